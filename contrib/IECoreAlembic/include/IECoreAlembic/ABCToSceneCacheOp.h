@@ -0,0 +1,100 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef IECOREALEMBIC_ABCTOSCENECACHEOP_H
+#define IECOREALEMBIC_ABCTOSCENECACHEOP_H
+
+#include "IECore/Op.h"
+#include "IECore/FileNameParameter.h"
+#include "IECore/NumericParameter.h"
+
+#include "IECoreAlembic/TypeIds.h"
+
+namespace IECoreAlembic
+{
+
+/// Converts an Alembic file into a SceneCache, exporting every sample
+/// which falls within a range of frames. Samples are written at their
+/// original times rather than being resampled, and the samples immediately
+/// outside the range are included too, so that interpolation at the ends
+/// of the range matches the Alembic file. Sibling locations are converted
+/// concurrently, and progress is reported as Info messages.
+class ABCToSceneCacheOp : public IECore::Op
+{
+
+	public :
+
+		IE_CORE_DECLARERUNTIMETYPEDEXTENSION( ABCToSceneCacheOp, ABCToSceneCacheOpTypeId, IECore::Op );
+
+		ABCToSceneCacheOp();
+		virtual ~ABCToSceneCacheOp();
+
+		IECore::FileNameParameter *inputFileParameter();
+		const IECore::FileNameParameter *inputFileParameter() const;
+
+		IECore::FileNameParameter *outputFileParameter();
+		const IECore::FileNameParameter *outputFileParameter() const;
+
+		IECore::DoubleParameter *startFrameParameter();
+		const IECore::DoubleParameter *startFrameParameter() const;
+
+		IECore::DoubleParameter *endFrameParameter();
+		const IECore::DoubleParameter *endFrameParameter() const;
+
+		IECore::DoubleParameter *framesPerSecondParameter();
+		const IECore::DoubleParameter *framesPerSecondParameter() const;
+
+		IECore::IntParameter *threadsParameter();
+		const IECore::IntParameter *threadsParameter() const;
+
+	protected :
+
+		virtual IECore::ObjectPtr doOperation( const IECore::CompoundObject *operands );
+
+	private :
+
+		IECore::FileNameParameterPtr m_inputFileParameter;
+		IECore::FileNameParameterPtr m_outputFileParameter;
+		IECore::DoubleParameterPtr m_startFrameParameter;
+		IECore::DoubleParameterPtr m_endFrameParameter;
+		IECore::DoubleParameterPtr m_framesPerSecondParameter;
+		IECore::IntParameterPtr m_threadsParameter;
+
+};
+
+IE_CORE_DECLAREPTR( ABCToSceneCacheOp );
+
+} // namespace IECoreAlembic
+
+#endif // IECOREALEMBIC_ABCTOSCENECACHEOP_H
@@ -0,0 +1,145 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef IECOREALEMBIC_ALEMBICSCENE_H
+#define IECOREALEMBIC_ALEMBICSCENE_H
+
+#include "IECore/SampledSceneInterface.h"
+
+#include "IECoreAlembic/TypeIds.h"
+
+namespace IECoreAlembic
+{
+
+IE_CORE_FORWARDDECLARE( AlembicScene )
+
+/// An implementation of the SceneInterface for reading Alembic files. It is
+/// registered for the ".abc" extension, so can be used via SceneInterface::create(),
+/// and therefore by the LinkedScene, SharedSceneInterfaces and anything else dealing
+/// with generic SceneInterfaces. Only Read mode is supported.
+///
+/// Each file is opened only once, and the hierarchy is shared between all the
+/// AlembicScenes referring to it, so navigating to a location resolves the Alembic
+/// object only the first time. The file is reopened if it has been modified since.
+/// Converted object samples are held in a cache which stores them in the
+/// ObjectPool::defaultObjectPool(), so the memory used is limited by the
+/// pool's maximum memory usage.
+/// \threading The const methods may be called concurrently from multiple threads.
+class AlembicScene : public IECore::SampledSceneInterface
+{
+
+	public :
+
+		typedef IECore::SceneInterface::Name Name;
+		typedef IECore::SceneInterface::NameList NameList;
+		typedef IECore::SceneInterface::Path Path;
+
+		IE_CORE_DECLARERUNTIMETYPEDEXTENSION( AlembicScene, AlembicSceneTypeId, IECore::SampledSceneInterface );
+
+		/// Opens the file, which must exist, with the current path set to "/".
+		/// Throws if the mode is not IndexedIO::Read.
+		AlembicScene( const std::string &fileName, IECore::IndexedIO::OpenMode mode );
+		virtual ~AlembicScene();
+
+		virtual std::string fileName() const;
+
+		virtual Name name() const;
+		virtual void path( Path &p ) const;
+
+		virtual size_t numBoundSamples() const;
+		virtual double boundSampleTime( size_t sampleIndex ) const;
+		virtual double boundSampleInterval( double time, size_t &floorIndex, size_t &ceilIndex ) const;
+		virtual Imath::Box3d readBoundAtSample( size_t sampleIndex ) const;
+		virtual Imath::Box3d readBound( double time ) const;
+		virtual void writeBound( const Imath::Box3d &bound, double time );
+
+		virtual size_t numTransformSamples() const;
+		virtual double transformSampleTime( size_t sampleIndex ) const;
+		virtual double transformSampleInterval( double time, size_t &floorIndex, size_t &ceilIndex ) const;
+		virtual IECore::ConstDataPtr readTransformAtSample( size_t sampleIndex ) const;
+		virtual Imath::M44d readTransformAsMatrixAtSample( size_t sampleIndex ) const;
+		virtual IECore::ConstDataPtr readTransform( double time ) const;
+		virtual Imath::M44d readTransformAsMatrix( double time ) const;
+		virtual void writeTransform( const IECore::Data *transform, double time );
+
+		/// Alembic files don't store attributes, so there are none to be read.
+		virtual bool hasAttribute( const Name &name ) const;
+		virtual void attributeNames( NameList &attrs ) const;
+		virtual size_t numAttributeSamples( const Name &name ) const;
+		virtual double attributeSampleTime( const Name &name, size_t sampleIndex ) const;
+		virtual double attributeSampleInterval( const Name &name, double time, size_t &floorIndex, size_t &ceilIndex ) const;
+		virtual IECore::ConstObjectPtr readAttributeAtSample( const Name &name, size_t sampleIndex ) const;
+		virtual IECore::ConstObjectPtr readAttribute( const Name &name, double time ) const;
+		virtual void writeAttribute( const Name &name, const IECore::Object *attribute, double time );
+
+		/// Alembic files don't store tags either.
+		virtual bool hasTag( const Name &name, bool includeChildren = true ) const;
+		virtual void readTags( NameList &tags, bool includeChildren = true ) const;
+		virtual void writeTags( const NameList &tags );
+
+		virtual bool hasObject() const;
+		virtual size_t numObjectSamples() const;
+		virtual double objectSampleTime( size_t sampleIndex ) const;
+		virtual double objectSampleInterval( double time, size_t &floorIndex, size_t &ceilIndex ) const;
+		virtual IECore::ConstObjectPtr readObjectAtSample( size_t sampleIndex ) const;
+		virtual IECore::ConstObjectPtr readObject( double time ) const;
+		virtual IECore::PrimitiveVariableMap readObjectPrimitiveVariables( const std::vector<IECore::InternedString> &primVarNames, double time ) const;
+		virtual void writeObject( const IECore::Object *object, double time );
+
+		virtual bool hasChild( const Name &name ) const;
+		virtual void childNames( NameList &childNames ) const;
+		virtual IECore::SceneInterfacePtr child( const Name &name, MissingBehaviour missingBehaviour = ThrowIfMissing );
+		virtual IECore::ConstSceneInterfacePtr child( const Name &name, MissingBehaviour missingBehaviour = ThrowIfMissing ) const;
+		virtual IECore::SceneInterfacePtr createChild( const Name &name );
+		virtual IECore::SceneInterfacePtr scene( const Path &path, MissingBehaviour missingBehaviour = ThrowIfMissing );
+		virtual IECore::ConstSceneInterfacePtr scene( const Path &path, MissingBehaviour missingBehaviour = ThrowIfMissing ) const;
+
+	private :
+
+		IE_CORE_FORWARDDECLARE( Location );
+
+		AlembicScene( ConstLocationPtr root, const Location *location );
+
+		const Location *childLocation( const Name &name, MissingBehaviour missingBehaviour ) const;
+		const Location *pathLocation( const Path &path, MissingBehaviour missingBehaviour ) const;
+
+		// The root keeps the whole shared hierarchy alive.
+		ConstLocationPtr m_root;
+		const Location *m_location;
+
+};
+
+} // namespace IECoreAlembic
+
+#endif // IECOREALEMBIC_ALEMBICSCENE_H
@@ -46,6 +46,8 @@ enum TypeId
 	FromAlembicSubDConverterTypeId = 112003,
 	FromAlembicGeomBaseConverterTypeId = 112004,
 	FromAlembicCameraConverterTypeId = 112005,
+	ABCToSceneCacheOpTypeId = 112006,
+	AlembicSceneTypeId = 112007,
 	
 	LastCoreAlembicTypeId = 112999,
 };
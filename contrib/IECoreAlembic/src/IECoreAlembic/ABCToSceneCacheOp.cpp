@@ -0,0 +1,409 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include <set>
+
+#include "boost/format.hpp"
+
+#include "tbb/parallel_for.h"
+#include "tbb/blocked_range.h"
+#include "tbb/mutex.h"
+#include "tbb/atomic.h"
+#include "tbb/task_arena.h"
+#include "tbb/tbb_thread.h"
+
+#include "IECore/SceneCache.h"
+#include "IECore/SimpleTypedData.h"
+#include "IECore/MessageHandler.h"
+#include "IECore/Exception.h"
+
+#include "IECoreAlembic/ABCToSceneCacheOp.h"
+#include "IECoreAlembic/AlembicInput.h"
+
+using namespace IECore;
+using namespace IECoreAlembic;
+
+//////////////////////////////////////////////////////////////////////////
+// Implementation of the conversion
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+struct ExportContext
+{
+
+	ExportContext( double start, double end, size_t locations )
+		:	startTime( start ), endTime( end ), numLocations( locations )
+	{
+		numExported = 0;
+	}
+
+	double startTime;
+	double endTime;
+
+	// The SceneCache may only be written by one thread at a time,
+	// so all writes are made while holding this mutex. The reading
+	// and conversion of the Alembic samples happens outside of it.
+	tbb::mutex writeMutex;
+
+	size_t numLocations;
+	tbb::atomic<size_t> numExported;
+
+	// The threads which have exported locations, so that
+	// we can report how many were used. Guarded by writeMutex.
+	std::set<tbb::tbb_thread::id> threads;
+
+};
+
+size_t countLocations( const AlembicInput *input )
+{
+	size_t result = 1;
+	for( size_t i = 0, n = input->numChildren(); i < n; ++i )
+	{
+		result += countLocations( input->child( i ).get() );
+	}
+	return result;
+}
+
+// Fills samples with the indices of all samples within the time range, plus
+// the samples immediately either side of it.
+void samplesInRange( const AlembicInput *input, double startTime, double endTime, std::vector<size_t> &samples )
+{
+	for( size_t i = 0, n = input->numSamples(); i < n; ++i )
+	{
+		const double time = input->timeAtSample( i );
+		if( time < startTime )
+		{
+			// we only want the last sample prior to the range.
+			samples.clear();
+		}
+		samples.push_back( i );
+		if( time > endTime )
+		{
+			break;
+		}
+	}
+}
+
+void exportLocation( const AlembicInput *input, SceneInterface *scene, bool isRoot, ExportContext &context );
+
+class ChildExporter
+{
+
+	public :
+
+		ChildExporter( const std::vector<AlembicInputPtr> &inputs, const std::vector<SceneInterfacePtr> &scenes, ExportContext &context )
+			:	m_inputs( inputs ), m_scenes( scenes ), m_context( context )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
+		{
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				exportLocation( m_inputs[i].get(), m_scenes[i].get(), false, m_context );
+			}
+		}
+
+	private :
+
+		const std::vector<AlembicInputPtr> &m_inputs;
+		const std::vector<SceneInterfacePtr> &m_scenes;
+		ExportContext &m_context;
+
+};
+
+void exportLocation( const AlembicInput *input, SceneInterface *scene, bool isRoot, ExportContext &context )
+{
+	// the root of a SceneCache can have neither an object nor a transform,
+	// and the top of an Alembic archive has neither anyway.
+	if( !isRoot )
+	{
+		std::vector<size_t> samples;
+		samplesInRange( input, context.startTime, context.endTime, samples );
+
+		if( input->converter( RenderableTypeId ) )
+		{
+			for( std::vector<size_t>::const_iterator it = samples.begin(); it != samples.end(); ++it )
+			{
+				ObjectPtr object = input->objectAtSample( *it, RenderableTypeId );
+				const double time = input->timeAtSample( *it );
+				tbb::mutex::scoped_lock lock( context.writeMutex );
+				scene->writeObject( object.get(), time );
+			}
+		}
+		else
+		{
+			for( std::vector<size_t>::const_iterator it = samples.begin(); it != samples.end(); ++it )
+			{
+				M44dDataPtr transform = new M44dData( input->transformAtSample( *it ) );
+				const double time = input->timeAtSample( *it );
+				tbb::mutex::scoped_lock lock( context.writeMutex );
+				scene->writeTransform( transform.get(), time );
+			}
+		}
+	}
+
+	const size_t numChildren = input->numChildren();
+	std::vector<AlembicInputPtr> childInputs;
+	std::vector<SceneInterfacePtr> childScenes;
+	childInputs.reserve( numChildren );
+	childScenes.reserve( numChildren );
+	for( size_t i = 0; i < numChildren; ++i )
+	{
+		childInputs.push_back( input->child( i ) );
+	}
+
+	{
+		tbb::mutex::scoped_lock lock( context.writeMutex );
+		for( size_t i = 0; i < numChildren; ++i )
+		{
+			childScenes.push_back( scene->createChild( childInputs[i]->name() ) );
+		}
+		context.threads.insert( tbb::this_tbb_thread::get_id() );
+	}
+
+	const size_t numExported = ++context.numExported;
+	if( numExported * 10 / context.numLocations != ( numExported - 1 ) * 10 / context.numLocations )
+	{
+		msg( Msg::Info, "ABCToSceneCacheOp", boost::format( "Exported %d of %d locations" ) % numExported % context.numLocations );
+	}
+
+	tbb::parallel_for( tbb::blocked_range<size_t>( 0, numChildren ), ChildExporter( childInputs, childScenes, context ) );
+
+	// everything below this location has now been written, so we can
+	// complete it and let the SceneCache release the memory it uses,
+	// rather than holding the whole hierarchy until the file is closed.
+	if( !isRoot )
+	{
+		if( SceneCache *sceneCache = runTimeCast<SceneCache>( scene ) )
+		{
+			tbb::mutex::scoped_lock lock( context.writeMutex );
+			sceneCache->finish();
+		}
+	}
+}
+
+class RootExporter
+{
+
+	public :
+
+		RootExporter( const AlembicInput *input, SceneInterface *scene, ExportContext &context )
+			:	m_input( input ), m_scene( scene ), m_context( context )
+		{
+		}
+
+		void operator()() const
+		{
+			exportLocation( m_input, m_scene, true, m_context );
+		}
+
+	private :
+
+		const AlembicInput *m_input;
+		SceneInterface *m_scene;
+		ExportContext &m_context;
+
+};
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// ABCToSceneCacheOp
+//////////////////////////////////////////////////////////////////////////
+
+IE_CORE_DEFINERUNTIMETYPED( ABCToSceneCacheOp );
+
+ABCToSceneCacheOp::ABCToSceneCacheOp()
+	:	Op(
+			"Converts Alembic files into SceneCache files, exporting all the samples within a range of frames.",
+			new FileNameParameter( "result", "The name of the SceneCache file which was written." )
+		)
+{
+	m_inputFileParameter = new FileNameParameter(
+		"inputFile",
+		"The alembic file to be converted.",
+		"abc",
+		"",
+		false,
+		PathParameter::MustExist
+	);
+
+	m_outputFileParameter = new FileNameParameter(
+		"outputFile",
+		"The filename of the scene cache to be written.",
+		"scc",
+		"",
+		false
+	);
+
+	m_startFrameParameter = new DoubleParameter(
+		"startFrame",
+		"The first frame of the range to be exported.",
+		1.0
+	);
+
+	m_endFrameParameter = new DoubleParameter(
+		"endFrame",
+		"The last frame of the range to be exported.",
+		1.0
+	);
+
+	m_framesPerSecondParameter = new DoubleParameter(
+		"framesPerSecond",
+		"Used to convert the frame range into the times used by the alembic file.",
+		24.0,
+		0.0
+	);
+
+	m_threadsParameter = new IntParameter(
+		"threads",
+		"The maximum number of threads to use for the conversion. A value of 0 uses "
+		"as many threads as there are available processors.",
+		0,
+		0
+	);
+
+	parameters()->addParameter( m_inputFileParameter );
+	parameters()->addParameter( m_outputFileParameter );
+	parameters()->addParameter( m_startFrameParameter );
+	parameters()->addParameter( m_endFrameParameter );
+	parameters()->addParameter( m_framesPerSecondParameter );
+	parameters()->addParameter( m_threadsParameter );
+}
+
+ABCToSceneCacheOp::~ABCToSceneCacheOp()
+{
+}
+
+FileNameParameter *ABCToSceneCacheOp::inputFileParameter()
+{
+	return m_inputFileParameter;
+}
+
+const FileNameParameter *ABCToSceneCacheOp::inputFileParameter() const
+{
+	return m_inputFileParameter;
+}
+
+FileNameParameter *ABCToSceneCacheOp::outputFileParameter()
+{
+	return m_outputFileParameter;
+}
+
+const FileNameParameter *ABCToSceneCacheOp::outputFileParameter() const
+{
+	return m_outputFileParameter;
+}
+
+DoubleParameter *ABCToSceneCacheOp::startFrameParameter()
+{
+	return m_startFrameParameter;
+}
+
+const DoubleParameter *ABCToSceneCacheOp::startFrameParameter() const
+{
+	return m_startFrameParameter;
+}
+
+DoubleParameter *ABCToSceneCacheOp::endFrameParameter()
+{
+	return m_endFrameParameter;
+}
+
+const DoubleParameter *ABCToSceneCacheOp::endFrameParameter() const
+{
+	return m_endFrameParameter;
+}
+
+DoubleParameter *ABCToSceneCacheOp::framesPerSecondParameter()
+{
+	return m_framesPerSecondParameter;
+}
+
+const DoubleParameter *ABCToSceneCacheOp::framesPerSecondParameter() const
+{
+	return m_framesPerSecondParameter;
+}
+
+IntParameter *ABCToSceneCacheOp::threadsParameter()
+{
+	return m_threadsParameter;
+}
+
+const IntParameter *ABCToSceneCacheOp::threadsParameter() const
+{
+	return m_threadsParameter;
+}
+
+ObjectPtr ABCToSceneCacheOp::doOperation( const CompoundObject *operands )
+{
+	const std::string &inputFile = m_inputFileParameter->getTypedValue();
+	const std::string &outputFile = m_outputFileParameter->getTypedValue();
+
+	const double startFrame = m_startFrameParameter->getNumericValue();
+	const double endFrame = m_endFrameParameter->getNumericValue();
+	if( endFrame < startFrame )
+	{
+		throw InvalidArgumentException( "ABCToSceneCacheOp : endFrame must not be less than startFrame" );
+	}
+
+	const double framesPerSecond = m_framesPerSecondParameter->getNumericValue();
+	if( framesPerSecond <= 0.0 )
+	{
+		throw InvalidArgumentException( "ABCToSceneCacheOp : framesPerSecond must be greater than 0" );
+	}
+
+	// we use an arena rather than a task_scheduler_init, because the latter
+	// has no effect when a scheduler has already been initialised, as it will
+	// have been when we are called from within a host application.
+	const int threads = m_threadsParameter->getNumericValue();
+	tbb::task_arena arena( threads > 0 ? threads : (int)tbb::task_arena::automatic );
+
+	AlembicInputPtr input = new AlembicInput( inputFile );
+	ExportContext context( startFrame / framesPerSecond, endFrame / framesPerSecond, countLocations( input.get() ) );
+
+	// the file is only completed when the root SceneCache is destroyed,
+	// so we make sure that happens before we return.
+	{
+		SceneCachePtr output = new SceneCache( outputFile, IndexedIO::Write );
+		arena.execute( RootExporter( input.get(), output.get(), context ) );
+	}
+
+	msg( Msg::Info, "ABCToSceneCacheOp", boost::format( "Exported %d locations using %d threads" ) % context.numLocations % context.threads.size() );
+
+	return new StringData( outputFile );
+}
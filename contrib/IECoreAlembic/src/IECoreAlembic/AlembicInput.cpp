@@ -34,6 +34,9 @@
 
 #include "OpenEXR/ImathBoxAlgo.h"
 
+#include "tbb/mutex.h"
+#include "tbb/atomic.h"
+
 #include "Alembic/AbcCoreHDF5/ReadWrite.h"
 #include "Alembic/Abc/IArchive.h"
 #include "Alembic/Abc/IObject.h"
@@ -57,13 +60,22 @@ using namespace IECore;
 struct AlembicInput::DataMembers
 {
 	DataMembers()
-		: numSamples( -1 )
+		: numSamples( 0 )
 	{
+		haveNumSamples = false;
+		haveTimeSampling = false;
 	}
 	
 	boost::shared_ptr<IArchive> archive;
 	IObject object;
-	int numSamples;
+
+	// The sampling is computed lazily, and an input may be shared between
+	// threads, so the mutex protects the computation and the flags tell
+	// us when it is complete.
+	tbb::mutex samplingMutex;
+	tbb::atomic<bool> haveNumSamples;
+	size_t numSamples;
+	tbb::atomic<bool> haveTimeSampling;
 	TimeSamplingPtr timeSampling;
 };
 
@@ -107,8 +119,15 @@ IECore::CompoundDataPtr AlembicInput::metaData() const
 
 size_t AlembicInput::numSamples() const
 {
-	if( m_data->numSamples != -1 )
+	if( m_data->haveNumSamples )
+	{
+		return m_data->numSamples;
+	}
+
+	tbb::mutex::scoped_lock lock( m_data->samplingMutex );
+	if( m_data->haveNumSamples )
 	{
+		// another thread computed it while we waited for the lock
 		return m_data->numSamples;
 	}
 	
@@ -147,6 +166,7 @@ size_t AlembicInput::numSamples() const
 		m_data->numSamples = geomBase.getSchema().getNumSamples();
 	}
 	
+	m_data->haveNumSamples = true;
 	return m_data->numSamples;
 }
 
@@ -429,10 +449,18 @@ AlembicInputPtr AlembicInput::child( const std::string &name ) const
 
 void AlembicInput::ensureTimeSampling() const
 {
-	if( m_data->timeSampling )
+	if( m_data->haveTimeSampling )
 	{
 		return;
 	}
+
+	tbb::mutex::scoped_lock lock( m_data->samplingMutex );
+	if( m_data->haveTimeSampling )
+	{
+		// another thread computed it while we waited for the lock
+		return;
+	}
+
 	const MetaData &md = m_data->object.getMetaData();
 	
 	/// \todo It's getting a bit daft having to cover all the
@@ -461,5 +489,7 @@ void AlembicInput::ensureTimeSampling() const
 		IGeomBaseObject geomBase( m_data->object, kWrapExisting );
 		m_data->timeSampling = geomBase.getSchema().getTimeSampling();
 	}
+
+	m_data->haveTimeSampling = true;
 }
 
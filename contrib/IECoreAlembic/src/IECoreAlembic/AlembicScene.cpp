@@ -0,0 +1,570 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include <ctime>
+
+#include "boost/format.hpp"
+#include "boost/filesystem/operations.hpp"
+
+#include "tbb/mutex.h"
+
+#include "IECore/SimpleTypedData.h"
+#include "IECore/Primitive.h"
+#include "IECore/ObjectInterpolator.h"
+#include "IECore/ComputationCache.h"
+#include "IECore/LRUCache.h"
+#include "IECore/Exception.h"
+
+#include "IECoreAlembic/AlembicScene.h"
+#include "IECoreAlembic/AlembicInput.h"
+
+using namespace IECore;
+using namespace IECoreAlembic;
+
+//////////////////////////////////////////////////////////////////////////
+// Location
+//////////////////////////////////////////////////////////////////////////
+
+// A location in the hierarchy of a file, shared between all the AlembicScenes
+// which refer to it. Children are resolved on demand, and are owned by their
+// parent, so the root location keeps the whole hierarchy alive.
+class AlembicScene::Location : public RefCounted
+{
+
+	public :
+
+		// Constructs the root location.
+		Location( const std::string &fileName )
+			:	input( new AlembicInput( fileName ) ), parent( 0 ), name( SceneInterface::rootName ),
+				fileName( fileName ), modificationTime( boost::filesystem::last_write_time( fileName ) ),
+				hasObject( false ), m_childrenResolved( false )
+		{
+		}
+
+		// Constructs a child location.
+		Location( AlembicInputPtr input, const Location *parent )
+			:	input( input ), parent( parent ), name( input->name() ),
+				fileName( parent->fileName ), modificationTime( parent->modificationTime ),
+				hasObject( input->converter( RenderableTypeId ).get() != 0 ), m_childrenResolved( false )
+		{
+		}
+
+		AlembicInputPtr input;
+		const Location *parent;
+		const Name name;
+		const std::string fileName;
+		const std::time_t modificationTime;
+		const bool hasObject;
+
+		// All the properties of an Alembic object share the same time sampling,
+		// so this is used for bounds, transforms and objects alike. Locations
+		// without any samples are treated as having a single sample at time 0.
+
+		size_t numSamples() const
+		{
+			return std::max<size_t>( input->numSamples(), 1 );
+		}
+
+		double sampleTime( size_t sampleIndex ) const
+		{
+			if( !input->numSamples() )
+			{
+				if( sampleIndex )
+				{
+					throw InvalidArgumentException( "Sample index out of range" );
+				}
+				return 0.0;
+			}
+			return input->timeAtSample( sampleIndex );
+		}
+
+		double sampleInterval( double time, size_t &floorIndex, size_t &ceilIndex ) const
+		{
+			if( !input->numSamples() )
+			{
+				floorIndex = ceilIndex = 0;
+				return 0.0;
+			}
+			return input->sampleIntervalAtTime( time, floorIndex, ceilIndex );
+		}
+
+		// Returns the root location for the file, opening
+		// it only if it isn't open already.
+		static ConstLocationPtr root( const std::string &fileName )
+		{
+			ConstLocationPtr result = archiveCache().get( fileName );
+			if( result->modificationTime != boost::filesystem::last_write_time( fileName ) )
+			{
+				// the file has changed since we opened it.
+				archiveCache().erase( fileName );
+				result = archiveCache().get( fileName );
+			}
+			return result;
+		}
+
+		ConstObjectPtr objectAtSample( size_t sampleIndex ) const
+		{
+			return sampleCache().get( SampleCacheKey( this, sampleIndex ) );
+		}
+
+		const Location *child( const Name &name ) const
+		{
+			resolveChildren();
+			ChildMap::const_iterator it = m_children.find( name );
+			return it != m_children.end() ? it->second.get() : 0;
+		}
+
+		void childNames( NameList &childNames ) const
+		{
+			resolveChildren();
+			childNames = m_childNames;
+		}
+
+	private :
+
+		void resolveChildren() const
+		{
+			tbb::mutex::scoped_lock lock( m_childrenMutex );
+			if( m_childrenResolved )
+			{
+				return;
+			}
+
+			for( size_t i = 0, n = input->numChildren(); i < n; ++i )
+			{
+				ConstLocationPtr c = new Location( input->child( i ), this );
+				m_children[c->name] = c;
+				m_childNames.push_back( c->name );
+			}
+			m_childrenResolved = true;
+		}
+
+		// Root locations, so that each file is only opened once.
+
+		typedef LRUCache<std::string, ConstLocationPtr> ArchiveCache;
+
+		static ConstLocationPtr archiveGetter( const std::string &fileName, size_t &cost )
+		{
+			cost = 1;
+			return new Location( fileName );
+		}
+
+		static ArchiveCache &archiveCache()
+		{
+			static ArchiveCache c( archiveGetter, 200 );
+			return c;
+		}
+
+		// Converted object samples, stored in the ObjectPool.
+
+		typedef std::pair<const Location *, size_t> SampleCacheKey;
+		typedef ComputationCache<SampleCacheKey> SampleCache;
+
+		static MurmurHash sampleHash( const SampleCacheKey &key )
+		{
+			MurmurHash h;
+			h.append( key.first->fileName );
+			h.append( (uint64_t)key.first->modificationTime );
+			h.append( key.first->input->fullName() );
+			h.append( (uint64_t)key.second );
+			return h;
+		}
+
+		static ConstObjectPtr readSample( const SampleCacheKey &key )
+		{
+			return key.first->input->objectAtSample( key.second, RenderableTypeId );
+		}
+
+		static SampleCache &sampleCache()
+		{
+			static SampleCache::Ptr c = new SampleCache( readSample, sampleHash, 10000 );
+			return *c;
+		}
+
+		typedef std::map<Name, ConstLocationPtr> ChildMap;
+
+		mutable tbb::mutex m_childrenMutex;
+		mutable bool m_childrenResolved;
+		mutable ChildMap m_children;
+		mutable NameList m_childNames;
+
+};
+
+//////////////////////////////////////////////////////////////////////////
+// AlembicScene
+//////////////////////////////////////////////////////////////////////////
+
+IE_CORE_DEFINERUNTIMETYPED( AlembicScene );
+
+static SceneInterface::FileFormatDescription<AlembicScene> g_description( ".abc", IndexedIO::Read );
+
+AlembicScene::AlembicScene( const std::string &fileName, IndexedIO::OpenMode mode )
+{
+	if( mode != IndexedIO::Read )
+	{
+		throw InvalidArgumentException( "AlembicScene : Only Read mode is supported" );
+	}
+
+	if( !boost::filesystem::exists( fileName ) )
+	{
+		throw FileNotFoundIOException( boost::str( boost::format( "AlembicScene : File \"%s\" does not exist" ) % fileName ) );
+	}
+
+	m_root = Location::root( fileName );
+	m_location = m_root.get();
+}
+
+AlembicScene::AlembicScene( ConstLocationPtr root, const Location *location )
+	:	m_root( root ), m_location( location )
+{
+}
+
+AlembicScene::~AlembicScene()
+{
+}
+
+std::string AlembicScene::fileName() const
+{
+	return m_root->fileName;
+}
+
+AlembicScene::Name AlembicScene::name() const
+{
+	return m_location->name;
+}
+
+void AlembicScene::path( Path &p ) const
+{
+	p.clear();
+	for( const Location *l = m_location; l->parent; l = l->parent )
+	{
+		p.insert( p.begin(), l->name );
+	}
+}
+
+size_t AlembicScene::numBoundSamples() const
+{
+	return m_location->numSamples();
+}
+
+double AlembicScene::boundSampleTime( size_t sampleIndex ) const
+{
+	return m_location->sampleTime( sampleIndex );
+}
+
+double AlembicScene::boundSampleInterval( double time, size_t &floorIndex, size_t &ceilIndex ) const
+{
+	return m_location->sampleInterval( time, floorIndex, ceilIndex );
+}
+
+Imath::Box3d AlembicScene::readBoundAtSample( size_t sampleIndex ) const
+{
+	if( m_location->input->hasStoredBound() )
+	{
+		return m_location->input->boundAtSample( sampleIndex );
+	}
+	return m_location->input->boundAtTime( m_location->sampleTime( sampleIndex ) );
+}
+
+Imath::Box3d AlembicScene::readBound( double time ) const
+{
+	return m_location->input->boundAtTime( time );
+}
+
+void AlembicScene::writeBound( const Imath::Box3d &bound, double time )
+{
+	throw Exception( "AlembicScene : Writing is not supported" );
+}
+
+size_t AlembicScene::numTransformSamples() const
+{
+	return m_location->numSamples();
+}
+
+double AlembicScene::transformSampleTime( size_t sampleIndex ) const
+{
+	return m_location->sampleTime( sampleIndex );
+}
+
+double AlembicScene::transformSampleInterval( double time, size_t &floorIndex, size_t &ceilIndex ) const
+{
+	return m_location->sampleInterval( time, floorIndex, ceilIndex );
+}
+
+ConstDataPtr AlembicScene::readTransformAtSample( size_t sampleIndex ) const
+{
+	return new M44dData( readTransformAsMatrixAtSample( sampleIndex ) );
+}
+
+Imath::M44d AlembicScene::readTransformAsMatrixAtSample( size_t sampleIndex ) const
+{
+	if( !m_location->input->numSamples() )
+	{
+		return Imath::M44d();
+	}
+	return m_location->input->transformAtSample( sampleIndex );
+}
+
+ConstDataPtr AlembicScene::readTransform( double time ) const
+{
+	return new M44dData( readTransformAsMatrix( time ) );
+}
+
+Imath::M44d AlembicScene::readTransformAsMatrix( double time ) const
+{
+	if( !m_location->input->numSamples() )
+	{
+		return Imath::M44d();
+	}
+	return m_location->input->transformAtTime( time );
+}
+
+void AlembicScene::writeTransform( const Data *transform, double time )
+{
+	throw Exception( "AlembicScene : Writing is not supported" );
+}
+
+bool AlembicScene::hasAttribute( const Name &name ) const
+{
+	return false;
+}
+
+void AlembicScene::attributeNames( NameList &attrs ) const
+{
+	attrs.clear();
+}
+
+size_t AlembicScene::numAttributeSamples( const Name &name ) const
+{
+	throw Exception( boost::str( boost::format( "AlembicScene : No attribute named \"%s\"" ) % name.value() ) );
+}
+
+double AlembicScene::attributeSampleTime( const Name &name, size_t sampleIndex ) const
+{
+	throw Exception( boost::str( boost::format( "AlembicScene : No attribute named \"%s\"" ) % name.value() ) );
+}
+
+double AlembicScene::attributeSampleInterval( const Name &name, double time, size_t &floorIndex, size_t &ceilIndex ) const
+{
+	throw Exception( boost::str( boost::format( "AlembicScene : No attribute named \"%s\"" ) % name.value() ) );
+}
+
+ConstObjectPtr AlembicScene::readAttributeAtSample( const Name &name, size_t sampleIndex ) const
+{
+	throw Exception( boost::str( boost::format( "AlembicScene : No attribute named \"%s\"" ) % name.value() ) );
+}
+
+ConstObjectPtr AlembicScene::readAttribute( const Name &name, double time ) const
+{
+	throw Exception( boost::str( boost::format( "AlembicScene : No attribute named \"%s\"" ) % name.value() ) );
+}
+
+void AlembicScene::writeAttribute( const Name &name, const Object *attribute, double time )
+{
+	throw Exception( "AlembicScene : Writing is not supported" );
+}
+
+bool AlembicScene::hasTag( const Name &name, bool includeChildren ) const
+{
+	return false;
+}
+
+void AlembicScene::readTags( NameList &tags, bool includeChildren ) const
+{
+	tags.clear();
+}
+
+void AlembicScene::writeTags( const NameList &tags )
+{
+	throw Exception( "AlembicScene : Writing is not supported" );
+}
+
+bool AlembicScene::hasObject() const
+{
+	return m_location->hasObject;
+}
+
+size_t AlembicScene::numObjectSamples() const
+{
+	return m_location->hasObject ? m_location->numSamples() : 0;
+}
+
+double AlembicScene::objectSampleTime( size_t sampleIndex ) const
+{
+	return m_location->sampleTime( sampleIndex );
+}
+
+double AlembicScene::objectSampleInterval( double time, size_t &floorIndex, size_t &ceilIndex ) const
+{
+	return m_location->sampleInterval( time, floorIndex, ceilIndex );
+}
+
+ConstObjectPtr AlembicScene::readObjectAtSample( size_t sampleIndex ) const
+{
+	if( !m_location->hasObject )
+	{
+		return 0;
+	}
+	return m_location->objectAtSample( sampleIndex );
+}
+
+ConstObjectPtr AlembicScene::readObject( double time ) const
+{
+	size_t sample1, sample2;
+	double x = objectSampleInterval( time, sample1, sample2 );
+	if( x == 0 )
+	{
+		return readObjectAtSample( sample1 );
+	}
+
+	ConstObjectPtr object1 = readObjectAtSample( sample1 );
+	ConstObjectPtr object2 = readObjectAtSample( sample2 );
+	if( !object1 || !object2 )
+	{
+		return 0;
+	}
+
+	ObjectPtr object = linearObjectInterpolation( object1, object2, x );
+	if( !object )
+	{
+		// failed to interpolate, return the closest one
+		return ( x >= 0.5 ? object2 : object1 );
+	}
+	return object;
+}
+
+PrimitiveVariableMap AlembicScene::readObjectPrimitiveVariables( const std::vector<InternedString> &primVarNames, double time ) const
+{
+	ConstPrimitivePtr primitive = runTimeCast<const Primitive>( readObject( time ) );
+	if( !primitive )
+	{
+		throw Exception( "AlembicScene : Object is not a Primitive" );
+	}
+
+	PrimitiveVariableMap result;
+	for( std::vector<InternedString>::const_iterator it = primVarNames.begin(); it != primVarNames.end(); ++it )
+	{
+		PrimitiveVariableMap::const_iterator vIt = primitive->variables.find( *it );
+		if( vIt != primitive->variables.end() )
+		{
+			result.insert( *vIt );
+		}
+	}
+	return result;
+}
+
+void AlembicScene::writeObject( const Object *object, double time )
+{
+	throw Exception( "AlembicScene : Writing is not supported" );
+}
+
+bool AlembicScene::hasChild( const Name &name ) const
+{
+	return m_location->child( name );
+}
+
+void AlembicScene::childNames( NameList &childNames ) const
+{
+	m_location->childNames( childNames );
+}
+
+SceneInterfacePtr AlembicScene::child( const Name &name, MissingBehaviour missingBehaviour )
+{
+	const Location *c = childLocation( name, missingBehaviour );
+	return c ? new AlembicScene( m_root, c ) : 0;
+}
+
+ConstSceneInterfacePtr AlembicScene::child( const Name &name, MissingBehaviour missingBehaviour ) const
+{
+	const Location *c = childLocation( name, missingBehaviour );
+	return c ? new AlembicScene( m_root, c ) : 0;
+}
+
+SceneInterfacePtr AlembicScene::createChild( const Name &name )
+{
+	throw Exception( "AlembicScene : Writing is not supported" );
+}
+
+SceneInterfacePtr AlembicScene::scene( const Path &path, MissingBehaviour missingBehaviour )
+{
+	const Location *l = pathLocation( path, missingBehaviour );
+	return l ? new AlembicScene( m_root, l ) : 0;
+}
+
+ConstSceneInterfacePtr AlembicScene::scene( const Path &path, MissingBehaviour missingBehaviour ) const
+{
+	const Location *l = pathLocation( path, missingBehaviour );
+	return l ? new AlembicScene( m_root, l ) : 0;
+}
+
+const AlembicScene::Location *AlembicScene::childLocation( const Name &name, MissingBehaviour missingBehaviour ) const
+{
+	const Location *c = m_location->child( name );
+	if( !c )
+	{
+		if( missingBehaviour == CreateIfMissing )
+		{
+			throw Exception( "AlembicScene : Writing is not supported" );
+		}
+		else if( missingBehaviour == ThrowIfMissing )
+		{
+			throw IOException( boost::str( boost::format( "AlembicScene : No child named \"%s\"" ) % name.value() ) );
+		}
+	}
+	return c;
+}
+
+const AlembicScene::Location *AlembicScene::pathLocation( const Path &path, MissingBehaviour missingBehaviour ) const
+{
+	const Location *l = m_root.get();
+	for( Path::const_iterator it = path.begin(); l && it != path.end(); ++it )
+	{
+		const Location *c = l->child( *it );
+		if( !c )
+		{
+			if( missingBehaviour == CreateIfMissing )
+			{
+				throw Exception( "AlembicScene : Writing is not supported" );
+			}
+			else if( missingBehaviour == ThrowIfMissing )
+			{
+				std::string pathString;
+				pathToString( path, pathString );
+				throw IOException( boost::str( boost::format( "AlembicScene : No location \"%s\"" ) % pathString ) );
+			}
+		}
+		l = c;
+	}
+	return l;
+}
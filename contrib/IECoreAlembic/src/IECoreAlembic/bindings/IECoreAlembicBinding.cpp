@@ -35,6 +35,8 @@
 #include <boost/python.hpp>
 
 #include "IECoreAlembic/bindings/AlembicInputBinding.h"
+#include "IECoreAlembic/bindings/ABCToSceneCacheOpBinding.h"
+#include "IECoreAlembic/bindings/AlembicSceneBinding.h"
 
 using namespace IECoreAlembicBindings;
 using namespace boost::python;
@@ -43,5 +45,7 @@ BOOST_PYTHON_MODULE( _IECoreAlembic )
 {
 
 	bindAlembicInput();
+	bindABCToSceneCacheOp();
+	bindAlembicScene();
 
 }
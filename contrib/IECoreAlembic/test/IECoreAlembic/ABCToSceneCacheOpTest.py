@@ -0,0 +1,146 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+import os
+import unittest
+
+import IECore
+import IECoreAlembic
+
+class ABCToSceneCacheOpTest( unittest.TestCase ) :
+
+	__outputFile = "/tmp/test.scc"
+
+	def testHierarchy( self ) :
+
+		IECoreAlembic.ABCToSceneCacheOp()(
+			inputFile = os.path.dirname( __file__ ) + "/data/cube.abc",
+			outputFile = self.__outputFile,
+		)
+
+		s = IECore.SceneCache( self.__outputFile, IECore.IndexedIO.OpenMode.Read )
+		self.assertEqual( s.childNames(), [ "group1" ] )
+		self.assertEqual( s.readBound( 0 ), IECore.Box3d( IECore.V3d( -2 ), IECore.V3d( 2 ) ) )
+
+		g = s.child( "group1" )
+		self.assertEqual( g.readTransformAsMatrix( 0 ), IECore.M44d.createScaled( IECore.V3d( 2 ) ) * IECore.M44d.createTranslated( IECore.V3d( 2, 0, 0 ) ) )
+		self.assertFalse( g.hasObject() )
+		self.assertEqual( g.childNames(), [ "pCube1" ] )
+
+		t = g.child( "pCube1" )
+		self.assertEqual( t.readTransformAsMatrix( 0 ), IECore.M44d.createTranslated( IECore.V3d( -1, 0, 0 ) ) )
+		self.assertFalse( t.hasObject() )
+		self.assertEqual( t.childNames(), [ "pCubeShape1" ] )
+
+		m = t.child( "pCubeShape1" )
+		self.assertTrue( m.hasObject() )
+		self.failUnless( isinstance( m.readObject( 0 ), IECore.MeshPrimitive ) )
+		self.assertEqual( m.readBound( 0 ), IECore.Box3d( IECore.V3d( -1 ), IECore.V3d( 1 ) ) )
+		self.assertEqual( m.childNames(), [] )
+
+	def testSampleRange( self ) :
+
+		a = IECoreAlembic.AlembicInput( os.path.dirname( __file__ ) + "/data/animatedCube.abc" )
+
+		IECoreAlembic.ABCToSceneCacheOp()(
+			inputFile = os.path.dirname( __file__ ) + "/data/animatedCube.abc",
+			outputFile = self.__outputFile,
+			startFrame = 3,
+			endFrame = 5,
+			framesPerSecond = 24,
+		)
+
+		s = IECore.SceneCache( self.__outputFile, IECore.IndexedIO.OpenMode.Read )
+
+		# we expect the samples within the range, plus one either side,
+		# at exactly the times they were stored in the alembic file.
+
+		t = s.child( "pCube1" )
+		at = a.child( "pCube1" )
+		self.assertEqual( t.numTransformSamples(), 5 )
+		for i in range( 0, 5 ) :
+			self.assertEqual( t.transformSampleTime( i ), at.timeAtSample( i + 1 ) )
+			self.assertEqual( t.readTransformAsMatrixAtSample( i ), at.transformAtSample( i + 1 ) )
+
+		m = t.child( "pCubeShape1" )
+		am = at.child( "pCubeShape1" )
+		self.assertEqual( m.numObjectSamples(), 5 )
+		for i in range( 0, 5 ) :
+			self.assertEqual( m.objectSampleTime( i ), am.timeAtSample( i + 1 ) )
+			self.assertEqual( m.readObjectAtSample( i ), am.objectAtSample( i + 1 ) )
+
+		# static locations keep their single sample, even though
+		# it is outside of the range.
+
+		p = s.child( "persp" )
+		self.assertEqual( p.numTransformSamples(), 1 )
+		self.assertEqual( p.transformSampleTime( 0 ), a.child( "persp" ).timeAtSample( 0 ) )
+
+	def testInvalidFrameRange( self ) :
+
+		self.assertRaises(
+			RuntimeError,
+			IECoreAlembic.ABCToSceneCacheOp(),
+			inputFile = os.path.dirname( __file__ ) + "/data/cube.abc",
+			outputFile = self.__outputFile,
+			startFrame = 10,
+			endFrame = 1,
+		)
+
+	def testThreads( self ) :
+
+		for threads in ( 1, 2 ) :
+
+			with IECore.CapturingMessageHandler() as mh :
+
+				IECoreAlembic.ABCToSceneCacheOp()(
+					inputFile = os.path.dirname( __file__ ) + "/data/animatedCube.abc",
+					outputFile = self.__outputFile,
+					threads = threads,
+				)
+
+			summary = [ m.message for m in mh.messages if m.message.startswith( "Exported" ) and "threads" in m.message ]
+			self.assertEqual( len( summary ), 1 )
+			numThreads = int( summary[0].split()[-2] )
+			self.failUnless( numThreads >= 1 )
+			self.failUnless( numThreads <= threads )
+
+	def tearDown( self ) :
+
+		if os.path.exists( self.__outputFile ) :
+			os.remove( self.__outputFile )
+
+if __name__ == "__main__":
+    unittest.main()
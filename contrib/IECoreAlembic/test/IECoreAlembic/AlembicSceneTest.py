@@ -0,0 +1,124 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+import os
+import unittest
+
+import IECore
+import IECoreAlembic
+
+class AlembicSceneTest( unittest.TestCase ) :
+
+	def testFactory( self ) :
+
+		s = IECore.SceneInterface.create( os.path.dirname( __file__ ) + "/data/cube.abc", IECore.IndexedIO.OpenMode.Read )
+		self.failUnless( isinstance( s, IECoreAlembic.AlembicScene ) )
+		self.failUnless( "abc" in IECore.SceneInterface.supportedExtensions( IECore.IndexedIO.OpenMode.Read ) )
+
+		self.assertRaises( RuntimeError, IECoreAlembic.AlembicScene, os.path.dirname( __file__ ) + "/data/cube.abc", IECore.IndexedIO.OpenMode.Write )
+		self.assertRaises( RuntimeError, IECoreAlembic.AlembicScene, "/tmp/nonexistentFile.abc", IECore.IndexedIO.OpenMode.Read )
+
+	def testHierarchy( self ) :
+
+		s = IECoreAlembic.AlembicScene( os.path.dirname( __file__ ) + "/data/cube.abc", IECore.IndexedIO.OpenMode.Read )
+		self.assertEqual( s.name(), "/" )
+		self.assertEqual( s.path(), [] )
+		self.assertEqual( s.childNames(), [ "group1" ] )
+		self.assertEqual( s.readBound( 0 ), IECore.Box3d( IECore.V3d( -2 ), IECore.V3d( 2 ) ) )
+		self.assertFalse( s.hasObject() )
+
+		g = s.child( "group1" )
+		self.assertEqual( g.name(), "group1" )
+		self.assertEqual( g.path(), [ "group1" ] )
+		self.assertEqual( g.readTransformAsMatrix( 0 ), IECore.M44d.createScaled( IECore.V3d( 2 ) ) * IECore.M44d.createTranslated( IECore.V3d( 2, 0, 0 ) ) )
+		self.assertFalse( g.hasObject() )
+
+		m = s.scene( [ "group1", "pCube1", "pCubeShape1" ] )
+		self.assertEqual( m.path(), [ "group1", "pCube1", "pCubeShape1" ] )
+		self.assertTrue( m.hasObject() )
+		self.failUnless( isinstance( m.readObject( 0 ), IECore.MeshPrimitive ) )
+		self.assertEqual( m.readBound( 0 ), IECore.Box3d( IECore.V3d( -1 ), IECore.V3d( 1 ) ) )
+		self.assertEqual( m.childNames(), [] )
+
+		self.assertTrue( s.hasChild( "group1" ) )
+		self.assertFalse( s.hasChild( "notAChild" ) )
+		self.assertEqual( s.child( "notAChild", IECore.SceneInterface.MissingBehaviour.NullIfMissing ), None )
+		self.assertRaises( RuntimeError, s.child, "notAChild" )
+		self.assertEqual( s.scene( [ "group1", "notAChild" ], IECore.SceneInterface.MissingBehaviour.NullIfMissing ), None )
+
+		self.assertEqual( s.attributeNames(), [] )
+		self.assertEqual( s.readTags(), [] )
+
+	def testSamples( self ) :
+
+		a = IECoreAlembic.AlembicInput( os.path.dirname( __file__ ) + "/data/animatedCube.abc" )
+		s = IECoreAlembic.AlembicScene( os.path.dirname( __file__ ) + "/data/animatedCube.abc", IECore.IndexedIO.OpenMode.Read )
+
+		t = s.child( "pCube1" )
+		at = a.child( "pCube1" )
+		self.assertEqual( t.numTransformSamples(), at.numSamples() )
+		for i in range( 0, at.numSamples() ) :
+			self.assertEqual( t.transformSampleTime( i ), at.timeAtSample( i ) )
+			self.assertEqual( t.readTransformAsMatrixAtSample( i ), at.transformAtSample( i ) )
+			self.assertEqual( t.readTransformAsMatrix( at.timeAtSample( i ) ), at.transformAtTime( at.timeAtSample( i ) ) )
+
+		m = t.child( "pCubeShape1" )
+		am = at.child( "pCubeShape1" )
+		self.assertEqual( m.numObjectSamples(), am.numSamples() )
+		for i in range( 0, am.numSamples() ) :
+			self.assertEqual( m.objectSampleTime( i ), am.timeAtSample( i ) )
+			self.assertEqual( m.readObjectAtSample( i ), am.objectAtSample( i ) )
+
+		time = ( am.timeAtSample( 0 ) + am.timeAtSample( 1 ) ) / 2
+		self.assertEqual( m.readObject( time ), am.objectAtTime( time ) )
+
+	def testSharedHierarchy( self ) :
+
+		fileName = os.path.dirname( __file__ ) + "/data/animatedCube.abc"
+
+		s1 = IECoreAlembic.AlembicScene( fileName, IECore.IndexedIO.OpenMode.Read )
+		s2 = IECoreAlembic.AlembicScene( fileName, IECore.IndexedIO.OpenMode.Read )
+
+		m1 = s1.scene( [ "pCube1", "pCubeShape1" ] )
+		m2 = s2.scene( [ "pCube1", "pCubeShape1" ] )
+
+		self.assertEqual( m1.readObjectAtSample( 0 ), m2.readObjectAtSample( 0 ) )
+		self.assertEqual( m1.fileName(), fileName )
+
+		del s1, m1
+		self.assertEqual( m2.scene( [] ).childNames(), s2.childNames() )
+
+if __name__ == "__main__":
+    unittest.main()
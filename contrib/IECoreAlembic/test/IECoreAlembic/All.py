@@ -42,6 +42,8 @@ warnings.simplefilter( "error", DeprecationWarning )
 
 from AlembicInputTest import AlembicInputTest
 from ABCToMDCTest import ABCToMDCTest
+from ABCToSceneCacheOpTest import ABCToSceneCacheOpTest
+from AlembicSceneTest import AlembicSceneTest
 
 unittest.TestProgram(
 	testRunner = unittest.TextTestRunner(
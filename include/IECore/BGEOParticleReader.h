@@ -65,13 +65,10 @@ class BGEOParticleReader : public ParticleReader
 		virtual unsigned long numParticles();
 		virtual void attributeNames( std::vector<std::string> &names );
 		virtual DataPtr readAttribute( const std::string &name );
+		virtual CompoundDataPtr readAttributes( const std::vector<std::string> &names );
 
 	protected :
 
-		/// Returns a PointsPrimitive object containing all the
-		/// This method overwrites the base class implementation.
-		virtual IECore::ObjectPtr doOperation( const IECore::CompoundObject *operands );
-		
 		// Returns the name of the position primVar
 		virtual std::string positionPrimVarName();
 		
@@ -99,6 +96,7 @@ class BGEOParticleReader : public ParticleReader
 		{
 			Record info;
 			IECore::DataPtr targetData;
+			int offset;
 		};
 		
 		// makes sure that m_iStream is open and that m_header is full.
@@ -125,9 +123,6 @@ class BGEOParticleReader : public ParticleReader
 		
 		template<typename T>
 		void readAttributeData( char **dataBuffer, T *attrBuffer, unsigned long n ) const;
-		
-		// reads all attributes from m_header.attributes and returns CoumpoundData containing the results
-		IECore::CompoundDataPtr readAttributes( const std::vector<std::string> &names );
 };
 
 IE_CORE_DECLAREPTR( BGEOParticleReader );
@@ -35,6 +35,8 @@
 #ifndef IE_CORE_CACHEDREADER_H
 #define IE_CORE_CACHEDREADER_H
 
+#include <vector>
+
 #include "boost/shared_ptr.hpp"
 
 #include "IECore/ObjectPool.h"
@@ -78,7 +80,12 @@ class CachedReader : public RefCounted
 
 		/// As above, but also takes an Op which will be applied to
 		/// objects following loading. Will use the given ObjectPool to store the loaded objects.
-		CachedReader( const SearchPath &paths, ConstModifyOpPtr postProcessor, ObjectPoolPtr objectPool = ObjectPool::defaultObjectPool() );
+		/// By default the Op is applied to only one object at a time. If concurrentPostProcessing
+		/// is true then it may be applied from several threads at once, which requires that
+		/// the Op accesses its arguments only via the operands passed to modify(). In this
+		/// case the values of the Op's parameters are captured at construction, and later
+		/// changes to them will have no effect.
+		CachedReader( const SearchPath &paths, ConstModifyOpPtr postProcessor, ObjectPoolPtr objectPool = ObjectPool::defaultObjectPool(), bool concurrentPostProcessing = false );
 
 		/// Searches for the given file and loads it if found.
 		/// Throws an exception in case it cannot be found or no suitable Reader
@@ -90,6 +97,13 @@ class CachedReader : public RefCounted
 		/// concurrent threads.
 		ConstObjectPtr read( const std::string &file );
 
+		/// Starts loading the given files into the cache on a background
+		/// task, returning immediately. Errors are not reported here, but
+		/// will be raised by subsequent calls to read().
+		/// \threading It is safe to call this method from multiple
+		/// concurrent threads.
+		void prefetch( const std::vector<std::string> &files );
+
 		/// Frees all memory used by the cache.
 		void clear();
 		/// Clears the cache for the given file.
@@ -106,6 +120,15 @@ class CachedReader : public RefCounted
 		/// potentially invalidates the contents of the cache.
 		void setSearchPath( const SearchPath &paths );
 
+		/// When validation is on, the size and modification time of a file
+		/// are checked each time it is accessed, and the file is reloaded
+		/// if either has changed since it was cached. This costs a search
+		/// and a stat per access, so is off by default. Stale entries are
+		/// not removed immediately, but are dropped from the cache in the
+		/// usual least-recently-used fashion.
+		void setValidation( bool validation );
+		bool getValidation() const;
+
 		/// Returns the ObjectPool object used by this CachedReader.
 		ObjectPool *objectPool() const;
 
@@ -123,6 +146,8 @@ class CachedReader : public RefCounted
 		struct MemberData;
 		boost::shared_ptr<MemberData> m_data;
 
+		class PrefetchTask;
+
 };
 
 IE_CORE_DECLAREPTR( CachedReader )
@@ -66,6 +66,7 @@ class CompoundFrameList : public FrameList
 		/// Frames are returned in the order specified by self.frameLists, but duplicate
 		/// frames will be omitted.
 		virtual void asList( std::vector<Frame> &frames ) const ;
+		virtual void asRanges( RangeVector &ranges ) const;
 		virtual std::string asString() const;
 		virtual bool isEqualTo( ConstFrameListPtr other ) const;
 		virtual FrameListPtr copy() const ;
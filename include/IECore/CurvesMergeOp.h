@@ -37,11 +37,12 @@
 
 #include "IECore/TypedPrimitiveOp.h"
 #include "IECore/TypedPrimitiveParameter.h"
+#include "IECore/TypedObjectParameter.h"
 
 namespace IECore
 {
 
-/// An op to merge one set of curves with another.
+/// An op to merge one set of curves with another, or with a list of others.
 /// \ingroup geometryProcessingGroup
 class CurvesMergeOp : public CurvesPrimitiveOp
 {
@@ -55,15 +56,20 @@ class CurvesMergeOp : public CurvesPrimitiveOp
 		CurvesPrimitiveParameter *curvesParameter();
 		const CurvesPrimitiveParameter *curvesParameter() const;
 
+		ObjectVectorParameter *curvesListParameter();
+		const ObjectVectorParameter *curvesListParameter() const;
+
 	protected :
 
 		virtual void modifyTypedPrimitive( CurvesPrimitive *curves, const CompoundObject *operands );
 
 	private :
 
-		struct AppendPrimVars;
+		struct MergeTopology;
 
 		CurvesPrimitiveParameterPtr m_curvesParameter;
+		ObjectVectorParameterPtr m_curvesListParameter;
+		BoolParameterPtr m_removePrimVarsParameter;
 
 };
 
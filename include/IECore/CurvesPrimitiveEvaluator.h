@@ -36,9 +36,12 @@
 #define IECORE_CURVESPRIMITIVEEVALUATOR_H
 
 #include "tbb/mutex.h"
+#include "tbb/atomic.h"
 
 #include "IECore/PrimitiveEvaluator.h"
 #include "IECore/BoundedKDTree.h"
+#include "IECore/VectorTypedData.h"
+#include "IECore/CompoundData.h"
 
 namespace IECore
 {
@@ -146,6 +149,24 @@ class CurvesPrimitiveEvaluator : public PrimitiveEvaluator
 		float curveLength( unsigned curveIndex, float vStart=0.0f, float vEnd=1.0f ) const;
 		//@}
 
+		//! @name Batched query functions
+		/// These perform many queries at once, in parallel, returning a CompoundData containing
+		/// an IntVectorData named "curveIndex" and a FloatVectorData named "v" specifying the
+		/// location of each result, along with vector data holding the value of each of the
+		/// requested primitive variables. Primitive variables of float, int, V3f and Color3f
+		/// types are supported.
+		/// \threading It is safe to call these from multiple concurrent threads.
+		////////////////////////////////////////////////////////////////////////////////////////
+		//@{
+		/// Performs closestPoint() for each of the specified points.
+		CompoundDataPtr closestPoints( const V3fVectorData *points, const std::vector<std::string> &primVarNames ) const;
+		/// Performs pointAtV() for each pair of curve indices and v values. As an individual
+		/// query fails if the curve index or v value is invalid, an additional BoolVectorData
+		/// named "status" is returned, with elements being true only if the corresponding
+		/// results are valid.
+		CompoundDataPtr pointsAtV( const IntVectorData *curveIndices, const FloatVectorData *v, const std::vector<std::string> &primVarNames ) const;
+		//@}
+
 		//! @name Topology access
 		/// These functions make it easier to index curve data manually in cases where the
 		/// queries above are not sufficient.
@@ -182,7 +203,8 @@ class CurvesPrimitiveEvaluator : public PrimitiveEvaluator
 		PrimitiveVariable m_p;
 		
 		void buildTree();
-		bool m_haveTree;
+		struct BuildLines;
+		tbb::atomic<bool> m_haveTree;
 		typedef tbb::mutex TreeMutex;
 		TreeMutex m_treeMutex;
 		Box3fTree m_tree;
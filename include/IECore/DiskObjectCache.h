@@ -0,0 +1,119 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef IECORE_DISKOBJECTCACHE_H
+#define IECORE_DISKOBJECTCACHE_H
+
+#include "boost/shared_ptr.hpp"
+
+#include "IECore/Object.h"
+#include "IECore/MurmurHash.h"
+
+namespace IECore
+{
+
+IE_CORE_FORWARDDECLARE( DiskObjectCache );
+
+/// The DiskObjectCache class stores Objects in a directory on disk, indexed by
+/// their hash. It is intended to be used as a second tier of storage for an
+/// ObjectPool (see ObjectPool::setDiskCache()), so that objects discarded from
+/// memory can be retrieved again cheaply, both by the current process and by
+/// any other process using the same directory.
+///
+/// Each object is saved with Object::save() in a file of its own. Files are
+/// written under a temporary name and renamed into place, so that readers in
+/// other processes never see partially written objects. The modification time
+/// of a file is updated each time it is retrieved, and when the total size of
+/// the files exceeds the maximum, the least recently used ones are removed until
+/// the total falls to 90% of the maximum. Only one process at a time performs
+/// this eviction, coordinated via an advisory lock on a file in the directory.
+/// \threading It is safe to call the methods of DiskObjectCache from concurrent
+/// threads, and from concurrent processes sharing the same directory.
+/// \ingroup utilityGroup
+class DiskObjectCache : public RefCounted
+{
+
+	public :
+
+		IE_CORE_DECLAREMEMBERPTR( DiskObjectCache );
+
+		/// Creates a cache storing objects in the given directory, which is
+		/// created if it doesn't exist already. maxDiskUsage is specified in bytes.
+		DiskObjectCache( const std::string &directory, size_t maxDiskUsage );
+		virtual ~DiskObjectCache();
+
+		/// Returns the directory the objects are stored in.
+		const std::string &directory() const;
+
+		/// Set the maximum number of bytes used on disk, discarding objects if necessary.
+		void setMaxDiskUsage( size_t maxDiskUsage );
+		/// Returns the maximum number of bytes used on disk.
+		size_t getMaxDiskUsage() const;
+		/// Returns the number of bytes currently used on disk. Objects written
+		/// by other processes are accounted for only each time the directory is
+		/// scanned, so this is an approximation.
+		size_t diskUsage() const;
+
+		/// Returns true if an object with the given hash is stored.
+		bool contains( const MurmurHash &hash ) const;
+		/// Loads the object with the given hash, returning NULL if it is not stored.
+		ConstObjectPtr retrieve( const MurmurHash &hash );
+		/// Saves the object under the given hash, which should be the result of
+		/// object->hash(). Does nothing if the object is stored already. Throws
+		/// an IOException if the object can't be written.
+		void store( const MurmurHash &hash, const Object *object );
+		/// Removes the object with the given hash, returning true if it was stored.
+		bool erase( const MurmurHash &hash );
+		/// Removes all stored objects.
+		void clear();
+
+		/// Returns the number of calls to retrieve() which found an object.
+		size_t hits() const;
+		/// Returns the number of calls to retrieve() which didn't find an object.
+		size_t misses() const;
+		/// Resets hits() and misses() to 0.
+		void resetStatistics();
+
+	private :
+
+		struct MemberData;
+		boost::shared_ptr<MemberData> m_data;
+
+};
+
+IE_CORE_DECLAREPTR( DiskObjectCache )
+
+} // namespace IECore
+
+#endif // IECORE_DISKOBJECTCACHE_H
@@ -53,6 +53,7 @@ class EmptyFrameList : public FrameList
 		virtual ~EmptyFrameList();
 
 		virtual void asList( std::vector<Frame> &frames ) const ;
+		virtual void asRanges( RangeVector &ranges ) const;
 		virtual std::string asString() const ;
 		virtual FrameListPtr copy() const ;
 
@@ -48,6 +48,8 @@ namespace IECore
 IE_CORE_FORWARDDECLARE( ObjectParameter );
 
 /// Projects a Lat-Long environment map on a SphericalHarmonics object and returns the resulting SH coefficients.
+/// The projection is made in parallel, and the sample positions and spherical harmonics evaluations are
+/// cached so they can be reused when projecting further maps with the same settings.
 /// \ingroup shGroup
 class EnvMapSHProjector : public Op
 {
@@ -55,10 +57,23 @@ class EnvMapSHProjector : public Op
 
 		IE_CORE_DECLARERUNTIMETYPEDEXTENSION( EnvMapSHProjector, EnvMapSHProjectorTypeId, Op );
 
+		typedef enum
+		{
+			Random = 0,
+			Texels = 1,
+		} Sampling;
+
 		EnvMapSHProjector();
 		
 		virtual ~EnvMapSHProjector();
 
+		/// The sample positions and spherical harmonics evaluations used for projection are held
+		/// in a cache, which by default is limited to 256MB.
+		static void setProjectorCacheMemoryLimit( size_t bytes );
+		static size_t getProjectorCacheMemoryLimit();
+		/// Removes everything from the cache.
+		static void clearProjectorCache();
+
 	protected :
 
 		virtual ObjectPtr doOperation( const CompoundObject * operands );
@@ -68,9 +83,14 @@ class EnvMapSHProjector : public Op
 		M44fParameterPtr m_orientationParameter;
 		IntParameterPtr m_bandsParameter;
 		IntParameterPtr m_samplesParameter;
+		IntParameterPtr m_samplingParameter;
+		FloatParameterPtr m_toleranceParameter;
 		BoolParameterPtr m_applyFilterParameter;
 		BoolParameterPtr m_rightHandSystemParameter;
 		ObjectParameterPtr m_envMapParameter;
+
+		class Cache;
+		static Cache &cache();
 };
 
 IE_CORE_DECLAREPTR( EnvMapSHProjector );
@@ -59,6 +59,7 @@ class ExclusionFrameList : public FrameList
 		FrameListPtr getExclusionFrameList();
 
 		virtual void asList( std::vector<Frame> &frames ) const ;
+		virtual void asRanges( RangeVector &ranges ) const;
 		virtual std::string asString() const ;
 		virtual bool isEqualTo( ConstFrameListPtr other ) const;
 		virtual FrameListPtr copy() const ;
@@ -54,6 +54,24 @@ class FrameList : public RunTimeTyped
 
 		typedef int64_t Frame;
 
+		/// A compact representation of an arithmetic progression of frames,
+		/// running from start to end inclusive, in increments of step.
+		struct Range
+		{
+			Range( Frame start = 0, Frame end = 0, Frame step = 1 );
+
+			Frame start;
+			Frame end;
+			Frame step;
+
+			size_t size() const;
+			bool contains( Frame frame ) const;
+
+			bool operator == ( const Range &other ) const;
+		};
+
+		typedef std::vector<Range> RangeVector;
+
 		IE_CORE_DECLARERUNTIMETYPED( FrameList, RunTimeTyped );
 
 		FrameList();
@@ -71,6 +89,41 @@ class FrameList : public RunTimeTyped
 		/// of lists of frames, where each sublist contains no more than clumpSize frames.
 		void asClumpedList( std::vector< std::vector<Frame> > &clumpedFrames, unsigned int clumpSize ) const;
 
+		/// Returns the frames as a set of disjoint Ranges, sorted by their start frames.
+		/// Ranges with a step greater than one may interleave with one another. The end
+		/// of each range lies on its step, and ranges containing a single frame have a
+		/// step of one. The default implementation builds the ranges from asList(), but
+		/// derived classes should reimplement it so that the frames needn't be expanded.
+		virtual void asRanges( RangeVector &ranges ) const;
+
+		/// @name Range arithmetic
+		/// These methods are implemented using asRanges(), so their cost is proportional
+		/// to the number of ranges needed to represent the frames rather than to the number
+		/// of frames themselves.
+		//////////////////////////////////////////////////////////////
+		//@{
+		/// Returns the number of frames.
+		size_t size() const;
+		/// Returns the lowest frame. Throws if the list is empty.
+		Frame minFrame() const;
+		/// Returns the highest frame. Throws if the list is empty.
+		Frame maxFrame() const;
+		/// Returns true if the list contains every frame between minFrame()
+		/// and maxFrame(), and false otherwise or if the list is empty.
+		bool isContiguous() const;
+		bool contains( Frame frame ) const;
+		/// Returns true if this and other have any frames in common.
+		bool intersects( const FrameList *other ) const;
+		/// Returns a new FrameList containing the frames in both this and other.
+		FrameListPtr setIntersection( const FrameList *other ) const;
+		/// Returns a new FrameList containing the frames in either this or other.
+		FrameListPtr setUnion( const FrameList *other ) const;
+		/// Returns a new FrameList containing the frames in this but not in other.
+		FrameListPtr setDifference( const FrameList *other ) const;
+		/// Returns the simplest FrameList representing the specified disjoint ranges.
+		static FrameListPtr fromRanges( const RangeVector &ranges );
+		//@}
+
 		/// Parses a string and returns the FrameList object that it represents.
 		/// Strings may be in any of the forms returned by SomeFrameListSubclass::asString().
 		/// Subclasses must register a suitable parser for the form that they return
@@ -86,6 +139,17 @@ class FrameList : public RunTimeTyped
 
 		static void registerParser( ParserFn fn );
 
+		/// Utilities for implementing asRanges() in derived classes.
+		/// Converts an arbitrary set of possibly overlapping ranges into
+		/// disjoint ranges of the form required by asRanges().
+		static void unionRanges( RangeVector &ranges );
+		/// Fills result with ranges representing the frames in a but not in b.
+		/// a and b must each contain disjoint ranges.
+		static void subtractRanges( const RangeVector &a, const RangeVector &b, RangeVector &result );
+		/// Fills result with ranges representing the frames in both a and b.
+		/// a and b must each contain disjoint ranges.
+		static void intersectRanges( const RangeVector &a, const RangeVector &b, RangeVector &result );
+
 		template<class T>
 		class Parser
 		{
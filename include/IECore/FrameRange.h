@@ -53,6 +53,7 @@ class FrameRange : public FrameList
 		virtual ~FrameRange();
 
 		virtual void asList( std::vector<Frame> &frames ) const ;
+		virtual void asRanges( RangeVector &ranges ) const;
 		virtual std::string asString() const ;
 		virtual bool isEqualTo( ConstFrameListPtr other ) const;
 		virtual FrameListPtr copy() const;
@@ -38,6 +38,7 @@
 #include "IECore/Op.h"
 #include "IECore/SimpleTypedParameter.h"
 #include "IECore/NumericParameter.h"
+#include "IECore/VectorTypedParameter.h"
 
 namespace IECore
 {
@@ -45,6 +46,10 @@ namespace IECore
 IE_CORE_FORWARDDECLARE( ObjectParameter )
 
 /// The HdrMergeOp merges a set of images with different exposures into a single HDR image.
+/// The images may either be provided in memory via the inputGroup parameter, or as files via
+/// the fileNames parameter. In the latter case the files are read and merged in bands of rows,
+/// so that peak memory usage for the inputs depends on the band height rather than the image
+/// size. In both cases the merging is performed in parallel.
 /// \todo Take in consideration Alpha channel from input images.
 /// \ingroup imageProcessingGroup
 class HdrMergeOp : public Op
@@ -60,6 +65,15 @@ class HdrMergeOp : public Op
 		ObjectParameter * inputGroupParameter();
 		const ObjectParameter * inputGroupParameter() const;
 
+		/// The Parameter for the files to read the images from. When
+		/// non-empty this is used in preference to the inputGroup.
+		StringVectorParameter * fileNamesParameter();
+		const StringVectorParameter * fileNamesParameter() const;
+
+		/// The number of rows read from each file at a time.
+		IntParameter * bandHeightParameter();
+		const IntParameter * bandHeightParameter() const;
+
 		FloatParameter * exposureStepParameter();
 		const FloatParameter * exposureStepParameter() const;
 
@@ -76,6 +90,8 @@ class HdrMergeOp : public Op
 	private :
 
 		ObjectParameterPtr m_inputGroupParameter;
+		StringVectorParameterPtr m_fileNamesParameter;
+		IntParameterPtr m_bandHeightParameter;
 		FloatParameterPtr m_exposureStepParameter;
 		FloatParameterPtr m_exposureAdjustmentParameter;
 		Box2fParameterPtr m_windowingParameter;
@@ -47,7 +47,9 @@
 namespace IECore
 {
 
-/// Performs basic compositing of images.
+/// Performs basic compositing of images. All the channels are composited together in a single
+/// parallel pass over the rows of the result, writing in place over the channels of the input
+/// image wherever possible.
 /// \ingroup imageProcessingGroup
 class ImageCompositeOp : public ImagePrimitiveOp
 {
@@ -111,8 +113,7 @@ class ImageCompositeOp : public ImagePrimitiveOp
 	private :
 		struct ChannelConverter;
 
-		FloatVectorDataPtr getChannelData( ImagePrimitive * image, const std::string &channelName, bool mustExist = true );
-		float readChannelData( const ImagePrimitive * image, const FloatVectorData * data, const Imath::V2i &pixel );
+		ConstFloatVectorDataPtr getChannelData( ImagePrimitive * image, const std::string &channelName, bool mustExist = true );
 
 };
 
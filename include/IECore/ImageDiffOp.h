@@ -49,7 +49,8 @@ IE_CORE_FORWARDDECLARE( ObjectParameter )
 /// Evaluates the root-mean-squared error between two images and returns true if it
 /// exceeds a specified threshold. Unless the "skip missing channels" parameter is
 /// enabled, it will also return true if either image contains a channel which
-/// the other doesn't.
+/// the other doesn't. Pixels outside the data window of an image are considered to be
+/// zero, and all channels are compared in a single parallel pass over the display window.
 /// \ingroup imageProcessingGroup
 class ImageDiffOp : public Op
 {
@@ -72,6 +73,11 @@ class ImageDiffOp : public Op
 		BoolParameter * skipMissingChannels();
 		const BoolParameter * skipMissingChannels() const;
 
+		/// If true (the default), the comparison stops as soon as any channel
+		/// is known to exceed the maximum error.
+		BoolParameter * earlyOutParameter();
+		const BoolParameter * earlyOutParameter() const;
+
 	protected :
 
 		virtual ObjectPtr doOperation( const CompoundObject * operands );
@@ -82,6 +88,7 @@ class ImageDiffOp : public Op
 		ImagePrimitiveParameterPtr m_imageBParameter;
 		FloatParameterPtr m_maxErrorParameter;
 		BoolParameterPtr m_skipMissingChannelsParameter;
+		BoolParameterPtr m_earlyOutParameter;
 
 		class FloatConverter;
 
@@ -64,7 +64,7 @@ class LRUCache : private boost::noncopyable
 		
 		/// The GetterFunction is responsible for computing the value and cost for a cache entry
 		/// when given the key. It should throw a descriptive exception if it can't get the data for
-		/// any reason.
+		/// any reason. Getters which use TBB must run their parallel work via isolatedExecute().
 		typedef boost::function<Ptr ( const Key &key, Cost &cost )> GetterFunction;
 		/// The optional RemovalCallback is called whenever an item is discarded from the cache.
 		typedef boost::function<void ( const Key &key, const Ptr &data )> RemovalCallback;
@@ -146,6 +146,14 @@ class LRUCache : private boost::noncopyable
 		Cache m_cache;
 };
 
+/// Calls f(), without letting the calling thread pick up unrelated TBB tasks while it waits
+/// for any parallel work that f() spawns. An LRUCache GetterFunction is called while its entry
+/// is marked as being computed, so if the thread were to take on a task which requests the same
+/// entry, that task would wait on it forever. Getters which use TBB must therefore do so from
+/// within isolatedExecute(). F must be copyable and provide a const operator()().
+template<typename F>
+void isolatedExecute( const F &f );
+
 } // namespace IECore
 
 #include "IECore/LRUCache.inl"
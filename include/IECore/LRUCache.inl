@@ -39,6 +39,7 @@
 #include <cassert>
 
 #include "tbb/tbb_thread.h"
+#include "tbb/task_arena.h"
 
 #include "IECore/Exception.h"
 
@@ -280,6 +281,18 @@ void LRUCache<Key, Ptr>::nullRemovalCallback( const Key &key, const Ptr &data )
 {
 }
 
+template<typename F>
+void isolatedExecute( const F &f )
+{
+#if TBB_INTERFACE_VERSION >= 10000
+	tbb::this_task_arena::isolate( f );
+#else
+	// A separate arena also stops the thread from taking work from outside it.
+	tbb::task_arena arena;
+	arena.execute( f );
+#endif
+}
+
 } // namespace IECore
 
 #endif // IECORE_LRUCACHE_INL
@@ -57,6 +57,15 @@ class LensDistortOp : public IECore::WarpOp
 		IECore::ObjectParameter * lensParameter();
 		const IECore::ObjectParameter * lensParameter() const;
 
+		/// The distortion maps computed for each combination of lens model parameters, mode and
+		/// data window are cached in memory and reused by subsequent operations, so that a sequence
+		/// of images shot through the same lens only needs the lens model to be evaluated once.
+		/// These methods control the maximum number of bytes the cache may occupy.
+		static void setDistortionMapCacheMemoryLimit( size_t bytes );
+		static size_t getDistortionMapCacheMemoryLimit();
+		/// Removes all maps from the cache.
+		static void clearDistortionMapCache();
+
 		IE_CORE_DECLARERUNTIMETYPEDEXTENSION( LensDistortOp, IECore::LensDistortOpTypeId, IECore::WarpOp );
 
 	protected :
@@ -68,8 +77,8 @@ class LensDistortOp : public IECore::WarpOp
 
 	private :
 
-		Imath::V2f distort( const Imath::V2f &p ) const;
-		Imath::V2f undistort( const Imath::V2f &p ) const;
+		class Cache;
+		static Cache &cache();
 
 		enum Mode
 		{
@@ -84,7 +93,7 @@ class LensDistortOp : public IECore::WarpOp
 		Imath::V2i m_imageSize;
 		Imath::Box2i m_imageDataWindow;
 		Imath::Box2i m_distortedDataWindow;
-		IECore::FloatVectorDataPtr m_cachePtr;
+		IECore::ConstFloatVectorDataPtr m_cachePtr;
 };
 
 IE_CORE_DECLAREPTR( LensDistortOp );
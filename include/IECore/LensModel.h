@@ -101,6 +101,8 @@ class LensModel : public Parameterised
 		//@{
 		/// Compute should be called to set up the internal values. This method must be called
 		/// before subsequent calls to distort(), undistort() and bounds() or their results are undefined.
+		/// Once it has been called, implementations of distort() and undistort() must be safe to call
+		/// from several threads at once, as LensDistortOp evaluates them in parallel.
 		virtual void validate() = 0;
 
 		/// Distorts a point in UV space of the range (0-1) where the lower left corner is 0,0.
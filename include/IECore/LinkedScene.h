@@ -97,6 +97,10 @@ class LinkedScene : public  SampledSceneInterface
 		/// \param time Specifies the time that should be used to query the given scene
 		static IECore::CompoundDataPtr linkAttributeData( const SceneInterface *scene, double time );
 
+		/// Completes the writing of the current location and everything below it, as described
+		/// in SceneCache::finish(). Only available in Write mode, and not at the root.
+		void finish();
+
 		/*
 		 * virtual functions defined in SceneInterface.
 		 */
@@ -134,6 +138,9 @@ class LinkedScene : public  SampledSceneInterface
 		virtual bool hasTag( const Name &name, bool includeChildren = true ) const;
 		virtual void readTags( NameList &tags, bool includeChildren = true ) const;
 		virtual void writeTags( const NameList &tags );
+		/// When the main scene is a SceneCache with a tag index, the answer is composed from the
+		/// indices of the main scene and of the linked scenes containing the tag, without a traversal.
+		virtual void pathsWithTag( const Name &name, std::vector<Path> &paths ) const;
 
 		virtual bool hasObject() const;
 		virtual size_t numObjectSamples() const;
@@ -158,6 +165,9 @@ class LinkedScene : public  SampledSceneInterface
 
 		static ConstSceneInterfacePtr expandLink( const StringData *fileName, const InternedStringVectorData *root, int &linkDepth );
 
+		// appends the paths with the tag from the linked scene, translated to paths in this scene.
+		void linkedPathsWithTag( const Name &name, std::vector<Path> &paths ) const;
+
 		// uses the mainScene to ask what is the time the link is remapped to. Should only be called when the linkAttribute is available.
 		double remappedLinkTime( double time ) const;
 		double remappedLinkTimeAtSample( size_t sampleIndex ) const;
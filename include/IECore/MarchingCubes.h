@@ -35,6 +35,8 @@
 #ifndef IE_CORE_MARCHINGCUBES_H
 #define IE_CORE_MARCHINGCUBES_H
 
+#include <vector>
+
 #include "OpenEXR/ImathVec.h"
 
 #include "IECore/VectorTypedData.h"
@@ -68,21 +70,44 @@ class MarchingCubes : public RefCounted
 
 		virtual ~MarchingCubes();
 				
-		void march( const BoxType &bound, const Imath::V3i &res, ValueBaseType iso = (ValueBaseType)0.0 );
+		/// Generates the isosurface of the implicit function within the given bound, sampling it on a grid
+		/// of the given resolution, and passes the resulting mesh to the builder. Each grid point is evaluated
+		/// only once, and only a few slices of the grid are held in memory at any time. When threaded is true the
+		/// grid is divided into slabs which are marched concurrently, so the implicit function must be safe to
+		/// call from several threads at once. The builder itself is only ever called from the calling thread.
+		void march( const BoxType &bound, const Imath::V3i &res, ValueBaseType iso = (ValueBaseType)0.0, bool threaded = false );
 
 	protected :
 	
 		inline Point gridToWorld( const PointBaseType i, const PointBaseType j, const PointBaseType k ) const;
 				
+		/// Returns the value of the implicit function at a grid point. Only the slices
+		/// around the layer currently being marched are available.
 		inline ValueBaseType getIsoValue( const int i, const int j, const int k );
 
+		/// As getIsoValue(), but offset by the iso value and nudged away from zero.
+		inline ValueBaseType getCornerValue( const int i, const int j, const int k );
+
+		/// Marches the layers of cubes from z0 up to but excluding z1, accumulating the
+		/// vertices and triangles in m_P, m_N and m_triangles.
+		void marchSlab( int z0, int z1 );
+
+		/// Evaluates the implicit function over slice k of the grid.
+		void loadValues( int k );
+
 		void processCube();
 		
 		bool testFace( signed char face );
 
 		bool testInterior( signed char s );
 
-		void computeIntersectionPoints( ValueBaseType iso );
+		typedef std::vector<std::pair<int, int> > BoundaryVertices;
+
+		/// Computes the vertices on the x and y edges of slice k, optionally recording them in boundary
+		/// so that they can be matched against the same vertices generated by the neighbouring slab.
+		void computeIntersectionPointsXY( int k, BoundaryVertices *boundary );
+		/// Computes the vertices on the z edges between slices k and k + 1.
+		void computeIntersectionPointsZ( int k );
 
 		void addTriangle( const char* trig, char n, int v12 = -1 );
 
@@ -107,7 +132,12 @@ class MarchingCubes : public RefCounted
 
 		BoxType m_bound;
 
-		IECore::V3iVectorDataPtr m_verts;
+		ValueBaseType m_iso;
+
+		/// The function values for slices k - 1 to k + 2 around the current layer k, indexed by slice & 3.
+		std::vector<ValueBaseType> m_values[4];
+		/// The vertex indices for the edges of slices k and k + 1, indexed by slice & 1.
+		std::vector<Imath::V3i> m_verts[2];
 
 		Imath::V3i m_currentGridPos;
 
@@ -129,9 +159,15 @@ class MarchingCubes : public RefCounted
 		typedef typename TypedData< std::vector< Imath::Vec3<PointBaseType > > >::Ptr V3xVectorDataPtr;
 		V3xVectorDataPtr m_P;
 		V3xVectorDataPtr m_N;		
+		std::vector<int> m_triangles;
+
+		BoundaryVertices m_bottomVertices;
+		BoundaryVertices m_topVertices;
 		
 	private:
 	
+		struct MarchSlabs;
+
 		/// Lookup tables.		
 		const static char g_cases[256][2] ;
 		const static char g_tiling1[16][3] ;
@@ -36,6 +36,11 @@
 #include <stdio.h>
 #include <stdlib.h>
 
+#include <algorithm>
+
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 #include "OpenEXR/ImathLimits.h"
 
 #include "IECore/MarchingCubes.h"
@@ -43,9 +48,34 @@
 namespace IECore
 {
 
+template< typename ImplicitFn, typename MeshBuilder >
+struct MarchingCubes<ImplicitFn, MeshBuilder>::MarchSlabs
+{
+	MarchSlabs( std::vector<typename MarchingCubes<ImplicitFn, MeshBuilder>::Ptr> &slabs, int slabDepth, int numLayers )
+		:	m_slabs( slabs ), m_slabDepth( slabDepth ), m_numLayers( numLayers )
+	{
+	}
+
+	void operator()( const tbb::blocked_range<size_t> &range ) const
+	{
+		for( size_t i = range.begin(); i != range.end(); ++i )
+		{
+			const int z0 = (int)i * m_slabDepth;
+			m_slabs[i]->marchSlab( z0, std::min( z0 + m_slabDepth, m_numLayers ) );
+		}
+	}
+
+	private :
+
+		std::vector<typename MarchingCubes<ImplicitFn, MeshBuilder>::Ptr> &m_slabs;
+		int m_slabDepth;
+		int m_numLayers;
+};
+
 template< typename ImplicitFn, typename MeshBuilder >
 MarchingCubes<ImplicitFn, MeshBuilder>::MarchingCubes( typename ImplicitFn::Ptr fn, typename MeshBuilder::Ptr builder ) :
 		m_bound(),		
+		m_iso( 0 ),
 		m_fn( fn ),
 		m_builder( builder ),
 		m_resolution( -1, -1, -1 ),
@@ -61,21 +91,137 @@ MarchingCubes<ImplicitFn, MeshBuilder>::~MarchingCubes()
 }
 
 template< typename ImplicitFn, typename MeshBuilder >
-void MarchingCubes<ImplicitFn, MeshBuilder>::march( const MarchingCubes<ImplicitFn, MeshBuilder>::BoxType &bound, const Imath::V3i &res, typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType iso )
+void MarchingCubes<ImplicitFn, MeshBuilder>::march( const MarchingCubes<ImplicitFn, MeshBuilder>::BoxType &bound, const Imath::V3i &res, typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType iso, bool threaded )
 {
 	m_resolution = res;
 	m_bound = bound;
+	m_iso = iso;
+	m_numVerts = 0;
+
+	const int numLayers = m_resolution.z - 1;
+	if( numLayers < 1 || m_resolution.x < 2 || m_resolution.y < 2 )
+	{
+		return;
+	}
+
+	// Each slab of layers is marched by its own instance, as the state of the cube being
+	// processed is held in member variables. Slabs recompute the function values on the
+	// slices adjacent to their neighbours, so we don't make them too thin.
+	const int slabDepth = threaded ? std::max( 8, numLayers / 64 ) : numLayers;
+	std::vector<Ptr> slabs;
+	for( int z = 0; z < numLayers; z += slabDepth )
+	{
+		Ptr slab = new MarchingCubes<ImplicitFn, MeshBuilder>( m_fn, m_builder );
+		slab->m_resolution = m_resolution;
+		slab->m_bound = m_bound;
+		slab->m_iso = m_iso;
+		slabs.push_back( slab );
+	}
+
+	MarchSlabs marchSlabs( slabs, slabDepth, numLayers );
+	if( threaded )
+	{
+		tbb::parallel_for( tbb::blocked_range<size_t>( 0, slabs.size(), 1 ), marchSlabs );
+	}
+	else
+	{
+		marchSlabs( tbb::blocked_range<size_t>( 0, slabs.size() ) );
+	}
+
+	// Pass the results to the builder in slab order. The vertices on the slice shared by two
+	// neighbouring slabs have been generated by both, so those from the upper slab are replaced
+	// by the ones already output for the lower slab.
+	std::vector<int> remap, previousRemap;
+	for( size_t s = 0; s < slabs.size(); ++s )
+	{
+		const MarchingCubes<ImplicitFn, MeshBuilder> *slab = slabs[s].get();
+		const typename V3xVectorData::ValueType &P = slab->m_P->readable();
+		const typename V3xVectorData::ValueType &N = slab->m_N->readable();
+
+		remap.clear();
+		remap.resize( P.size(), -1 );
+
+		if( s > 0 )
+		{
+			const BoundaryVertices &top = slabs[s-1]->m_topVertices;
+			typename BoundaryVertices::const_iterator topIt = top.begin();
+			for( typename BoundaryVertices::const_iterator it = slab->m_bottomVertices.begin(); it != slab->m_bottomVertices.end(); ++it )
+			{
+				while( topIt != top.end() && topIt->first < it->first )
+				{
+					++topIt;
+				}
+				if( topIt != top.end() && topIt->first == it->first )
+				{
+					remap[it->second] = previousRemap[topIt->second];
+				}
+			}
+			slabs[s-1] = 0;
+		}
+
+		for( size_t i = 0; i < P.size(); ++i )
+		{
+			if( remap[i] == -1 )
+			{
+				m_builder->addVertex( P[i], N[i] );
+				remap[i] = m_numVerts++;
+			}
+		}
+
+		const std::vector<int> &triangles = slab->m_triangles;
+		for( size_t i = 0; i + 2 < triangles.size(); i += 3 )
+		{
+			m_builder->addTriangle( remap[triangles[i]], remap[triangles[i+1]], remap[triangles[i+2]] );
+		}
+
+		previousRemap.swap( remap );
+	}
+}
+
+template< typename ImplicitFn, typename MeshBuilder >
+void MarchingCubes<ImplicitFn, MeshBuilder>::marchSlab( int z0, int z1 )
+{
+	assert( z0 >= 0 );
+	assert( z0 < z1 );
+	assert( z1 < m_resolution.z );
+
+	const size_t sliceSize = m_resolution.x * m_resolution.y;
+
 	m_numVerts = 0;
 	m_P = new V3xVectorData();
-	m_N = new V3xVectorData();	
-		
-	m_verts = new V3iVectorData();
-	m_verts->writable().resize( m_resolution.x * m_resolution.y * m_resolution.z, Imath::V3i( -1, -1, -1 ) );
-	
-	computeIntersectionPoints( iso ) ;
+	m_N = new V3xVectorData();
+	m_triangles.clear();
+	m_bottomVertices.clear();
+	m_topVertices.clear();
 
-	for ( m_currentGridPos.z = 0 ; m_currentGridPos.z < m_resolution.z-1 ; m_currentGridPos.z++ )
+	for( int i = 0; i < 4; ++i )
 	{
+		m_values[i].resize( sliceSize );
+	}
+	for( int i = 0; i < 2; ++i )
+	{
+		m_verts[i].resize( sliceSize );
+	}
+
+	for( int k = std::max( z0 - 1, 0 ); k <= std::min( z0 + 2, m_resolution.z - 1 ); ++k )
+	{
+		loadValues( k );
+	}
+
+	computeIntersectionPointsXY( z0, z0 > 0 ? &m_bottomVertices : 0 );
+
+	for( int k = z0; k < z1; ++k )
+	{
+		if( k > z0 && k + 2 < m_resolution.z )
+		{
+			loadValues( k + 2 );
+		}
+
+		computeIntersectionPointsZ( k );
+		computeIntersectionPointsXY( k + 1, ( k + 1 == z1 && z1 < m_resolution.z - 1 ) ? &m_topVertices : 0 );
+
+		m_currentGridPos.z = k;
+
 		for ( m_currentGridPos.y = 0 ; m_currentGridPos.y < m_resolution.y-1 ; m_currentGridPos.y++ )
 		{
 			for ( m_currentGridPos.x = 0 ; m_currentGridPos.x < m_resolution.x-1 ; m_currentGridPos.x++ )
@@ -84,12 +230,7 @@ void MarchingCubes<ImplicitFn, MeshBuilder>::march( const MarchingCubes<Implicit
 
 				for ( int p = 0 ; p < 8 ; ++p )
 				{
-					m_currentCubeValues[p] = getIsoValue( m_currentGridPos.x+((p^(p>>1))&1), m_currentGridPos.y+((p>>1)&1), m_currentGridPos.z+((p>>2)&1) ) - iso ;
-
-					if ( fabs( m_currentCubeValues[p] ) < Imath::limits<typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType>::epsilon() )
-					{
-						m_currentCubeValues[p] = Imath::limits<typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType>::epsilon() ;
-					}
+					m_currentCubeValues[p] = getCornerValue( m_currentGridPos.x+((p^(p>>1))&1), m_currentGridPos.y+((p>>1)&1), m_currentGridPos.z+((p>>2)&1) ) ;
 
 					if ( m_currentCubeValues[p] > 0 )
 					{
@@ -101,6 +242,30 @@ void MarchingCubes<ImplicitFn, MeshBuilder>::march( const MarchingCubes<Implicit
 			}
 		}
 	}
+
+	// only the results are needed from now on
+	for( int i = 0; i < 4; ++i )
+	{
+		std::vector<ValueBaseType>().swap( m_values[i] );
+	}
+	for( int i = 0; i < 2; ++i )
+	{
+		std::vector<Imath::V3i>().swap( m_verts[i] );
+	}
+}
+
+template< typename ImplicitFn, typename MeshBuilder >
+void MarchingCubes<ImplicitFn, MeshBuilder>::loadValues( int k )
+{
+	std::vector<ValueBaseType> &values = m_values[k & 3];
+	typename std::vector<ValueBaseType>::iterator it = values.begin();
+	for( int j = 0; j < m_resolution.y; ++j )
+	{
+		for( int i = 0; i < m_resolution.x; ++i, ++it )
+		{
+			*it = m_fn->operator()( gridToWorld( i, j, k ) );
+		}
+	}
 }
 
 template< typename ImplicitFn, typename MeshBuilder >
@@ -127,98 +292,79 @@ typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType MarchingCubes<Imp
 	assert( k >= 0 );
 	assert( k < m_resolution.z );
 
-	return m_fn->operator()( gridToWorld( i, j, k ) );
-}										           	      
+	return m_values[k & 3][ i + j*m_resolution.x ];
+}
 
 template< typename ImplicitFn, typename MeshBuilder >
-void MarchingCubes<ImplicitFn, MeshBuilder>::computeIntersectionPoints( typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType iso )
+typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType MarchingCubes<ImplicitFn, MeshBuilder>::getCornerValue( const int i, const int j, const int k )
 {
-	for ( m_currentGridPos.z = 0 ; m_currentGridPos.z < m_resolution.z ; m_currentGridPos.z++ )
+	typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType v = getIsoValue( i, j, k ) - m_iso;
+	if ( fabs( v ) < Imath::limits<typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType>::epsilon() )
 	{
-		for ( m_currentGridPos.y = 0 ; m_currentGridPos.y < m_resolution.y ; m_currentGridPos.y++ )
-		{
-			for ( m_currentGridPos.x = 0 ; m_currentGridPos.x < m_resolution.x ; m_currentGridPos.x++ )
-			{
-				m_currentCubeValues[0] = getIsoValue( m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z ) - iso ;
-				if ( m_currentGridPos.x < m_resolution.x - 1 )
-				{
-					m_currentCubeValues[1] = getIsoValue(m_currentGridPos.x+1, m_currentGridPos.y, m_currentGridPos.z ) - iso ;
-				}
-				else
-				{
-					m_currentCubeValues[1] = m_currentCubeValues[0] ;
-				}
+		v = Imath::limits<typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType>::epsilon() ;
+	}
+	return v;
+}
 
-				if ( m_currentGridPos.y < m_resolution.y - 1 )
-				{
-					m_currentCubeValues[3] = getIsoValue( m_currentGridPos.x, m_currentGridPos.y+1, m_currentGridPos.z ) - iso ;
-				}
-				else
-				{
-					m_currentCubeValues[3] = m_currentCubeValues[0] ;
-				}
+template< typename ImplicitFn, typename MeshBuilder >
+void MarchingCubes<ImplicitFn, MeshBuilder>::computeIntersectionPointsXY( int k, typename MarchingCubes<ImplicitFn, MeshBuilder>::BoundaryVertices *boundary )
+{
+	std::vector<Imath::V3i> &verts = m_verts[k & 1];
+	std::fill( verts.begin(), verts.end(), Imath::V3i( -1, -1, -1 ) );
 
-				if ( m_currentGridPos.z < m_resolution.z - 1 )
-				{
-					m_currentCubeValues[4] = getIsoValue( m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z+1) - iso ;
-				}
-				else
-				{
-					m_currentCubeValues[4] = m_currentCubeValues[0] ;
-				}
+	m_currentGridPos.z = k;
+	for ( m_currentGridPos.y = 0 ; m_currentGridPos.y < m_resolution.y ; m_currentGridPos.y++ )
+	{
+		for ( m_currentGridPos.x = 0 ; m_currentGridPos.x < m_resolution.x ; m_currentGridPos.x++ )
+		{
+			m_currentCubeValues[0] = getCornerValue( m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z ) ;
+			m_currentCubeValues[1] = m_currentGridPos.x < m_resolution.x - 1 ? getCornerValue( m_currentGridPos.x+1, m_currentGridPos.y, m_currentGridPos.z ) : m_currentCubeValues[0] ;
+			m_currentCubeValues[3] = m_currentGridPos.y < m_resolution.y - 1 ? getCornerValue( m_currentGridPos.x, m_currentGridPos.y+1, m_currentGridPos.z ) : m_currentCubeValues[0] ;
 
-				if ( fabs( m_currentCubeValues[0] ) < Imath::limits<typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType>::epsilon() )
-				{
-					m_currentCubeValues[0] = Imath::limits<typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType>::epsilon() ;
-				}
-				if ( fabs( m_currentCubeValues[1] ) < Imath::limits<typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType>::epsilon() )
-				{
-					m_currentCubeValues[1] = Imath::limits<typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType>::epsilon() ;
-				}
-				if ( fabs( m_currentCubeValues[3] ) < Imath::limits<typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType>::epsilon() )
-				{
-					m_currentCubeValues[3] = Imath::limits<typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType>::epsilon() ;
-				}
-				if ( fabs( m_currentCubeValues[4] ) < Imath::limits<typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType>::epsilon() )
-				{
-					m_currentCubeValues[4] = Imath::limits<typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType>::epsilon() ;
-				}
+			// the boundary key orders the edges as they are visited here
+			const int key = ( m_currentGridPos.x + m_currentGridPos.y * m_resolution.x ) * 2;
 
-				if ( m_currentCubeValues[0] < 0 )
+			if ( ( m_currentCubeValues[0] < 0 ) != ( m_currentCubeValues[1] < 0 ) )
+			{
+				const int v = addVertexX( );
+				setVertX( v, m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z ) ;
+				if( boundary )
 				{
-					if ( m_currentCubeValues[1] > 0 )
-					{
-						setVertX( addVertexX( ), m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z ) ;
-					}
-					if ( m_currentCubeValues[3] > 0 )
-					{
-						setVertY( addVertexY( ), m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z ) ;
-					}
-					if ( m_currentCubeValues[4] > 0 )
-					{
-						setVertZ( addVertexZ( ), m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z ) ;
-					}
+					boundary->push_back( std::pair<int, int>( key, v ) );
 				}
-				else
+			}
+			if ( ( m_currentCubeValues[0] < 0 ) != ( m_currentCubeValues[3] < 0 ) )
+			{
+				const int v = addVertexY( );
+				setVertY( v, m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z ) ;
+				if( boundary )
 				{
-					if ( m_currentCubeValues[1] < 0 )
-					{
-						setVertX( addVertexX( ), m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z ) ;
-					}
-					if ( m_currentCubeValues[3] < 0 )
-					{
-						setVertY( addVertexY( ), m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z ) ;
-					}
-					if ( m_currentCubeValues[4] < 0 )
-					{
-						setVertZ( addVertexZ( ), m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z ) ;
-					}
+					boundary->push_back( std::pair<int, int>( key + 1, v ) );
 				}
 			}
 		}
 	}
 }
 
+template< typename ImplicitFn, typename MeshBuilder >
+void MarchingCubes<ImplicitFn, MeshBuilder>::computeIntersectionPointsZ( int k )
+{
+	assert( k < m_resolution.z - 1 );
+
+	m_currentGridPos.z = k;
+	for ( m_currentGridPos.y = 0 ; m_currentGridPos.y < m_resolution.y ; m_currentGridPos.y++ )
+	{
+		for ( m_currentGridPos.x = 0 ; m_currentGridPos.x < m_resolution.x ; m_currentGridPos.x++ )
+		{
+			m_currentCubeValues[0] = getCornerValue( m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z ) ;
+			m_currentCubeValues[4] = getCornerValue( m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z+1 ) ;
+
+			const int v = ( m_currentCubeValues[0] < 0 ) != ( m_currentCubeValues[4] < 0 ) ? addVertexZ( ) : -1;
+			setVertZ( v, m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z ) ;
+		}
+	}
+}
+
 template< typename ImplicitFn, typename MeshBuilder >
 bool MarchingCubes<ImplicitFn, MeshBuilder>::testFace( signed char face )
 {
@@ -977,7 +1123,9 @@ void MarchingCubes<ImplicitFn, MeshBuilder>::addTriangle( const char* trig, char
 
 		if ( t%3 == 2 )
 		{
-			m_builder->addTriangle(tv[0], tv[1], tv[2] );
+			m_triangles.push_back( tv[0] );
+			m_triangles.push_back( tv[1] );
+			m_triangles.push_back( tv[2] );
 		}
 	}
 }
@@ -1083,37 +1231,37 @@ typename MarchingCubes<ImplicitFn, MeshBuilder>::ValueBaseType MarchingCubes<Imp
 template< typename ImplicitFn, typename MeshBuilder >
 int MarchingCubes<ImplicitFn, MeshBuilder>::getVertX( const int i, const int j, const int k ) const
 {
-	return m_verts->readable()[ i + j*m_resolution.x + k*m_resolution.x*m_resolution.y].x ;
+	return m_verts[k & 1][ i + j*m_resolution.x ].x ;
 }
 
 template< typename ImplicitFn, typename MeshBuilder >
 int MarchingCubes<ImplicitFn, MeshBuilder>::getVertY( const int i, const int j, const int k ) const
 {
-	return m_verts->readable()[ i + j*m_resolution.x + k*m_resolution.x*m_resolution.y].y ;
+	return m_verts[k & 1][ i + j*m_resolution.x ].y ;
 }
 
 template< typename ImplicitFn, typename MeshBuilder >
 int MarchingCubes<ImplicitFn, MeshBuilder>::getVertZ( const int i, const int j, const int k ) const
 {
-	return m_verts->readable()[ i + j*m_resolution.x + k*m_resolution.x*m_resolution.y].z ;
+	return m_verts[k & 1][ i + j*m_resolution.x ].z ;
 }
 
 template< typename ImplicitFn, typename MeshBuilder >
 void MarchingCubes<ImplicitFn, MeshBuilder>::setVertX( const int val, const int i, const int j, const int k )
 {
-	m_verts->writable()[ i + j*m_resolution.x + k*m_resolution.x*m_resolution.y].x = val ;
+	m_verts[k & 1][ i + j*m_resolution.x ].x = val ;
 }
 
 template< typename ImplicitFn, typename MeshBuilder >
 void MarchingCubes<ImplicitFn, MeshBuilder>::setVertY( const int val, const int i, const int j, const int k )
 {
-	m_verts->writable()[ i + j*m_resolution.x + k*m_resolution.x*m_resolution.y].y = val ;
+	m_verts[k & 1][ i + j*m_resolution.x ].y = val ;
 }
 
 template< typename ImplicitFn, typename MeshBuilder >
 void MarchingCubes<ImplicitFn, MeshBuilder>::setVertZ( const int val, const int i, const int j, const int k )
 {
-	m_verts->writable()[ i + j*m_resolution.x + k*m_resolution.x*m_resolution.y].z = val ;
+	m_verts[k & 1][ i + j*m_resolution.x ].z = val ;
 }
 
 template< typename ImplicitFn, typename MeshBuilder >
@@ -1128,8 +1276,6 @@ int MarchingCubes<ImplicitFn, MeshBuilder>::addVertexX( )
 	typename MarchingCubes<ImplicitFn, MeshBuilder>::Vector p = gridToWorld( m_currentGridPos.x+u, m_currentGridPos.y, m_currentGridPos.z );
 	typename MarchingCubes<ImplicitFn, MeshBuilder>::Vector n = getGradient(m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z)*(1-u) + getGradient(m_currentGridPos.x+1, m_currentGridPos.y, m_currentGridPos.z) *u;
 
-	m_builder->addVertex( p, n );
-	
 	m_P->writable().push_back( p );
 	m_N->writable().push_back( n );		
 	
@@ -1148,8 +1294,6 @@ int MarchingCubes<ImplicitFn, MeshBuilder>::addVertexY( )
 	typename MarchingCubes<ImplicitFn, MeshBuilder>::Vector p = gridToWorld( m_currentGridPos.x, m_currentGridPos.y+u, m_currentGridPos.z );
 	typename MarchingCubes<ImplicitFn, MeshBuilder>::Vector n = getGradient(m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z)*(1-u) + getGradient(m_currentGridPos.x, m_currentGridPos.y+1, m_currentGridPos.z)*u ;
 
-	m_builder->addVertex( p, n );
-	
 	m_P->writable().push_back( p );
 	m_N->writable().push_back( n );	
 	
@@ -1168,8 +1312,6 @@ int MarchingCubes<ImplicitFn, MeshBuilder>::addVertexZ( )
 	typename MarchingCubes<ImplicitFn, MeshBuilder>::Vector p = gridToWorld( m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z+u );
 	typename MarchingCubes<ImplicitFn, MeshBuilder>::Vector n = getGradient(m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z)*(1-u) + getGradient(m_currentGridPos.x, m_currentGridPos.y, m_currentGridPos.z+1) * u;
 
-	m_builder->addVertex( p, n );
-	
 	m_P->writable().push_back( p );
 	m_N->writable().push_back( n );	
 	
@@ -1275,8 +1417,6 @@ int MarchingCubes<ImplicitFn, MeshBuilder>::addVertexC( )
 	p /= u;
 	n /= u;
 
-	m_builder->addVertex( p, n );
-	
 	m_P->writable().push_back( p );
 	m_N->writable().push_back( n );		
 	
@@ -50,6 +50,10 @@ namespace IECore
 /// light directions and positions. This allows the use of the class
 /// as a simple 2d point distribution algorithm in addition to
 /// a light probe sampler.
+///
+/// The summed area table used to find the cuts is cached, so sampling
+/// the same image repeatedly (for instance with different subdivision
+/// depths) only computes it once.
 /// \ingroup imageProcessingGroup
 class MedianCutSampler : public Op
 {
@@ -79,6 +83,13 @@ class MedianCutSampler : public Op
 		IntParameter * projectionParameter();
 		const IntParameter * projectionParameter() const;
 
+		/// The summed area tables are stored in a cache, which by
+		/// default is limited to 256MB.
+		static void setSummedAreaTableCacheMemoryLimit( size_t bytes );
+		static size_t getSummedAreaTableCacheMemoryLimit();
+		/// Removes everything from the cache.
+		static void clearSummedAreaTableCache();
+
 	protected :
 
 		ObjectPtr doOperation( const CompoundObject * operands );
@@ -90,6 +101,9 @@ class MedianCutSampler : public Op
 		IntParameterPtr m_subdivisionDepthParameter;
 		IntParameterPtr m_projectionParameter;
 
+		class Cache;
+		static Cache &cache();
+
 };
 
 IE_CORE_DECLAREPTR( MedianCutSampler );
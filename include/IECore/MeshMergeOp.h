@@ -37,11 +37,12 @@
 
 #include "IECore/TypedPrimitiveOp.h"
 #include "IECore/TypedPrimitiveParameter.h"
+#include "IECore/TypedObjectParameter.h"
 
 namespace IECore
 {
 
-/// A MeshPrimitiveOp to merge one mesh with another.
+/// A MeshPrimitiveOp to merge one mesh with another, or with a list of others.
 /// \ingroup geometryProcessingGroup
 class MeshMergeOp : public MeshPrimitiveOp
 {
@@ -55,25 +56,19 @@ class MeshMergeOp : public MeshPrimitiveOp
 		MeshPrimitiveParameter * meshParameter();
 		const MeshPrimitiveParameter * meshParameter() const;
 
+		ObjectVectorParameter * meshListParameter();
+		const ObjectVectorParameter * meshListParameter() const;
+
 	protected :
 
 		virtual void modifyTypedPrimitive( MeshPrimitive * mesh, const CompoundObject * operands );
 
 	private :
 
-		struct AppendPrimVars;
-		struct PrependPrimVars;
-		
-		template<class T>
-		struct DefaultValue;
-		
-		template<class T>
-		struct DefaultValue<Imath::Vec3<T> >;
-
-		template<class T>
-		struct DefaultValue<Imath::Vec2<T> >;
+		struct MergeTopology;
 
 		MeshPrimitiveParameterPtr m_meshParameter;
+		ObjectVectorParameterPtr m_meshListParameter;
 		BoolParameterPtr m_removePrimVarsParameter;
 
 };
@@ -61,6 +61,7 @@ class NParticleReader : public ParticleReader
 		virtual unsigned long numParticles();
 		virtual void attributeNames( std::vector<std::string> &names );
 		virtual DataPtr readAttribute( const std::string &name );
+		virtual CompoundDataPtr readAttributes( const std::vector<std::string> &names );
 		
 		/// returns IntVectorData of all frames contained in the nCache
 		/// the frameIndex parameter should be set using an index into this IntVectorData
@@ -111,8 +112,9 @@ class NParticleReader : public ParticleReader
 		IntVectorDataPtr m_frames;
 		std::map<int, IFFFile::Chunk::ChunkIterator> frameToRootChildren;
 		
-		template<typename T, typename F>
-		typename T::Ptr filterAttr( const F * attr, float percentage );
+		// reads the channel named by the CHNM chunk at attrIt, filtering it using
+		// the mask for its size, which is computed and stored in masks if necessary.
+		DataPtr readAttribute( const std::string &name, IFFFile::Chunk::ChunkIterator attrIt, IFFFile::Chunk::ChunkIterator end, std::map<int, std::vector<bool> > &masks );
 };
 
 IE_CORE_DECLAREPTR( NParticleReader );
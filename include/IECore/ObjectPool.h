@@ -44,12 +44,18 @@ namespace IECore
 {
 
 IE_CORE_FORWARDDECLARE( ObjectPool );
+IE_CORE_FORWARDDECLARE( DiskObjectCache );
 
 /// \addtogroup environmentGroup
 ///
 /// <b>IECORE_OBJECTPOOL_MEMORY</b><br>
 /// Used to specify the memory limits for the default ObjectPool. See
 /// ObjectPool::defaultObjectPool() for more information.
+///
+/// <b>IECORE_OBJECTPOOL_DISKCACHE_PATH</b><br>
+/// <b>IECORE_OBJECTPOOL_DISKCACHE_SIZE</b><br>
+/// Used to specify a DiskObjectCache for the default ObjectPool. See
+/// ObjectPool::defaultObjectPool() for more information.
 
 /// The ObjectPool class implements a cache of Object instances indexed by their own hash and limited by the memory consumption.
 /// The function defaultObjectPool() returns a singleton object that should be used by most of the operations, 
@@ -80,11 +86,14 @@ class ObjectPool : public RefCounted
 		/// Returns the current memory cost of items held in the pool
 		size_t memoryUsage() const;
 
-		/// Returns true if the object with the given hash is in the pool.
+		/// Returns true if the object with the given hash is in the pool, or
+		/// in the disk cache if there is one.
 		/// Note: this function doesn't garantee that retrieve() will return an object in a multi-threaded application.
 		bool contains( const MurmurHash &hash ) const;
 
 		/// Retrieves the Object with the given hash, or NULL if not held in the pool.
+		/// If the object is not in memory but is in the disk cache, it is loaded
+		/// from there and returned to memory.
 		ConstObjectPtr retrieve( const MurmurHash &hash ) const;
 
 		/// Enum used to specify how to store the pointer passed to the store() function.
@@ -100,13 +109,26 @@ class ObjectPool : public RefCounted
 		/// prevent affecting the contents of the pool and it's memoryUsage count.
 		ConstObjectPtr store( const Object *obj, StoreMode mode );
 
+		/// Specifies a DiskObjectCache to be used as a second tier of storage.
+		/// Objects discarded from memory to honour the memory limit are written
+		/// to it, and retrieve() falls back to it when an object isn't in memory.
+		/// Objects removed explicitly with clear() or erase() are not written.
+		/// Passing NULL disables the second tier.
+		/// \threading This should not be called while other threads are using the pool.
+		void setDiskCache( DiskObjectCachePtr diskCache );
+		/// Returns the DiskObjectCache in use, or NULL if there is none.
+		DiskObjectCache *getDiskCache() const;
+
 		/// Returns a static ObjectPool instance to be used by anything
 		/// wishing to share IECore::Object instances. 
 		/// It makes sense to use this wherever possible to conserve memory. This initially
 		/// has a memory limit specified in megabytes by the IECORE_OBJECTPOOL_MEMORY
 		/// environment variable. If it needs changing it's recommended to do 
 		/// that from a config file loaded by the ConfigLoader, to avoid multiple 
-		/// clients fighting over the same set of settings.
+		/// clients fighting over the same set of settings. If the
+		/// IECORE_OBJECTPOOL_DISKCACHE_PATH environment variable specifies a
+		/// directory then a DiskObjectCache is used as a second tier of storage,
+		/// with a size limit specified in megabytes by IECORE_OBJECTPOOL_DISKCACHE_SIZE.
 		static ObjectPoolPtr defaultObjectPool();
 
 	private:
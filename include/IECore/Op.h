@@ -71,11 +71,15 @@ class Op : public Parameterised
 		/// Throws an Exception if the parameter values are not valid.
 		ObjectPtr operate();
 
-		/// Performs the operation using the given values of parameters.
+		/// Performs the operation using the given values of parameters. Unlike
+		/// operate(), this doesn't update the value of resultParameter().
+		/// \threading This may be called concurrently from multiple threads
+		/// provided that the derived class accesses its arguments only via the
+		/// operands passed to doOperation(), and never via the parameters.
 		ObjectPtr operate( const CompoundObject *operands );
 
 		/// Returns a parameter describing the result of the operation - the
-		/// value of this parameter is always the value last returned by operate.
+		/// value of this parameter is always the value last returned by operate().
 		const Parameter *resultParameter() const;
 
 	protected :
@@ -62,6 +62,7 @@ class PDCParticleReader : public ParticleReader
 		virtual unsigned long numParticles();
 		virtual void attributeNames( std::vector<std::string> &names );
 		virtual DataPtr readAttribute( const std::string &name );
+		virtual CompoundDataPtr readAttributes( const std::vector<std::string> &names );
 
 	protected:
 		
@@ -104,6 +105,8 @@ class PDCParticleReader : public ParticleReader
 
 		template<typename T>
 		void readElements( T *buffer, std::streampos pos, unsigned long n ) const;
+		// reads and filters a single attribute, using a mask computed by filterMask().
+		DataPtr readAttribute( const Record &record, const std::vector<bool> &mask );
 
 		// loads particleId in a completely unfiltered state
 		const Data * idAttribute();
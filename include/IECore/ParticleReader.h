@@ -36,6 +36,7 @@
 #define IE_CORE_PARTICLEREADER_H
 
 #include "IECore/Reader.h"
+#include "IECore/CompoundData.h"
 #include "IECore/SimpleTypedParameter.h"
 #include "IECore/VectorTypedParameter.h"
 #include "IECore/NumericParameter.h"
@@ -101,6 +102,14 @@ class ParticleReader : public Reader
 		/// exist. The type of Data is chosen automatically to best represent the
 		/// particle data.
 		virtual DataPtr readAttribute( const std::string &name ) = 0;
+		/// Reads all the specified attributes, filtered by the percentage
+		/// specified in parameters(), returning them in a CompoundData. Attributes
+		/// which don't exist are omitted from the result, and 0 is returned if
+		/// the file can't be read. The default implementation simply calls
+		/// readAttribute() for each name, but derived classes should reimplement
+		/// it to read all the attributes in a single pass where the file format
+		/// allows.
+		virtual CompoundDataPtr readAttributes( const std::vector<std::string> &names );
 		//@}
 
 	protected :
@@ -132,6 +141,18 @@ class ParticleReader : public Reader
 		/// particle index if no id is provided.
 		template<typename T, typename F>
 		typename T::Ptr filterAttr( const F * attr, float percentage, const Data *idAttr ) const;
+
+		/// Computes a mask specifying which of numParticles particles survive the
+		/// percentage filtering, so that the random numbers need only be drawn once
+		/// when reading several attributes. The decision for each particle is based
+		/// on its id if idAttr is specified, and on its index otherwise, matching
+		/// the filterAttr() method above. Returns false if no filtering is required,
+		/// in which case the mask is left empty.
+		bool filterMask( size_t numParticles, const Data *idAttr, std::vector<bool> &mask ) const;
+		/// Filters and converts attr using a mask computed by filterMask(). An empty mask
+		/// performs type conversion only.
+		template<typename T, typename F>
+		typename T::Ptr filterAttr( const F * attr, const std::vector<bool> &mask ) const;
 		
 		/// Returns the name of the original position primVar should we need to convert it to "P"
 		virtual std::string positionPrimVarName() = 0;
@@ -35,6 +35,8 @@
 #ifndef IE_CORE_PARTICLEREADER_INL
 #define IE_CORE_PARTICLEREADER_INL
 
+#include <algorithm>
+
 #include "OpenEXR/ImathRandom.h"
 #include "IECore/MessageHandler.h"
 #include "IECore/Convert.h"
@@ -100,6 +102,30 @@ typename T::Ptr ParticleReader::filterAttr( const F *attr, float percentage, con
 	return typename T::Ptr( (T *)attr );
 }
 
+template<typename T, typename F>
+typename T::Ptr ParticleReader::filterAttr( const F *attr, const std::vector<bool> &mask ) const
+{
+	if( mask.size() )
+	{
+		// percentage filtering (and type conversion if necessary)
+		typename T::Ptr result( new T );
+		const typename F::ValueType &in = attr->readable();
+		typename T::ValueType &out = result->writable();
+		out.reserve( std::count( mask.begin(), mask.end(), true ) );
+		const size_t size = std::min( in.size(), mask.size() );
+		for( size_t i=0; i<size; i++ )
+		{
+			if( mask[i] )
+			{
+				out.push_back( convert< typename T::ValueType::value_type, typename F::ValueType::value_type >( in[i] ) );
+			}
+		}
+		return result;
+	}
+
+	return filterAttr<T, F>( attr, 100.0f, 0 );
+}
+
 template<typename T, typename F, typename U >
 typename T::Ptr ParticleReader::filterAttr( const F *attr, float percentage, const std::vector< U > &ids ) const
 {
@@ -56,6 +56,13 @@ namespace IECore
 /// parameter (which defaults to "P"). Optionally one can also deform a normal V3fVectorData primitive variable (which
 /// defaults to "N"). These variables must have the same number of elements and must match the number of points in the
 /// SmoothSkinningData.
+///
+/// Points are deformed in parallel, with positions and normals being deformed in a single pass. The
+/// packInfluences parameter may be used to rearrange the influences into a fixed number per point
+/// (the maximum used by any point) so they can be accessed sequentially - this is generally faster when
+/// the influence counts are similar for all points, but wastes time and memory on padding when a few
+/// points have many more influences than the rest. The packed layout is retained between calls for as
+/// long as the SmoothSkinningData remains unchanged.
 /// \ingroup geometryProcessingGroup
 /// \ingroup skinningGroup
 class PointSmoothSkinningOp : public ModifyOp
@@ -103,6 +110,11 @@ class PointSmoothSkinningOp : public ModifyOp
 		IntParameter * blendParameter();
 		const IntParameter * blendParameter() const;
 
+		/// parameter to control whether the influences are packed into a fixed number per point
+		/// before deformation, defaults to false
+		BoolParameter * packInfluencesParameter();
+		const BoolParameter * packInfluencesParameter() const;
+
 	protected:
 
         virtual void modify( Object *object, const CompoundObject * operands );
@@ -115,8 +127,15 @@ class PointSmoothSkinningOp : public ModifyOp
 		IntParameterPtr m_blendParameter;
 		BoolParameterPtr m_deformNormalsParameter;
 		M44fVectorParameterPtr m_deformationPoseParameter;
+		BoolParameterPtr m_packInfluencesParameter;
 
 		SmoothSkinningDataPtr m_prevSmoothSkinningData;
+
+		// influences packed into m_packedInfluenceCount entries per point, derived
+		// from m_prevSmoothSkinningData on demand.
+		int m_packedInfluenceCount;
+		std::vector<int> m_packedInfluenceIndices;
+		std::vector<float> m_packedInfluenceWeights;
 };
 
 IE_CORE_DECLAREPTR( PointSmoothSkinningOp );
@@ -59,6 +59,10 @@ class ReorderedFrameList : public FrameList
 
 		virtual bool isEqualTo( ConstFrameListPtr other ) const;
 
+		/// Reordering doesn't change the set of frames, so the ranges
+		/// are simply those of the child list.
+		virtual void asRanges( RangeVector &ranges ) const;
+
 	protected :
 
 		FrameListPtr m_frameList;
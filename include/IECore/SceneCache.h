@@ -46,8 +46,8 @@ IE_CORE_FORWARDDECLARE( SceneCache );
 /// the ability to traverse the scene and perform partial loading on demand.
 /// When saving, it's important to keep the initial root SceneCache object alive until the very end.
 /// The destruction of the root scene will trigger the recursive computation of the bounding boxes for all the
-/// locations that no bounds were written. It will also store (without duplication) all the
-/// sample times used by objects, transforms, bounds and attributes.
+/// locations that no bounds were written, unless they were already completed with finish(). It will also
+/// store (without duplication) all the sample times used by objects, transforms, bounds and attributes.
 /// \ingroup ioGroup
 class SceneCache : public SampledSceneInterface
 {
@@ -113,6 +113,10 @@ class SceneCache : public SampledSceneInterface
 		virtual bool hasTag( const Name &name, bool includeChildren = true ) const;
 		virtual void readTags( NameList &tags, bool includeChildren = true ) const;
 		virtual void writeTags( const NameList &tags );
+		/// Answers using the tag index written when the file is closed, without
+		/// traversing the hierarchy. Falls back to the traversal for files written
+		/// before the tag index was introduced.
+		virtual void pathsWithTag( const Name &name, std::vector<Path> &paths ) const;
 
 		virtual bool hasObject() const;
 		virtual size_t numObjectSamples() const;
@@ -130,6 +134,17 @@ class SceneCache : public SampledSceneInterface
 		virtual SceneInterfacePtr createChild( const Name &name );
 		virtual SceneInterfacePtr scene( const Path &path, MissingBehaviour missingBehaviour = ThrowIfMissing );
 		virtual ConstSceneInterfacePtr scene( const Path &path, SceneInterface::MissingBehaviour missingBehaviour = ThrowIfMissing ) const;
+
+		/// Completes the writing of this location and all the locations below it,
+		/// computing any bounds which weren't written explicitly and committing
+		/// everything to the file, so that the memory used to hold it can be freed.
+		/// No further changes may be made to these locations afterwards, and the
+		/// locations below this one may no longer be accessed. This is
+		/// done for all remaining locations when the root is destroyed, but calling
+		/// it for each location as soon as it is complete means that the memory used
+		/// while writing grows with the locations still being written, rather than
+		/// with the whole file. Only available in Write mode, and not at the root.
+		void finish();
 		
 		// The attribute names used to mark animated topology and primitive variables
 		// when SceneCache objects are Primitives.
@@ -145,6 +160,10 @@ class SceneCache : public SampledSceneInterface
 		/// LinkedScene need to specify whether the tag is supposed to be saved
 		/// as a local tag or a tag that was artificially inherited from the child transforms.
 		void writeTags( const NameList &tags,  bool fromChildren );
+		/// Fills paths with the locations at or below the current one where the tag
+		/// was written with fromChildren set to true, as LinkedScene does for the tags
+		/// of linked scenes. Returns false if the file has no tag index.
+		bool pathsWithTagFromChildren( const Name &name, std::vector<Path> &paths ) const;
 
 		friend class LinkedScene;
 		
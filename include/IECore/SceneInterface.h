@@ -181,6 +181,20 @@ class SceneInterface : public RunTimeTyped
 		virtual void readTags( NameList &tags, bool includeChildren = true ) const = 0;
 		/// Adds tags to the current scene location.
 		virtual void writeTags( const NameList &tags ) = 0;
+		/// Fills paths with the locations at or below the current one which have the given tag
+		/// written in them (as reported by hasTag( name, false )). The paths are absolute and sorted.
+		/// The default implementation traverses the hierarchy, using hasTag( name, true ) to skip the
+		/// branches without the tag. Implementations which keep an index of their tags should override
+		/// it to answer without a traversal.
+		virtual void pathsWithTag( const Name &name, std::vector<Path> &paths ) const;
+		/// Fills paths with the locations at or below the current one whose tags match the expression.
+		/// The expression is a whitespace separated list of tag names, which may contain the wildcards
+		/// supported by fnmatch. Locations with any of the plain terms are included, terms prefixed
+		/// with '&' are also required, and terms prefixed with '!' exclude locations. When there are no
+		/// plain terms, all tagged locations are considered. For example, "ObjectType:* !proxy" matches
+		/// all locations with an object, except the ones tagged as proxies. The paths are absolute and
+		/// sorted. This is implemented in terms of pathsWithTag().
+		void matchingPaths( const std::string &tagExpression, std::vector<Path> &paths ) const;
 
 		/*
 		 * Object
@@ -235,6 +249,11 @@ class SceneInterface : public RunTimeTyped
 		/// this will be "/". Use the childNames() and child() methods
 		/// to traverse to other parts of the scene.
 		static void stringToPath( const std::string &path, Path &p );
+		/// Orders names by their string values, rather than by the addresses of the interned strings.
+		static bool nameLess( const Name &a, const Name &b );
+		/// Orders paths lexicographically using nameLess(). This is the order in which pathsWithTag()
+		/// and matchingPaths() return their results.
+		static bool pathLess( const Path &a, const Path &b );
 
 	protected:
 
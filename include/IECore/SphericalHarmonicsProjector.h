@@ -49,6 +49,10 @@ namespace IECore
 /// The object defines a distribution of points over the sphere surface and uses that distribution to 
 /// project a given function onto a spherical harmonics object.
 /// Based mainly on "Spherical Harmonic Lighting: The Gritty Details" by Robin Green.
+///
+/// The projection functions accumulate the samples in parallel, with each thread summing into
+/// its own partial coefficients. The functors passed to them are copied for use on each thread,
+/// and must be safe to call concurrently.
 /// \ingroup shGroup
 template < typename V >
 class SphericalHarmonicsProjector
@@ -101,6 +105,19 @@ class SphericalHarmonicsProjector
 		template< typename T, typename U > 
 		void euclideanProjection( T functor, SphericalHarmonics< U > & result ) const;
 
+		// Sets the given SphericalHarmonics object with the projection of the given functor for every sample index.
+		// This is useful when the values are already known per sample, and don't need to be looked up by coordinate.
+		// the value stored in the spherical harmonics is the same as the functor return type.
+		template< typename T, typename U >
+		void indexedProjection( T functor, SphericalHarmonics< U > &result ) const;
+
+		// As indexedProjection(), but the projection is made in a number of passes, each one doubling the number of
+		// samples used, so that the first pass uses 1 / 2^(passes-1) of the samples. The samples for each pass are
+		// spread evenly through the full set. After every pass, progress( result, numSamples ) is called with the
+		// coefficients estimated from the samples used so far, and if it returns false the projection stops there.
+		template< typename T, typename U, typename P >
+		void progressiveProjection( T functor, SphericalHarmonics< U > &result, P progress, unsigned int passes = 4 ) const;
+
 		// make sure the evaluations go up to the given number of bands.
 		// this function is called by the projection functions, but you may want to use it if the projector is used by several threads.
 		void computeSamples( unsigned int bands ) const;
@@ -113,6 +130,24 @@ class SphericalHarmonicsProjector
 		template <typename T>
 		static void addProjection( typename SphericalHarmonics<T>::CoefficientVector &c, const EvaluationVector &v, const T &scale );
 
+		// adds the unnormalised projection of functor( i ) to coefficients, for count samples
+		// i = first, first + step, first + 2 * step..., all modulo the number of samples.
+		template< typename T, typename U >
+		void accumulate( const T &functor, typename SphericalHarmonics<U>::CoefficientVector &coefficients, unsigned int first, unsigned int step, unsigned int count ) const;
+
+		// returns the factor by which the sum of numSamples projections must be scaled.
+		double normalisationFactor( unsigned int numSamples ) const;
+
+	private :
+
+		class SampleEvaluator;
+		template< typename T, typename U >
+		class Accumulator;
+		template< typename T, typename C, typename U >
+		class CoordinateFunctor;
+
+	protected :
+
 
 		mutable unsigned int m_bands;
 		std::vector< Imath::Vec2< V > > m_sphericalCoordinates;
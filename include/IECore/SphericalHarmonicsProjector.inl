@@ -33,12 +33,134 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include <cassert>
+#include <algorithm>
+
+#include "tbb/parallel_for.h"
+#include "tbb/parallel_reduce.h"
+#include "tbb/blocked_range.h"
+
+#include "boost/cstdint.hpp"
+#include "boost/math/common_factor_rt.hpp"
+
 #include "OpenEXR/ImathRandom.h"
 #include "IECore/SphericalToEuclideanTransform.h"
 
 namespace IECore
 {
 
+template< typename V >
+class SphericalHarmonicsProjector<V>::SampleEvaluator
+{
+
+	public :
+
+		SampleEvaluator( const std::vector< Imath::Vec2<V> > &sphericalCoordinates, unsigned int bands, EvaluationSamples &evaluations )
+			:	m_sphericalCoordinates( sphericalCoordinates ), m_bands( bands ), m_evaluations( evaluations )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
+		{
+			for ( size_t i = range.begin(); i != range.end(); i++ )
+			{
+				const Imath::Vec2<V> &c = m_sphericalCoordinates[i];
+				RealSphericalHarmonicFunction<V>::evaluate( static_cast<V>(c.x), static_cast<V>(c.y), m_bands, m_evaluations[i] );
+			}
+		}
+
+	private :
+
+		const std::vector< Imath::Vec2<V> > &m_sphericalCoordinates;
+		unsigned int m_bands;
+		EvaluationSamples &m_evaluations;
+
+};
+
+template< typename V >
+template< typename T, typename U >
+class SphericalHarmonicsProjector<V>::Accumulator
+{
+
+	public :
+
+		Accumulator( const SphericalHarmonicsProjector<V> &projector, const T &functor, size_t numCoefficients, unsigned int first, unsigned int step )
+			:	m_projector( projector ), m_functor( functor ), m_first( first ), m_step( step ), m_coefficients( numCoefficients, U(0) )
+		{
+		}
+
+		Accumulator( Accumulator &other, tbb::split )
+			:	m_projector( other.m_projector ), m_functor( other.m_functor ), m_first( other.m_first ), m_step( other.m_step ),
+				m_coefficients( other.m_coefficients.size(), U(0) )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range )
+		{
+			for ( size_t k = range.begin(); k != range.end(); k++ )
+			{
+				const unsigned int i = ( m_first + (boost::uint64_t)k * m_step ) % m_projector.m_shEvaluations.size();
+				if ( m_projector.m_weights.size() )
+				{
+					addProjection<U>( m_coefficients, m_projector.m_shEvaluations[i], m_functor( i ) * m_projector.m_weights[i] );
+				}
+				else
+				{
+					// uniform distribution weights
+					addProjection<U>( m_coefficients, m_projector.m_shEvaluations[i], m_functor( i ) );
+				}
+			}
+		}
+
+		void join( const Accumulator &other )
+		{
+			typename SphericalHarmonics<U>::CoefficientVector::iterator it = m_coefficients.begin();
+			typename SphericalHarmonics<U>::CoefficientVector::const_iterator oit = other.m_coefficients.begin();
+			for ( ; it != m_coefficients.end(); it++, oit++ )
+			{
+				*it += *oit;
+			}
+		}
+
+		const typename SphericalHarmonics<U>::CoefficientVector &coefficients() const
+		{
+			return m_coefficients;
+		}
+
+	private :
+
+		const SphericalHarmonicsProjector<V> &m_projector;
+		T m_functor;
+		unsigned int m_first;
+		unsigned int m_step;
+		typename SphericalHarmonics<U>::CoefficientVector m_coefficients;
+
+};
+
+// adapts a functor taking a coordinate into one taking a sample index.
+template< typename V >
+template< typename T, typename C, typename U >
+class SphericalHarmonicsProjector<V>::CoordinateFunctor
+{
+
+	public :
+
+		CoordinateFunctor( T functor, const std::vector<C> &coordinates )
+			:	m_functor( functor ), m_coordinates( coordinates )
+		{
+		}
+
+		U operator()( unsigned int i )
+		{
+			return m_functor( m_coordinates[i] );
+		}
+
+	private :
+
+		T m_functor;
+		const std::vector<C> &m_coordinates;
+
+};
+
 
 template < typename V >
 SphericalHarmonicsProjector<V>::SphericalHarmonicsProjector( unsigned int samples, unsigned long int seed ) : 
@@ -164,71 +286,120 @@ template< typename V >
 template< typename T, typename U > 
 void SphericalHarmonicsProjector<V>::polarProjection( T functor, SphericalHarmonics< U > &result ) const
 {
-	double factor;
+	indexedProjection( CoordinateFunctor< T, Imath::Vec2<V>, U >( functor, m_sphericalCoordinates ), result );
+}
+
+template< typename V >
+template< typename T, typename U > 
+void SphericalHarmonicsProjector<V>::euclideanProjection( T functor, SphericalHarmonics< U > &result ) const
+{
+	// make sure our internal object is created before we start using it from multiple threads.
+	euclideanCoordinates();
 
+	indexedProjection( CoordinateFunctor< T, Imath::Vec3<V>, U >( functor, m_euclideanCoordinates ), result );
+}
+
+template< typename V >
+template< typename T, typename U >
+void SphericalHarmonicsProjector<V>::indexedProjection( T functor, SphericalHarmonics< U > &result ) const
+{
 	computeSamples( result.bands() );
 
 	// zero coefficients to start accumulation.
 	result = U(0);
 
-	typename std::vector< Imath::Vec2<V> >::const_iterator cit = m_sphericalCoordinates.begin();
-	if ( m_weights.size() )
+	accumulate<T, U>( functor, result.coefficients(), 0, 1, m_shEvaluations.size() );
+
+	result *= normalisationFactor( m_shEvaluations.size() );
+}
+
+template< typename V >
+template< typename T, typename U, typename P >
+void SphericalHarmonicsProjector<V>::progressiveProjection( T functor, SphericalHarmonics< U > &result, P progress, unsigned int passes ) const
+{
+	computeSamples( result.bands() );
+
+	const unsigned int numSamples = m_shEvaluations.size();
+	passes = std::max( passes, 1u );
+
+	// We visit the samples in an order that spreads every pass evenly over the whole set, rather than
+	// in the order they are stored (which may well be rows of an image). This is done by stepping through
+	// them with a stride of roughly the golden ratio of the sample count, chosen to be coprime with the
+	// sample count so that each sample is visited exactly once.
+	unsigned int step = std::max( 1u, (unsigned int)( numSamples * 0.6180339887 ) );
+	while ( numSamples && boost::math::gcd( step, numSamples ) != 1 )
 	{
-		typename std::vector< V >::const_iterator wit = m_weights.begin();
-		for ( typename EvaluationSamples::const_iterator it = m_shEvaluations.begin(); it != m_shEvaluations.end(); it++, cit++, wit++ )
+		step++;
+	}
+
+	typename SphericalHarmonics<U>::CoefficientVector sums( result.coefficients().size(), U(0) );
+	unsigned int samplesUsed = 0;
+
+	for ( unsigned int pass = 0; pass < passes; pass++ )
+	{
+		const unsigned int passEnd = pass == passes - 1 ? numSamples : numSamples >> ( passes - 1 - pass );
+		if ( passEnd <= samplesUsed )
 		{
-			addProjection( result.coefficients(), *it, functor( *cit ) * (*wit) );
+			continue;
 		}
-		factor = 1. / (double)m_shEvaluations.size();
 
-	}
-	else
-	{
-		// uniform distribution weights
-		for ( typename EvaluationSamples::const_iterator it = m_shEvaluations.begin(); it != m_shEvaluations.end(); it++, cit++ )
+		const unsigned int first = ( (boost::uint64_t)samplesUsed * step ) % numSamples;
+		accumulate<T, U>( functor, sums, first, step, passEnd - samplesUsed );
+		samplesUsed = passEnd;
+
+		result.coefficients() = sums;
+		result *= normalisationFactor( samplesUsed );
+
+		if ( !progress( static_cast< const SphericalHarmonics< U > & >( result ), samplesUsed ) )
 		{
-			addProjection( result.coefficients(), *it, functor( *cit ) );
+			return;
 		}
-		const double weight = 4 * M_PI;
-		factor = weight / (double)m_shEvaluations.size();
 	}
-	result *= factor;
+
+	if ( !samplesUsed )
+	{
+		result = U(0);
+	}
 }
 
 template< typename V >
-template< typename T, typename U > 
-void SphericalHarmonicsProjector<V>::euclideanProjection( T functor, SphericalHarmonics< U > &result ) const
+template< typename T, typename U >
+void SphericalHarmonicsProjector<V>::accumulate( const T &functor, typename SphericalHarmonics<U>::CoefficientVector &coefficients, unsigned int first, unsigned int step, unsigned int count ) const
 {
-	double factor;
+	if ( !count )
+	{
+		return;
+	}
 
-	computeSamples( result.bands() );
+	Accumulator<T, U> accumulator( *this, functor, coefficients.size(), first, step );
+	tbb::parallel_reduce( tbb::blocked_range<size_t>( 0, count ), accumulator );
 
-	// make sure our internal object is created.
-	euclideanCoordinates();
+	typename SphericalHarmonics<U>::CoefficientVector::iterator it = coefficients.begin();
+	typename SphericalHarmonics<U>::CoefficientVector::const_iterator ait = accumulator.coefficients().begin();
+	for ( ; it != coefficients.end(); it++, ait++ )
+	{
+		*it += *ait;
+	}
+}
+
+template< typename V >
+double SphericalHarmonicsProjector<V>::normalisationFactor( unsigned int numSamples ) const
+{
+	if ( !numSamples )
+	{
+		return 0;
+	}
 
-	// zero coefficients to start accumulation.
-	result = U(0);
-	typename std::vector< Imath::Vec3<V> >::const_iterator cit = m_euclideanCoordinates.begin();
 	if ( m_weights.size() )
 	{
-		typename std::vector< V >::const_iterator wit = m_weights.begin();
-		for ( typename EvaluationSamples::const_iterator it = m_shEvaluations.begin(); it != m_shEvaluations.end(); it++, cit++, wit++ )
-		{
-			addProjection( result.coefficients(), *it, functor( *cit ) * (*wit) );
-		}
-		factor = 1. / m_shEvaluations.size();
+		return 1. / (double)numSamples;
 	}
 	else
 	{
 		// uniform distribution weights
-		for ( typename EvaluationSamples::const_iterator it = m_shEvaluations.begin(); it != m_shEvaluations.end(); it++, cit++ )
-		{
-			addProjection( result.coefficients(), *it, functor( *cit ) );
-		}
 		const double weight = 4 * M_PI;
-		factor = weight / m_shEvaluations.size();
+		return weight / (double)numSamples;
 	}
-	result *= factor;
 }
 
 template< typename V >
@@ -240,12 +411,7 @@ void SphericalHarmonicsProjector<V>::computeSamples( unsigned int bands ) const
 	m_bands = bands;
 	m_shEvaluations.resize( m_sphericalCoordinates.size() );
 
-	typename std::vector< Imath::Vec2<V> >::const_iterator cit = m_sphericalCoordinates.begin();
-	for ( typename EvaluationSamples::iterator it = m_shEvaluations.begin(); it != m_shEvaluations.end(); it++, cit++ )
-	{
-		RealSphericalHarmonicFunction<V>::evaluate( static_cast<V>(cit->x), static_cast<V>(cit->y), m_bands, *it );
-	}
-
+	tbb::parallel_for( tbb::blocked_range<size_t>( 0, m_shEvaluations.size() ), SampleEvaluator( m_sphericalCoordinates, m_bands, m_shEvaluations ) );
 }
 
 template< typename V >
@@ -146,6 +146,26 @@ class StreamIndexedIO : public IndexedIO
 		void read(const IndexedIO::EntryID &name, short &x) const;
 		void read(const IndexedIO::EntryID &name, unsigned short &x) const;
 
+		/// @name Index memory
+		/// Files opened in Read mode load the subindexes for committed
+		/// directories on demand. If the memory they use exceeds a limit,
+		/// the subindexes loaded first are released again, provided that
+		/// no IndexedIO instances refer to anything within them.
+		//////////////////////////////////////////////////////////////
+		//@{
+		/// Returns an estimate of the memory used by the index of this file, in bytes.
+		/// Only the portions of the index read from the file are accounted for.
+		size_t indexMemoryUsage() const;
+		typedef std::vector< std::pair< std::string, size_t > > MemoryUsageVector;
+		/// Fills usage with the name and indexMemoryUsage() of every open file. Names
+		/// are empty for streams which don't correspond to a file on disk.
+		static void openFilesIndexMemoryUsage( MemoryUsageVector &usage );
+		/// Sets the approximate number of bytes that may be used by the subindexes
+		/// loaded from each file opened in Read mode. The default of 0 means unlimited.
+		static void setSubIndexMemoryLimit( size_t bytes );
+		static size_t getSubIndexMemoryLimit();
+		//@}
+
 	protected:
 
 		class Index;
@@ -171,6 +191,10 @@ class StreamIndexedIO : public IndexedIO
 
 				IndexedIO::OpenMode openMode() const;
 
+				/// Returns a name for the stream, used when reporting memory usage.
+				/// The default implementation returns an empty string.
+				virtual std::string name() const;
+
 				// returns a read lock, when thread-safety is required.
 				typedef tbb::recursive_mutex Mutex;
 				typedef Mutex::scoped_lock MutexLock;
@@ -435,6 +435,8 @@ enum TypeId
 	LensModelTypeId = 387,
 	StandardRadialLensModelTypeId = 388,
 	LensDistortOpTypeId = 389,
+	PointsPrimitiveOpTypeId = 390,
+	PointsMergeOpTypeId = 391,
 	
 	// Remember to update TypeIdBinding.cpp !!!
 
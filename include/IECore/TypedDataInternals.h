@@ -35,11 +35,87 @@
 #ifndef IECORE_TYPEDDATAINTERNALS_H
 #define IECORE_TYPEDDATAINTERNALS_H
 
+#include <algorithm>
+
+#include "tbb/parallel_for.h"
+#include "tbb/blocked_range.h"
+
 #include "IECore/MurmurHash.h"
 
 namespace IECore
 {
 
+/// Large arrays may optionally be hashed in parallel, by dividing them into
+/// fixed size chunks, hashing each chunk on a separate thread, and then hashing
+/// the results. Because this yields a different hash to the serial method, it
+/// is disabled by default, and all processes sharing hashes (via a DiskObjectCache
+/// for instance) must use the same setting. The threshold specifies the size in
+/// bytes above which data is hashed in parallel, with 0 disabling parallel hashing.
+/// It is initialised from the IECORE_PARALLELHASH_THRESHOLD environment variable,
+/// which specifies a size in megabytes. Changing the threshold invalidates any
+/// hashes cached with the previous setting.
+/// \todo Consider making parallel hashing the default in a future major version.
+void setParallelHashThreshold( size_t bytes );
+size_t getParallelHashThreshold();
+
+namespace Detail
+{
+
+template<typename V>
+class ChunkHasher
+{
+
+	public :
+
+		static const size_t chunkBytes = 1024 * 1024;
+
+		ChunkHasher( const V *data, size_t size, MurmurHash *hashes )
+			:	m_data( data ), m_size( size ), m_hashes( hashes )
+		{
+		}
+
+		static size_t chunkSize()
+		{
+			return std::max( chunkBytes / sizeof( V ), (size_t)1 );
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &r ) const
+		{
+			const size_t c = chunkSize();
+			for( size_t i = r.begin(); i != r.end(); ++i )
+			{
+				const size_t begin = i * c;
+				const size_t end = std::min( begin + c, m_size );
+				m_hashes[i].append( m_data + begin, end - begin );
+			}
+		}
+
+	private :
+
+		const V *m_data;
+		size_t m_size;
+		MurmurHash *m_hashes;
+
+};
+
+template<typename V>
+MurmurHash parallelHash( const V *data, size_t size )
+{
+	const size_t c = ChunkHasher<V>::chunkSize();
+	std::vector<MurmurHash> hashes( ( size + c - 1 ) / c );
+	tbb::parallel_for( tbb::blocked_range<size_t>( 0, hashes.size() ), ChunkHasher<V>( data, size, &hashes[0] ) );
+
+	MurmurHash result;
+	result.append( (uint64_t)size );
+	for( std::vector<MurmurHash>::const_iterator it = hashes.begin(), eIt = hashes.end(); it != eIt; ++it )
+	{
+		result.append( *it );
+	}
+	return result;
+}
+
+} // namespace Detail
+
 template<class T>
 class SimpleDataHolder
 {
@@ -134,9 +210,14 @@ class SharedDataHolder
 		// datatype has special needs.
 		void hash( MurmurHash &h ) const
 		{
-			if( !m_data->hashValid )
+			// the cached hash is only valid for the threshold it was computed
+			// with, as parallel hashes differ from serial ones.
+			const size_t threshold = getParallelHashThreshold();
+			if( !m_data->hashValid || m_data->hashThreshold != threshold )
 			{
+				m_data->hashValid = false;
 				m_data->hash = hash();
+				m_data->hashThreshold = threshold;
 				m_data->hashValid = true;
 			}
 			h.append( m_data->hash );
@@ -146,6 +227,12 @@ class SharedDataHolder
 	
 		MurmurHash hash() const
 		{
+			const size_t threshold = getParallelHashThreshold();
+			if( threshold && readable().size() * sizeof( readable()[0] ) > threshold )
+			{
+				return Detail::parallelHash( &(readable()[0]), readable().size() );
+			}
+
 			MurmurHash result;
 			result.append( &(readable()[0]), readable().size() );
 			return result;
@@ -157,11 +244,12 @@ class SharedDataHolder
 		{
 			public :
 			
-				Shareable() : data(), hashValid( false ) {}
-				Shareable( const T &initData ) : data( initData ), hashValid( false ) {}
+				Shareable() : data(), hashThreshold( 0 ), hashValid( false ) {}
+				Shareable( const T &initData ) : data( initData ), hashThreshold( 0 ), hashValid( false ) {}
 				
 				T data;
 				MurmurHash hash;
+				size_t hashThreshold;
 				volatile bool hashValid;
 				
 		};
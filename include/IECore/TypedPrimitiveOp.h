@@ -39,6 +39,7 @@
 #include "IECore/MeshPrimitive.h"
 #include "IECore/ImagePrimitive.h"
 #include "IECore/CurvesPrimitive.h"
+#include "IECore/PointsPrimitive.h"
 
 namespace IECore
 {
@@ -77,6 +78,7 @@ class TypedPrimitiveOp : public ModifyOp
 IE_CORE_DEFINETYPEDPRIMITIVEOP( MeshPrimitive )
 IE_CORE_DEFINETYPEDPRIMITIVEOP( ImagePrimitive )
 IE_CORE_DEFINETYPEDPRIMITIVEOP( CurvesPrimitive )
+IE_CORE_DEFINETYPEDPRIMITIVEOP( PointsPrimitive )
 
 } // namespace IECore
 
@@ -51,7 +51,9 @@ class WarpOp : public ImagePrimitiveOp
 {
 	public:
 
-		enum FilterType { None = 0, Bilinear, TypeCount };
+		/// Bicubic uses a Catmull-Rom spline and Lanczos a three lobed Lanczos window. Both are
+		/// separable, and may overshoot the input values at sharp edges.
+		enum FilterType { None = 0, Bilinear, Bicubic, Lanczos, TypeCount };
 
 		WarpOp( const std::string &description );
 		virtual ~WarpOp();
@@ -77,7 +79,8 @@ class WarpOp : public ImagePrimitiveOp
 		/// Called once per element (pixel for ImagePrimitives).
 		/// Must be implemented by subclasses to determine where the color will come from.
 		/// The returned coordinate is on pixel space of the input image and the given V2f coordinates are on the
-		/// output image pixel space.
+		/// output image pixel space. The warped coordinates are computed once for all channels, using several
+		/// threads, so implementations must be safe to call concurrently.
 		virtual Imath::V2f warp( const Imath::V2f &p ) const = 0;
 		/// Called once per operation, after all calls to transform() have been made. This is
 		/// an opportunity to perform any cleanup necessary.
@@ -89,6 +92,8 @@ class WarpOp : public ImagePrimitiveOp
 
 		struct Warp;
 		friend class Warp;
+		struct WarpCoordinates;
+		friend struct WarpCoordinates;
 };
 
 IE_CORE_DECLAREPTR( WarpOp );
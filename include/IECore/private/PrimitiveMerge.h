@@ -0,0 +1,62 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef IECORE_PRIMITIVEMERGE_H
+#define IECORE_PRIMITIVEMERGE_H
+
+#include <vector>
+
+#include "IECore/Primitive.h"
+
+namespace IECore
+{
+namespace Detail
+{
+
+/// Concatenates the PrimitiveVariables of several primitives, in order, placing the
+/// results in mergedVariables. The total size of each variable is computed up front
+/// so that each output is allocated exactly once, and the per-primitive segments are
+/// then filled in parallel. Constant variables (and Uniform variables on PointsPrimitives)
+/// are taken from the first primitive.
+/// Where a variable is missing from a primitive (or has a different type or
+/// interpolation) it is either padded with a default value or, if
+/// removeNonMatchingPrimVars is true, omitted from the result entirely. Note that the
+/// primitives must not have had their topology changed yet, as their variableSize()
+/// is used to determine the size of each segment.
+void mergePrimitiveVariables( const std::vector<const Primitive *> &primitives, bool removeNonMatchingPrimVars, PrimitiveVariableMap &mergedVariables );
+
+} // namespace Detail
+} // namespace IECore
+
+#endif // IECORE_PRIMITIVEMERGE_H
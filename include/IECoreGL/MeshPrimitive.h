@@ -42,7 +42,11 @@
 namespace IECoreGL
 {
 
-/// \todo Fast drawing, uvs etc. Consider using NVIDIA tristrip library? something else? GLU?
+/// A triangle mesh, which may be drawn either with one vertex per triangle corner
+/// or with an index buffer referencing shared vertices. ToGLMeshConverter creates
+/// indexed meshes, welding together corners which share a vertex and all
+/// FaceVarying values.
+/// \todo Consider using NVIDIA tristrip library? something else? GLU?
 class MeshPrimitive : public Primitive
 {
 
@@ -50,11 +54,27 @@ class MeshPrimitive : public Primitive
 
 		IE_CORE_DECLARERUNTIMETYPEDEXTENSION( IECoreGL::MeshPrimitive, MeshPrimitiveTypeId, Primitive );
 
-		/// Copies of all data are taken.
+		/// Constructs a mesh drawn without an index buffer. vertIds specifies
+		/// the vertex for each triangle corner, and Vertex and Varying primitive
+		/// variables are expanded to one value per corner. Copies of all data are taken.
 		MeshPrimitive( IECore::ConstIntVectorDataPtr vertIds );
+		/// Constructs a mesh drawn using an index buffer. vertexIndices specifies
+		/// three indices per triangle into the vertex attribute arrays. If vertexSources
+		/// is non-null, it specifies the source vertex for each of those indices, and
+		/// Vertex and Varying primitive variables are gathered through it, otherwise
+		/// they are used as they are. Likewise, faceVaryingSources specifies the source
+		/// face-vertex for each index, and must be provided for FaceVarying primitive
+		/// variables to be added. No copies of the data are taken, so it must not be
+		/// modified subsequently.
+		MeshPrimitive( IECore::ConstUIntVectorDataPtr vertexIndices, IECore::ConstIntVectorDataPtr vertexSources, IECore::ConstIntVectorDataPtr faceVaryingSources );
 		virtual ~MeshPrimitive();
 
+		/// Returns the vertex ids passed to the non-indexed constructor,
+		/// or 0 if the mesh is indexed.
 		IECore::ConstIntVectorDataPtr vertexIds() const;
+		/// Returns the index buffer data for an indexed mesh, or 0
+		/// if the mesh is not indexed.
+		IECore::ConstUIntVectorDataPtr vertexIndices() const;
 
 		virtual Imath::Box3f bound() const;
 
@@ -33,6 +33,7 @@
 ##########################################################################
 
 from IECore import *
+from FileDependenciesOp import FileDependenciesOp
 import os
 import os.path
 
@@ -36,6 +36,7 @@
 
 import os
 from IECore import *
+from FileSequenceAnalyzerOp import FileSequenceAnalyzerOp
 
 #This Op checks an image file sequence for corrupted and missing files. It also warns of abrupt file size changes.
 # The Op will raise an error if there's any missing or corrupt file.
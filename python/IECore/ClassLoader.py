@@ -38,7 +38,11 @@ import glob
 import re
 import os.path
 import threading
-from fnmatch import fnmatch
+import Queue
+import hashlib
+import tempfile
+import cPickle
+from fnmatch import fnmatch, fnmatchcase
 
 from IECore import Msg, msg, SearchPath, warning
 
@@ -57,14 +61,24 @@ from IECore import Msg, msg, SearchPath, warning
 # And for performance sake, it will not explore directories which 
 # contain files that match this:
 # <any path>/<className>/<className>*.*
+#
+# Finding all the classes requires a walk of every searchpath, which
+# can be slow on network filesystems. Directories are therefore walked
+# in parallel, and an index of the classes may optionally be stored on
+# disk, so that subsequent ClassLoaders need only check the modification
+# times of the directories to know whether or not the index is still valid.
 class ClassLoader :
 
 	## Creates a ClassLoader which will load
 	# classes found on the SearchPath object passed
-	# in.
-	def __init__( self, searchPaths ) :
+	# in. If indexDirectory is specified, then indices
+	# of the classes found on each searchpath are stored
+	# there, and reused for as long as the searchpath
+	# remains unchanged.
+	def __init__( self, searchPaths, indexDirectory = None ) :
 
 		self.__searchPaths = searchPaths
+		self.__indexDirectory = indexDirectory
 		self.__defaultVersions = {}
 		self.__loadMutex = threading.RLock()
 		self.refresh()
@@ -151,8 +165,7 @@ class ClassLoader :
 				return c["imports"][version]
 
 			nameTail = os.path.basename( name )
-			fileName = os.path.join( name, nameTail + "-" + str(version) + ".py" )
-			fileName = self.__searchPaths.find( fileName )
+			fileName = c["files"].get( version, "" )
 			if fileName=="" :
 				raise IOError( "Unable to find implementation file for class \"%s\" version %d." % (name, version) )
 
@@ -189,6 +202,7 @@ class ClassLoader :
 		#		"versions" : [], # a list containing all the available versions for that class
 		#		"imports" : {}, # a dictionary mapping from version numbers to the actual class definition
 		#						# this is filled in lazily by load()
+		#		"files" : {}, # a dictionary mapping from version numbers to the file which implements them
 		# }
 		# this will be filled in lazily by __findClass and __findAllClasses
 
@@ -199,7 +213,9 @@ class ClassLoader :
 	__defaultLoaderMutex = threading.Lock()
 	## Returns a ClassLoader configured to load from the paths defined by the
 	# specified environment variable. The same object is returned each time,
-	# allowing one loader to be shared by many callers.
+	# allowing one loader to be shared by many callers. If the
+	# IECORE_CLASSLOADER_INDEX_PATH environment variable is set, then it
+	# specifies the directory where the loader stores its indices.
 	@classmethod
 	def defaultLoader( cls, envVar ) :
 
@@ -215,7 +231,7 @@ class ClassLoader :
 			else :
 				msg( Msg.Level.Warning, "ClassLoader.defaultLoader", "Environment variable %s not set." % envVar )
 
-			loader = cls( SearchPath( os.path.expandvars( sp ), ":" ) )
+			loader = cls( SearchPath( os.path.expandvars( sp ), ":" ), os.environ.get( "IECORE_CLASSLOADER_INDEX_PATH", None ) )
 			cls.__defaultLoaders[envVar] = loader
 
 			return loader
@@ -238,9 +254,10 @@ class ClassLoader :
 
 		return cls.defaultLoader( "IECORE_PROCEDURAL_PATHS" )
 
+	__versionPattern = re.compile( ".*-(\d+).py$" )
+
 	def __updateClassFromSearchPath( self, searchPath, name ) :
 
-		pattern = re.compile( ".*-(\d+).py$" )
 		pruneDir = False
 		nameTail = os.path.split( name )[-1]
 
@@ -251,25 +268,36 @@ class ClassLoader :
 
 			pruneDir = True
 
-			m = re.match( pattern, f )
+			m = re.match( self.__versionPattern, f )
 			try :
 				version = int( m.group( 1 ) )
 			except :
 				continue
 
-			c = self.__classes.setdefault( name, { "versions" : [], "imports" : {} } )
-
-			if not version in c["versions"]:
-				c["versions"].append( version )
-				c["versions"].sort()
+			self.__addClassVersion( name, version, f )
 
 		return pruneDir
 
+	def __addClassVersion( self, name, version, fileName ) :
+
+		c = self.__classes.setdefault( name, { "versions" : [], "imports" : {}, "files" : {} } )
+
+		if not version in c["versions"]:
+			c["versions"].append( version )
+			c["versions"].sort()
+
+		# searchpaths are visited in order, so the first file found takes precedence
+		c["files"].setdefault( version, fileName )
+
 	def __findClass( self, name ) :
 
 		if not name in self.__classes and not self.__foundAllClasses :
-			for path in self.__searchPaths.paths :
-				self.__updateClassFromSearchPath( path, name )
+			if self.__indexDirectory :
+				# checking the index is cheaper than globbing the searchpaths
+				self.__findAllClasses()
+			else :
+				for path in self.__searchPaths.paths :
+					self.__updateClassFromSearchPath( path, name )
 
 		if name in self.__classes :
 			return self.__classes[name]
@@ -284,23 +312,177 @@ class ClassLoader :
 		self.__classes = {}
 		for path in self.__searchPaths.paths :
 
-			for root, dirs, files in os.walk( path ) :
+			index = self.__index( path )
+			for name, files in index["classes"].items() :
+				for version, fileName in files.items() :
+					self.__addClassVersion( name, version, fileName )
 
-				if path.endswith( '/' ) :
-					nameBase = root[len(path):]
-				else :
-					nameBase = root[len(path)+1:]
+		self.__foundAllClasses = True
 
-				dirsToPrune = set()
-				for d in dirs :
+	## Returns the index for a single searchpath entry, reusing the
+	# one on disk if it is still valid.
+	def __index( self, path ) :
 
-					if self.__updateClassFromSearchPath( path, os.path.join( nameBase, d ) ) :
-						dirsToPrune.add( d )
+		indexFileName = None
+		if self.__indexDirectory :
+			indexFileName = os.path.join(
+				self.__indexDirectory,
+				hashlib.md5( os.path.abspath( path ) ).hexdigest() + ".index"
+			)
+			index = self.__readIndex( indexFileName, path )
+			if index is not None :
+				return index
 
-				for d in dirsToPrune :
-					dirs.remove( d )
+		index = self.__scan( path )
 
-		self.__foundAllClasses = True
+		if indexFileName :
+			self.__writeIndex( indexFileName, index )
+
+		return index
+
+	__indexFormatVersion = 1
+
+	@classmethod
+	def __readIndex( cls, indexFileName, path ) :
+
+		try :
+			with open( indexFileName, "rb" ) as f :
+				index = cPickle.load( f )
+		except Exception :
+			return None
+
+		if not isinstance( index, dict ) or index.get( "formatVersion" ) != cls.__indexFormatVersion :
+			return None
+
+		if index.get( "path" ) != os.path.abspath( path ) :
+			return None
+
+		# any change to the classes would have modified one of the
+		# directories we scanned, so the index is valid if none
+		# of them have changed.
+		for directory, mtime in index["mtimes"].items() :
+			try :
+				if os.stat( directory ).st_mtime != mtime :
+					return None
+			except OSError :
+				return None
+
+		return index
+
+	@staticmethod
+	def __writeIndex( indexFileName, index ) :
+
+		directory = os.path.dirname( indexFileName )
+		try :
+			if not os.path.isdir( directory ) :
+				os.makedirs( directory )
+			# write to a temporary file and rename it into place, so that
+			# concurrent readers never see a partial index.
+			fd, tempFileName = tempfile.mkstemp( dir = directory, suffix = ".tmp" )
+			with os.fdopen( fd, "wb" ) as f :
+				cPickle.dump( index, f, cPickle.HIGHEST_PROTOCOL )
+			os.rename( tempFileName, indexFileName )
+		except Exception, e :
+			msg( Msg.Level.Warning, "ClassLoader", "Unable to write index \"%s\" (%s)." % ( indexFileName, e ) )
+
+	__scanThreads = 8
+
+	## Walks a searchpath entry, returning an index of the form
+	# {
+	#		"formatVersion" : int,
+	#		"path" : str, # the absolute path to the searchpath entry
+	#		"classes" : { name : { version : fileName } },
+	#		"mtimes" : { directory : mtime }, # the modification times of all directories scanned
+	# }
+	# Directories are listed in parallel, as the time taken is dominated
+	# by filesystem latency rather than by our own processing.
+	@classmethod
+	def __scan( cls, path ) :
+
+		# the index may be reused from another working directory,
+		# so everything it refers to must be absolute.
+		path = os.path.abspath( path )
+
+		index = {
+			"formatVersion" : cls.__indexFormatVersion,
+			"path" : path,
+			"classes" : {},
+			"mtimes" : {},
+		}
+
+		lock = threading.Lock()
+		queue = Queue.Queue()
+
+		def worker() :
+
+			while True :
+				item = queue.get()
+				try :
+					if item is None :
+						return
+					for child in cls.__scanDirectory( path, item[0], item[1], index, lock ) :
+						queue.put( child )
+				finally :
+					queue.task_done()
+
+		threads = [ threading.Thread( target = worker ) for i in range( 0, cls.__scanThreads ) ]
+		for t in threads :
+			t.daemon = True
+			t.start()
+
+		queue.put( ( "", False ) )
+		queue.join()
+
+		for t in threads :
+			queue.put( None )
+		for t in threads :
+			t.join()
+
+		return index
+
+	## Lists a single directory, adding it to the index if it contains a class.
+	# This is equivalent to the combination of os.walk() and __updateClassFromSearchPath()
+	# used to find a single class, but requires a single listdir() per directory.
+	# Returns the subdirectories which should be scanned in turn.
+	@classmethod
+	def __scanDirectory( cls, path, nameBase, isLink, index, lock ) :
+
+		directory = os.path.join( path, nameBase )
+		try :
+			mtime = os.stat( directory ).st_mtime
+			entries = os.listdir( directory )
+		except OSError :
+			return []
+
+		isClass = False
+		versions = {}
+		if nameBase :
+			nameTail = os.path.basename( nameBase )
+			for e in entries :
+				if e.startswith( "." ) or not fnmatchcase( e, nameTail + "*.*" ) :
+					continue
+				isClass = True
+				m = re.match( cls.__versionPattern, e )
+				if m is not None :
+					versions[int( m.group( 1 ) )] = os.path.join( directory, e )
+
+		with lock :
+			index["mtimes"][directory] = mtime
+			if versions :
+				index["classes"][nameBase] = versions
+
+		# os.walk() doesn't follow links, but it does report them, which
+		# is why we've still checked linked directories for classes.
+		if isClass or isLink :
+			return []
+
+		children = []
+		for e in entries :
+			child = os.path.join( directory, e )
+			if os.path.isdir( child ) :
+				children.append( ( os.path.join( nameBase, e ), os.path.islink( child ) ) )
+
+		return children
 
 	# throws an exception if the version is no good
 	@staticmethod
@@ -35,9 +35,12 @@
 import re
 import os
 import re
+import sys
 import glob
+import Queue
 import shutil
 import os.path
+import threading
 import _IECore as IECore
 
 # This is here because we can't yet create a to_python converter for boost::regex
@@ -47,40 +50,67 @@ IECore.FileSequence.fileNameValidator = staticmethod( lambda : re.compile( "^([^
 # specified by sequence2, where sequence1 and sequence2 are
 # FileSequence objects of equal length. This function is safe even if the
 # files specified by each sequence overlap.
+#
+# Files are moved using a pool of numThreads worker threads, and
+# progressCallback( numCompleted, numTotal ) is called after each file is
+# moved. Returns the list of ( source, destination ) moves performed, in
+# the order in which they are started. If dryRun is True, the list is
+# returned without touching the filesystem.
 ## \ingroup python
-def mv( sequence1, sequence2 ) :
+def mv( sequence1, sequence2, dryRun = False, numThreads = None, progressCallback = None ) :
 
 	if __sequencesClash( sequence1, sequence2 ) :
 		sTmp = sequence1.copy()
 		sTmp.setPrefix( os.path.join( os.path.dirname( sTmp.getPrefix() ), __tmpPrefix() ) )
-		for src, dst in sequence1.mapTo( sTmp, True ) :
-			shutil.move( src, dst )
-		for src, dst in sTmp.mapTo( sequence2, True ) :
-			shutil.move( src, dst )
+		stages = [ sequence1.mapTo( sTmp, True ), sTmp.mapTo( sequence2, True ) ]
 	else :
-		for src, dst in sequence1.mapTo( sequence2, True ) :
-			shutil.move( src, dst )
+		stages = [ sequence1.mapTo( sequence2, True ) ]
+
+	__checkDestinations( stages[-1] )
+
+	if not dryRun :
+		numTotal = sum( [ len( s ) for s in stages ] )
+		numCompleted = 0
+		for stage in stages :
+			__execute( shutil.move, stage, numThreads, __offsetProgress( progressCallback, numCompleted, numTotal ) )
+			numCompleted += len( stage )
+
+	return sum( stages, [] )
 
 ## Copies the set of files specified by sequence1 to the set of files
 # specified by sequence2, where sequence1 and sequence2 are
 # FileSequence objects of equal length. This function is safe even if the
 # files specified by each sequence overlap.
+#
+# The numThreads, progressCallback and dryRun arguments and the return
+# value are as for mv().
 ## \ingroup python
-def cp( sequence1, sequence2 ) :
+def cp( sequence1, sequence2, dryRun = False, numThreads = None, progressCallback = None ) :
 
 	if __sequencesClash( sequence1, sequence2 ) :
 		raise RuntimeError( "Attempt to copy sequences with common filenames." )
 
-	for src, dst in sequence1.mapTo( sequence2, True ) :
-		shutil.copy( src, dst )
+	plan = sequence1.mapTo( sequence2, True )
+	__checkDestinations( plan )
+
+	if not dryRun :
+		__execute( __copy, plan, numThreads, progressCallback )
+
+	return plan
 
 ## Removes all the files specified by the sequence.
+#
+# The numThreads, progressCallback and dryRun arguments are as for mv().
+# Returns the list of files removed.
 ## \ingroup python
-def rm( sequence ) :
+def rm( sequence, dryRun = False, numThreads = None, progressCallback = None ) :
 
-	for f in sequence.fileNames() :
+	plan = sequence.fileNames()
 
-		os.remove( f )
+	if not dryRun :
+		__execute( os.remove, [ ( f, ) for f in plan ], numThreads, progressCallback )
+
+	return plan
 
 ## Concetenates all the files specified by the sequence to stdout
 # \todo Allow destination file to be specified
@@ -95,6 +125,15 @@ def cat( sequence ) :
 
 def __sequencesClash( sequence1, sequence2 ) :
 
+	if (
+		sequence1.getPrefix() == sequence2.getPrefix() and
+		sequence1.getSuffix() == sequence2.getSuffix() and
+		sequence1.getPadding() == sequence2.getPadding()
+	) :
+		# the filenames correspond one to one with the frames,
+		# so we can avoid generating them.
+		return sequence1.frameList.intersects( sequence2.frameList )
+
 	s = set()
 	for f in sequence1.fileNames() :
 		s.add( f )
@@ -105,6 +144,128 @@ def __sequencesClash( sequence1, sequence2 ) :
 
 	return False
 
+def __checkDestinations( plan ) :
+
+	destinations = set()
+	for src, dst in plan :
+		if dst in destinations :
+			raise RuntimeError( "Multiple files would be written to \"%s\"." % dst )
+		destinations.add( dst )
+
+## The number of file operations to have outstanding at once. File
+# operations are dominated by filesystem latency, particularly on networked
+# storage, so we use more threads than we might have cores.
+__numThreads = 8
+
+## Calls operation( *args ) for each tuple of args, using a pool of
+# worker threads. If any call fails, no further calls are started and the
+# exception is reraised once the outstanding calls have completed.
+def __execute( operation, argsList, numThreads, progressCallback ) :
+
+	numTotal = len( argsList )
+	if numThreads is None :
+		numThreads = __numThreads
+	numThreads = max( 1, min( numThreads, numTotal ) )
+
+	if numThreads == 1 :
+		for i, args in enumerate( argsList ) :
+			operation( *args )
+			if progressCallback is not None :
+				progressCallback( i + 1, numTotal )
+		return
+
+	work = Queue.Queue()
+	for args in argsList :
+		work.put( args )
+
+	results = Queue.Queue()
+	failed = threading.Event()
+
+	def worker() :
+
+		while not failed.is_set() :
+			try :
+				args = work.get_nowait()
+			except Queue.Empty :
+				return
+			try :
+				operation( *args )
+			except :
+				failed.set()
+				results.put( sys.exc_info() )
+				return
+			results.put( None )
+
+	threads = [ threading.Thread( target = worker ) for i in range( 0, numThreads ) ]
+	for t in threads :
+		t.daemon = True
+		t.start()
+
+	# progress is reported from this thread, so callbacks
+	# needn't be threadsafe.
+	error = None
+	numCompleted = 0
+	while numCompleted < numTotal :
+		result = results.get()
+		if result is not None :
+			error = result
+			break
+		numCompleted += 1
+		if progressCallback is not None :
+			progressCallback( numCompleted, numTotal )
+
+	for t in threads :
+		t.join()
+
+	if error is not None :
+		raise error[0], error[1], error[2]
+
+def __offsetProgress( progressCallback, offset, numTotal ) :
+
+	if progressCallback is None :
+		return None
+
+	return lambda numCompleted, stageTotal : progressCallback( offset + numCompleted, numTotal )
+
+## Equivalent to shutil.copy(), but using sendfile() to copy within the
+# kernel where it is available, and large buffers otherwise.
+def __copy( src, dst ) :
+
+	if os.path.isdir( dst ) :
+		dst = os.path.join( dst, os.path.basename( src ) )
+
+	with open( src, "rb" ) as fSrc :
+		with open( dst, "wb" ) as fDst :
+			if not __sendFile( fSrc, fDst ) :
+				# sendfile() isn't available or isn't supported for
+				# this combination of files, so fall back to a regular copy.
+				fSrc.seek( 0 )
+				fDst.seek( 0 )
+				fDst.truncate()
+				shutil.copyfileobj( fSrc, fDst, 1024 * 1024 )
+
+	shutil.copymode( src, dst )
+
+## Copies the whole of fSrc into fDst using sendfile(), returning
+# True on success and False otherwise.
+def __sendFile( fSrc, fDst ) :
+
+	if not hasattr( os, "sendfile" ) :
+		return False
+
+	size = os.fstat( fSrc.fileno() ).st_size
+	offset = 0
+	try :
+		while offset < size :
+			sent = os.sendfile( fDst.fileno(), fSrc.fileno(), offset, size - offset )
+			if sent == 0 :
+				return False
+			offset += sent
+	except OSError :
+		return False
+
+	return True
+
 def __tmpPrefix() :
 
 	"""Returns a hopefully unique string suitable for use as the temporary
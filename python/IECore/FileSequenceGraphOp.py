@@ -36,6 +36,7 @@
 
 import os, copy
 from IECore import *
+from FileSequenceAnalyzerOp import FileSequenceAnalyzerOp
 
 # Creates a bar graph object that represents the file sizes as bar height and file status as bar color.
 class FileSequenceGraphOp( FileSequenceAnalyzerOp ):
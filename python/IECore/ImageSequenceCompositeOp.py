@@ -36,6 +36,7 @@
 
 import os
 from IECore import *
+from SequenceMergeOp import SequenceMergeOp
 
 # The ImageSequenceCompositeOp does a simple A-over-B composite of two input sequences of image files
 class ImageSequenceCompositeOp( SequenceMergeOp ) :
@@ -0,0 +1,131 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+import sys
+import types
+
+## A module type which defers the import of rarely used attributes until
+# they are first accessed. It is intended to replace a package in sys.modules
+# at the end of its __init__.py, so that core functionality is still imported
+# eagerly but everything else is only paid for when it is used. For example :
+#
+# LazyModule.install( __name__, { "SequenceLsOp" : "SequenceLsOp" } )
+#
+# Star imports of a LazyModule load all the lazy attributes, so that
+# "from module import *" behaves exactly as it would for a regular module.
+# Submodules are exempt from this while they are being lazily loaded, so
+# they may star import the package without loading everything else - they
+# must explicitly import any lazy attributes they depend on. Note that
+# importing a lazy submodule directly with "import module.submodule" leaves
+# the submodule in place of the attribute until the next lazy load, so
+# clients should access lazy attributes via the package instead.
+# \ingroup python
+class LazyModule( types.ModuleType ) :
+
+	## module is the module being replaced, and lazyAttributes is a dictionary
+	# mapping from attribute names to the names of the submodules they should
+	# be loaded from.
+	def __init__( self, module, lazyAttributes ) :
+
+		types.ModuleType.__init__( self, module.__name__, module.__doc__ )
+
+		self.__dict__.update( module.__dict__ )
+		# we must keep the original module alive, as python clears the globals
+		# of a module when it is destroyed. we also use it to find any attributes
+		# which are added to it after we've replaced it.
+		self.__dict__["_LazyModule__module"] = module
+		self.__dict__["_LazyModule__lazyAttributes"] = dict( lazyAttributes )
+		self.__dict__["_LazyModule__loading"] = 0
+
+	## Replaces the module called name in sys.modules with a LazyModule.
+	@staticmethod
+	def install( name, lazyAttributes ) :
+
+		module = LazyModule( sys.modules[name], lazyAttributes )
+		sys.modules[name] = module
+		return module
+
+	## Returns the names of all the attributes which have yet to be loaded.
+	def pendingAttributes( self ) :
+
+		return sorted( [
+			n for n in self.__lazyAttributes.keys()
+			if isinstance( self.__dict__.get( n, types ), types.ModuleType )
+		] )
+
+	def __getattr__( self, name ) :
+
+		if name in self.__lazyAttributes :
+			return self.__load( name )
+
+		if name == "__all__" and not self.__loading :
+			return [ n for n in self.__dir__() if not n.startswith( "_" ) ]
+
+		try :
+			return getattr( self.__module, name )
+		except AttributeError :
+			raise AttributeError( "'module' object has no attribute '%s'" % name )
+
+	def __dir__( self ) :
+
+		names = set( self.__dict__.keys() )
+		names.update( self.__module.__dict__.keys() )
+		names.update( self.__lazyAttributes.keys() )
+		return sorted( [ n for n in names if not n.startswith( "_LazyModule__" ) ] )
+
+	def __load( self, name ) :
+
+		moduleName = self.__name__ + "." + self.__lazyAttributes[name]
+
+		self.__dict__["_LazyModule__loading"] += 1
+		try :
+			__import__( moduleName )
+			value = getattr( sys.modules[moduleName], name )
+		finally :
+			self.__dict__["_LazyModule__loading"] -= 1
+
+		self.__dict__[name] = value
+
+		# the import machinery stores submodules in the dictionary of their
+		# package when they're loaded, so any lazy submodules imported by the
+		# one we just loaded will now be hiding the attributes we want to
+		# provide. we replace them now they're fully loaded.
+		if not self.__loading :
+			for attributeName, submoduleName in self.__lazyAttributes.items() :
+				value = self.__dict__.get( attributeName, None )
+				if isinstance( value, types.ModuleType ) and value.__name__ == self.__name__ + "." + submoduleName :
+					self.__dict__[attributeName] = getattr( value, attributeName )
+
+		return self.__dict__[name]
@@ -33,6 +33,7 @@
 ##########################################################################
 
 from IECore import *
+from SequenceCpOp import SequenceCpOp
 
 class SequenceConvertOp( Op ) :
 
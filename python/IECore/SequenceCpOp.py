@@ -65,7 +65,12 @@ class SequenceCpOp( Op ) :
 					check = FileSequenceParameter.CheckType.MustNotExist,
 					allowEmptyString = False,
 					minSequenceSize = 1,
-				)
+				),
+				BoolParameter(
+					name = "dryRun",
+					description = "When on, the copies are listed but not performed.",
+					defaultValue = False,
+				),
 			]
 		)
 
@@ -77,7 +82,10 @@ class SequenceCpOp( Op ) :
 		if isinstance( dst.frameList, EmptyFrameList ):
 			dst.frameList = src.frameList
 
-		cp(	src, dst )
+		plan = cp( src, dst, dryRun = operands["dryRun"].value )
+		if operands["dryRun"].value :
+			for s, d in plan :
+				msg( Msg.Level.Info, "SequenceCpOp", "Copy \"%s\" to \"%s\"" % ( s, d ) )
 
 		return StringData( str(dst) )
 
@@ -288,7 +288,7 @@ class SequenceLsOp( Op ) :
 
 			def isContiguous( sequence ):
 
-				return len( sequence.frameList.asList() ) == max( sequence.frameList.asList() ) - min( sequence.frameList.asList() ) + 1
+				return sequence.frameList.isContiguous()
 
 			filters.append( isContiguous )
 
@@ -363,11 +363,11 @@ class SequenceLsOp( Op ) :
 			s = s.replace( "<SUFFIX>", sequences[i].getSuffix() )
 			s = s.replace( "<FRAMES>", str( sequences[i].frameList ) )
 
-			frames = sequences[i].frameList.asList()
-			frames.sort()
-			s = s.replace( "<FIRST>", str( frames[0] ) )
-			s = s.replace( "<LAST>", str( frames[-1] ) )
+			s = s.replace( "<FIRST>", str( sequences[i].frameList.minFrame() ) )
+			s = s.replace( "<LAST>", str( sequences[i].frameList.maxFrame() ) )
 			if s.find( "<STEP>" )!=-1 :
+				frames = sequences[i].frameList.asList()
+				frames.sort()
 				stepCounts = {}
 				for j in xrange( 1, len( frames ) ) :
 					step = frames[j] - frames[j-1]
@@ -66,7 +66,12 @@ class SequenceMvOp( Op ) :
 					check = FileSequenceParameter.CheckType.MustNotExist,
 					allowEmptyString = False,
 					minSequenceSize = 1,
-				)
+				),
+				BoolParameter(
+					name = "dryRun",
+					description = "When on, the moves are listed but not performed.",
+					defaultValue = False,
+				),
 			]
 		)
 
@@ -78,7 +83,10 @@ class SequenceMvOp( Op ) :
 		if isinstance( dst.frameList, EmptyFrameList ):
 			dst.frameList = src.frameList
 
-		mv( src, dst )
+		plan = mv( src, dst, dryRun = operands["dryRun"].value )
+		if operands["dryRun"].value :
+			for s, d in plan :
+				msg( Msg.Level.Info, "SequenceMvOp", "Move \"%s\" to \"%s\"" % ( s, d ) )
 
 		return StringData( str(dst) )
 
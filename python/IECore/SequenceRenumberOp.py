@@ -32,6 +32,8 @@
 #
 ##########################################################################
 
+import os
+
 from IECore import *
 
 class SequenceRenumberOp( Op ) :
@@ -77,6 +79,11 @@ class SequenceRenumberOp( Op ) :
 					description = "A number added to each frame number after multiplication.",
 					defaultValue = 0,
 				),
+				BoolParameter(
+					name = "dryRun",
+					description = "When on, the moves are listed but not performed, and any existing files which would be overwritten are reported.",
+					defaultValue = False,
+				),
 			]
 		)
 
@@ -91,7 +98,14 @@ class SequenceRenumberOp( Op ) :
 
 		dst.frameList = frameListFromList( frames )
 
-		mv( src, dst )
+		plan = mv( src, dst, dryRun = operands["dryRun"].value )
+		if operands["dryRun"].value :
+			for s, d in plan :
+				msg( Msg.Level.Info, "SequenceRenumberOp", "Move \"%s\" to \"%s\"" % ( s, d ) )
+			sources = set( src.fileNames() )
+			for f in dst.fileNames() :
+				if f not in sources and os.path.exists( f ) :
+					msg( Msg.Level.Warning, "SequenceRenumberOp", "Existing file \"%s\" would be overwritten" % f )
 
 		return StringData( dst.fileName )
 
@@ -58,13 +58,21 @@ class SequenceRmOp( Op ) :
 					check = FileSequenceParameter.CheckType.MustExist,
 					allowEmptyString = False,
 					minSequenceSize = 1,
-				)
+				),
+				BoolParameter(
+					name = "dryRun",
+					description = "When on, the removals are listed but not performed.",
+					defaultValue = False,
+				),
 			]
 		)
 
 	def doOperation( self, operands ) :
 
-		rm( self.parameters()["seq"].getFileSequenceValue() )
+		plan = rm( self.parameters()["seq"].getFileSequenceValue(), dryRun = operands["dryRun"].value )
+		if operands["dryRun"].value :
+			for f in plan :
+				msg( Msg.Level.Info, "SequenceRmOp", "Remove \"%s\"" % f )
 
 		return StringData( operands["seq"].value )
 
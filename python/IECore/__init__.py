@@ -57,52 +57,22 @@ import StringUtil
 from DataTraits import *
 from FileSequenceFunctions import *
 from ClassLoader import ClassLoader
-from RemovePrimitiveVariables import RemovePrimitiveVariables
-from RenamePrimitiveVariables import RenamePrimitiveVariables
-from SequenceCpOp import SequenceCpOp
-from SequenceLsOp import SequenceLsOp
-from SequenceMvOp import SequenceMvOp
-from SequenceRmOp import SequenceRmOp
-from SequenceCatOp import SequenceCatOp
-from SequenceRenumberOp import SequenceRenumberOp
-from SequenceConvertOp import SequenceConvertOp
 from FormattedParameterHelp import formatParameterHelp
 from ReadProcedural import ReadProcedural
-from ClassLsOp import ClassLsOp
 from OptionalCompoundParameter import OptionalCompoundParameter
 from FileExaminer import FileExaminer
 from NukeFileExaminer import NukeFileExaminer
 from RIBFileExaminer import RIBFileExaminer
-from FileDependenciesOp import FileDependenciesOp
-from CheckFileDependenciesOp import CheckFileDependenciesOp
-from PointsExpressionOp import PointsExpressionOp
 from Struct import Struct
 import Enum
-from LsHeaderOp import LsHeaderOp
 from curry import curry
-from MenuItemDefinition import MenuItemDefinition
-from MenuDefinition import MenuDefinition
 from ParameterParser import ParameterParser
-from SearchReplaceOp import SearchReplaceOp
 from CapturingMessageHandler import CapturingMessageHandler
-from FileSequenceAnalyzerOp import FileSequenceAnalyzerOp
-from CheckImagesOp import CheckImagesOp
-from FileSequenceGraphOp import FileSequenceGraphOp
-from LayeredDict import LayeredDict
 from CompoundVectorParameter import CompoundVectorParameter
-from AttributeBlock import AttributeBlock
-from TransformBlock import TransformBlock
-from WorldBlock import WorldBlock
-from SequenceMergeOp import SequenceMergeOp
-from ImageSequenceCompositeOp import ImageSequenceCompositeOp
 from DateTimeParameterParser import *
-from MotionBlock import MotionBlock
-from SubstitutedDict import SubstitutedDict
-from VisualiserProcedural import VisualiserProcedural
 from IDXReader import IDXReader
 from ClassParameter import ClassParameter
 from ClassVectorParameter import ClassVectorParameter
-from CompoundStream import CompoundStream
 from IgnoredExceptions import IgnoredExceptions
 import ParameterAlgo
 from SWAReader import SWAReader
@@ -114,8 +84,49 @@ from ParameterOverwriting import *
 from ParameterisedOverwriting import *
 from MessageHandlerOverwriting import *
 
-from ConfigLoader import loadConfig
 from Preset import Preset
 from BasicPreset import BasicPreset
 from RelativePreset import RelativePreset
 
+# Rarely used classes are only imported when they are first accessed, to keep
+# the cost of "import IECore" down. Modules which register things on import (new
+# Readers, ParameterParser types and the like) must not be listed here, as
+# the registrations would then be missed. Likewise, names which are used by the
+# modules imported above must be imported eagerly.
+from LazyModule import LazyModule
+LazyModule.install( __name__, dict( [ ( n, n ) for n in [
+	"RemovePrimitiveVariables",
+	"RenamePrimitiveVariables",
+	"SequenceCpOp",
+	"SequenceLsOp",
+	"SequenceMvOp",
+	"SequenceRmOp",
+	"SequenceCatOp",
+	"SequenceRenumberOp",
+	"SequenceConvertOp",
+	"ClassLsOp",
+	"FileDependenciesOp",
+	"CheckFileDependenciesOp",
+	"PointsExpressionOp",
+	"LsHeaderOp",
+	"MenuItemDefinition",
+	"MenuDefinition",
+	"SearchReplaceOp",
+	"FileSequenceAnalyzerOp",
+	"CheckImagesOp",
+	"FileSequenceGraphOp",
+	"LayeredDict",
+	"AttributeBlock",
+	"TransformBlock",
+	"WorldBlock",
+	"SequenceMergeOp",
+	"ImageSequenceCompositeOp",
+	"MotionBlock",
+	"SubstitutedDict",
+	"VisualiserProcedural",
+	"CompoundStream",
+] ] ) )
+
+# this is done last so that the config files see the fully initialised module
+from ConfigLoader import loadConfig
+
@@ -242,58 +242,6 @@ void BGEOParticleReader::attributeNames( std::vector<std::string> &names )
 	}
 }
 
-ObjectPtr BGEOParticleReader::doOperation( const CompoundObject *operands )
-{
-	vector<string> attributes;
-	particleAttributes( attributes );
-	size_t nParticles = numParticles();
-	PointsPrimitivePtr result = new PointsPrimitive( nParticles );
-
-	CompoundDataPtr attributeData = readAttributes( attributes );
-	if ( !attributeData )
-	{
-		throw Exception( ( format( "Failed to load \"%s\"." ) % fileName() ).str() );
-
-	}
-
-	bool haveNumPoints = false;
-	for( vector<string>::const_iterator it = attributes.begin(); it!=attributes.end(); it++ )
-	{
-		CompoundDataMap::const_iterator itData = attributeData->readable().find( *it );
-		if ( itData == attributeData->readable().end() )
-		{
-			msg( Msg::Warning, "ParticleReader::doOperation", format( "Attribute %s expected but not found." ) % *it );
-			continue;
-		}
-		
-		DataPtr d = itData->second;
-		
-		if ( testTypedData<TypeTraits::IsVectorTypedData>( d ) )
-		{
-			size_t s = despatchTypedData< TypedDataSize, TypeTraits::IsVectorTypedData >( d );
-			if( !haveNumPoints )
-			{
-				result->setNumPoints( s );
-				haveNumPoints = true;
-			}
-			if( s==result->getNumPoints() )
-			{
-				result->variables.insert( PrimitiveVariableMap::value_type( *it, PrimitiveVariable( PrimitiveVariable::Vertex, d ) ) );
-			}
-			else
-			{
-				msg( Msg::Warning, "ParticleReader::doOperation", format( "Ignoring attribute \"%s\" due to insufficient elements (expected %d but found %d)." ) % *it % result->getNumPoints() % s );
-			}
-		}
-		else if ( testTypedData<TypeTraits::IsSimpleTypedData>( d ) )
-		{
-			result->variables.insert( PrimitiveVariableMap::value_type( *it, PrimitiveVariable( PrimitiveVariable::Constant, d ) ) );
-		}
-	}
-
-	return result;
-}
-
 template<typename T>
 void BGEOParticleReader::readAttributeData( char **dataBuffer, T *attrBuffer, unsigned long n ) const
 {
@@ -341,9 +289,18 @@ CompoundDataPtr BGEOParticleReader::readAttributes( const std::vector<std::strin
 	float floatAttribBuffer[ 4 ];
 	float *floatAttributePtr = &floatAttribBuffer[0];
 	
+	// all attribute values are 4 bytes wide, so we can compute the
+	// offset of each attribute within a point as we go.
+	int offset = 0;
 	vector<Record>::const_iterator it;
-	for( it=m_header.attributes.begin(); it!=m_header.attributes.end(); it++ )
+	for( it=m_header.attributes.begin(); it!=m_header.attributes.end(); offset += it->size * sizeof( int ), it++ )
 	{
+		// skip data we don't need
+		if( find( names.begin(), names.end(), it->name ) == names.end() )
+		{
+			continue;
+		}
+		
 		V3fVectorDataPtr v3fVector = 0;
 		V2fVectorDataPtr v2fVector = 0;
 		FloatVectorDataPtr floatVector = 0;
@@ -393,22 +350,36 @@ CompoundDataPtr BGEOParticleReader::readAttributes( const std::vector<std::strin
 		AttrInfo info = {
 			*it,
 			dataVector,
+			offset,
 		};
 
 		attrInfo.push_back( info );
 	}
 		
-	// read all of the data at once
+	if( attrInfo.empty() )
+	{
+		return result;
+	}
+	
+	// stream the point data through a buffer of bounded size, decoding
+	// only the requested attributes from each point.
+	const int pointsPerChunk = std::max( 1, ( 1024 * 1024 ) / std::max( 1, m_header.dataSize ) );
 	std::vector<char> dataBuffer;
-	dataBuffer.resize( m_header.numPoints * m_header.dataSize );
-	char *dataBufferPtr = &dataBuffer[0];
+	dataBuffer.resize( std::min( pointsPerChunk, m_header.numPoints ) * m_header.dataSize );
 	m_iStream->seekg( ios_base::beg + m_header.firstPointPosition );
-	m_iStream->read( dataBufferPtr, m_header.numPoints * m_header.dataSize );
 	for ( int i = 0; i < m_header.numPoints; i++)
 	{
+		const int chunkIndex = i % pointsPerChunk;
+		if( chunkIndex == 0 )
+		{
+			const int chunkSize = std::min( pointsPerChunk, m_header.numPoints - i );
+			m_iStream->read( &dataBuffer[0], chunkSize * m_header.dataSize );
+		}
+		
 		std::vector< struct AttrInfo >::iterator it;
 		for (it = attrInfo.begin(); it != attrInfo.end(); it++)
 		{
+			char *dataBufferPtr = &dataBuffer[0] + chunkIndex * m_header.dataSize + it->offset;
 			// P contains an additional byte in the BGEO
 			if ( it->info.type == Integer || it->info.type == Index )
 			{
@@ -455,20 +426,16 @@ CompoundDataPtr BGEOParticleReader::readAttributes( const std::vector<std::strin
 		}
 	}
 	
+	// compute the filtering once for all attributes.
 	/// \todo Use particle ids for filtering.
-	const Data *ids = 0;
+	std::vector<bool> mask;
+	filterMask( numParticles(), 0, mask );
 
 	DataPtr filteredData = 0;
 	// filter and convert each attribute individually.
 	std::vector< struct AttrInfo >::const_iterator attrIt;
 	for( attrIt=attrInfo.begin(); attrIt!=attrInfo.end(); attrIt++ )
 	{
-		// The data had to be read, but we don't need to filter or store it
-		if( find( names.begin(), names.end(), attrIt->info.name ) == names.end() )
-		{
-			continue;
-		}
-		
 		if ( attrIt->info.size == 1 )
 		{
 			if ( attrIt->info.type == Float )
@@ -477,20 +444,20 @@ CompoundDataPtr BGEOParticleReader::readAttributes( const std::vector<std::strin
 				{
 				case ParticleReader::Native :
 				case ParticleReader::Float :
-					filteredData = filterAttr<FloatVectorData, FloatVectorData>( staticPointerCast<FloatVectorData>(attrIt->targetData), particlePercentage(), ids );
+					filteredData = filterAttr<FloatVectorData, FloatVectorData>( staticPointerCast<FloatVectorData>(attrIt->targetData), mask );
 					break;
 				case ParticleReader::Double :
-					filteredData = filterAttr<DoubleVectorData, FloatVectorData>( staticPointerCast<FloatVectorData>(attrIt->targetData), particlePercentage(), ids );
+					filteredData = filterAttr<DoubleVectorData, FloatVectorData>( staticPointerCast<FloatVectorData>(attrIt->targetData), mask );
 					break;
 				}
 			}
 			else if ( attrIt->info.type == Integer )
 			{
-				filteredData = filterAttr<IntVectorData, IntVectorData>( staticPointerCast<IntVectorData>(attrIt->targetData), particlePercentage(), ids );
+				filteredData = filterAttr<IntVectorData, IntVectorData>( staticPointerCast<IntVectorData>(attrIt->targetData), mask );
 			}
 			else if ( attrIt->info.type == Index )
 			{
-				filteredData = filterAttr<StringVectorData, StringVectorData>( staticPointerCast<StringVectorData>(attrIt->targetData), particlePercentage(), ids );
+				filteredData = filterAttr<StringVectorData, StringVectorData>( staticPointerCast<StringVectorData>(attrIt->targetData), mask );
 			}
 		}
 		else if ( attrIt->info.size == 2 )
@@ -501,10 +468,10 @@ CompoundDataPtr BGEOParticleReader::readAttributes( const std::vector<std::strin
 				{
 				case ParticleReader::Native :
 				case ParticleReader::Float :
-					filteredData = filterAttr<V2fVectorData, V2fVectorData>( staticPointerCast<V2fVectorData>(attrIt->targetData), particlePercentage(), ids );
+					filteredData = filterAttr<V2fVectorData, V2fVectorData>( staticPointerCast<V2fVectorData>(attrIt->targetData), mask );
 					break;
 				case ParticleReader::Double :
-					filteredData = filterAttr<V2dVectorData, V2fVectorData>( staticPointerCast<V2fVectorData>(attrIt->targetData), particlePercentage(), ids );
+					filteredData = filterAttr<V2dVectorData, V2fVectorData>( staticPointerCast<V2fVectorData>(attrIt->targetData), mask );
 					break;
 				}
 			}
@@ -517,10 +484,10 @@ CompoundDataPtr BGEOParticleReader::readAttributes( const std::vector<std::strin
 				{
 				case ParticleReader::Native :
 				case ParticleReader::Float :
-					filteredData = filterAttr<V3fVectorData, V3fVectorData>( staticPointerCast<V3fVectorData>(attrIt->targetData), particlePercentage(), ids );
+					filteredData = filterAttr<V3fVectorData, V3fVectorData>( staticPointerCast<V3fVectorData>(attrIt->targetData), mask );
 					break;
 				case ParticleReader::Double :
-					filteredData = filterAttr<V3dVectorData, V3fVectorData>( staticPointerCast<V3fVectorData>(attrIt->targetData), particlePercentage(), ids );
+					filteredData = filterAttr<V3dVectorData, V3fVectorData>( staticPointerCast<V3fVectorData>(attrIt->targetData), mask );
 					break;
 				}
 			}
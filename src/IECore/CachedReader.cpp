@@ -33,16 +33,24 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include "tbb/mutex.h"
+#include "tbb/atomic.h"
 #include "tbb/concurrent_hash_map.h"
+#include "tbb/task.h"
+#include "tbb/parallel_for.h"
+#include "tbb/blocked_range.h"
 
 #include "boost/format.hpp"
 #include "boost/lexical_cast.hpp"
+#include "boost/filesystem/operations.hpp"
 
 #include "IECore/CachedReader.h"
 #include "IECore/ComputationCache.h"
 #include "IECore/Reader.h"
 #include "IECore/Object.h"
 #include "IECore/ModifyOp.h"
+#include "IECore/CompoundObject.h"
+#include "IECore/CompoundParameter.h"
+#include "IECore/SimpleTypedData.h"
 
 using namespace IECore;
 using namespace boost;
@@ -59,59 +67,131 @@ struct CachedReader::MemberData
 {
 	public :
 
-		MemberData(const SearchPath &paths, ConstModifyOpPtr postProcessor, ObjectPoolPtr objectPool )
+		MemberData(const SearchPath &paths, ConstModifyOpPtr postProcessor, ObjectPoolPtr objectPool, bool concurrentPostProcessing )
 			:	m_searchPaths( paths ), m_cache( computeFn, hashFn, 10000, objectPool ), m_postProcessor( postProcessor )
 		{
+			m_validation = false;
+			if( m_postProcessor && concurrentPostProcessing )
+			{
+				// Take a snapshot of the arguments, so that we never need to touch the Parameters
+				// of the Op (which isn't threadsafe) when applying it.
+				ModifyOpPtr p = constPointerCast<ModifyOp>( m_postProcessor );
+				m_postProcessorOperands = p->parameters()->getTypedValidatedValue<CompoundObject>()->copy();
+			}
 		}
 
-		typedef std::pair< std::string, MemberData * > ComputeParameters;
+		/// The arguments passed to the computation. The resolved path and file
+		/// stamp are only filled in when validation is on, in which case they
+		/// form part of the hash so that modified files are reloaded.
+		struct ComputeParameters
+		{
+			ComputeParameters( const std::string &f, MemberData *d )
+				:	file( f ), data( d ), validation( d->m_validation ), fileSize( 0 ), modificationTime( 0 )
+			{
+				if( validation )
+				{
+					resolvedPath = data->m_searchPaths.find( file );
+					if( !resolvedPath.empty() )
+					{
+						boost::system::error_code ec;
+						fileSize = file_size( resolvedPath, ec );
+						modificationTime = last_write_time( resolvedPath, ec );
+					}
+				}
+			}
+
+			const std::string &file;
+			MemberData *data;
+			bool validation;
+			path resolvedPath;
+			uintmax_t fileSize;
+			std::time_t modificationTime;
+		};
+
 		typedef IECore::ComputationCache< ComputeParameters > Cache;
 
 		SearchPath m_searchPaths;
 		Cache m_cache;
 		ConstModifyOpPtr m_postProcessor;
+		ConstCompoundObjectPtr m_postProcessorOperands;
 		tbb::mutex m_postProcessorMutex;
-		typedef tbb::concurrent_hash_map< std::string, std::string > FileErrors;
-		FileErrors m_fileErrors;		
+		tbb::atomic<bool> m_validation;
+
+		struct FileError
+		{
+			std::string message;
+			uintmax_t fileSize;
+			std::time_t modificationTime;
+		};
+
+		typedef tbb::concurrent_hash_map< std::string, FileError > FileErrors;
+		FileErrors m_fileErrors;
+
+		// Returns true if a previous attempt to load the file failed, and the file hasn't
+		// changed since. Errors recorded against older versions of the file are discarded.
+		bool previousError( const ComputeParameters &params, std::string *message = 0 )
+		{
+			{
+				FileErrors::const_accessor cit;
+				if( !m_fileErrors.find( cit, params.file ) )
+				{
+					return false;
+				}
+				if( cit->second.fileSize == params.fileSize && cit->second.modificationTime == params.modificationTime )
+				{
+					if( message )
+					{
+						*message = cit->second.message;
+					}
+					return true;
+				}
+			}
+			m_fileErrors.erase( params.file );
+			return false;
+		}
 
 	private :
 
-		void registerFileError( const std::string &filePath, const std::string &errorMsg )
+		void registerFileError( const ComputeParameters &params, const std::string &errorMsg )
 		{
 			FileErrors::accessor it;
-			if ( m_fileErrors.insert( it, filePath ) )
+			if ( m_fileErrors.insert( it, params.file ) )
 			{
-				it->second = errorMsg;
+				it->second.message = errorMsg;
+				it->second.fileSize = params.fileSize;
+				it->second.modificationTime = params.modificationTime;
 			}
 		}
 
 		static MurmurHash hashFn( const ComputeParameters &params )
 		{
-			const std::string &filePath = params.first;
 			MurmurHash h;
-			h.append( filePath );
+			h.append( params.file );
+			if( params.validation )
+			{
+				h.append( (uint64_t)params.fileSize );
+				h.append( (int64_t)params.modificationTime );
+			}
 			return h;
 		}
 
 		// static function used by the cache mechanism to actually load the object data from file.
 		static ObjectPtr computeFn( const ComputeParameters &params )
 		{
-			const std::string &filePath = params.first;
-			MemberData *data = params.second;
+			const std::string &filePath = params.file;
+			MemberData *data = params.data;
 
+			/// Check if the file failed before...
+			std::string previousMessage;
+			if( data->previousError( params, &previousMessage ) )
 			{
-				/// Check if the file failed before...
-				FileErrors::const_accessor cit;
-				if ( data->m_fileErrors.find( cit, filePath ) )
-				{
-					throw Exception( ( format( "Previous attempt to read %s failed: %s" ) % filePath % cit->second ).str() );
-				}
+				throw Exception( ( format( "Previous attempt to read %s failed: %s" ) % filePath % previousMessage ).str() );
 			}
 
 			ObjectPtr result(0);
 			try
 			{
-				path resolvedPath = data->m_searchPaths.find( filePath );
+				path resolvedPath = params.validation ? params.resolvedPath : data->m_searchPaths.find( filePath );
 				if( resolvedPath.empty() )
 				{
 					string pathList;
@@ -145,43 +225,110 @@ struct CachedReader::MemberData
 		
 				if( data->m_postProcessor )
 				{
-					/// \todo We need to allow arguments to be passed to Op::operate() directly
-					/// so that the same Op can be used from multiple threads with different arguments.
-					/// This means adding an overloaded operate() method but more importantly making sure
-					/// that all Ops only use their operands to access arguments and not go getting them
-					/// from the Parameters directly.
-					tbb::mutex::scoped_lock l( data->m_postProcessorMutex );
 					ModifyOpPtr postProcessor = constPointerCast<ModifyOp>( data->m_postProcessor );
-					postProcessor->inputParameter()->setValue( result );
-					postProcessor->copyParameter()->setTypedValue( false );
-					postProcessor->operate();
+					if( data->m_postProcessorOperands )
+					{
+						// The Op has promised to use only its operands, so we can pass them
+						// directly and run concurrently with other loads.
+						CompoundObjectPtr operands = new CompoundObject;
+						operands->members() = data->m_postProcessorOperands->members();
+						operands->members()[postProcessor->inputParameter()->name()] = result;
+						operands->members()[postProcessor->copyParameter()->name()] = new BoolData( false );
+						postProcessor->operate( operands.get() );
+					}
+					else
+					{
+						tbb::mutex::scoped_lock l( data->m_postProcessorMutex );
+						postProcessor->inputParameter()->setValue( result );
+						postProcessor->copyParameter()->setTypedValue( false );
+						postProcessor->operate();
+					}
 				}
 			}
 			catch ( std::exception &e )
 			{
-				data->registerFileError( filePath, e.what() );
+				data->registerFileError( params, e.what() );
 				throw;
 			}
 			catch ( ... )
 			{
-				data->registerFileError( filePath, "Unexpected error." );
+				data->registerFileError( params, "Unexpected error." );
 				throw;
 			}
 			return result;
 		}
 };
 
+//////////////////////////////////////////////////////////////////////////
+// Prefetching
+//////////////////////////////////////////////////////////////////////////
+
+class CachedReader::PrefetchTask : public tbb::task
+{
+
+	public :
+
+		PrefetchTask( boost::shared_ptr<MemberData> data, const std::vector<std::string> &files )
+			:	m_data( data ), m_files( files )
+		{
+		}
+
+		virtual tbb::task *execute()
+		{
+			Loader loader( m_data.get(), m_files );
+			tbb::parallel_for( tbb::blocked_range<size_t>( 0, m_files.size() ), loader );
+			return 0;
+		}
+
+	private :
+
+		struct Loader
+		{
+
+			Loader( MemberData *data, const std::vector<std::string> &files )
+				:	m_data( data ), m_files( files )
+			{
+			}
+
+			void operator()( const tbb::blocked_range<size_t> &r ) const
+			{
+				for( size_t i = r.begin(); i != r.end(); ++i )
+				{
+					try
+					{
+						m_data->m_cache.get( MemberData::ComputeParameters( m_files[i], m_data ) );
+					}
+					catch( ... )
+					{
+						// The error has been recorded against the file, and will
+						// be reported by any subsequent call to read().
+					}
+				}
+			}
+
+			MemberData *m_data;
+			const std::vector<std::string> &m_files;
+
+		};
+
+		// Holding the MemberData keeps it alive even if the CachedReader
+		// is destroyed before we complete.
+		boost::shared_ptr<MemberData> m_data;
+		std::vector<std::string> m_files;
+
+};
+
 //////////////////////////////////////////////////////////////////////////
 // CachedReader
 //////////////////////////////////////////////////////////////////////////
 
 CachedReader::CachedReader( const SearchPath &paths, ObjectPoolPtr objectPool  )
-	:	m_data( new MemberData( paths, 0, objectPool ) )
+	:	m_data( new MemberData( paths, 0, objectPool, false ) )
 {
 }
 
-CachedReader::CachedReader( const SearchPath &paths, ConstModifyOpPtr postProcessor, ObjectPoolPtr objectPool )
-	:	m_data( new MemberData( paths, postProcessor, objectPool ) )
+CachedReader::CachedReader( const SearchPath &paths, ConstModifyOpPtr postProcessor, ObjectPoolPtr objectPool, bool concurrentPostProcessing )
+	:	m_data( new MemberData( paths, postProcessor, objectPool, concurrentPostProcessing ) )
 {
 }
 
@@ -190,6 +337,15 @@ ConstObjectPtr CachedReader::read( const std::string &file )
 	return m_data->m_cache.get( PARAM(file) );
 }
 
+void CachedReader::prefetch( const std::vector<std::string> &files )
+{
+	if( files.empty() )
+	{
+		return;
+	}
+	tbb::task::enqueue( *new( tbb::task::allocate_root() ) PrefetchTask( m_data, files ) );
+}
+
 void CachedReader::insert( const std::string &file, ConstObjectPtr obj )
 {
 	m_data->m_fileErrors.erase( file );
@@ -198,16 +354,14 @@ void CachedReader::insert( const std::string &file, ConstObjectPtr obj )
 
 bool CachedReader::cached( const std::string &file ) const
 {
+	MemberData::ComputeParameters params( file, m_data.get() );
+	/// Check if the file failed before...
+	if( m_data->previousError( params ) )
 	{
-		/// Check if the file failed before...
-		MemberData::FileErrors::const_accessor cit;
-		if ( m_data->m_fileErrors.find( cit, file ) )
-		{
-			return false;
-		}
+		return false;
 	}
 
-	return m_data->m_cache.get( PARAM(file), MemberData::Cache::NullIfMissing );
+	return m_data->m_cache.get( params, MemberData::Cache::NullIfMissing );
 }
 
 void CachedReader::clear()
@@ -236,6 +390,16 @@ void CachedReader::setSearchPath( const SearchPath &paths )
 	}
 }
 
+void CachedReader::setValidation( bool validation )
+{
+	m_data->m_validation = validation;
+}
+
+bool CachedReader::getValidation() const
+{
+	return m_data->m_validation;
+}
+
 ObjectPool *CachedReader::objectPool() const
 {
 	return m_data->m_cache.objectPool();
@@ -104,6 +104,25 @@ void CompoundFrameList::asList( std::vector<Frame> &frames ) const
 	}
 }
 
+void CompoundFrameList::asRanges( RangeVector &ranges ) const
+{
+	ranges.clear();
+
+	RangeVector subRanges;
+	for ( std::vector< FrameListPtr >::const_iterator it = m_frameLists.begin(); it != m_frameLists.end(); ++it )
+	{
+		if ( !(*it) )
+		{
+			throw Exception( "CompoundFrameList contains invalid frame list" );
+		}
+
+		(*it)->asRanges( subRanges );
+		ranges.insert( ranges.end(), subRanges.begin(), subRanges.end() );
+	}
+
+	unionRanges( ranges );
+}
+
 std::string CompoundFrameList::asString() const
 {
 	std::string s;
@@ -32,11 +32,13 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 #include "IECore/CurvesMergeOp.h"
 #include "IECore/CompoundParameter.h"
-#include "IECore/NullObject.h"
-#include "IECore/DespatchTypedData.h"
-#include "IECore/TypeTraits.h"
+#include "IECore/ObjectVector.h"
+#include "IECore/private/PrimitiveMerge.h"
 
 #include <algorithm>
 
@@ -54,7 +56,23 @@ CurvesMergeOp::CurvesMergeOp()
 		new CurvesPrimitive
 	);
 
+	m_curvesListParameter = new ObjectVectorParameter(
+		"curvesList",
+		"A list of further CurvesPrimitives to be merged with the input, after the curves parameter. "
+		"Merging many primitives at once is much faster than merging them one at a time, as the "
+		"result is allocated only once.",
+		new ObjectVector
+	);
+
+	m_removePrimVarsParameter = new BoolParameter(
+		"removeNonMatchingPrimVars",
+		"If true, PrimitiveVariables that exist on one set of curves and not the other will be removed. If false, the PrimitiveVariable data will be expanded using a default value.",
+		false
+	);
+
 	parameters()->addParameter( m_curvesParameter );
+	parameters()->addParameter( m_curvesListParameter );
+	parameters()->addParameter( m_removePrimVarsParameter );
 }
 
 CurvesMergeOp::~CurvesMergeOp()
@@ -71,60 +89,96 @@ const CurvesPrimitiveParameter * CurvesMergeOp::curvesParameter() const
 	return m_curvesParameter;
 }
 
-struct CurvesMergeOp::AppendPrimVars
+ObjectVectorParameter * CurvesMergeOp::curvesListParameter()
 {
-	typedef void ReturnType;
+	return m_curvesListParameter;
+}
 
-	AppendPrimVars( const CurvesPrimitive * curves2, const std::string &name )
-		:	m_curves2( curves2 ), m_name( name )
-	{
-	}
+const ObjectVectorParameter * CurvesMergeOp::curvesListParameter() const
+{
+	return m_curvesListParameter;
+}
 
-	template<typename T>
-	ReturnType operator()( T * data )
-	{
+struct CurvesMergeOp::MergeTopology
+{
+	public :
 
-		PrimitiveVariableMap::const_iterator it = m_curves2->variables.find( m_name );
-		if( it!=m_curves2->variables.end() )
+		MergeTopology( const vector<const CurvesPrimitive *> &curves, const vector<size_t> &offsets, vector<int> &verticesPerCurve )
+			:	m_curves( curves ), m_offsets( offsets ), m_verticesPerCurve( verticesPerCurve )
 		{
-			const T *data2 = runTimeCast<const T>( it->second.data );
-			if( data2 )
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
+		{
+			for( size_t i=range.begin(); i!=range.end(); ++i )
 			{
-				data->writable().insert( data->writable().end(), data2->readable().begin(), data2->readable().end() );
+				const vector<int> &verticesPerCurve = m_curves[i]->verticesPerCurve()->readable();
+				copy( verticesPerCurve.begin(), verticesPerCurve.end(), m_verticesPerCurve.begin() + m_offsets[i] );
 			}
 		}
-	}
 
 	private :
 
-		const CurvesPrimitive * m_curves2;
-		std::string m_name;
+		const vector<const CurvesPrimitive *> &m_curves;
+		const vector<size_t> &m_offsets;
+		vector<int> &m_verticesPerCurve;
 
 };
 
 void CurvesMergeOp::modifyTypedPrimitive( CurvesPrimitive * curves, const CompoundObject * operands )
 {
-	const CurvesPrimitive *curves2 = static_cast<const CurvesPrimitive *>( m_curvesParameter->getValue() );
+	// gather all the curves to be merged. empty primitives are skipped so
+	// that they don't affect the primitive variables of the result.
+	vector<const CurvesPrimitive *> allCurves;
+	allCurves.push_back( curves );
 
-	const vector<int> &verticesPerCurve1 = curves->verticesPerCurve()->readable();
-	const vector<int> &verticesPerCurve2 = curves2->verticesPerCurve()->readable();
-	
-	IntVectorDataPtr verticesPerCurveData = new IntVectorData;
-	vector<int> &verticesPerCurve = verticesPerCurveData->writable();
-	verticesPerCurve.resize( verticesPerCurve1.size() + verticesPerCurve2.size() );
-	
-	vector<int>::iterator it = copy( verticesPerCurve1.begin(), verticesPerCurve1.end(), verticesPerCurve.begin() );
-	copy( verticesPerCurve2.begin(), verticesPerCurve2.end(), it );
-
-	curves->setTopology( verticesPerCurveData, curves->basis(), curves->periodic() );
+	const CurvesPrimitive *curves2 = static_cast<const CurvesPrimitive *>( m_curvesParameter->getValue() );
+	if( curves2->numCurves() )
+	{
+		allCurves.push_back( curves2 );
+	}
 
-	PrimitiveVariableMap::iterator pvIt;
-	for( pvIt=curves->variables.begin(); pvIt!=curves->variables.end(); pvIt++ )
+	const ObjectVector::MemberContainer &curvesList = static_cast<const ObjectVector *>( m_curvesListParameter->getValue() )->members();
+	for( ObjectVector::MemberContainer::const_iterator it = curvesList.begin(); it != curvesList.end(); ++it )
 	{
-		if( pvIt->second.interpolation!=PrimitiveVariable::Constant )
+		const CurvesPrimitive *c = runTimeCast<const CurvesPrimitive>( it->get() );
+		if( !c )
 		{
-			AppendPrimVars f( curves2, pvIt->first );
-			despatchTypedData<AppendPrimVars, TypeTraits::IsVectorTypedData, DespatchTypedDataIgnoreError>( pvIt->second.data, f );
+			throw InvalidArgumentException( "CurvesMergeOp : curvesList parameter must contain only CurvesPrimitives." );
 		}
+		if( c->numCurves() )
+		{
+			allCurves.push_back( c );
+		}
+	}
+
+	if( allCurves.size() == 1 )
+	{
+		return;
+	}
+
+	vector<size_t> offsets( 1, 0 );
+	for( vector<const CurvesPrimitive *>::const_iterator it = allCurves.begin(); it != allCurves.end(); ++it )
+	{
+		offsets.push_back( offsets.back() + (*it)->numCurves() );
 	}
+
+	// merge the primitive variables, before the topology is changed
+
+	PrimitiveVariableMap variables;
+	Detail::mergePrimitiveVariables( vector<const Primitive *>( allCurves.begin(), allCurves.end() ), m_removePrimVarsParameter->getTypedValue(), variables );
+
+	// merge the topology
+
+	IntVectorDataPtr verticesPerCurveData = new IntVectorData;
+	vector<int> &verticesPerCurve = verticesPerCurveData->writable();
+	verticesPerCurve.resize( offsets.back() );
+
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, allCurves.size() ),
+		MergeTopology( allCurves, offsets, verticesPerCurve )
+	);
+
+	curves->setTopology( verticesPerCurveData, curves->basis(), curves->periodic() );
+	curves->variables.swap( variables );
 }
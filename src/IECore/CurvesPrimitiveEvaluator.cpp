@@ -34,6 +34,11 @@
 
 #include "OpenEXR/ImathFun.h"
 
+#include "boost/shared_ptr.hpp"
+
+#include "tbb/parallel_for.h"
+#include "tbb/blocked_range.h"
+
 #include "IECore/CurvesPrimitiveEvaluator.h"
 #include "IECore/CurvesPrimitive.h"
 #include "IECore/Exception.h"
@@ -328,8 +333,10 @@ struct CurvesPrimitiveEvaluator::Line
 //////////////////////////////////////////////////////////////////////////
 
 CurvesPrimitiveEvaluator::CurvesPrimitiveEvaluator( ConstCurvesPrimitivePtr curves )
-	:	m_curvesPrimitive( curves->copy() ), m_verticesPerCurve( m_curvesPrimitive->verticesPerCurve()->readable() ), m_haveTree( false )
+	:	m_curvesPrimitive( curves->copy() ), m_verticesPerCurve( m_curvesPrimitive->verticesPerCurve()->readable() )
 {
+	m_haveTree = false;
+
 	m_vertexDataOffsets.reserve( m_verticesPerCurve.size() );
 	m_varyingDataOffsets.reserve( m_verticesPerCurve.size() );
 	int vertexDataOffset = 0;
@@ -499,6 +506,257 @@ bool CurvesPrimitiveEvaluator::pointAtV( unsigned curveIndex, float v, Primitive
 	return true;
 }
 
+namespace
+{
+
+// Writes the value of a primitive variable from query results into a vector of values,
+// one per query.
+class PrimVarWriter
+{
+
+	public :
+
+		PrimVarWriter( const PrimitiveVariable &primVar, size_t size )
+			:	m_primVar( primVar )
+		{
+			switch( primVar.data->typeId() )
+			{
+				case FloatDataTypeId :
+				case FloatVectorDataTypeId :
+					m_data = createVector<FloatVectorData>( size, m_floats );
+					break;
+				case IntDataTypeId :
+				case IntVectorDataTypeId :
+					m_data = createVector<IntVectorData>( size, m_ints );
+					break;
+				case V3fDataTypeId :
+				case V3fVectorDataTypeId :
+					m_data = createVector<V3fVectorData>( size, m_v3fs );
+					break;
+				case Color3fDataTypeId :
+				case Color3fVectorDataTypeId :
+					m_data = createVector<Color3fVectorData>( size, m_color3fs );
+					break;
+				default :
+					throw InvalidArgumentException( std::string( "CurvesPrimitiveEvaluator: Unsupported primitive variable type " ) + primVar.data->typeName() );
+			}
+		}
+
+		DataPtr data() const
+		{
+			return m_data;
+		}
+
+		void write( size_t index, const CurvesPrimitiveEvaluator::Result *result ) const
+		{
+			if( m_floats )
+			{
+				m_floats[index] = result->floatPrimVar( m_primVar );
+			}
+			else if( m_ints )
+			{
+				m_ints[index] = result->intPrimVar( m_primVar );
+			}
+			else if( m_v3fs )
+			{
+				m_v3fs[index] = result->vectorPrimVar( m_primVar );
+			}
+			else
+			{
+				m_color3fs[index] = result->colorPrimVar( m_primVar );
+			}
+		}
+
+	private :
+
+		template<typename T>
+		DataPtr createVector( size_t size, typename T::ValueType::value_type *&values )
+		{
+			m_floats = 0;
+			m_ints = 0;
+			m_v3fs = 0;
+			m_color3fs = 0;
+			typename T::Ptr result = new T;
+			result->writable().resize( size );
+			values = size ? &(result->writable()[0]) : 0;
+			return result;
+		}
+
+		PrimitiveVariable m_primVar;
+		DataPtr m_data;
+		float *m_floats;
+		int *m_ints;
+		V3f *m_v3fs;
+		Color3f *m_color3fs;
+
+};
+
+typedef boost::shared_ptr<PrimVarWriter> PrimVarWriterPtr;
+
+// The output of a batched query, consisting of the curve index and v value of
+// each query, and the values of the requested primitive variables.
+class BatchResults
+{
+
+	public :
+
+		BatchResults( const CurvesPrimitive *curves, const std::vector<std::string> &primVarNames, size_t size )
+			:	m_curveIndices( new IntVectorData ), m_v( new FloatVectorData )
+		{
+			for( std::vector<std::string>::const_iterator it = primVarNames.begin(); it != primVarNames.end(); it++ )
+			{
+				PrimitiveVariableMap::const_iterator pIt = curves->variables.find( *it );
+				if( pIt == curves->variables.end() || !pIt->second.data )
+				{
+					throw InvalidArgumentException( "CurvesPrimitiveEvaluator: No primitive variable named \"" + *it + "\"" );
+				}
+				m_primVarNames.push_back( *it );
+				m_primVarWriters.push_back( PrimVarWriterPtr( new PrimVarWriter( pIt->second, size ) ) );
+			}
+
+			m_curveIndices->writable().resize( size, 0 );
+			m_v->writable().resize( size, 0 );
+			m_curveIndexValues = size ? &(m_curveIndices->writable()[0]) : 0;
+			m_vValues = size ? &(m_v->writable()[0]) : 0;
+		}
+
+		void write( size_t index, const CurvesPrimitiveEvaluator::Result *result ) const
+		{
+			// the result vectors are sized up front, so writing to distinct indices
+			// from multiple threads is safe.
+			m_curveIndexValues[index] = result->curveIndex();
+			m_vValues[index] = result->uv()[1];
+			for( std::vector<PrimVarWriterPtr>::const_iterator it = m_primVarWriters.begin(); it != m_primVarWriters.end(); it++ )
+			{
+				(*it)->write( index, result );
+			}
+		}
+
+		CompoundDataPtr compoundData() const
+		{
+			CompoundDataPtr result = new CompoundData;
+			result->writable()["curveIndex"] = m_curveIndices;
+			result->writable()["v"] = m_v;
+			for( size_t i = 0; i < m_primVarNames.size(); i++ )
+			{
+				result->writable()[m_primVarNames[i]] = m_primVarWriters[i]->data();
+			}
+			return result;
+		}
+
+	private :
+
+		IntVectorDataPtr m_curveIndices;
+		FloatVectorDataPtr m_v;
+		int *m_curveIndexValues;
+		float *m_vValues;
+		std::vector<std::string> m_primVarNames;
+		std::vector<PrimVarWriterPtr> m_primVarWriters;
+
+};
+
+class ClosestPoints
+{
+
+	public :
+
+		ClosestPoints( const CurvesPrimitiveEvaluator *evaluator, const std::vector<V3f> &points, const BatchResults &results )
+			:	m_evaluator( evaluator ), m_points( points ), m_results( results )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
+		{
+			PrimitiveEvaluator::ResultPtr result = m_evaluator->createResult();
+			const CurvesPrimitiveEvaluator::Result *typedResult = static_cast<const CurvesPrimitiveEvaluator::Result *>( result.get() );
+			for( size_t i = range.begin(); i != range.end(); i++ )
+			{
+				m_evaluator->closestPoint( m_points[i], result.get() );
+				m_results.write( i, typedResult );
+			}
+		}
+
+	private :
+
+		const CurvesPrimitiveEvaluator *m_evaluator;
+		const std::vector<V3f> &m_points;
+		const BatchResults &m_results;
+
+};
+
+class PointsAtV
+{
+
+	public :
+
+		PointsAtV( const CurvesPrimitiveEvaluator *evaluator, const std::vector<int> &curveIndices, const std::vector<float> &v, const BatchResults &results, std::vector<char> &status )
+			:	m_evaluator( evaluator ), m_curveIndices( curveIndices ), m_v( v ), m_results( results ), m_status( status )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
+		{
+			PrimitiveEvaluator::ResultPtr result = m_evaluator->createResult();
+			const CurvesPrimitiveEvaluator::Result *typedResult = static_cast<const CurvesPrimitiveEvaluator::Result *>( result.get() );
+			for( size_t i = range.begin(); i != range.end(); i++ )
+			{
+				if( m_curveIndices[i] >= 0 && m_evaluator->pointAtV( m_curveIndices[i], m_v[i], result.get() ) )
+				{
+					m_results.write( i, typedResult );
+					m_status[i] = 1;
+				}
+			}
+		}
+
+	private :
+
+		const CurvesPrimitiveEvaluator *m_evaluator;
+		const std::vector<int> &m_curveIndices;
+		const std::vector<float> &m_v;
+		const BatchResults &m_results;
+		std::vector<char> &m_status;
+
+};
+
+} // namespace
+
+CompoundDataPtr CurvesPrimitiveEvaluator::closestPoints( const V3fVectorData *points, const std::vector<std::string> &primVarNames ) const
+{
+	const std::vector<V3f> &p = points->readable();
+	BatchResults results( m_curvesPrimitive, primVarNames, p.size() );
+	if( p.size() && m_verticesPerCurve.size() )
+	{
+		// build the tree before launching the queries, so the threads don't all
+		// queue up waiting for the first one to do it.
+		const_cast<CurvesPrimitiveEvaluator *>( this )->buildTree();
+		tbb::parallel_for( tbb::blocked_range<size_t>( 0, p.size(), 100 ), ClosestPoints( this, p, results ) );
+	}
+	return results.compoundData();
+}
+
+CompoundDataPtr CurvesPrimitiveEvaluator::pointsAtV( const IntVectorData *curveIndices, const FloatVectorData *v, const std::vector<std::string> &primVarNames ) const
+{
+	const std::vector<int> &c = curveIndices->readable();
+	const std::vector<float> &vv = v->readable();
+	if( c.size() != vv.size() )
+	{
+		throw InvalidArgumentException( "CurvesPrimitiveEvaluator: curveIndices and v must have the same length" );
+	}
+
+	BatchResults results( m_curvesPrimitive, primVarNames, c.size() );
+
+	// std::vector<bool> packs its elements into bits, so can't be written from
+	// multiple threads. we gather the status as chars and convert afterwards.
+	std::vector<char> status( c.size(), 0 );
+	tbb::parallel_for( tbb::blocked_range<size_t>( 0, c.size(), 100 ), PointsAtV( this, c, vv, results, status ) );
+
+	CompoundDataPtr result = results.compoundData();
+	BoolVectorDataPtr statusData = new BoolVectorData;
+	statusData->writable().assign( status.begin(), status.end() );
+	result->writable()["status"] = statusData;
+	return result;
+}
+
 
 float CurvesPrimitiveEvaluator::integrateCurve( unsigned curveIndex, float vStart, float vEnd, int samples, Result& typedResult ) const
 {
@@ -634,72 +892,124 @@ float CurvesPrimitiveEvaluator::curveLength( unsigned curveIndex, float vStart,
 	}
 }
 
-void CurvesPrimitiveEvaluator::buildTree()
+// Linearises a range of curves into the lines to be stored in the tree,
+// starting at the precomputed offset for each curve.
+struct CurvesPrimitiveEvaluator::BuildLines
 {
-	if( m_haveTree )
-	{
-		return;
-	}
-	
-	TreeMutex::scoped_lock lock( m_treeMutex );
-	if( m_haveTree )
+
+	BuildLines( const CurvesPrimitiveEvaluator *evaluator, const std::vector<size_t> &lineOffsets, std::vector<Box3f> &bounds, std::vector<Line> &lines )
+		:	m_evaluator( evaluator ), m_lineOffsets( lineOffsets ), m_bounds( bounds ), m_lines( lines )
 	{
-		// another thread may have built the tree while we waited for the mutex
-		return;
 	}
-	
-	bool linear = m_curvesPrimitive->basis() == CubicBasisf::linear();
-	const std::vector<V3f> &p = static_cast<const V3fVectorData *>( m_p.data.get() )->readable();
-	PrimitiveEvaluator::ResultPtr result = createResult();
-	
-	size_t numCurves = m_curvesPrimitive->numCurves();
-	for( size_t curveIndex = 0; curveIndex<numCurves; curveIndex++ )
+
+	void operator()( const tbb::blocked_range<size_t> &range ) const
 	{
-		if( linear )
+		const CurvesPrimitive *curves = m_evaluator->m_curvesPrimitive.get();
+		bool linear = curves->basis() == CubicBasisf::linear();
+		const std::vector<V3f> &p = static_cast<const V3fVectorData *>( m_evaluator->m_p.data.get() )->readable();
+		PrimitiveEvaluator::ResultPtr result = m_evaluator->createResult();
+
+		for( size_t curveIndex = range.begin(); curveIndex != range.end(); curveIndex++ )
 		{
-			int numVertices = m_verticesPerCurve[curveIndex];
-			int vertIndex = m_vertexDataOffsets[curveIndex];
-			float prevV = 0.0f;
-			for( int i=0; i<numVertices; i++, vertIndex++ )
+			size_t lineIndex = m_lineOffsets[curveIndex];
+			if( linear )
 			{
-				float v = clamp( (float)i/(float)(numVertices-1), 0.0f, 1.0f );
-				if( i!=0 )
+				int numVertices = m_evaluator->m_verticesPerCurve[curveIndex];
+				int vertIndex = m_evaluator->m_vertexDataOffsets[curveIndex];
+				float prevV = 0.0f;
+				for( int i=0; i<numVertices; i++, vertIndex++ )
 				{
-					Box3f b;
-					b.extendBy( p[vertIndex-1] );
-					b.extendBy( p[vertIndex] );
-					m_treeBounds.push_back( b );
-					m_treeLines.push_back( Line(  p[vertIndex-1], p[vertIndex], curveIndex, prevV, v ) );
+					float v = clamp( (float)i/(float)(numVertices-1), 0.0f, 1.0f );
+					if( i!=0 )
+					{
+						Box3f b;
+						b.extendBy( p[vertIndex-1] );
+						b.extendBy( p[vertIndex] );
+						m_bounds[lineIndex] = b;
+						m_lines[lineIndex] = Line( p[vertIndex-1], p[vertIndex], curveIndex, prevV, v );
+						lineIndex++;
+					}
+					prevV = v;
 				}
-				prevV = v;				
 			}
-		}
-		else
-		{
-			unsigned numSegments = m_curvesPrimitive->numSegments( curveIndex );
-			int steps = numSegments * Line::linesPerCurveSegment();
-			V3f prevP( 0 );
-			float prevV = 0;
-			for( int i=0; i<steps; i++ )
+			else
 			{
-				float v = clamp( (float)i/(float)(steps-1), 0.0f, 1.0f );
-				pointAtV( curveIndex, v, result );
-				V3f p = result->point();
-				if( i!=0 )
+				unsigned numSegments = curves->numSegments( curveIndex );
+				int steps = numSegments * Line::linesPerCurveSegment();
+				V3f prevP( 0 );
+				float prevV = 0;
+				for( int i=0; i<steps; i++ )
 				{
-					Box3f b;
-					b.extendBy( prevP );
-					b.extendBy( p );
-					m_treeBounds.push_back( b );
-					m_treeLines.push_back( Line( prevP, p, curveIndex, prevV, v ) );
-				}
+					float v = clamp( (float)i/(float)(steps-1), 0.0f, 1.0f );
+					m_evaluator->pointAtV( curveIndex, v, result );
+					V3f p = result->point();
+					if( i!=0 )
+					{
+						Box3f b;
+						b.extendBy( prevP );
+						b.extendBy( p );
+						m_bounds[lineIndex] = b;
+						m_lines[lineIndex] = Line( prevP, p, curveIndex, prevV, v );
+						lineIndex++;
+					}
 
-				prevP = p;
-				prevV = v;
+					prevP = p;
+					prevV = v;
+				}
 			}
+			assert( lineIndex == m_lineOffsets[curveIndex+1] );
 		}
 	}
+
+	private :
+
+		const CurvesPrimitiveEvaluator *m_evaluator;
+		const std::vector<size_t> &m_lineOffsets;
+		std::vector<Box3f> &m_bounds;
+		std::vector<Line> &m_lines;
+
+};
+
+void CurvesPrimitiveEvaluator::buildTree()
+{
+	if( m_haveTree )
+	{
+		return;
+	}
 	
+	// count the lines for each curve up front, so that the curves can then
+	// be linearised independently of one another, in parallel. we do this
+	// before taking the mutex, because a thread waiting for the parallel loop
+	// to complete may pick up another of the caller's tasks, which could then
+	// block forever trying to lock the mutex we hold. if several threads
+	// get here at once they will all linearise the curves, but only the first
+	// to take the mutex will use the result.
+	bool linear = m_curvesPrimitive->basis() == CubicBasisf::linear();
+	size_t numCurves = m_curvesPrimitive->numCurves();
+	std::vector<size_t> lineOffsets;
+	lineOffsets.reserve( numCurves + 1 );
+	size_t numLines = 0;
+	for( size_t curveIndex = 0; curveIndex<numCurves; curveIndex++ )
+	{
+		lineOffsets.push_back( numLines );
+		int numPoints = linear ? m_verticesPerCurve[curveIndex] : m_curvesPrimitive->numSegments( curveIndex ) * Line::linesPerCurveSegment();
+		numLines += std::max( numPoints - 1, 0 );
+	}
+	lineOffsets.push_back( numLines );
+
+	std::vector<Box3f> bounds( numLines );
+	std::vector<Line> lines( numLines, Line( V3f( 0 ), V3f( 0 ), 0, 0.0f, 0.0f ) );
+	tbb::parallel_for( tbb::blocked_range<size_t>( 0, numCurves ), BuildLines( this, lineOffsets, bounds, lines ) );
+
+	TreeMutex::scoped_lock lock( m_treeMutex );
+	if( m_haveTree )
+	{
+		// another thread built the tree while we were linearising
+		return;
+	}
+
+	m_treeBounds.swap( bounds );
+	m_treeLines.swap( lines );
 	m_tree.init( m_treeBounds.begin(), m_treeBounds.end() );
 	m_haveTree = true;
 }
@@ -0,0 +1,355 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include <algorithm>
+#include <ctime>
+#include <vector>
+
+#include <fcntl.h>
+#include <unistd.h>
+#include <sys/file.h>
+
+#include "tbb/atomic.h"
+#include "tbb/mutex.h"
+
+#include "boost/filesystem/operations.hpp"
+#include "boost/format.hpp"
+
+#include "IECore/DiskObjectCache.h"
+#include "IECore/FileIndexedIO.h"
+#include "IECore/Exception.h"
+
+using namespace IECore;
+using namespace boost::filesystem;
+
+//////////////////////////////////////////////////////////////////////////
+// MemberData
+//////////////////////////////////////////////////////////////////////////
+
+struct DiskObjectCache::MemberData
+{
+
+	MemberData( const std::string &d, size_t m )
+		:	directory( d ), maxDiskUsage( m )
+	{
+		hits = 0;
+		misses = 0;
+		diskUsage = 0;
+		temporaryFileCount = 0;
+	}
+
+	path filePath( const MurmurHash &hash ) const
+	{
+		const std::string h = hash.toString();
+		// We use the first two characters of the hash to divide the objects
+		// between subdirectories, to avoid directories with huge numbers of files.
+		return path( directory ) / h.substr( 0, 2 ) / ( h + ".fio" );
+	}
+
+	struct Entry
+	{
+		path filePath;
+		uintmax_t size;
+		std::time_t lastUsed;
+
+		bool operator < ( const Entry &other ) const
+		{
+			return lastUsed < other.lastUsed;
+		}
+	};
+
+	// Scans the directory for all stored objects, updating
+	// diskUsage and optionally returning the entries found.
+	void scan( std::vector<Entry> *entries = 0 )
+	{
+		size_t total = 0;
+		boost::system::error_code ec;
+		path lastError;
+		for( recursive_directory_iterator it( directory, ec ), eIt; it != eIt; it.increment( ec ) )
+		{
+			if( ec )
+			{
+				// Entries may be unreadable, or removed by other processes as we
+				// iterate. We skip them and carry on, because stopping would leave
+				// the rest of the directory out of the total. We only give up if
+				// we can't get past the same entry twice.
+				if( it->path() == lastError )
+				{
+					break;
+				}
+				lastError = it->path();
+				ec.clear();
+				it.no_push();
+				continue;
+			}
+			if( it->path().extension() != ".fio" || !is_regular_file( it->status() ) )
+			{
+				continue;
+			}
+			Entry entry;
+			entry.filePath = it->path();
+			entry.size = file_size( entry.filePath, ec );
+			entry.lastUsed = last_write_time( entry.filePath, ec );
+			if( ec )
+			{
+				continue;
+			}
+			total += entry.size;
+			if( entries )
+			{
+				entries->push_back( entry );
+			}
+		}
+		diskUsage = total;
+	}
+
+	// Removes the least recently used objects until we are under budget. Only
+	// one thread in one process does this at any one time - any others arriving
+	// in the meantime leave it to the one already working.
+	void evict()
+	{
+		tbb::mutex::scoped_lock lock;
+		if( !lock.try_acquire( evictionMutex ) )
+		{
+			return;
+		}
+
+		const std::string lockFileName = ( path( directory ) / ".lock" ).string();
+		int lockFile = open( lockFileName.c_str(), O_RDWR | O_CREAT, 0666 );
+		if( lockFile == -1 )
+		{
+			return;
+		}
+		if( flock( lockFile, LOCK_EX | LOCK_NB ) == -1 )
+		{
+			close( lockFile );
+			return;
+		}
+
+		std::vector<Entry> entries;
+		scan( &entries );
+		const size_t targetDiskUsage = maxDiskUsage - maxDiskUsage / 10;
+		if( diskUsage > targetDiskUsage )
+		{
+			std::sort( entries.begin(), entries.end() );
+			size_t total = diskUsage;
+			for( std::vector<Entry>::const_iterator it = entries.begin(), eIt = entries.end(); it != eIt && total > targetDiskUsage; ++it )
+			{
+				boost::system::error_code ec;
+				boost::filesystem::remove( it->filePath, ec );
+				// The file may have been removed by another process already,
+				// but either way it no longer counts.
+				total -= it->size;
+			}
+			diskUsage = total;
+		}
+
+		flock( lockFile, LOCK_UN );
+		close( lockFile );
+	}
+
+	const std::string directory;
+	tbb::atomic<size_t> maxDiskUsage;
+	tbb::atomic<size_t> diskUsage;
+	tbb::atomic<size_t> hits;
+	tbb::atomic<size_t> misses;
+	tbb::atomic<size_t> temporaryFileCount;
+	tbb::mutex evictionMutex;
+
+};
+
+//////////////////////////////////////////////////////////////////////////
+// DiskObjectCache
+//////////////////////////////////////////////////////////////////////////
+
+DiskObjectCache::DiskObjectCache( const std::string &directory, size_t maxDiskUsage )
+	:	m_data( new MemberData( directory, maxDiskUsage ) )
+{
+	boost::system::error_code ec;
+	create_directories( directory, ec );
+	if( !is_directory( directory ) )
+	{
+		throw IOException( "DiskObjectCache : Unable to create directory \"" + directory + "\"" );
+	}
+	m_data->scan();
+}
+
+DiskObjectCache::~DiskObjectCache()
+{
+}
+
+const std::string &DiskObjectCache::directory() const
+{
+	return m_data->directory;
+}
+
+void DiskObjectCache::setMaxDiskUsage( size_t maxDiskUsage )
+{
+	m_data->maxDiskUsage = maxDiskUsage;
+	if( m_data->diskUsage > maxDiskUsage )
+	{
+		m_data->evict();
+	}
+}
+
+size_t DiskObjectCache::getMaxDiskUsage() const
+{
+	return m_data->maxDiskUsage;
+}
+
+size_t DiskObjectCache::diskUsage() const
+{
+	return m_data->diskUsage;
+}
+
+bool DiskObjectCache::contains( const MurmurHash &hash ) const
+{
+	boost::system::error_code ec;
+	return exists( m_data->filePath( hash ), ec );
+}
+
+ConstObjectPtr DiskObjectCache::retrieve( const MurmurHash &hash )
+{
+	const path filePath = m_data->filePath( hash );
+
+	boost::system::error_code ec;
+	if( !exists( filePath, ec ) )
+	{
+		m_data->misses++;
+		return 0;
+	}
+
+	ObjectPtr result = 0;
+	try
+	{
+		IndexedIOPtr io = new FileIndexedIO( filePath.string(), IndexedIO::rootPath, IndexedIO::Read );
+		result = Object::load( io, "object" );
+	}
+	catch( ... )
+	{
+		// Another process may have evicted the file since we checked for it.
+		m_data->misses++;
+		return 0;
+	}
+
+	// Record the use, so the file is not a candidate for eviction.
+	last_write_time( filePath, std::time( 0 ), ec );
+	m_data->hits++;
+
+	return result;
+}
+
+void DiskObjectCache::store( const MurmurHash &hash, const Object *object )
+{
+	const path filePath = m_data->filePath( hash );
+
+	boost::system::error_code ec;
+	if( exists( filePath, ec ) )
+	{
+		last_write_time( filePath, std::time( 0 ), ec );
+		return;
+	}
+
+	create_directories( filePath.parent_path(), ec );
+
+	// We write to a temporary file first and then rename it into place,
+	// so that no other thread or process can see a partially written file.
+	const path temporaryPath = filePath.string() + ( boost::format( ".%d.%d.tmp" ) % getpid() % m_data->temporaryFileCount.fetch_and_increment() ).str();
+	try
+	{
+		IndexedIOPtr io = new FileIndexedIO( temporaryPath.string(), IndexedIO::rootPath, IndexedIO::Exclusive | IndexedIO::Write );
+		object->save( io, "object" );
+	}
+	catch( const std::exception &e )
+	{
+		boost::filesystem::remove( temporaryPath, ec );
+		throw IOException( std::string( "DiskObjectCache : Unable to write \"" ) + filePath.string() + "\" : " + e.what() );
+	}
+
+	boost::filesystem::rename( temporaryPath, filePath, ec );
+	if( ec )
+	{
+		boost::filesystem::remove( temporaryPath, ec );
+		throw IOException( "DiskObjectCache : Unable to write \"" + filePath.string() + "\"" );
+	}
+
+	m_data->diskUsage += file_size( filePath, ec );
+	if( m_data->diskUsage > m_data->maxDiskUsage )
+	{
+		m_data->evict();
+	}
+}
+
+bool DiskObjectCache::erase( const MurmurHash &hash )
+{
+	const path filePath = m_data->filePath( hash );
+
+	boost::system::error_code ec;
+	const uintmax_t size = file_size( filePath, ec );
+	if( ec || !boost::filesystem::remove( filePath, ec ) )
+	{
+		return false;
+	}
+
+	m_data->diskUsage -= std::min<size_t>( size, m_data->diskUsage );
+	return true;
+}
+
+void DiskObjectCache::clear()
+{
+	std::vector<MemberData::Entry> entries;
+	m_data->scan( &entries );
+	for( std::vector<MemberData::Entry>::const_iterator it = entries.begin(), eIt = entries.end(); it != eIt; ++it )
+	{
+		boost::system::error_code ec;
+		boost::filesystem::remove( it->filePath, ec );
+	}
+	m_data->diskUsage = 0;
+}
+
+size_t DiskObjectCache::hits() const
+{
+	return m_data->hits;
+}
+
+size_t DiskObjectCache::misses() const
+{
+	return m_data->misses;
+}
+
+void DiskObjectCache::resetStatistics()
+{
+	m_data->hits = 0;
+	m_data->misses = 0;
+}
@@ -55,6 +55,11 @@ void EmptyFrameList::asList( std::vector<Frame> &frames ) const
 	frames.clear();
 }
 
+void EmptyFrameList::asRanges( RangeVector &ranges ) const
+{
+	ranges.clear();
+}
+
 std::string EmptyFrameList::asString() const
 {
 	return "";
@@ -32,17 +32,280 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include "boost/shared_ptr.hpp"
+
+#include "OpenEXR/ImathEuler.h"
+
 #include "IECore/EnvMapSHProjector.h"
 #include "IECore/CompoundParameter.h"
 #include "IECore/ObjectParameter.h"
 #include "IECore/ImagePrimitive.h"
 #include "IECore/SphericalHarmonicsAlgo.h"
+#include "IECore/EuclideanToSphericalTransform.h"
+#include "IECore/SphericalToEuclideanTransform.h"
+#include "IECore/LRUCache.h"
+#include "IECore/MurmurHash.h"
 
-using namespace tbb;
 using namespace IECore;
 
 IE_CORE_DEFINERUNTIMETYPED( EnvMapSHProjector );
 
+//////////////////////////////////////////////////////////////////////////////////////////
+// Cache implementation
+//////////////////////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+typedef boost::shared_ptr<const SHProjectorf> ConstSHProjectorfPtr;
+
+struct ProjectorKey
+{
+	ProjectorKey( const MurmurHash &hash, int sampling, unsigned samples, unsigned bands, const Imath::V2i &resolution, const Imath::M44f &orientation, bool rightHandSystem )
+		:	hash( hash ), sampling( sampling ), samples( samples ), bands( bands ), resolution( resolution ), orientation( orientation ), rightHandSystem( rightHandSystem )
+	{
+	}
+
+	bool operator < ( const ProjectorKey &other ) const
+	{
+		return hash < other.hash;
+	}
+
+	MurmurHash hash;
+	// The remaining members are the values the hash was
+	// computed from, and are what's needed to build the projector.
+	int sampling;
+	unsigned samples;
+	unsigned bands;
+	Imath::V2i resolution;
+	Imath::M44f orientation;
+	bool rightHandSystem;
+};
+
+// Converts a direction in 3D space into the polar coordinates of the environment map,
+// as defined by the orientation and handedness of the projection.
+Imath::V2f mapCoordinates( const Imath::V3f &direction, const Imath::M44f &orientation, const Imath::V3f &systemConversion )
+{
+	EuclideanToSphericalTransform< Imath::V3f, Imath::V2f > euc2sph;
+	return euc2sph.transform( ( direction * systemConversion ) * orientation );
+}
+
+// Returns the colour of the environment map for each of the samples of a projector
+// made with random sampling.
+class DirectionLookup
+{
+
+	public :
+
+		DirectionLookup( const std::vector<Imath::V3f> &directions, const Imath::M44f &orientation, const Imath::V3f &systemConversion, const Imath::V2i &resolution, const float *r, const float *g, const float *b )
+			:	m_directions( directions ), m_orientation( orientation ), m_systemConversion( systemConversion ), m_resolution( resolution ), m_r( r ), m_g( g ), m_b( b )
+		{
+		}
+
+		Imath::Color3f operator()( unsigned int i ) const
+		{
+			Imath::V2f phiTheta = mapCoordinates( m_directions[i], m_orientation, m_systemConversion );
+			int ix = (int)(phiTheta.x * (float)m_resolution.x / ( M_PI * 2 ));
+			int iy = (int)(phiTheta.y * (float)m_resolution.y /  M_PI );
+			ix = std::max( 0, std::min( ix, m_resolution.x - 1 ) );
+			iy = std::max( 0, std::min( iy, m_resolution.y - 1 ) );
+			int offset = iy * m_resolution.x + ix;
+			return Imath::Color3f( m_r[offset], m_g[offset], m_b[offset] );
+		}
+
+	private :
+
+		const std::vector<Imath::V3f> &m_directions;
+		const Imath::M44f &m_orientation;
+		const Imath::V3f &m_systemConversion;
+		const Imath::V2i &m_resolution;
+		const float *m_r;
+		const float *m_g;
+		const float *m_b;
+
+};
+
+// Returns the colour of the environment map for each of the samples of a projector
+// made with texel sampling, where there is one sample per texel.
+class TexelLookup
+{
+
+	public :
+
+		TexelLookup( const float *r, const float *g, const float *b )
+			:	m_r( r ), m_g( g ), m_b( b )
+		{
+		}
+
+		Imath::Color3f operator()( unsigned int i ) const
+		{
+			return Imath::Color3f( m_r[i], m_g[i], m_b[i] );
+		}
+
+	private :
+
+		const float *m_r;
+		const float *m_g;
+		const float *m_b;
+
+};
+
+// Used with SphericalHarmonicsProjector::progressiveProjection() to stop projecting
+// once no coefficient changes by more than the tolerance from one pass to the next.
+class Convergence
+{
+
+	public :
+
+		Convergence( float tolerance )
+			:	m_tolerance( tolerance )
+		{
+		}
+
+		bool operator()( const SHColor3f &sh, unsigned int numSamples )
+		{
+			bool converged = m_previous.size() == sh.coefficients().size();
+			for ( size_t i = 0; i < m_previous.size() && converged; i++ )
+			{
+				const Imath::Color3f d = sh.coefficients()[i] - m_previous[i];
+				converged = fabs( d[0] ) <= m_tolerance && fabs( d[1] ) <= m_tolerance && fabs( d[2] ) <= m_tolerance;
+			}
+			m_previous = sh.coefficients();
+			return !converged;
+		}
+
+	private :
+
+		float m_tolerance;
+		std::vector<Imath::Color3f> m_previous;
+
+};
+
+// Evaluates the spherical harmonics for all the samples of a projector.
+// This is run via isolatedExecute() because it is called from within the
+// cache getter.
+class SampleComputation
+{
+
+	public :
+
+		SampleComputation( SHProjectorf &projector, unsigned int bands )
+			:	m_projector( projector ), m_bands( bands )
+		{
+		}
+
+		void operator()() const
+		{
+			m_projector.computeSamples( m_bands );
+		}
+
+	private :
+
+		SHProjectorf &m_projector;
+		unsigned int m_bands;
+
+};
+
+} // namespace
+
+typedef LRUCache<ProjectorKey, ConstSHProjectorfPtr> ProjectorLRUCache;
+
+class EnvMapSHProjector::Cache : public ProjectorLRUCache
+{
+	public :
+
+		Cache( ProjectorLRUCache::Cost maxCost )
+			: ProjectorLRUCache( projectorGetter, maxCost )
+		{
+		}
+
+	private :
+
+		static ConstSHProjectorfPtr projectorGetter( const ProjectorKey &key, size_t &cost )
+		{
+			boost::shared_ptr<SHProjectorf> result;
+			if ( key.sampling == EnvMapSHProjector::Texels )
+			{
+				// Make one sample at the center of each texel, weighted by the solid angle of the texel.
+				// These are defined in the space of the environment map, so we must transform them back
+				// into 3D space to make the projector.
+				const Imath::V2i &resolution = key.resolution;
+				const size_t numTexels = resolution.x * resolution.y;
+
+				std::vector<Imath::V2f> sphericalCoordinates;
+				std::vector<float> weights;
+				sphericalCoordinates.reserve( numTexels );
+				weights.reserve( numTexels );
+
+				Imath::V3f systemConversion( 1 );
+				if ( !key.rightHandSystem )
+				{
+					systemConversion[2] = -systemConversion[2];
+				}
+
+				const Imath::M44f inverseOrientation = key.orientation.inverse();
+				EuclideanToSphericalTransform< Imath::V3f, Imath::V2f > euc2sph;
+				SphericalToEuclideanTransform< Imath::V2f, Imath::V3f > sph2euc;
+
+				const double texelPhi = 2 * M_PI / resolution.x;
+				const double texelTheta = M_PI / resolution.y;
+				for ( int iy = 0; iy < resolution.y; iy++ )
+				{
+					const float theta = ( iy + 0.5 ) * texelTheta;
+					const double solidAngle = texelPhi * ( cos( iy * texelTheta ) - cos( ( iy + 1 ) * texelTheta ) );
+					for ( int ix = 0; ix < resolution.x; ix++ )
+					{
+						const float phi = ( ix + 0.5 ) * texelPhi;
+						Imath::V3f direction;
+						inverseOrientation.multDirMatrix( sph2euc.transform( Imath::V2f( phi, theta ) ), direction );
+						direction *= systemConversion;
+						sphericalCoordinates.push_back( euc2sph.transform( direction.normalized() ) );
+						// the projector divides by the number of samples, so we compensate for that here
+						weights.push_back( solidAngle * numTexels );
+					}
+				}
+
+				result.reset( new SHProjectorf( sphericalCoordinates, weights ) );
+			}
+			else
+			{
+				result.reset( new SHProjectorf( key.samples ) );
+				result->euclideanCoordinates();
+			}
+
+			isolatedExecute( SampleComputation( *result, key.bands ) );
+
+			const size_t numSamples = result->sphericalCoordinates().size();
+			cost = numSamples * ( key.bands * key.bands * sizeof( float ) + sizeof( Imath::V2f ) + sizeof( Imath::V3f ) + sizeof( float ) );
+			return result;
+		}
+};
+
+EnvMapSHProjector::Cache &EnvMapSHProjector::cache()
+{
+	static Cache cache( 256 * 1024 * 1024 );
+	return cache;
+}
+
+void EnvMapSHProjector::setProjectorCacheMemoryLimit( size_t bytes )
+{
+	cache().setMaxCost( bytes );
+}
+
+size_t EnvMapSHProjector::getProjectorCacheMemoryLimit()
+{
+	return cache().getMaxCost();
+}
+
+void EnvMapSHProjector::clearProjectorCache()
+{
+	cache().clear();
+}
+
+//////////////////////////////////////////////////////////////////////////////////////////
+// EnvMapSHProjector
+//////////////////////////////////////////////////////////////////////////////////////////
+
 EnvMapSHProjector::EnvMapSHProjector(): Op( "Projects a Lat-Long environment map on a SphericalHarmonics object and returns the resulting SH coefficients.",
 											new ObjectParameter( "result", "The result", new Color3fVectorData(), Color3fVectorData::staticTypeId() ) )
 {
@@ -79,6 +342,29 @@ EnvMapSHProjector::EnvMapSHProjector(): Op( "Projects a Lat-Long environment map
 		true
 	);
 
+	IntParameter::PresetsContainer samplingPresets;
+	samplingPresets.push_back( IntParameter::Preset( "Random", Random ) );
+	samplingPresets.push_back( IntParameter::Preset( "Texels", Texels ) );
+
+	m_samplingParameter = new IntParameter(
+		"sampling",
+		"How the env map is sampled. Random takes the number of samples specified by the samples parameter, distributed "
+		"randomly over the sphere. Texels takes one sample per texel, weighted by the solid angle of the texel, and "
+		"ignores the samples parameter. In both cases the sample positions and spherical harmonics evaluations are "
+		"cached for reuse by subsequent projections.",
+		Random,
+		samplingPresets,
+		true
+	);
+
+	m_toleranceParameter = new FloatParameter(
+		"tolerance",
+		"When non-zero, the projection is made progressively, using an increasing number of samples in each pass, "
+		"and finishes early as soon as no coefficient changes by more than this amount from one pass to the next.",
+		0.0f,
+		0.0f
+	);
+
 	m_envMapParameter = new ObjectParameter( 
 		"input", 
 		"The Lat-Long environment map", 
@@ -88,6 +374,8 @@ EnvMapSHProjector::EnvMapSHProjector(): Op( "Projects a Lat-Long environment map
 
 	parameters()->addParameter( m_bandsParameter );
 	parameters()->addParameter( m_samplesParameter );
+	parameters()->addParameter( m_samplingParameter );
+	parameters()->addParameter( m_toleranceParameter );
 	parameters()->addParameter( m_orientationParameter );
 	parameters()->addParameter( m_rightHandSystemParameter );
 	parameters()->addParameter( m_applyFilterParameter );
@@ -109,16 +397,13 @@ ObjectPtr EnvMapSHProjector::doOperation( const CompoundObject *operands )
 
 	unsigned bands = m_bandsParameter->getNumericValue();
 	unsigned samples = m_samplesParameter->getNumericValue();
+	int sampling = m_samplingParameter->getNumericValue();
+	float tolerance = m_toleranceParameter->getNumericValue();
 	bool rightHandSystem = m_rightHandSystemParameter->getTypedValue();
 	bool applyFilter = m_applyFilterParameter->getTypedValue();
 	Imath::M44f orientation = m_orientationParameter->getTypedValue();
 
-	int imgWidth = image->getDataWindow().size().x + 1;
-	int imgHeight = image->getDataWindow().size().y + 1;
-
-	// create SH projector
-	IECore::SHProjectorf projector( samples );
-	projector.computeSamples( bands );
+	Imath::V2i resolution = image->getDataWindow().size() + Imath::V2i( 1 );
 
 	ConstFloatVectorDataPtr redData = image->getChannel< float >( "R" );
 	ConstFloatVectorDataPtr greenData = image->getChannel< float >( "G" );
@@ -129,9 +414,9 @@ ObjectPtr EnvMapSHProjector::doOperation( const CompoundObject *operands )
 		throw Exception( "EnvMap does not have the three colour channels (R,G,B)!" );
 	}
 
-	const std::vector<float> &chR = redData->readable();
-	const std::vector<float> &chG = greenData->readable();
-	const std::vector<float> &chB = blueData->readable();
+	const float *chR = &redData->readable()[0];
+	const float *chG = &greenData->readable()[0];
+	const float *chB = &blueData->readable()[0];
 
 	// rotate coordinates along X axis so that the image maps Y coordinates to the vertical direction instead of Z.
 	Imath::M44f rotX90 = Imath::Eulerf( M_PI * 0.5, 0, 0 ).toMatrix44();
@@ -139,30 +424,55 @@ ObjectPtr EnvMapSHProjector::doOperation( const CompoundObject *operands )
 	// \todo: check if the order of multiplication is what we expect...
 	orientation = orientation * rotX90;
 
-	EuclideanToSphericalTransform< Imath::V3f, Imath::V2f > euc2sph;
-	std::vector< Imath::V3f >::const_iterator cit = projector.euclideanCoordinates().begin();
-
-	SHColor3f sh( bands );
-	unsigned int i;
-	unsigned actualSamples = projector.euclideanCoordinates().size();
 	Imath::V3f systemConversion(1);
 	if ( !rightHandSystem )
 	{
 		systemConversion[2] = -systemConversion[2];
 	}
 
+	// get a projector from the cache. texel projectors depend on the resolution and orientation
+	// of the map, whereas random projectors only depend on the number of samples.
+	MurmurHash hash;
+	hash.append( sampling );
+	hash.append( bands );
+	if ( sampling == Texels )
+	{
+		hash.append( resolution );
+		hash.append( orientation );
+		hash.append( rightHandSystem ? 1 : 0 );
+	}
+	else
+	{
+		hash.append( samples );
+	}
+
+	ConstSHProjectorfPtr projector = cache().get( ProjectorKey( hash, sampling, samples, bands, resolution, orientation, rightHandSystem ) );
+
 	// image to SH
-	for ( i = 0; i < actualSamples; i++, cit++ )
+	SHColor3f sh( bands );
+	if ( sampling == Texels )
+	{
+		TexelLookup lookup( chR, chG, chB );
+		if ( tolerance > 0.0f )
+		{
+			projector->progressiveProjection( lookup, sh, Convergence( tolerance ), 8 );
+		}
+		else
+		{
+			projector->indexedProjection( lookup, sh );
+		}
+	}
+	else
 	{
-		Imath::V2f phiTheta = euc2sph.transform( ((*cit) * systemConversion) * orientation );
-		int ix = (int)(phiTheta.x * (float)imgWidth / ( M_PI * 2 ));
-		int iy = (int)(phiTheta.y * (float)imgHeight /  M_PI );
-		if ( ix > imgWidth )
-			ix = imgWidth;
-		if ( iy > imgHeight )
-			iy = imgHeight;
-		int offset = iy * imgWidth + ix;
-		projector( i, Imath::Color3f( chR[ offset ], chG[ offset ], chB[ offset ] ), sh );
+		DirectionLookup lookup( projector->euclideanCoordinates(), orientation, systemConversion, resolution, chR, chG, chB );
+		if ( tolerance > 0.0f )
+		{
+			projector->progressiveProjection( lookup, sh, Convergence( tolerance ), 8 );
+		}
+		else
+		{
+			projector->indexedProjection( lookup, sh );
+		}
 	}
 
 	// filter SH
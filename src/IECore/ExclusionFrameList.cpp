@@ -92,6 +92,17 @@ void ExclusionFrameList::asList( std::vector<Frame> &frames ) const
 	assert( frames.size() <= l.size() );
 }
 
+void ExclusionFrameList::asRanges( RangeVector &ranges ) const
+{
+	RangeVector l;
+	m_frameList->asRanges( l );
+
+	RangeVector e;
+	m_exclusionFrameList->asRanges( e );
+
+	subtractRanges( l, e, ranges );
+}
+
 std::string ExclusionFrameList::asString() const
 {
 	std::string s1 = m_frameList->asString();
@@ -34,11 +34,14 @@
 
 #include "boost/regex.hpp"
 #include "boost/format.hpp"
+#include "boost/type_traits/is_same.hpp"
+
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
 
 #include "IECore/FaceVaryingPromotionOp.h"
 #include "IECore/DespatchTypedData.h"
 #include "IECore/CompoundParameter.h"
-#include "IECore/PolygonVertexIterator.h"
 
 using namespace IECore;
 
@@ -125,6 +128,66 @@ const BoolParameter *FaceVaryingPromotionOp::promoteVertexParameter() const
 	return parameters()->parameter<BoolParameter>( "promoteVertex" );
 }
 
+namespace
+{
+
+// Copies the value for each face onto all of its face-vertices.
+template<typename Container>
+class PromoteUniform
+{
+	public :
+
+		PromoteUniform( const Container &data, const std::vector<int> &vertsPerFace, const std::vector<int> &faceOffsets, Container &result )
+			:	m_data( data ), m_vertsPerFace( vertsPerFace ), m_faceOffsets( faceOffsets ), m_result( result )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
+		{
+			for( size_t f=range.begin(); f!=range.end(); ++f )
+			{
+				std::fill_n( m_result.begin() + m_faceOffsets[f], m_vertsPerFace[f], m_data[f] );
+			}
+		}
+
+	private :
+
+		const Container &m_data;
+		const std::vector<int> &m_vertsPerFace;
+		const std::vector<int> &m_faceOffsets;
+		Container &m_result;
+
+};
+
+// Copies the value for each vertex onto all the face-vertices referencing it.
+template<typename Container>
+class PromoteVertex
+{
+	public :
+
+		PromoteVertex( const Container &data, const std::vector<int> &vertIds, Container &result )
+			:	m_data( data ), m_vertIds( vertIds ), m_result( result )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
+		{
+			for( size_t i=range.begin(); i!=range.end(); ++i )
+			{
+				m_result[i] = m_data[m_vertIds[i]];
+			}
+		}
+
+	private :
+
+		const Container &m_data;
+		const std::vector<int> &m_vertIds;
+		Container &m_result;
+
+};
+
+} // namespace
+
 struct FaceVaryingPromotionOp::Promoter
 {
 	typedef DataPtr ReturnType;
@@ -141,48 +204,68 @@ struct FaceVaryingPromotionOp::Promoter
 
 	template<typename T>
 	ReturnType operator()( T *data )
-	{	
+	{
 		typedef typename T::ValueType Container;
-		typedef typename Container::const_iterator ConstIterator;
-		
+
 		typename T::Ptr result = new T;
-		result->writable().reserve( m_vertIds.size() );
-		std::back_insert_iterator<Container> inserter( result->writable() );
+		Container &resultContainer = result->writable();
+		resultContainer.resize( m_vertIds.size() );
+
+		// std::vector<bool> packs its elements into shared words, so
+		// it can't be written from several threads at once.
+		const size_t grainSize = boost::is_same<typename Container::value_type, bool>::value ? m_vertIds.size() + 1 : 1;
+
 		switch( m_interpolation )
 		{
 			case PrimitiveVariable::Uniform :
 			{
-				ConstIterator dataIt = data->readable().begin();
-				for( std::vector<int>::const_iterator it=m_vertsPerFace.begin(); it!=m_vertsPerFace.end(); ++it, ++dataIt )
-				{
-					std::fill_n( inserter, *it, *dataIt );
-				}				
+				tbb::parallel_for(
+					tbb::blocked_range<size_t>( 0, m_vertsPerFace.size(), grainSize ),
+					PromoteUniform<Container>( data->readable(), m_vertsPerFace, faceOffsets(), resultContainer )
+				);
 				break;
 			}
 			case PrimitiveVariable::Vertex :
 			case PrimitiveVariable::Varying :
 			{
-				std::copy(
-					PolygonVertexIterator<ConstIterator>( m_vertIds.begin(), data->readable().begin() ),
-					PolygonVertexIterator<ConstIterator>( m_vertIds.end(), data->readable().begin() ),
-					inserter
-				);					
+				tbb::parallel_for(
+					tbb::blocked_range<size_t>( 0, m_vertIds.size(), grainSize ),
+					PromoteVertex<Container>( data->readable(), m_vertIds, resultContainer )
+				);
 				break;
 			}
 			default :
 				assert( 0 ); // shouldn't get here
 		}
-		
+
 		assert( result->readable().size() == m_vertIds.size() );
-		
+
 		return result;
 	}
 
 	private :
 
+		// Returns the index of the first face-vertex of each face,
+		// computing it the first time it is needed.
+		const std::vector<int> &faceOffsets()
+		{
+			if( m_faceOffsets.size() != m_vertsPerFace.size() )
+			{
+				m_faceOffsets.resize( m_vertsPerFace.size() );
+				int offset = 0;
+				for( size_t f=0; f<m_vertsPerFace.size(); ++f )
+				{
+					m_faceOffsets[f] = offset;
+					offset += m_vertsPerFace[f];
+				}
+			}
+			return m_faceOffsets;
+		}
+
 		PrimitiveVariable::Interpolation m_interpolation;
 		const std::vector<int> &m_vertsPerFace;
 		const std::vector<int> &m_vertIds;
+		std::vector<int> m_faceOffsets;
 
 };
 
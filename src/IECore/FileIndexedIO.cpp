@@ -62,6 +62,8 @@ class FileIndexedIO::StreamFile : public StreamIndexedIO::StreamFile
 
 		virtual ~StreamFile();
 
+		virtual std::string name() const;
+
 		static bool canRead( const std::string &path );
 
 		void flush( size_t endPosition );
@@ -177,6 +179,11 @@ FileIndexedIO::StreamFile::~StreamFile()
 	}
 }
 
+std::string FileIndexedIO::StreamFile::name() const
+{
+	return m_filename;
+}
+
 bool FileIndexedIO::StreamFile::canRead( const std::string &path )
 {
 	std::fstream d( path.c_str(), std::ios::binary | std::ios::in);
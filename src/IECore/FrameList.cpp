@@ -38,9 +38,238 @@
 
 #include "IECore/Exception.h"
 #include "IECore/FrameList.h"
+#include "IECore/FrameRange.h"
+#include "IECore/EmptyFrameList.h"
+#include "IECore/CompoundFrameList.h"
 
 using namespace IECore;
 
+//////////////////////////////////////////////////////////////////////////
+// Range arithmetic utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+typedef FrameList::Frame Frame;
+typedef FrameList::Range Range;
+typedef FrameList::RangeVector RangeVector;
+
+// Division rounding towards negative infinity. b must be positive.
+Frame floorDiv( Frame a, Frame b )
+{
+	Frame q = a / b;
+	if( a % b != 0 && a < 0 )
+	{
+		q -= 1;
+	}
+	return q;
+}
+
+// Returns a value in the range [0,m). m must be positive.
+Frame positiveMod( Frame a, Frame m )
+{
+	Frame r = a % m;
+	return r < 0 ? r + m : r;
+}
+
+Frame greatestCommonDivisor( Frame a, Frame b )
+{
+	while( b )
+	{
+		Frame t = a % b;
+		a = b;
+		b = t;
+	}
+	return a;
+}
+
+// Returns x such that ( a * x ) % m == 1. a and m must be coprime.
+Frame modularInverse( Frame a, Frame m )
+{
+	if( m == 1 )
+	{
+		return 0;
+	}
+
+	Frame r0 = m, r1 = positiveMod( a, m );
+	Frame t0 = 0, t1 = 1;
+	while( r1 )
+	{
+		Frame q = r0 / r1;
+		Frame r = r0 - q * r1; r0 = r1; r1 = r;
+		Frame t = t0 - q * t1; t0 = t1; t1 = t;
+	}
+	return positiveMod( t0, m );
+}
+
+bool rangeStartLess( const Range &a, const Range &b )
+{
+	return a.start < b.start;
+}
+
+// Makes the step positive, aligns the end with the step and gives
+// single frame ranges a step of 1. Returns false if the range is empty.
+bool normalise( Range &r )
+{
+	if( r.end < r.start )
+	{
+		return false;
+	}
+	if( r.step < 0 )
+	{
+		r.step = -r.step;
+	}
+	r.end = r.start + ( ( r.end - r.start ) / r.step ) * r.step;
+	if( r.end == r.start )
+	{
+		r.step = 1;
+	}
+	return true;
+}
+
+void appendNormalised( Range r, RangeVector &ranges )
+{
+	if( normalise( r ) )
+	{
+		ranges.push_back( r );
+	}
+}
+
+// Computes the intersection of two normalised ranges, which is
+// itself a single range, returning false if it is empty.
+bool intersect( const Range &a, const Range &b, Range &result )
+{
+	const Frame lo = std::max( a.start, b.start );
+	const Frame hi = std::min( a.end, b.end );
+	if( lo > hi )
+	{
+		return false;
+	}
+
+	// Solve x == a.start ( mod a.step ), x == b.start ( mod b.step )
+	// for the smallest such x >= lo.
+	const Frame g = greatestCommonDivisor( a.step, b.step );
+	const Frame d = b.start - a.start;
+	if( d % g )
+	{
+		return false;
+	}
+
+	const Frame m = b.step / g;
+	const Frame k = positiveMod( positiveMod( d / g, m ) * modularInverse( ( a.step / g ) % m, m ), m );
+	const Frame lcm = a.step * m;
+
+	Frame x = a.start + a.step * k;
+	x -= floorDiv( x - lo, lcm ) * lcm;
+	if( x > hi )
+	{
+		return false;
+	}
+
+	result = Range( x, hi, lcm );
+	normalise( result );
+	return true;
+}
+
+// Appends the frames of a which are not in b. The appended
+// ranges are sorted by their start frames.
+void subtract( const Range &a, const Range &b, RangeVector &result )
+{
+	Range i;
+	if( !intersect( a, b, i ) )
+	{
+		result.push_back( a );
+		return;
+	}
+
+	appendNormalised( Range( a.start, i.start - a.step, a.step ), result );
+
+	if( i.end != i.start )
+	{
+		// The frames of a which fall between the intersected frames.
+		for( Frame offset = a.step; offset < i.step && i.start + offset <= i.end; offset += a.step )
+		{
+			appendNormalised( Range( i.start + offset, i.end, i.step ), result );
+		}
+	}
+
+	appendNormalised( Range( i.end + a.step, a.end, a.step ), result );
+}
+
+// Sorts the ranges and merges neighbours which continue one another.
+void sortAndCoalesce( RangeVector &ranges )
+{
+	if( ranges.empty() )
+	{
+		return;
+	}
+
+	std::sort( ranges.begin(), ranges.end(), rangeStartLess );
+
+	RangeVector::iterator out = ranges.begin();
+	for( RangeVector::const_iterator it = ranges.begin() + 1; it != ranges.end(); ++it )
+	{
+		const bool outSingle = out->start == out->end;
+		const bool itSingle = it->start == it->end;
+		Frame step = 0;
+		if( outSingle && itSingle )
+		{
+			step = 1;
+		}
+		else if( outSingle )
+		{
+			step = it->step;
+		}
+		else if( itSingle || it->step == out->step )
+		{
+			step = out->step;
+		}
+
+		if( step && it->start == out->end + step )
+		{
+			out->end = it->end;
+			out->step = step;
+		}
+		else
+		{
+			*(++out) = *it;
+		}
+	}
+
+	ranges.erase( out + 1, ranges.end() );
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// FrameList::Range
+//////////////////////////////////////////////////////////////////////////
+
+FrameList::Range::Range( Frame s, Frame e, Frame st )
+	:	start( s ), end( e ), step( st )
+{
+}
+
+size_t FrameList::Range::size() const
+{
+	return ( end - start ) / step + 1;
+}
+
+bool FrameList::Range::contains( Frame frame ) const
+{
+	return frame >= start && frame <= end && ( frame - start ) % step == 0;
+}
+
+bool FrameList::Range::operator == ( const Range &other ) const
+{
+	return start == other.start && end == other.end && step == other.step;
+}
+
+//////////////////////////////////////////////////////////////////////////
+// FrameList
+//////////////////////////////////////////////////////////////////////////
+
 IE_CORE_DEFINERUNTIMETYPED( FrameList );
 
 FrameList::FrameList()
@@ -76,6 +305,272 @@ void FrameList::asClumpedList( std::vector< std::vector<Frame> > &clumpedFrames,
 	}
 }
 
+void FrameList::asRanges( RangeVector &ranges ) const
+{
+	ranges.clear();
+
+	std::vector<Frame> frames;
+	asList( frames );
+	std::sort( frames.begin(), frames.end() );
+	frames.erase( std::unique( frames.begin(), frames.end() ), frames.end() );
+
+	// Greedily gather the sorted frames into runs with a constant step.
+	size_t i = 0;
+	while( i < frames.size() )
+	{
+		Range r( frames[i], frames[i], 1 );
+		if( i + 1 < frames.size() )
+		{
+			r.step = frames[i+1] - frames[i];
+			size_t j = i + 1;
+			while( j < frames.size() && frames[j] - frames[j-1] == r.step )
+			{
+				r.end = frames[j++];
+			}
+			i = j;
+		}
+		else
+		{
+			i++;
+		}
+		ranges.push_back( r );
+	}
+}
+
+size_t FrameList::size() const
+{
+	RangeVector ranges;
+	asRanges( ranges );
+
+	size_t result = 0;
+	for( RangeVector::const_iterator it = ranges.begin(); it != ranges.end(); ++it )
+	{
+		result += it->size();
+	}
+	return result;
+}
+
+FrameList::Frame FrameList::minFrame() const
+{
+	RangeVector ranges;
+	asRanges( ranges );
+	if( ranges.empty() )
+	{
+		throw Exception( "FrameList::minFrame : FrameList is empty." );
+	}
+	return ranges.front().start;
+}
+
+FrameList::Frame FrameList::maxFrame() const
+{
+	RangeVector ranges;
+	asRanges( ranges );
+	if( ranges.empty() )
+	{
+		throw Exception( "FrameList::maxFrame : FrameList is empty." );
+	}
+
+	Frame result = ranges.front().end;
+	for( RangeVector::const_iterator it = ranges.begin() + 1; it != ranges.end(); ++it )
+	{
+		result = std::max( result, it->end );
+	}
+	return result;
+}
+
+bool FrameList::isContiguous() const
+{
+	RangeVector ranges;
+	asRanges( ranges );
+	if( ranges.empty() )
+	{
+		return false;
+	}
+
+	size_t numFrames = 0;
+	Frame max = ranges.front().end;
+	for( RangeVector::const_iterator it = ranges.begin(); it != ranges.end(); ++it )
+	{
+		numFrames += it->size();
+		max = std::max( max, it->end );
+	}
+
+	return (Frame)numFrames == max - ranges.front().start + 1;
+}
+
+bool FrameList::contains( Frame frame ) const
+{
+	RangeVector ranges;
+	asRanges( ranges );
+	for( RangeVector::const_iterator it = ranges.begin(); it != ranges.end() && it->start <= frame; ++it )
+	{
+		if( it->contains( frame ) )
+		{
+			return true;
+		}
+	}
+	return false;
+}
+
+bool FrameList::intersects( const FrameList *other ) const
+{
+	RangeVector a, b;
+	asRanges( a );
+	other->asRanges( b );
+
+	Range i;
+	for( RangeVector::const_iterator aIt = a.begin(); aIt != a.end(); ++aIt )
+	{
+		for( RangeVector::const_iterator bIt = b.begin(); bIt != b.end() && bIt->start <= aIt->end; ++bIt )
+		{
+			if( intersect( *aIt, *bIt, i ) )
+			{
+				return true;
+			}
+		}
+	}
+	return false;
+}
+
+FrameListPtr FrameList::setIntersection( const FrameList *other ) const
+{
+	RangeVector a, b, result;
+	asRanges( a );
+	other->asRanges( b );
+	intersectRanges( a, b, result );
+	return fromRanges( result );
+}
+
+FrameListPtr FrameList::setUnion( const FrameList *other ) const
+{
+	RangeVector a, b;
+	asRanges( a );
+	other->asRanges( b );
+	a.insert( a.end(), b.begin(), b.end() );
+	unionRanges( a );
+	return fromRanges( a );
+}
+
+FrameListPtr FrameList::setDifference( const FrameList *other ) const
+{
+	RangeVector a, b, result;
+	asRanges( a );
+	other->asRanges( b );
+	subtractRanges( a, b, result );
+	return fromRanges( result );
+}
+
+FrameListPtr FrameList::fromRanges( const RangeVector &ranges )
+{
+	if( ranges.empty() )
+	{
+		return new EmptyFrameList();
+	}
+	else if( ranges.size() == 1 )
+	{
+		return new FrameRange( ranges[0].start, ranges[0].end, ranges[0].step );
+	}
+
+	std::vector<FrameListPtr> frameLists;
+	frameLists.reserve( ranges.size() );
+	for( RangeVector::const_iterator it = ranges.begin(); it != ranges.end(); ++it )
+	{
+		frameLists.push_back( new FrameRange( it->start, it->end, it->step ) );
+	}
+	return new CompoundFrameList( frameLists );
+}
+
+void FrameList::unionRanges( RangeVector &ranges )
+{
+	RangeVector sorted;
+	sorted.reserve( ranges.size() );
+	for( RangeVector::const_iterator it = ranges.begin(); it != ranges.end(); ++it )
+	{
+		appendNormalised( *it, sorted );
+	}
+	std::sort( sorted.begin(), sorted.end(), rangeStartLess );
+
+	// Add each range in turn, removing any frames already covered by the
+	// ranges added before it. Because the ranges are visited in order of
+	// their start frames, we can skip over any previous ranges which end
+	// before the current one starts.
+	RangeVector result;
+	size_t firstActive = 0;
+	for( RangeVector::const_iterator it = sorted.begin(); it != sorted.end(); ++it )
+	{
+		while( firstActive < result.size() && result[firstActive].end < it->start )
+		{
+			firstActive++;
+		}
+
+		RangeVector pieces( 1, *it ), remaining;
+		for( size_t i = firstActive; i < result.size() && !pieces.empty(); ++i )
+		{
+			if( result[i].end < it->start )
+			{
+				continue;
+			}
+			remaining.clear();
+			for( RangeVector::const_iterator pIt = pieces.begin(); pIt != pieces.end(); ++pIt )
+			{
+				subtract( *pIt, result[i], remaining );
+			}
+			pieces.swap( remaining );
+		}
+
+		result.insert( result.end(), pieces.begin(), pieces.end() );
+	}
+
+	sortAndCoalesce( result );
+	ranges.swap( result );
+}
+
+void FrameList::subtractRanges( const RangeVector &a, const RangeVector &b, RangeVector &result )
+{
+	result.clear();
+
+	RangeVector pieces, remaining;
+	for( RangeVector::const_iterator aIt = a.begin(); aIt != a.end(); ++aIt )
+	{
+		pieces.assign( 1, *aIt );
+		for( RangeVector::const_iterator bIt = b.begin(); bIt != b.end() && bIt->start <= aIt->end && !pieces.empty(); ++bIt )
+		{
+			if( bIt->end < aIt->start )
+			{
+				continue;
+			}
+			remaining.clear();
+			for( RangeVector::const_iterator pIt = pieces.begin(); pIt != pieces.end(); ++pIt )
+			{
+				subtract( *pIt, *bIt, remaining );
+			}
+			pieces.swap( remaining );
+		}
+		result.insert( result.end(), pieces.begin(), pieces.end() );
+	}
+
+	sortAndCoalesce( result );
+}
+
+void FrameList::intersectRanges( const RangeVector &a, const RangeVector &b, RangeVector &result )
+{
+	result.clear();
+
+	Range i;
+	for( RangeVector::const_iterator aIt = a.begin(); aIt != a.end(); ++aIt )
+	{
+		for( RangeVector::const_iterator bIt = b.begin(); bIt != b.end() && bIt->start <= aIt->end; ++bIt )
+		{
+			if( intersect( *aIt, *bIt, i ) )
+			{
+				result.push_back( i );
+			}
+		}
+	}
+
+	sortAndCoalesce( result );
+}
+
 FrameListPtr FrameList::parse( const std::string &frameList )
 {
 	std::string s;
@@ -113,6 +113,17 @@ void FrameRange::asList( std::vector<Frame> &frames ) const
 	}
 }
 
+void FrameRange::asRanges( RangeVector &ranges ) const
+{
+	ranges.clear();
+
+	/// \todo A negative step is accepted by the constructor but not honoured
+	/// by asList(). Here we simply treat it as positive.
+	const Frame step = m_step < 0 ? -m_step : m_step;
+	const Frame end = m_start + ( ( m_end - m_start ) / step ) * step;
+	ranges.push_back( Range( m_start, end, end == m_start ? 1 : step ) );
+}
+
 std::string FrameRange::asString() const
 {
 	if ( m_step != 1 )
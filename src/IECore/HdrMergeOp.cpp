@@ -33,13 +33,20 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include "boost/format.hpp"
+#include "boost/scoped_array.hpp"
+
+#include "tbb/parallel_for.h"
+#include "tbb/blocked_range.h"
+#include "tbb/mutex.h"
 
 #include "IECore/HdrMergeOp.h"
 #include "IECore/CompoundParameter.h"
 #include "IECore/ObjectParameter.h"
+#include "IECore/VectorTypedParameter.h"
 #include "IECore/Math.h"
 #include "IECore/Group.h"
 #include "IECore/ImagePrimitive.h"
+#include "IECore/ImageReader.h"
 
 #include <cassert>
 
@@ -99,7 +106,23 @@ HdrMergeOp::HdrMergeOp()
 		"zones are weighted with a smooth curve.",
 		new Box2fData( Box2f( V2f( 0.0, 0.05 ), V2f( 0.9, 1.0 ) ) )
 	);
+	m_fileNamesParameter = new StringVectorParameter(
+		"fileNames",
+		"The image files to be merged, ordered from the least to the most exposed. When specified, these are "
+		"used instead of the inputGroup. The files are read and merged in bands of rows, so that the images "
+		"never need to be loaded in their entirety.",
+		new StringVectorData()
+	);
+	m_bandHeightParameter = new IntParameter(
+		"bandHeight",
+		"The number of rows read from each file at a time when merging the files specified by the fileNames "
+		"parameter. The memory used by the input images is proportional to this rather than to the image size.",
+		64,
+		1
+	);
 	parameters()->addParameter( m_inputGroupParameter );
+	parameters()->addParameter( m_fileNamesParameter );
+	parameters()->addParameter( m_bandHeightParameter );
 	parameters()->addParameter( m_exposureStepParameter );
 	parameters()->addParameter( m_exposureAdjustmentParameter );
 	parameters()->addParameter( m_windowingParameter );
@@ -119,6 +142,26 @@ const ObjectParameter * HdrMergeOp::inputGroupParameter() const
 	return m_inputGroupParameter;
 }
 
+StringVectorParameter * HdrMergeOp::fileNamesParameter()
+{
+	return m_fileNamesParameter;
+}
+
+const StringVectorParameter * HdrMergeOp::fileNamesParameter() const
+{
+	return m_fileNamesParameter;
+}
+
+IntParameter * HdrMergeOp::bandHeightParameter()
+{
+	return m_bandHeightParameter;
+}
+
+const IntParameter * HdrMergeOp::bandHeightParameter() const
+{
+	return m_bandHeightParameter;
+}
+
 FloatParameter * HdrMergeOp::exposureStepParameter()
 {
 	return m_exposureStepParameter;
@@ -149,46 +192,58 @@ const Box2fParameter * HdrMergeOp::windowingParameter() const
 	return m_windowingParameter;
 }
 
-template< typename T >
-inline void merge( bool firstImage, size_t &pixelCount,
-					const ImagePrimitive * img, ImagePrimitive * outImg,
-					const Imath::Box2f &windowing, float intensityMultiplier,
-					FloatVectorData * outR, FloatVectorData * outG, FloatVectorData * outB, FloatVectorData * outA )
+namespace
 {
 
-	const TypedData< std::vector< T > > *inR = img->getChannel< T >( "R" );
-	const TypedData< std::vector< T > > *inG = img->getChannel< T >( "G" );
-	const TypedData< std::vector< T > > *inB = img->getChannel< T >( "B" );
-
-	if ( firstImage )
+// Checks that an image has RGB channels of float or half type, returning true if they are half.
+bool validateChannels( const ImagePrimitive *img )
+{
+	if ( img->getChannel< float >( "R" ) && img->getChannel< float >( "G" ) && img->getChannel< float >( "B" ) )
 	{
-		pixelCount = inR->readable().size();
-		outR->writable().resize( pixelCount, 0 );
-		outG->writable().resize( pixelCount, 0 );
-		outB->writable().resize( pixelCount, 0 );
-		outA->writable().resize( pixelCount, 0 );
-		outImg->setDisplayWindow( img->getDisplayWindow() );
-		outImg->setDataWindow( img->getDataWindow() );
+		return false;
 	}
-	else
+	else if ( img->getChannel< half >( "R" ) && img->getChannel< half >( "G" ) && img->getChannel< half >( "B" ) )
 	{
-		if ( pixelCount != inR->readable().size() ||
-			 pixelCount != inG->readable().size() ||
-			 pixelCount != inB->readable().size() )
-		{
-			throw Exception( "Images are not of the same resolution!!" );
-		}
+		return true;
 	}
+	throw Exception( "Input images must have RGB channels of either half or float data types." );
+}
+
+template< typename T >
+bool channelsMatchDataWindow( const ImagePrimitive *img )
+{
+	size_t numPixels = img->variableSize( PrimitiveVariable::Vertex );
+	return
+		img->getChannel< T >( "R" )->readable().size() == numPixels &&
+		img->getChannel< T >( "G" )->readable().size() == numPixels &&
+		img->getChannel< T >( "B" )->readable().size() == numPixels;
+}
 
-	const T *ptrInR = &(inR->readable()[0]);
-	const T *ptrInG = &(inG->readable()[0]);
-	const T *ptrInB = &(inB->readable()[0]);
-	float *ptrOutR = &(outR->writable()[0]);
-	float *ptrOutG = &(outG->writable()[0]);
-	float *ptrOutB = &(outB->writable()[0]);
-	float *ptrOutA = &(outA->writable()[0]);
+// The output channels and merging parameters shared by all the brackets.
+struct MergeOutput
+{
+	float *r;
+	float *g;
+	float *b;
+	float *a;
+	Imath::Box2f windowing;
+};
 
-	for ( size_t i = 0; i < pixelCount; i++ )
+// Accumulates the contribution of pixels [begin, end) of a bracket into the output pixels
+// [outOffset, outOffset + end - begin).
+template< typename T >
+void accumulate( const ImagePrimitive *img, bool firstImage, float intensityMultiplier, size_t begin, size_t end, const MergeOutput &output, size_t outOffset )
+{
+	const T *ptrInR = &(img->getChannel< T >( "R" )->readable()[0]) + begin;
+	const T *ptrInG = &(img->getChannel< T >( "G" )->readable()[0]) + begin;
+	const T *ptrInB = &(img->getChannel< T >( "B" )->readable()[0]) + begin;
+	float *ptrOutR = output.r + outOffset;
+	float *ptrOutG = output.g + outOffset;
+	float *ptrOutB = output.b + outOffset;
+	float *ptrOutA = output.a + outOffset;
+
+	const Imath::Box2f &windowing = output.windowing;
+	for ( size_t i = begin; i < end; i++ )
 	{
 		float intensity = (*ptrInR + *ptrInG + *ptrInB) / 3.0;
 		float weight = smoothstep( windowing.min[0], windowing.min[1], intensity );
@@ -207,32 +262,189 @@ inline void merge( bool firstImage, size_t &pixelCount,
 	}
 }
 
+void accumulate( const ImagePrimitive *img, bool firstImage, float intensityMultiplier, size_t begin, size_t end, const MergeOutput &output, size_t outOffset )
+{
+	if ( validateChannels( img ) )
+	{
+		accumulate<half>( img, firstImage, intensityMultiplier, begin, end, output, outOffset );
+	}
+	else
+	{
+		accumulate<float>( img, firstImage, intensityMultiplier, begin, end, output, outOffset );
+	}
+}
+
+// Normalises the accumulated output pixels [begin, end).
+void normalize( float adjustment, size_t begin, size_t end, const MergeOutput &output )
+{
+	for ( size_t i = begin; i < end; i++ )
+	{
+		float w = adjustment * output.a[i];
+		if ( w > 0 )
+		{
+			output.r[i] /= w;
+			output.g[i] /= w;
+			output.b[i] /= w;
+		}
+	}
+}
+
+// Merges a range of pixels from brackets which are already in memory.
+class MergeImages
+{
+
+	public :
+
+		MergeImages( const std::vector<const ImagePrimitive *> &images, const std::vector<float> &multipliers, float adjustment, const MergeOutput &output )
+			:	m_images( images ), m_multipliers( multipliers ), m_adjustment( adjustment ), m_output( output )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
+		{
+			for ( size_t i = 0; i < m_images.size(); i++ )
+			{
+				accumulate( m_images[i], i == 0, m_multipliers[i], range.begin(), range.end(), m_output, range.begin() );
+			}
+			normalize( m_adjustment, range.begin(), range.end(), m_output );
+		}
+
+	private :
+
+		const std::vector<const ImagePrimitive *> &m_images;
+		const std::vector<float> &m_multipliers;
+		float m_adjustment;
+		const MergeOutput &m_output;
+
+};
+
+// Merges bands of rows, reading each band from the brackets' files as it goes. The readers
+// may only be used by one thread at a time, so each is protected by its own mutex - but
+// different bands may be read from different files concurrently, and the merging itself
+// happens in parallel.
+class MergeBands
+{
+
+	public :
+
+		MergeBands( const std::vector<ImageReaderPtr> &readers, tbb::mutex *mutexes, const std::vector<float> &multipliers, float adjustment, const Box2i &dataWindow, int bandHeight, const MergeOutput &output )
+			:	m_readers( readers ), m_mutexes( mutexes ), m_multipliers( multipliers ), m_adjustment( adjustment ),
+				m_dataWindow( dataWindow ), m_bandHeight( bandHeight ), m_output( output )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<int> &range ) const
+		{
+			const size_t width = m_dataWindow.size().x + 1;
+			for ( int band = range.begin(); band != range.end(); band++ )
+			{
+				Box2i bandWindow = m_dataWindow;
+				bandWindow.min.y = m_dataWindow.min.y + band * m_bandHeight;
+				bandWindow.max.y = std::min( bandWindow.min.y + m_bandHeight - 1, m_dataWindow.max.y );
+
+				const size_t outOffset = ( bandWindow.min.y - m_dataWindow.min.y ) * width;
+				const size_t numPixels = ( bandWindow.size().y + 1 ) * width;
+
+				for ( size_t i = 0; i < m_readers.size(); i++ )
+				{
+					ConstImagePrimitivePtr img;
+					{
+						tbb::mutex::scoped_lock lock( m_mutexes[i] );
+						m_readers[i]->dataWindowParameter()->setTypedValue( bandWindow );
+						img = runTimeCast<ImagePrimitive>( m_readers[i]->read() );
+					}
+					if ( !img )
+					{
+						throw Exception( "Input files must contain images only!" );
+					}
+					accumulate( img.get(), i == 0, m_multipliers[i], 0, numPixels, m_output, outOffset );
+				}
+
+				normalize( m_adjustment, outOffset, outOffset + numPixels, m_output );
+			}
+		}
+
+	private :
+
+		const std::vector<ImageReaderPtr> &m_readers;
+		tbb::mutex *m_mutexes;
+		const std::vector<float> &m_multipliers;
+		float m_adjustment;
+		const Box2i &m_dataWindow;
+		int m_bandHeight;
+		const MergeOutput &m_output;
+
+};
+
+} // namespace
+
 ObjectPtr HdrMergeOp::doOperation( const CompoundObject * operands )
 {
-	Group *imageGroup = static_cast<Group *>( m_inputGroupParameter->getValue() );
+	const std::vector<std::string> &fileNames = operands->member< StringVectorData >( "fileNames" )->readable();
+	int bandHeight = operands->member< IntData >( "bandHeight" )->readable();
 
-	// first of all, check if the group contains ImagePrimitive objects with float or half vector data types and "R","G","B" channels.
-	const Group::ChildContainer &images = imageGroup->children();
-	for ( Group::ChildContainer::const_iterator it = images.begin(); it != images.end(); it++ )
+	// gather the inputs, either as images or as readers for the files.
+	std::vector<const ImagePrimitive *> images;
+	std::vector<ImageReaderPtr> readers;
+	Box2i dataWindow, displayWindow;
+	if ( fileNames.size() )
 	{
-		if ( (*it)->typeId() != ImagePrimitiveTypeId )
+		std::vector<std::string> channelNames;
+		channelNames.push_back( "R" );
+		channelNames.push_back( "G" );
+		channelNames.push_back( "B" );
+		for ( std::vector<std::string>::const_iterator it = fileNames.begin(); it != fileNames.end(); it++ )
 		{
-			throw Exception( "Input group should contain images only!" );
+			ImageReaderPtr reader = runTimeCast<ImageReader>( Reader::create( *it ) );
+			if ( !reader )
+			{
+				throw Exception( str( format( "File \"%s\" is not an image." ) % *it ) );
+			}
+			reader->channelNamesParameter()->setTypedValue( channelNames );
+			if ( readers.empty() )
+			{
+				dataWindow = reader->dataWindow();
+				displayWindow = reader->displayWindow();
+			}
+			else if ( reader->dataWindow() != dataWindow )
+			{
+				throw Exception( "Images are not of the same resolution!!" );
+			}
+			readers.push_back( reader );
 		}
-		ImagePrimitivePtr img = staticPointerCast< ImagePrimitive >(*it);
-		if ( !((img->getChannel< float >( "R" ) &&
-				img->getChannel< float >( "G" ) &&
-				img->getChannel< float >( "B" )) ||
-			   (img->getChannel< half >( "R" ) &&
-			    img->getChannel< half >( "G" ) &&
-			    img->getChannel< half >( "B" ))
-			  )
-			)
+	}
+	else
+	{
+		Group *imageGroup = static_cast<Group *>( m_inputGroupParameter->getValue() );
+
+		// first of all, check if the group contains ImagePrimitive objects with float or half vector data types and "R","G","B" channels.
+		const Group::ChildContainer &children = imageGroup->children();
+		for ( Group::ChildContainer::const_iterator it = children.begin(); it != children.end(); it++ )
 		{
-			throw Exception( "Input images must have RGB channels of either half or float data types." );
+			if ( (*it)->typeId() != ImagePrimitiveTypeId )
+			{
+				throw Exception( "Input group should contain images only!" );
+			}
+			const ImagePrimitive *img = staticPointerCast< ImagePrimitive >(*it).get();
+			if ( !( validateChannels( img ) ? channelsMatchDataWindow<half>( img ) : channelsMatchDataWindow<float>( img ) ) )
+			{
+				throw Exception( "Input images must have channels matching their data windows." );
+			}
+			if ( images.empty() )
+			{
+				dataWindow = img->getDataWindow();
+				displayWindow = img->getDisplayWindow();
+			}
+			else if ( img->getDataWindow() != dataWindow )
+			{
+				throw Exception( "Images are not of the same resolution!!" );
+			}
+			images.push_back( img );
 		}
 	}
-	if ( images.size() == 0 )
+
+	const int numInputs = readers.size() + images.size();
+	if ( numInputs == 0 )
 	{
 		throw Exception( "Input group has no images to merge!" );
 	}
@@ -241,54 +453,57 @@ ObjectPtr HdrMergeOp::doOperation( const CompoundObject * operands )
 	float exposureAdjustment = operands->member< FloatData >("exposureAdjustment")->readable();
 	Imath::Box2f windowing = operands->member< Box2fData >("windowing" )->readable();
 
+	// compute the intensity multiplier for each input
+	std::vector<float> multipliers;
+	float exposure = exposureStep * (numInputs-1)/2.0;
+	for ( int i = 0; i < numInputs; i++ )
+	{
+		multipliers.push_back( pow( 2.0f, exposure ) );
+		exposure -= exposureStep;
+	}
+
+	const size_t pixelCount = ( dataWindow.size().x + 1 ) * ( dataWindow.size().y + 1 );
+
 	FloatVectorDataPtr outR = new FloatVectorData();
 	FloatVectorDataPtr outG = new FloatVectorData();
 	FloatVectorDataPtr outB = new FloatVectorData();
 	FloatVectorDataPtr outA = new FloatVectorData();
+	outR->writable().resize( pixelCount, 0 );
+	outG->writable().resize( pixelCount, 0 );
+	outB->writable().resize( pixelCount, 0 );
+	outA->writable().resize( pixelCount, 0 );
 
-	ImagePrimitivePtr outImg = new ImagePrimitive();
+	ImagePrimitivePtr outImg = new ImagePrimitive( dataWindow, displayWindow );
 	outImg->variables["R"] = PrimitiveVariable( PrimitiveVariable::Vertex, outR );
 	outImg->variables["G"] = PrimitiveVariable( PrimitiveVariable::Vertex, outG );
 	outImg->variables["B"] = PrimitiveVariable( PrimitiveVariable::Vertex, outB );
 	outImg->variables["A"] = PrimitiveVariable( PrimitiveVariable::Vertex, outA );
 
-	// loop over inputs accumulating them into the buffer
-	int numInputs = images.size();
-
-	float exposure = exposureStep * (numInputs-1)/2.0;
-	size_t pixelCount = 0;
-	bool firstImage = true;
-	for ( Group::ChildContainer::const_iterator it = images.begin(); it != images.end(); it++, firstImage = false )
+	if ( !pixelCount )
 	{
-		const ImagePrimitive *img = staticPointerCast< ImagePrimitive >(*it);
-		float intensityMultiplier = pow( 2.0f, exposure );
-		if ( img->getChannel< float >( "R" ) )
-		{
-			merge< float >( firstImage, pixelCount, img, outImg, windowing, intensityMultiplier, outR, outG, outB, outA );
-		}
-		else
-		{
-			merge< half >( firstImage, pixelCount, img, outImg, windowing, intensityMultiplier, outR, outG, outB, outA );
-		}
-		exposure -= exposureStep;
+		return outImg;
 	}
-	
-	// normalize the outputs
+
+	MergeOutput output;
+	output.r = &(outR->writable()[0]);
+	output.g = &(outG->writable()[0]);
+	output.b = &(outB->writable()[0]);
+	output.a = &(outA->writable()[0]);
+	output.windowing = windowing;
+
 	float adjustment = pow( 2.0f, -exposureAdjustment );
-	float *ptrOutR = &(outR->writable()[0]);
-	float *ptrOutG = &(outG->writable()[0]);
-	float *ptrOutB = &(outB->writable()[0]);
-	float *ptrOutA = &(outA->writable()[0]);
 
-	for ( size_t i = 0; i < pixelCount; i++ )
+	if ( readers.size() )
 	{
-		float w = adjustment * ptrOutA[i];
-		if ( w > 0 )
-		{
-			ptrOutR[i] /= w;
-			ptrOutG[i] /= w;
-			ptrOutB[i] /= w;
-		}
+		boost::scoped_array<tbb::mutex> mutexes( new tbb::mutex[readers.size()] );
+		const int numBands = ( dataWindow.size().y + bandHeight ) / bandHeight;
+		MergeBands mergeBands( readers, mutexes.get(), multipliers, adjustment, dataWindow, bandHeight, output );
+		tbb::parallel_for( tbb::blocked_range<int>( 0, numBands, 1 ), mergeBands );
+	}
+	else
+	{
+		MergeImages mergeImages( images, multipliers, adjustment, output );
+		tbb::parallel_for( tbb::blocked_range<size_t>( 0, pixelCount, 4096 ), mergeImages );
 	}
 
 	return outImg;
@@ -52,12 +52,89 @@
 
 #include "boost/format.hpp"
 
+#include "tbb/parallel_for.h"
+#include "tbb/blocked_range.h"
+
 using boost::str;
 using boost::format;
 
 using namespace IECore;
 using namespace Imath;
 
+namespace
+{
+
+// Composites all channels at once over a range of rows of imageB's data window. All the
+// inputs for a pixel are read before any of the results are written, so the results may
+// safely be written in place over the channels of imageB. Pixels outside the data window
+// of imageA are treated as zero.
+class CompositeRows
+{
+
+	public :
+
+		typedef float (*CompositeFn)( float, float, float, float );
+
+		CompositeRows(
+			CompositeFn fn, const Box2i &dataWindowA, const Box2i &dataWindowB,
+			const std::vector<const float *> &channelsA, const float *alphaA,
+			const std::vector<const float *> &channelsB, const float *alphaB,
+			const std::vector<float *> &result
+		)
+			:	m_fn( fn ), m_dataWindowA( dataWindowA ), m_dataWindowB( dataWindowB ),
+				m_channelsA( channelsA ), m_alphaA( alphaA ), m_channelsB( channelsB ), m_alphaB( alphaB ),
+				m_result( result )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<int> &rows ) const
+		{
+			const size_t numChannels = m_result.size();
+			std::vector<float> values( numChannels );
+
+			const int widthA = m_dataWindowA.size().x + 1;
+			const int widthB = m_dataWindowB.size().x + 1;
+
+			for( int y = rows.begin(); y != rows.end(); ++y )
+			{
+				const bool rowInA = y >= m_dataWindowA.min.y && y <= m_dataWindowA.max.y;
+				size_t offsetB = ( y - m_dataWindowB.min.y ) * widthB;
+				for( int x = m_dataWindowB.min.x; x <= m_dataWindowB.max.x; ++x, ++offsetB )
+				{
+					const bool inA = rowInA && x >= m_dataWindowA.min.x && x <= m_dataWindowA.max.x;
+					const size_t offsetA = inA ? ( y - m_dataWindowA.min.y ) * widthA + x - m_dataWindowA.min.x : 0;
+
+					const float alphaA = m_alphaA ? ( inA ? m_alphaA[offsetA] : 0.0f ) : 1.0f;
+					const float alphaB = m_alphaB ? m_alphaB[offsetB] : 1.0f;
+
+					for( size_t c = 0; c < numChannels; ++c )
+					{
+						values[c] = m_fn( inA ? m_channelsA[c][offsetA] : 0.0f, alphaA, m_channelsB[c][offsetB], alphaB );
+					}
+
+					for( size_t c = 0; c < numChannels; ++c )
+					{
+						m_result[c][offsetB] = values[c];
+					}
+				}
+			}
+		}
+
+	private :
+
+		CompositeFn m_fn;
+		const Box2i &m_dataWindowA;
+		const Box2i &m_dataWindowB;
+		const std::vector<const float *> &m_channelsA;
+		const float *m_alphaA;
+		const std::vector<const float *> &m_channelsB;
+		const float *m_alphaB;
+		const std::vector<float *> &m_result;
+
+};
+
+} // namespace
+
 IE_CORE_DEFINERUNTIMETYPED( ImageCompositeOp );
 
 ImageCompositeOp::ImageCompositeOp() : ImagePrimitiveOp( "ImageCompositeOp" )
@@ -204,7 +281,7 @@ struct ImageCompositeOp::ChannelConverter
 	};
 };
 
-FloatVectorDataPtr ImageCompositeOp::getChannelData( ImagePrimitive * image, const std::string &channelName, bool mustExist )
+ConstFloatVectorDataPtr ImageCompositeOp::getChannelData( ImagePrimitive * image, const std::string &channelName, bool mustExist )
 {
 	assert( image );
 
@@ -233,6 +310,12 @@ FloatVectorDataPtr ImageCompositeOp::getChannelData( ImagePrimitive * image, con
 		throw Exception( str( format( "ImageCompositeOp: Primitive variable \"%s\" has no data." ) % channelName ) );
 	}
 
+	// no need for a conversion if the data is already what we want
+	if( FloatVectorDataPtr floatData = runTimeCast<FloatVectorData>( it->second.data ) )
+	{
+		return floatData;
+	}
+
 	ChannelConverter converter( channelName );
 
 	return despatchTypedData<
@@ -242,32 +325,6 @@ FloatVectorDataPtr ImageCompositeOp::getChannelData( ImagePrimitive * image, con
 		>( it->second.data, converter );
 }
 
-float ImageCompositeOp::readChannelData( const ImagePrimitive * image, const FloatVectorData * data, const V2i &pixel )
-{
-	assert( image );
-	assert( data );
-
-	V2i offset = pixel - image->getDataWindow().min;
-	if ( offset.x < 0 || offset.y < 0 )
-	{
-		return 0.0f;
-	}
-
-	const int width = image->getDataWindow().size().x + 1;
-	const int height = image->getDataWindow().size().y + 1;
-
-	if ( offset.x >= width || offset.y >= height )
-	{
-		return 0.0f;
-	}
-
-	const int idx = offset.y * width + offset.x;
-
-	assert( idx >= 0 );
-	assert( idx < (int)data->readable().size() );
-	return data->readable()[ idx ];
-}
-
 void ImageCompositeOp::composite( CompositeFn fn, DataWindowResult dwr, ImagePrimitive * imageB, const CompoundObject * operands )
 {
 	assert( fn );
@@ -336,17 +393,22 @@ void ImageCompositeOp::composite( CompositeFn fn, DataWindowResult dwr, ImagePri
 
 	newDataWindow = boxIntersection( newDataWindow, displayWindow );
 
-	ImageCropOpPtr cropOp = new ImageCropOp();
+	/// We only need to crop imageB if its data window is changing - otherwise we can
+	/// composite straight into its existing channels.
+	if ( imageB->getDataWindow() != newDataWindow )
+	{
+		ImageCropOpPtr cropOp = new ImageCropOp();
 
-	/// Need to make sure that we don't create a new image here - we want to modify the current one in-place. So,
-	/// we turn off the "copy" parameter of ModifyOp.
-	cropOp->copyParameter()->setTypedValue( false );
-	cropOp->inputParameter()->setValue( imageB );
-	cropOp->cropBoxParameter()->setTypedValue( newDataWindow );
-	cropOp->matchDataWindowParameter()->setTypedValue( true );
-	cropOp->resetOriginParameter()->setTypedValue( false );
+		/// Need to make sure that we don't create a new image here - we want to modify the current one in-place. So,
+		/// we turn off the "copy" parameter of ModifyOp.
+		cropOp->copyParameter()->setTypedValue( false );
+		cropOp->inputParameter()->setValue( imageB );
+		cropOp->cropBoxParameter()->setTypedValue( newDataWindow );
+		cropOp->matchDataWindowParameter()->setTypedValue( true );
+		cropOp->resetOriginParameter()->setTypedValue( false );
 
-	cropOp->operate();
+		cropOp->operate();
+	}
 
 	assert( imageB->arePrimitiveVariablesValid() );
 	assert( imageB->getDataWindow() == newDataWindow );
@@ -354,44 +416,89 @@ void ImageCompositeOp::composite( CompositeFn fn, DataWindowResult dwr, ImagePri
 	/// \todo Use the "reformat" parameter of the ImageCropOp to do this, when it's implemented
 	imageB->setDisplayWindow( displayWindow );
 
-	FloatVectorDataPtr aAlphaData = getChannelData( imageA, alphaChannel, false );
-	FloatVectorDataPtr bAlphaData = getChannelData( imageB, alphaChannel, false );
-
 	const int newWidth = newDataWindow.size().x + 1;
 	const int newHeight = newDataWindow.size().y + 1;
 	const int newArea = newWidth * newHeight;
 
 	assert( newArea == (int)imageB->variableSize( PrimitiveVariable::Vertex ) );
 
+	/// Get the data to hold the results. We write in place over the existing channels of imageB
+	/// wherever they're already float data, unless that data is also used by imageA, by either
+	/// alpha channel, or by any other channel of imageB.
+	std::vector<ConstFloatVectorDataPtr> aData, bData;
+	std::vector<FloatVectorDataPtr> resultData;
 	for( unsigned i=0; i<channelNames.size(); i++ )
 	{
-		const StringVectorParameter::ValueType::value_type &channelName = channelNames[i];
+		aData.push_back( getChannelData( imageA, channelNames[i] ) );
+		assert( aData.back()->readable().size() == imageA->variableSize( PrimitiveVariable::Vertex ) );
+		bData.push_back( getChannelData( imageB, channelNames[i] ) );
+		assert( bData.back()->readable().size() == imageB->variableSize( PrimitiveVariable::Vertex ) );
+	}
 
-		FloatVectorDataPtr aData = getChannelData( imageA, channelName );
-		assert( aData->readable().size() == imageA->variableSize( PrimitiveVariable::Vertex ) );
-		FloatVectorDataPtr bData = getChannelData( imageB, channelName );
-		assert( bData->readable().size() == imageB->variableSize( PrimitiveVariable::Vertex ) );
-		FloatVectorDataPtr newBData = new FloatVectorData();
+	ConstFloatVectorDataPtr aAlphaData = getChannelData( imageA, alphaChannel, false );
+	ConstFloatVectorDataPtr bAlphaData = getChannelData( imageB, alphaChannel, false );
 
-		newBData->writable().resize( newArea );
-		imageB->variables[ channelName ].data = newBData;
+	for( unsigned i=0; i<channelNames.size(); i++ )
+	{
+		bool inPlace = imageB->variables[ channelNames[i] ].data == bData[i] && bData[i] != aAlphaData && bData[i] != bAlphaData;
+		for( unsigned j=0; j<channelNames.size() && inPlace; j++ )
+		{
+			inPlace = bData[i] != aData[j];
+		}
+		/// This also covers channels of imageB which aren't being composited, and result channels
+		/// which have already been given their own data, since we replace the variables as we go.
+		for( PrimitiveVariableMap::const_iterator it = imageB->variables.begin(); it != imageB->variables.end() && inPlace; ++it )
+		{
+			inPlace = it->first == channelNames[i] || it->second.data != bData[i];
+		}
 
-		for ( int y = newDataWindow.min.y; y <= newDataWindow.max.y; y++ )
+		FloatVectorDataPtr newBData;
+		if ( inPlace )
 		{
-			int offset = (y - newDataWindow.min.y ) * newWidth;
-			for ( int x = newDataWindow.min.x; x <= newDataWindow.max.x; x++, offset++ )
-			{
-				float aVal = readChannelData( imageA, aData, V2i( x, y ) );
-				float bVal = readChannelData( imageB, bData, V2i( x, y ) );
+			newBData = constPointerCast<FloatVectorData>( bData[i] );
+		}
+		else
+		{
+			newBData = new FloatVectorData();
+			newBData->writable().resize( newArea );
+			imageB->variables[ channelNames[i] ].data = newBData;
+		}
+		resultData.push_back( newBData );
+	}
+
+	if ( newArea )
+	{
+		/// Get the pointers to write to first, so that any copy-on-write of shared data happens before
+		/// we get the pointers to read from.
+		std::vector<float *> result;
+		for( unsigned i=0; i<channelNames.size(); i++ )
+		{
+			result.push_back( &(resultData[i]->writable()[0]) );
+		}
 
-				float aAlpha = aAlphaData ? readChannelData( imageA, aAlphaData, V2i( x, y ) ) : 1.0f;
-				float bAlpha = bAlphaData ? readChannelData( imageB, bAlphaData, V2i( x, y ) ) : 1.0f;
+		std::vector<const float *> aChannels, bChannels;
+		for( unsigned i=0; i<channelNames.size(); i++ )
+		{
+			aChannels.push_back( aData[i]->readable().empty() ? 0 : &(aData[i]->readable()[0]) );
+			bChannels.push_back( &(bData[i]->readable()[0]) );
+		}
 
-				assert( offset >= 0 );
-				assert( offset < (int)newBData->readable().size() );
-				newBData->writable()[ offset  ] = fn( aVal, aAlpha, bVal, bAlpha );
-			}
+		const float *aAlpha = aAlphaData && !aAlphaData->readable().empty() ? &(aAlphaData->readable()[0]) : 0;
+		const float *bAlpha = bAlphaData ? &(bAlphaData->readable()[0]) : 0;
+
+		/// Pixels outside the data window of imageA are treated as zero, so if imageA has an alpha channel
+		/// with an empty data window we must still account for it.
+		static const float zero = 0.0f;
+		if( aAlphaData && !aAlpha )
+		{
+			aAlpha = &zero;
 		}
+
+		CompositeRows compositeRows(
+			fn, imageA->getDataWindow(), newDataWindow,
+			aChannels, aAlpha, bChannels, bAlpha, result
+		);
+		tbb::parallel_for( tbb::blocked_range<int>( newDataWindow.min.y, newDataWindow.max.y + 1 ), compositeRows );
 	}
 
 	/// displayWindow should be unchanged
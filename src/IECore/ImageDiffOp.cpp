@@ -37,6 +37,10 @@
 
 #include "boost/format.hpp"
 
+#include "tbb/parallel_reduce.h"
+#include "tbb/blocked_range.h"
+#include "tbb/atomic.h"
+
 #include "IECore/ImageDiffOp.h"
 
 #include "IECore/MessageHandler.h"
@@ -51,13 +55,111 @@
 #include "IECore/ImagePrimitive.h"
 #include "IECore/DataConvert.h"
 #include "IECore/ScaledDataConversion.h"
-#include "IECore/MeanSquaredError.h"
-#include "IECore/ImageCropOp.h"
+#include "IECore/BoxOps.h"
 
 using namespace IECore;
 using namespace Imath;
 using namespace std;
 
+namespace
+{
+
+// Sums the squared differences between any number of channels at once, over a range of
+// rows of a window. Pixels outside the data window of an image are treated as zero, so
+// that the images needn't be cropped to a common window first. In early out mode, the
+// summation is abandoned as soon as any channel is known to exceed the error limit.
+class SquaredErrorSum
+{
+
+	public :
+
+		SquaredErrorSum(
+			const Box2i &window, const Box2i &dataWindowA, const Box2i &dataWindowB,
+			const std::vector<const float *> &channelsA, const std::vector<const float *> &channelsB,
+			double limit, bool earlyOut, tbb::atomic<int> &limitExceeded
+		)
+			:	m_window( window ), m_dataWindowA( dataWindowA ), m_dataWindowB( dataWindowB ),
+				m_channelsA( channelsA ), m_channelsB( channelsB ),
+				m_limit( limit ), m_earlyOut( earlyOut ), m_limitExceeded( limitExceeded ),
+				m_sums( channelsA.size(), 0.0 )
+		{
+		}
+
+		SquaredErrorSum( SquaredErrorSum &that, tbb::split )
+			:	m_window( that.m_window ), m_dataWindowA( that.m_dataWindowA ), m_dataWindowB( that.m_dataWindowB ),
+				m_channelsA( that.m_channelsA ), m_channelsB( that.m_channelsB ),
+				m_limit( that.m_limit ), m_earlyOut( that.m_earlyOut ), m_limitExceeded( that.m_limitExceeded ),
+				m_sums( that.m_sums.size(), 0.0 )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<int> &rows )
+		{
+			const int widthA = m_dataWindowA.size().x + 1;
+			const int widthB = m_dataWindowB.size().x + 1;
+
+			for( int y = rows.begin(); y != rows.end(); ++y )
+			{
+				if( m_earlyOut && m_limitExceeded )
+				{
+					return;
+				}
+
+				const bool rowInA = y >= m_dataWindowA.min.y && y <= m_dataWindowA.max.y;
+				const bool rowInB = y >= m_dataWindowB.min.y && y <= m_dataWindowB.max.y;
+
+				for( size_t c = 0; c < m_channelsA.size(); ++c )
+				{
+					const float *a = rowInA ? m_channelsA[c] + ( y - m_dataWindowA.min.y ) * widthA : 0;
+					const float *b = rowInB ? m_channelsB[c] + ( y - m_dataWindowB.min.y ) * widthB : 0;
+
+					double sum = 0.0;
+					for( int x = m_window.min.x; x <= m_window.max.x; ++x )
+					{
+						const float va = a && x >= m_dataWindowA.min.x && x <= m_dataWindowA.max.x ? a[x - m_dataWindowA.min.x] : 0.0f;
+						const float vb = b && x >= m_dataWindowB.min.x && x <= m_dataWindowB.max.x ? b[x - m_dataWindowB.min.x] : 0.0f;
+						sum += ( va - vb ) * ( va - vb );
+					}
+
+					m_sums[c] += sum;
+					if( m_earlyOut && m_sums[c] > m_limit )
+					{
+						m_limitExceeded = 1;
+						return;
+					}
+				}
+			}
+		}
+
+		void join( const SquaredErrorSum &that )
+		{
+			for( size_t c = 0; c < m_sums.size(); ++c )
+			{
+				m_sums[c] += that.m_sums[c];
+			}
+		}
+
+		const std::vector<double> &sums() const
+		{
+			return m_sums;
+		}
+
+	private :
+
+		const Box2i &m_window;
+		const Box2i &m_dataWindowA;
+		const Box2i &m_dataWindowB;
+		const std::vector<const float *> &m_channelsA;
+		const std::vector<const float *> &m_channelsB;
+		double m_limit;
+		bool m_earlyOut;
+		tbb::atomic<int> &m_limitExceeded;
+		std::vector<double> m_sums;
+
+};
+
+} // namespace
+
 IE_CORE_DEFINERUNTIMETYPED( ImageDiffOp );
 
 ImageDiffOp::ImageDiffOp()
@@ -98,10 +200,18 @@ ImageDiffOp::ImageDiffOp()
 	        false
 	);
 
+	m_earlyOutParameter = new BoolParameter(
+	        "earlyOut",
+	        "If true then the comparison stops as soon as any channel is known to exceed the maximum error, "
+	        "rather than measuring the error over the whole of both images.",
+	        true
+	);
+
 	parameters()->addParameter( m_imageAParameter );
 	parameters()->addParameter( m_imageBParameter );
 	parameters()->addParameter( m_maxErrorParameter );
 	parameters()->addParameter( m_skipMissingChannelsParameter );
+	parameters()->addParameter( m_earlyOutParameter );
 }
 
 ImageDiffOp::~ImageDiffOp()
@@ -148,6 +258,16 @@ const BoolParameter * ImageDiffOp::skipMissingChannels() const
 	return m_skipMissingChannelsParameter;
 }
 
+BoolParameter * ImageDiffOp::earlyOutParameter()
+{
+	return m_earlyOutParameter;
+}
+
+const BoolParameter * ImageDiffOp::earlyOutParameter() const
+{
+	return m_earlyOutParameter;
+}
+
 /// A class to use a ScaledDataConversion to transform image data to floating point, to allow for simple measuring of
 /// error between two potentially different data types (e.g. UShort and Half)
 struct ImageDiffOp::FloatConverter
@@ -195,21 +315,16 @@ ObjectPtr ImageDiffOp::doOperation( const CompoundObject * operands )
 		return new BoolData( true );
 	}
 
-	/// Use the CropOp to expand the dataWindows of both images to fill the display window
-	ImageCropOpPtr cropOp = new ImageCropOp();
-	cropOp->matchDataWindowParameter()->setTypedValue( true );
-	cropOp->cropBoxParameter()->setTypedValue( imageA->getDisplayWindow() );
-
-	cropOp->inputParameter()->setValue( imageA );
-	imageA = runTimeCast< ImagePrimitive >( cropOp->operate() );
-
-	cropOp->inputParameter()->setValue( imageB );
-	imageB = runTimeCast< ImagePrimitive >( cropOp->operate() );
+	const Box2i &displayWindow = imageA->getDisplayWindow();
+	const Box2i &dataWindowA = imageA->getDataWindow();
+	const Box2i &dataWindowB = imageB->getDataWindow();
 
 	const float maxError = m_maxErrorParameter->getNumericValue();
 
 	const bool skipMissingChannels = m_skipMissingChannelsParameter->getTypedValue();
 
+	const bool earlyOut = m_earlyOutParameter->getTypedValue();
+
 	std::vector< std::string > channelsA;
 	imageA->channelNames( channelsA );
 
@@ -217,7 +332,6 @@ ObjectPtr ImageDiffOp::doOperation( const CompoundObject * operands )
 	{
 		std::vector< std::string > channelsB, channelsIntersection ;
 
-		imageA->channelNames( channelsA );
 		imageB->channelNames( channelsB );
 
 		std::set_intersection(
@@ -232,6 +346,11 @@ ObjectPtr ImageDiffOp::doOperation( const CompoundObject * operands )
 		}
 	}
 
+	// gather the float data for all the channels to be compared, converting only
+	// where the channels aren't already stored as floats.
+	std::vector<ConstFloatVectorDataPtr> floatData;
+	std::vector<const float *> floatChannelsA, floatChannelsB;
+
 	for ( std::vector< std::string >::const_iterator it = channelsA.begin(); it != channelsA.end(); ++it )
 	{
 		PrimitiveVariableMap::const_iterator aPrimVarIt = imageA->variables.find( *it );
@@ -248,14 +367,9 @@ ObjectPtr ImageDiffOp::doOperation( const CompoundObject * operands )
 		assert( bPrimVarIt->second.interpolation == PrimitiveVariable::Vertex );
 
 		DataPtr aData = aPrimVarIt->second.data;
+		DataPtr bData = bPrimVarIt->second.data;
 
-		DataPtr bData = 0;
-		if ( bPrimVarIt != imageB->variables.end() )
-		{
-			bData = bPrimVarIt->second.data;
-		}
-
-		if ( aData == bData )
+		if ( aData == bData && dataWindowA == dataWindowB )
 		{
 			msg( Msg::Warning, "ImageDiffOp", "Exact same data found in two different input images.");
 			continue;
@@ -270,13 +384,19 @@ ObjectPtr ImageDiffOp::doOperation( const CompoundObject * operands )
 		assert( aData );
 		assert( bData );
 
-		FloatVectorDataPtr aFloatData = 0;
-		FloatVectorDataPtr bFloatData = 0;
+		ConstFloatVectorDataPtr aFloatData = runTimeCast<const FloatVectorData>( aData );
+		ConstFloatVectorDataPtr bFloatData = runTimeCast<const FloatVectorData>( bData );
 
 		try
 		{
-			aFloatData = despatchTypedData< FloatConverter, TypeTraits::IsNumericVectorTypedData > ( aData );
-			bFloatData = despatchTypedData< FloatConverter, TypeTraits::IsNumericVectorTypedData > ( bData );
+			if ( !aFloatData )
+			{
+				aFloatData = despatchTypedData< FloatConverter, TypeTraits::IsNumericVectorTypedData > ( aData );
+			}
+			if ( !bFloatData )
+			{
+				bFloatData = despatchTypedData< FloatConverter, TypeTraits::IsNumericVectorTypedData > ( bData );
+			}
 		}
 		catch ( Exception &e )
 		{
@@ -286,9 +406,45 @@ ObjectPtr ImageDiffOp::doOperation( const CompoundObject * operands )
 
 		assert( aFloatData );
 		assert( bFloatData );
-		assert( aFloatData->readable().size() == bFloatData->readable().size() );
+		assert( aFloatData->readable().size() == imageA->variableSize( PrimitiveVariable::Vertex ) );
+		assert( bFloatData->readable().size() == imageB->variableSize( PrimitiveVariable::Vertex ) );
+
+		floatData.push_back( aFloatData );
+		floatData.push_back( bFloatData );
+		floatChannelsA.push_back( aFloatData->readable().empty() ? 0 : &aFloatData->readable()[0] );
+		floatChannelsB.push_back( bFloatData->readable().empty() ? 0 : &bFloatData->readable()[0] );
+	}
 
-		float rms = sqrt( MeanSquaredError<FloatVectorData>()( aFloatData, bFloatData ) );
+	// pixels outside both data windows don't contribute to the error, and neither do
+	// pixels outside the display window, so we only need to visit those that remain.
+	Box2i window = dataWindowA;
+	window.extendBy( dataWindowB );
+	window = boxIntersection( window, displayWindow );
+
+	if ( floatChannelsA.empty() || window.isEmpty() )
+	{
+		return new BoolData( false );
+	}
+
+	const double displayArea = double( displayWindow.size().x + 1 ) * double( displayWindow.size().y + 1 );
+
+	tbb::atomic<int> limitExceeded;
+	limitExceeded = 0;
+
+	SquaredErrorSum errorSum(
+		window, dataWindowA, dataWindowB, floatChannelsA, floatChannelsB,
+		double( maxError ) * double( maxError ) * displayArea, earlyOut, limitExceeded
+	);
+	tbb::parallel_reduce( tbb::blocked_range<int>( window.min.y, window.max.y + 1 ), errorSum );
+
+	if ( limitExceeded )
+	{
+		return new BoolData( true );
+	}
+
+	for ( std::vector<double>::const_iterator it = errorSum.sums().begin(); it != errorSum.sums().end(); ++it )
+	{
+		float rms = sqrt( *it / displayArea );
 		if ( rms > maxError )
 		{
 			return new BoolData( true );
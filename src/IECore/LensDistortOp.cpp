@@ -34,8 +34,13 @@
 
 #include <cassert>
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 #include "IECore/LensDistortOp.h"
 #include "IECore/LensModel.h"
+#include "IECore/LRUCache.h"
+#include "IECore/MurmurHash.h"
 #include "IECore/FastFloat.h"
 #include "IECore/NullObject.h"
 #include "IECore/CompoundParameter.h"
@@ -51,6 +56,151 @@ using namespace Imath;
 
 IE_CORE_DEFINERUNTIMETYPED( LensDistortOp );
 
+//////////////////////////////////////////////////////////////////////////////////////////
+// Cache implementation
+//////////////////////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+struct DistortionMapKey
+{
+	DistortionMapKey( const MurmurHash &hash, LensModelPtr lensModel, bool distort, const Box2i &distortedDataWindow, const V2i &imageSize )
+		:	hash( hash ), lensModel( lensModel ), distort( distort ), distortedDataWindow( distortedDataWindow ), imageSize( imageSize )
+	{
+	}
+
+	bool operator < ( const DistortionMapKey &other ) const
+	{
+		return hash < other.hash;
+	}
+
+	MurmurHash hash;
+	// The remaining members are all derived from the hashed values, and are
+	// just what's needed to compute the map.
+	LensModelPtr lensModel;
+	bool distort;
+	Box2i distortedDataWindow;
+	V2i imageSize;
+};
+
+class DistortionMapRows
+{
+
+	public :
+
+		DistortionMapRows( const DistortionMapKey &key, std::vector<float> &map )
+			:	m_key( key ), m_map( map )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<int> &range ) const
+		{
+			const Box2i &window = m_key.distortedDataWindow;
+			const V2i &imageSize = m_key.imageSize;
+			// We interleave the X and Y vector components within the map.
+			size_t pixelIndex = range.begin() * ( window.size().x + 1 ) * 2;
+			for( int y = range.begin() + window.min.y; y != range.end() + window.min.y; y++ )
+			{
+				for( int x = window.min.x; x <= window.max.x; x++ )
+				{
+					// Convert to UV space, distort or undistort and convert back to pixel space
+					Imath::V2f p( x, y );
+					Imath::V2d uv = p / imageSize;
+					Imath::V2f inPos( Imath::V2d( ( m_key.distort ? m_key.lensModel->distort( uv ) : m_key.lensModel->undistort( uv ) ) * imageSize ) );
+					m_map[pixelIndex++] = inPos[0];
+					m_map[pixelIndex++] = inPos[1];
+				}
+			}
+		}
+
+	private :
+
+		const DistortionMapKey &m_key;
+		std::vector<float> &m_map;
+
+};
+
+// Computes all the rows of a distortion map. This is run via isolatedExecute()
+// because it is called from within the cache getter.
+class DistortionMap
+{
+
+	public :
+
+		DistortionMap( const DistortionMapKey &key, std::vector<float> &map )
+			:	m_key( key ), m_map( map )
+		{
+		}
+
+		void operator()() const
+		{
+			const int height = m_key.distortedDataWindow.size().y + 1;
+			tbb::parallel_for( tbb::blocked_range<int>( 0, height ), DistortionMapRows( m_key, m_map ) );
+		}
+
+	private :
+
+		const DistortionMapKey &m_key;
+		std::vector<float> &m_map;
+
+};
+
+} // namespace
+
+typedef IECore::LRUCache< DistortionMapKey, IECore::ConstFloatVectorDataPtr > DistortionMapLRUCache;
+
+class LensDistortOp::Cache : public DistortionMapLRUCache
+{
+	public :
+
+		Cache( DistortionMapLRUCache::Cost maxCost )
+			: DistortionMapLRUCache( distortionMapGetter, maxCost )
+		{
+		}
+
+	private :
+
+		static ConstFloatVectorDataPtr distortionMapGetter( const DistortionMapKey &key, size_t &cost )
+		{
+			FloatVectorDataPtr result = new FloatVectorData;
+			std::vector<float> &map = result->writable();
+			const V2i size = key.distortedDataWindow.size() + V2i( 1 );
+			map.resize( size.x * size.y * 2 );
+
+			// The lens models are only read from once they have been validated, so can be evaluated concurrently.
+			isolatedExecute( DistortionMap( key, map ) );
+
+			cost = map.size() * sizeof( float );
+			return result;
+		}
+};
+
+LensDistortOp::Cache &LensDistortOp::cache()
+{
+	static Cache cache( 256 * 1024 * 1024 );
+	return cache;
+}
+
+void LensDistortOp::setDistortionMapCacheMemoryLimit( size_t bytes )
+{
+	cache().setMaxCost( bytes );
+}
+
+size_t LensDistortOp::getDistortionMapCacheMemoryLimit()
+{
+	return cache().getMaxCost();
+}
+
+void LensDistortOp::clearDistortionMapCache()
+{
+	cache().clear();
+}
+
+//////////////////////////////////////////////////////////////////////////////////////////
+// LensDistortOp implementation
+//////////////////////////////////////////////////////////////////////////////////////////
+
 LensDistortOp::LensDistortOp()
 	:	WarpOp(
 			"Distorts an ImagePrimitive using a parametric lens model which is supplied as a .cob file. "
@@ -118,37 +268,15 @@ void LensDistortOp::begin( const CompoundObject * operands )
 	// Get the distorted window.
 	m_distortedDataWindow = m_lensModel->bounds( m_mode, m_imageDataWindow, m_imageSize.x, m_imageSize.y );
 
-	// Compute a 2D cache of the warped points for use in the warp() method.
-	IECore::FloatVectorDataPtr cachePtr = new IECore::FloatVectorData;
-	std::vector<float> &cache( cachePtr->writable() );
-	cache.resize( ( m_distortedDataWindow.size().x + 1 ) * ( m_distortedDataWindow.size().y + 1 ) * 2 ); // We interleave the X and Y vector components within the cache.
+	// Get a 2D map of the warped points for use in the warp() method. Everything the map
+	// depends on goes into the hash, so the map can be shared with other operations.
+	MurmurHash hash;
+	lensModelParams->hash( hash );
+	hash.append( m_mode );
+	hash.append( m_imageDataWindow );
+	hash.append( m_imageSize );
 
-	if ( m_mode == kDistort )
-	{
-		for( int y = m_distortedDataWindow.min.y, pixelIndex = 0; y <= m_distortedDataWindow.max.y; y++ )
-		{
-			for( int x = m_distortedDataWindow.min.x; x <= m_distortedDataWindow.max.x; x++ )
-			{
-				Imath::V2f inPos( distort( Imath::V2f( x, y ) ) );
-				cache[pixelIndex++] = inPos[0];
-				cache[pixelIndex++] = inPos[1];
-			}
-		}
-	}
-	else
-	{
-		for( int y = m_distortedDataWindow.min.y, pixelIndex = 0; y <= m_distortedDataWindow.max.y; y++ )
-		{
-			for( int x = m_distortedDataWindow.min.x; x <= m_distortedDataWindow.max.x; x++ )
-			{
-				Imath::V2f inPos( undistort( Imath::V2f( x, y ) ) );
-				cache[pixelIndex++] = inPos[0];
-				cache[pixelIndex++] = inPos[1];
-			}
-		}
-	}
-
-	m_cachePtr = cachePtr;
+	m_cachePtr = cache().get( DistortionMapKey( hash, m_lensModel, m_mode == kDistort, m_distortedDataWindow, m_imageSize ) );
 }
 
 Imath::Box2i LensDistortOp::warpedDataWindow( const Imath::Box2i &dataWindow ) const
@@ -156,28 +284,6 @@ Imath::Box2i LensDistortOp::warpedDataWindow( const Imath::Box2i &dataWindow ) c
 	return m_distortedDataWindow;
 }
 
-Imath::V2f LensDistortOp::undistort( const Imath::V2f &p ) const
-{
-	// Convert to UV space.
-	Imath::V2d uv = p / m_imageSize;
-
-	// Undistort and convert to pixel space
-	Imath::V2d dp( m_lensModel->undistort( uv ) * m_imageSize );
-	
-	return dp;
-}
-
-Imath::V2f LensDistortOp::distort( const Imath::V2f &p ) const
-{
-	// Convert to UV space.
-	Imath::V2d uv = p / m_imageSize;
-	
-	// Distort and convert to pixel space
-	Imath::V2d dp( m_lensModel->distort( uv ) * m_imageSize );
-	
-	return dp;
-}
-
 Imath::V2f LensDistortOp::warp( const Imath::V2f &p ) const
 {
 	// Just pull the distorted point from the cache.
@@ -32,6 +32,8 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
+
 #include "IECore/LinkedScene.h"
 #include "IECore/SceneCache.h"
 #include "IECore/FileIndexedIO.h"
@@ -124,6 +126,20 @@ IECore::CompoundDataPtr LinkedScene::linkAttributeData( const SceneInterface *sc
 	return d;
 }
 
+void LinkedScene::finish()
+{
+	if ( m_readOnly )
+	{
+		throw Exception( "No write access to scene file!" );
+	}
+	SceneCache *sceneCache = runTimeCast<SceneCache>( m_mainScene.get() );
+	if ( !sceneCache )
+	{
+		throw Exception( "LinkedScene::finish is only supported when writing to a SceneCache!" );
+	}
+	sceneCache->finish();
+}
+
 std::string LinkedScene::fileName() const
 {
 	return m_mainScene->fileName();
@@ -780,6 +796,62 @@ void LinkedScene::writeTags( const NameList &tags )
 	m_mainScene->writeTags(tags);
 }
 
+void LinkedScene::pathsWithTag( const Name &name, std::vector<Path> &paths ) const
+{
+	if ( !m_readOnly )
+	{
+		throw Exception( "pathsWithTag is only supported when reading the scene file!" );
+	}
+
+	if ( m_linkedScene && !m_atLink )
+	{
+		// we're inside a link, so the linked scene has all the answers
+		paths.clear();
+		linkedPathsWithTag( name, paths );
+		return;
+	}
+
+	const SceneCache *mainCache = runTimeCast< const SceneCache >( m_mainScene.get() );
+	std::vector<Path> links;
+	if ( !mainCache || !mainCache->pathsWithTagFromChildren( name, links ) )
+	{
+		// we can't tell which links contain the tag without traversing
+		SceneInterface::pathsWithTag( name, paths );
+		return;
+	}
+
+	// the locations tagged in the main scene
+	m_mainScene->pathsWithTag( name, paths );
+
+	// and the locations tagged within the links containing the tag
+	for ( std::vector<Path>::const_iterator it = links.begin(); it != links.end(); ++it )
+	{
+		ConstSceneInterfacePtr link = scene( *it, SceneInterface::NullIfMissing );
+		const LinkedScene *linkedScene = runTimeCast< const LinkedScene >( link.get() );
+		if ( linkedScene && linkedScene->m_linkedScene )
+		{
+			linkedScene->linkedPathsWithTag( name, paths );
+		}
+	}
+
+	std::sort( paths.begin(), paths.end(), SceneInterface::pathLess );
+	paths.erase( std::unique( paths.begin(), paths.end() ), paths.end() );
+}
+
+void LinkedScene::linkedPathsWithTag( const Name &name, std::vector<Path> &paths ) const
+{
+	std::vector<Path> linkedPaths;
+	m_linkedScene->pathsWithTag( name, linkedPaths );
+
+	Path mainPath;
+	m_mainScene->path( mainPath );
+	for ( std::vector<Path>::const_iterator it = linkedPaths.begin(); it != linkedPaths.end(); ++it )
+	{
+		paths.push_back( mainPath );
+		paths.back().insert( paths.back().end(), it->begin() + m_rootLinkDepth, it->end() );
+	}
+}
+
 bool LinkedScene::hasObject() const
 {
 	if ( m_linkedScene )
@@ -38,9 +38,15 @@
 #include "IECore/ImagePrimitive.h"
 #include "IECore/SummedAreaOp.h"
 #include "IECore/CompoundParameter.h"
+#include "IECore/MurmurHash.h"
+#include "IECore/LRUCache.h"
 
 #include "boost/multi_array.hpp"
 #include "boost/format.hpp"
+#include "boost/shared_ptr.hpp"
+
+#include "tbb/parallel_for.h"
+#include "tbb/blocked_range.h"
 
 using namespace IECore;
 using namespace boost;
@@ -147,11 +153,162 @@ const IntParameter * MedianCutSampler::projectionParameter() const
 	return m_projectionParameter;
 }
 
+//////////////////////////////////////////////////////////////////////////////////////////
+// Cache implementation
+//////////////////////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// The weighted luminance and its summed area table, which depend only on the
+// image channel and the projection, and not on the subdivision depth.
+struct SummedAreaTable
+{
+	ConstFloatVectorDataPtr luminance;
+	ConstFloatVectorDataPtr summedLuminance;
+};
+
+typedef boost::shared_ptr<const SummedAreaTable> ConstSummedAreaTablePtr;
+
+struct SummedAreaTableKey
+{
+	SummedAreaTableKey( const MurmurHash &hash, const FloatVectorData *channel, const Box2i &dataWindow, MedianCutSampler::Projection projection )
+		:	hash( hash ), channel( channel ), dataWindow( dataWindow ), projection( projection )
+	{
+	}
+
+	bool operator < ( const SummedAreaTableKey &other ) const
+	{
+		return hash < other.hash;
+	}
+
+	MurmurHash hash;
+	// The remaining members are the values the hash was computed from. The
+	// channel is only valid for the duration of the call which computes the
+	// table - we don't want the cache to keep the source images alive.
+	const FloatVectorData *channel;
+	Box2i dataWindow;
+	MedianCutSampler::Projection projection;
+};
+
+// Runs an Op. This is used to run the SummedAreaOp via isolatedExecute(),
+// because it is called from within the cache getter.
+class Operation
+{
+
+	public :
+
+		Operation( Op *op )
+			:	m_op( op )
+		{
+		}
+
+		void operator()() const
+		{
+			m_op->operate();
+		}
+
+	private :
+
+		Op *m_op;
+
+};
+
+} // namespace
+
+typedef LRUCache<SummedAreaTableKey, ConstSummedAreaTablePtr> SummedAreaTableLRUCache;
+
+class MedianCutSampler::Cache : public SummedAreaTableLRUCache
+{
+	public :
+
+		Cache( SummedAreaTableLRUCache::Cost maxCost )
+			: SummedAreaTableLRUCache( summedAreaTableGetter, maxCost )
+		{
+		}
+
+	private :
+
+		static ConstSummedAreaTablePtr summedAreaTableGetter( const SummedAreaTableKey &key, size_t &cost )
+		{
+			const Box2i &dataWindow = key.dataWindow;
+			FloatVectorDataPtr luminance = key.channel->copy();
+
+			// if the projection requires it, weight the luminances so they're less
+			// important towards the poles of the sphere
+			if( key.projection==LatLong )
+			{
+				float radiansPerPixel = M_PI / (dataWindow.size().y + 1);
+				float angle = ( M_PI - radiansPerPixel ) / 2.0f;
+
+				float *p = &(luminance->writable()[0]);
+
+				for( int y=dataWindow.min.y; y<=dataWindow.max.y; y++ )
+				{
+					float *pEnd = p + dataWindow.size().x + 1;
+					float w = cosf( angle );
+					while( p < pEnd )
+					{
+						*p *= w;
+						p++;
+					}
+					angle -= radiansPerPixel;
+				}
+			}
+
+			// make a summed area table for speed
+			ImagePrimitivePtr image = new ImagePrimitive( dataWindow, dataWindow );
+			image->variables["Y"] = PrimitiveVariable( PrimitiveVariable::Vertex, luminance->copy() );
+
+			SummedAreaOpPtr summedAreaOp = new SummedAreaOp();
+			summedAreaOp->inputParameter()->setValue( image );
+			summedAreaOp->copyParameter()->setTypedValue( false );
+			summedAreaOp->channelNamesParameter()->getTypedValue().clear();
+			summedAreaOp->channelNamesParameter()->getTypedValue().push_back( "Y" );
+			isolatedExecute( Operation( summedAreaOp.get() ) );
+
+			boost::shared_ptr<SummedAreaTable> result( new SummedAreaTable );
+			result->luminance = luminance;
+			result->summedLuminance = image->getChannel<float>( "Y" );
+
+			cost = 2 * luminance->readable().size() * sizeof( float );
+			return result;
+		}
+};
+
+MedianCutSampler::Cache &MedianCutSampler::cache()
+{
+	static Cache cache( 256 * 1024 * 1024 );
+	return cache;
+}
+
+void MedianCutSampler::setSummedAreaTableCacheMemoryLimit( size_t bytes )
+{
+	cache().setMaxCost( bytes );
+}
+
+size_t MedianCutSampler::getSummedAreaTableCacheMemoryLimit()
+{
+	return cache().getMaxCost();
+}
+
+void MedianCutSampler::clearSummedAreaTableCache()
+{
+	cache().clear();
+}
+
+//////////////////////////////////////////////////////////////////////////////////////////
+// Sampling implementation
+//////////////////////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
 /// \todo This functionality and the code in SummedAreaOp should be
 /// refactored into a low level templated SummedAreaTable class that
 /// operates on data passed to it.
-typedef boost::multi_array_ref<float, 2> Array2D;
-static inline float energy( const Array2D &summedLuminance, const Box2i &area )
+typedef boost::const_multi_array_ref<float, 2> Array2D;
+inline float energy( const Array2D &summedLuminance, const Box2i &area )
 {
 	V2i min = area.min - V2i( 1 ); // box is inclusive so we need to step outside
 
@@ -163,102 +320,124 @@ static inline float energy( const Array2D &summedLuminance, const Box2i &area )
 	return a - b - c + d;
 }
 
-static void medianCut( const Array2D &luminance, const Array2D &summedLuminance, MedianCutSampler::Projection projection, const Box2i &area, vector<Box2i> &areas, vector<V2f> &centroids, int depth, int maxDepth )
+// Cuts each of a range of areas into two halves of equal energy. The halves of
+// area i are stored at 2i and 2i+1 in the output, so that the final areas are
+// in the same order as they would be if the cuts were made depth first.
+class MedianCut
 {
-	float radiansPerPixel = M_PI / (luminance.shape()[1]);
 
-	if( depth==maxDepth )
-	{
-		float totalEnergy = 0.0f;
-		V2f position( 0.0f );
-		for( int y=area.min.y; y<=area.max.y; y++ )
+	public :
+
+		MedianCut( const Array2D &summedLuminance, MedianCutSampler::Projection projection, const vector<Box2i> &areas, vector<Box2i> &cutAreas )
+			:	m_summedLuminance( summedLuminance ), m_projection( projection ), m_areas( areas ), m_cutAreas( cutAreas )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
 		{
-			for( int x=area.min.x; x<=area.max.x; x++ )
+			float radiansPerPixel = M_PI / (m_summedLuminance.shape()[1]);
+			for( size_t i=range.begin(); i!=range.end(); i++ )
 			{
-				float e = luminance[x][y];
-				position += V2f( x, y ) * e;
-				totalEnergy += e;
+				const Box2i &area = m_areas[i];
+
+				// find cut dimension
+				V2f size = area.size();
+				if( m_projection==MedianCutSampler::LatLong )
+				{
+					float centreY = (area.max.y + area.min.y) / 2.0f;
+					float centreAngle = (M_PI - radiansPerPixel) / 2.0f - centreY * radiansPerPixel;
+					size.x *= cosf( centreAngle );
+				}
+				int cutAxis = size.x > size.y ? 0 : 1;
+				float e = energy( m_summedLuminance, area );
+				float halfE = e / 2.0f;
+				Box2i lowArea = area;
+				while( e > halfE )
+				{
+					lowArea.max[cutAxis] -= 1;
+					e = energy( m_summedLuminance, lowArea );
+				}
+				Box2i highArea = area;
+				highArea.min[cutAxis] = lowArea.max[cutAxis] + 1;
+
+				m_cutAreas[2*i] = lowArea;
+				m_cutAreas[2*i+1] = highArea;
 			}
 		}
 
-		position /= totalEnergy;
-		centroids.push_back( position );
-		areas.push_back( area );
-	}
-	else
-	{
-		// find cut dimension
-		V2f size = area.size();
-		if( projection==MedianCutSampler::LatLong )
+	private :
+
+		const Array2D &m_summedLuminance;
+		MedianCutSampler::Projection m_projection;
+		const vector<Box2i> &m_areas;
+		vector<Box2i> &m_cutAreas;
+
+};
+
+// Computes the energy weighted centroid of each of a range of areas.
+class Centroids
+{
+
+	public :
+
+		Centroids( const Array2D &luminance, const vector<Box2i> &areas, vector<V2f> &centroids )
+			:	m_luminance( luminance ), m_areas( areas ), m_centroids( centroids )
 		{
-			float centreY = (area.max.y + area.min.y) / 2.0f;
-			float centreAngle = (M_PI - radiansPerPixel) / 2.0f - centreY * radiansPerPixel;
-			size.x *= cosf( centreAngle );
 		}
-		int cutAxis = size.x > size.y ? 0 : 1;
-		float e = energy( summedLuminance, area );
-		float halfE = e / 2.0f;
-		Box2i lowArea = area;
-		while( e > halfE )
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
 		{
-			lowArea.max[cutAxis] -= 1;
-			e = energy( summedLuminance, lowArea );
+			for( size_t i=range.begin(); i!=range.end(); i++ )
+			{
+				const Box2i &area = m_areas[i];
+				float totalEnergy = 0.0f;
+				V2f position( 0.0f );
+				for( int y=area.min.y; y<=area.max.y; y++ )
+				{
+					for( int x=area.min.x; x<=area.max.x; x++ )
+					{
+						float e = m_luminance[x][y];
+						position += V2f( x, y ) * e;
+						totalEnergy += e;
+					}
+				}
+
+				position /= totalEnergy;
+				m_centroids[i] = position;
+			}
 		}
-		Box2i highArea = area;
-		highArea.min[cutAxis] = lowArea.max[cutAxis] + 1;
-		medianCut( luminance, summedLuminance, projection, lowArea, areas, centroids, depth + 1, maxDepth );
-		medianCut( luminance, summedLuminance, projection, highArea, areas, centroids, depth + 1, maxDepth );
-	}
-}
 
+	private :
+
+		const Array2D &m_luminance;
+		const vector<Box2i> &m_areas;
+		vector<V2f> &m_centroids;
+
+};
+
+} // namespace
 
 ObjectPtr MedianCutSampler::doOperation( const CompoundObject * operands )
 {
-	ImagePrimitivePtr image = static_cast<ImagePrimitive *>( imageParameter()->getValue() )->copy();
+	const ImagePrimitive *image = static_cast<const ImagePrimitive *>( imageParameter()->getValue() );
 	Box2i dataWindow = image->getDataWindow();
 
 	// find the right channel
 	const std::string &channelName = m_channelNameParameter->getTypedValue();
-	FloatVectorDataPtr luminance = image->getChannel<float>( channelName );
-	if( !luminance )
+	const FloatVectorData *channel = image->getChannel<float>( channelName );
+	if( !channel )
 	{
 		throw Exception( str( format( "No FloatVectorData channel named \"%s\"." ) % channelName ) );
 	}
 
-	// if the projection requires it, weight the luminances so they're less
-	// important towards the poles of the sphere
+	// get the weighted luminance and summed area table from the cache, so that
+	// sampling the same image repeatedly with different depths doesn't recompute them.
 	Projection projection = (Projection)m_projectionParameter->getNumericValue();
-	if( projection==LatLong )
-	{
-		float radiansPerPixel = M_PI / (dataWindow.size().y + 1);
-		float angle = ( M_PI - radiansPerPixel ) / 2.0f;
-
-		float *p = &(luminance->writable()[0]);
-
-		for( int y=dataWindow.min.y; y<=dataWindow.max.y; y++ )
-		{
-			float *pEnd = p + dataWindow.size().x + 1;
-			float w = cosf( angle );
-			while( p < pEnd )
-			{
-				*p *= w;
-				p++;
-			}
-			angle -= radiansPerPixel;
-		}
-
-	}
-
-	// make a summed area table for speed
-	FloatVectorDataPtr summedLuminance = luminance;
-	luminance = luminance->copy(); // we need this for the centroid computation
-
-	SummedAreaOpPtr summedAreaOp = new SummedAreaOp();
-	summedAreaOp->inputParameter()->setValue( image );
-	summedAreaOp->copyParameter()->setTypedValue( false );
-	summedAreaOp->channelNamesParameter()->getTypedValue().clear();
-	summedAreaOp->channelNamesParameter()->getTypedValue().push_back( "Y" );
-	summedAreaOp->operate();
+	MurmurHash hash;
+	channel->hash( hash );
+	hash.append( dataWindow );
+	hash.append( (int)projection );
+	ConstSummedAreaTablePtr table = cache().get( SummedAreaTableKey( hash, channel, dataWindow, projection ) );
 
 	// do the median cut thing
 	CompoundObjectPtr result = new CompoundObject;
@@ -269,10 +448,23 @@ ObjectPtr MedianCutSampler::doOperation( const CompoundObject * operands )
 
 	dataWindow.max -= dataWindow.min;
 	dataWindow.min -= dataWindow.min; // let's start indexing from 0 shall we?
-	Array2D array( &(luminance->writable()[0]), extents[dataWindow.size().x+1][dataWindow.size().y+1], fortran_storage_order() );
-	Array2D summedArray( &(summedLuminance->writable()[0]), extents[dataWindow.size().x+1][dataWindow.size().y+1], fortran_storage_order() );
-	medianCut( array, summedArray, projection, dataWindow, areas->writable(), centroids->writable(), 0, subdivisionDepthParameter()->getNumericValue() );
+	Array2D array( &(table->luminance->readable()[0]), extents[dataWindow.size().x+1][dataWindow.size().y+1], fortran_storage_order() );
+	Array2D summedArray( &(table->summedLuminance->readable()[0]), extents[dataWindow.size().x+1][dataWindow.size().y+1], fortran_storage_order() );
+
+	// the areas at each depth can be cut independently of one another, so we
+	// proceed breadth first, cutting all the areas at each depth in parallel.
+	vector<Box2i> &resultAreas = areas->writable();
+	resultAreas.push_back( dataWindow );
+	const int maxDepth = subdivisionDepthParameter()->getNumericValue();
+	for( int depth = 0; depth < maxDepth; depth++ )
+	{
+		vector<Box2i> cutAreas( resultAreas.size() * 2 );
+		tbb::parallel_for( tbb::blocked_range<size_t>( 0, resultAreas.size() ), MedianCut( summedArray, projection, resultAreas, cutAreas ) );
+		resultAreas.swap( cutAreas );
+	}
+
+	centroids->writable().resize( resultAreas.size() );
+	tbb::parallel_for( tbb::blocked_range<size_t>( 0, resultAreas.size() ), Centroids( array, resultAreas, centroids->writable() ) );
 
 	return result;
 }
-
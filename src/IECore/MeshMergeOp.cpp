@@ -32,11 +32,13 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 #include "IECore/MeshMergeOp.h"
 #include "IECore/CompoundParameter.h"
-#include "IECore/NullObject.h"
-#include "IECore/DespatchTypedData.h"
-#include "IECore/TypeTraits.h"
+#include "IECore/ObjectVector.h"
+#include "IECore/private/PrimitiveMerge.h"
 
 #include <algorithm>
 
@@ -53,6 +55,14 @@ MeshMergeOp::MeshMergeOp()
 		"The mesh to be merged with the input.",
 		new MeshPrimitive
 	);
+
+	m_meshListParameter = new ObjectVectorParameter(
+		"meshList",
+		"A list of further meshes to be merged with the input, after the mesh parameter. "
+		"Merging many meshes at once is much faster than merging them one at a time, as the "
+		"result is allocated only once.",
+		new ObjectVector
+	);
 	
 	m_removePrimVarsParameter = new BoolParameter(
 		"removeNonMatchingPrimVars",
@@ -61,6 +71,7 @@ MeshMergeOp::MeshMergeOp()
 	);
 	
 	parameters()->addParameter( m_meshParameter );
+	parameters()->addParameter( m_meshListParameter );
 	parameters()->addParameter( m_removePrimVarsParameter );
 }
 
@@ -78,176 +89,111 @@ const MeshPrimitiveParameter * MeshMergeOp::meshParameter() const
 	return m_meshParameter;
 }
 
-template<class T>
-struct MeshMergeOp::DefaultValue
-{
-	T operator()()
-	{
-		return T();
-	}
-};
-
-template<class T>
-struct MeshMergeOp::DefaultValue<Imath::Vec3<T> >
+ObjectVectorParameter * MeshMergeOp::meshListParameter()
 {
-	Imath::Vec3<T> operator()()
-	{
-		return Imath::Vec3<T>( 0 );
-	}
-};
+	return m_meshListParameter;
+}
 
-template<class T>
-struct MeshMergeOp::DefaultValue<Imath::Vec2<T> >
+const ObjectVectorParameter * MeshMergeOp::meshListParameter() const
 {
-	Imath::Vec2<T> operator()()
-	{
-		return Imath::Vec2<T>( 0 );
-	}
-};
+	return m_meshListParameter;
+}
 
-struct MeshMergeOp::AppendPrimVars
+struct MeshMergeOp::MergeTopology
 {
-	typedef void ReturnType;
+	public :
 
-	AppendPrimVars( MeshPrimitive *mesh, const MeshPrimitive *mesh2, const std::string &name, const PrimitiveVariable::Interpolation interpolation, const bool remove, std::set<DataPtr> &visitedData )
-		:	m_mesh( mesh ), m_mesh2( mesh2 ), m_name( name ), m_interpolation( interpolation ), m_remove( remove ), m_visitedData( visitedData )
-	{
-	}
-
-	template<typename T>
-	ReturnType operator()( typename T::Ptr data )
-	{
-		if ( m_visitedData.find( data ) != m_visitedData.end() )
+		MergeTopology( const vector<const MeshPrimitive *> &meshes, const vector<size_t> &faceOffsets, const vector<size_t> &vertexIdOffsets, const vector<int> &vertexOffsets, vector<int> &verticesPerFace, vector<int> &vertexIds )
+			:	m_meshes( meshes ), m_faceOffsets( faceOffsets ), m_vertexIdOffsets( vertexIdOffsets ), m_vertexOffsets( vertexOffsets ), m_verticesPerFace( verticesPerFace ), m_vertexIds( vertexIds )
 		{
-			return;
 		}
 
-		const T *data2 = m_mesh2->variableData<T>( m_name, m_interpolation );
-		if ( data2 )
-		{
-			data->writable().insert( data->writable().end(), data2->readable().begin(), data2->readable().end() );
-		}
-		else if ( m_remove )
-		{
-			m_mesh->variables.erase( m_name );
-		}
-		else
+		void operator()( const tbb::blocked_range<size_t> &range ) const
 		{
-			typedef typename T::ValueType::value_type ValueType;
- 			ValueType defaultValue = DefaultValue<ValueType>()();
- 			size_t size = m_mesh2->variableSize( m_interpolation );
-			
- 			data->writable().insert( data->writable().end(), size, defaultValue );
+			for( size_t i=range.begin(); i!=range.end(); ++i )
+			{
+				const vector<int> &verticesPerFace = m_meshes[i]->verticesPerFace()->readable();
+				const vector<int> &vertexIds = m_meshes[i]->vertexIds()->readable();
+				copy( verticesPerFace.begin(), verticesPerFace.end(), m_verticesPerFace.begin() + m_faceOffsets[i] );
+				transform( vertexIds.begin(), vertexIds.end(), m_vertexIds.begin() + m_vertexIdOffsets[i], bind2nd( plus<int>(), m_vertexOffsets[i] ) );
+			}
 		}
-		
-		m_visitedData.insert( data );
-	}
 
 	private :
 
-		MeshPrimitive *m_mesh;
-		const MeshPrimitive *m_mesh2;
-		const std::string m_name;
-		const PrimitiveVariable::Interpolation m_interpolation;
-		const bool m_remove;
-		std::set<DataPtr> &m_visitedData;
+		const vector<const MeshPrimitive *> &m_meshes;
+		const vector<size_t> &m_faceOffsets;
+		const vector<size_t> &m_vertexIdOffsets;
+		const vector<int> &m_vertexOffsets;
+		vector<int> &m_verticesPerFace;
+		vector<int> &m_vertexIds;
 
 };
 
-struct MeshMergeOp::PrependPrimVars
+void MeshMergeOp::modifyTypedPrimitive( MeshPrimitive * mesh, const CompoundObject * operands )
 {
-	typedef void ReturnType;
-	
-	PrependPrimVars( MeshPrimitive *mesh, const std::string &name, const PrimitiveVariable::Interpolation interpolation, const bool remove, std::map<ConstDataPtr, DataPtr> &visitedData )
-		:	m_mesh( mesh ), m_name( name ), m_interpolation( interpolation ), m_remove( remove ), m_visitedData( visitedData )
+	// gather all the meshes to be merged. empty meshes are skipped so
+	// that they don't affect the primitive variables of the result.
+	vector<const MeshPrimitive *> meshes;
+	meshes.push_back( mesh );
+
+	const MeshPrimitive *mesh2 = static_cast<const MeshPrimitive *>( m_meshParameter->getValue() );
+	if( mesh2->numFaces() )
 	{
+		meshes.push_back( mesh2 );
 	}
-	
-	template<typename T>
-	ReturnType operator()( typename T::ConstPtr data )
+
+	const ObjectVector::MemberContainer &meshList = static_cast<const ObjectVector *>( m_meshListParameter->getValue() )->members();
+	for( ObjectVector::MemberContainer::const_iterator it = meshList.begin(); it != meshList.end(); ++it )
 	{
-		PrimitiveVariableMap::iterator it = m_mesh->variables.find( m_name );
-		if ( it == m_mesh->variables.end() && !m_remove )
+		const MeshPrimitive *m = runTimeCast<const MeshPrimitive>( it->get() );
+		if( !m )
 		{
-			typename T::Ptr data2 = 0;
-
-			std::map<ConstDataPtr, DataPtr>::iterator dataIt = m_visitedData.find( data );
-			if ( dataIt != m_visitedData.end() )
-			{
-				data2 = runTimeCast<T>( dataIt->second );
-			}
-			
-			if ( !data2 )
-			{
-				typedef typename T::ValueType::value_type ValueType;
-				ValueType defaultValue = DefaultValue<ValueType>()();
-				size_t size = m_mesh->variableSize( m_interpolation ) - data->readable().size();
-				
-				data2 = new T();
-				data2->writable().insert( data2->writable().end(), size, defaultValue );
-				data2->writable().insert( data2->writable().end(), data->readable().begin(), data->readable().end() );
-			}
-			
-			m_mesh->variables[m_name] = PrimitiveVariable( m_interpolation, data2 );
-			
-			m_visitedData[data] = data2;
+			throw InvalidArgumentException( "MeshMergeOp : meshList parameter must contain only MeshPrimitives." );
+		}
+		if( m->numFaces() )
+		{
+			meshes.push_back( m );
 		}
 	}
-	
-	private :
 
-		MeshPrimitive *m_mesh;
-		const std::string m_name;
-		const PrimitiveVariable::Interpolation m_interpolation;
-		const bool m_remove;
-		std::map<ConstDataPtr, DataPtr> &m_visitedData;
+	if( meshes.size() == 1 )
+	{
+		return;
+	}
 
-};
+	// compute the size of the merged topology
 
-void MeshMergeOp::modifyTypedPrimitive( MeshPrimitive * mesh, const CompoundObject * operands )
-{
-	const MeshPrimitive *mesh2 = static_cast<const MeshPrimitive *>( m_meshParameter->getValue() );
+	vector<size_t> faceOffsets( 1, 0 );
+	vector<size_t> vertexIdOffsets( 1, 0 );
+	vector<int> vertexOffsets( 1, 0 );
+	for( vector<const MeshPrimitive *>::const_iterator it = meshes.begin(); it != meshes.end(); ++it )
+	{
+		faceOffsets.push_back( faceOffsets.back() + (*it)->verticesPerFace()->readable().size() );
+		vertexIdOffsets.push_back( vertexIdOffsets.back() + (*it)->vertexIds()->readable().size() );
+		vertexOffsets.push_back( vertexOffsets.back() + (*it)->variableSize( PrimitiveVariable::Vertex ) );
+	}
 
-	const vector<int> &verticesPerFace1 = mesh->verticesPerFace()->readable();
-	const vector<int> &vertexIds1 = mesh->vertexIds()->readable();
+	// merge the primitive variables, before the topology is changed
 
-	const vector<int> &verticesPerFace2 = mesh2->verticesPerFace()->readable();
-	const vector<int> &vertexIds2 = mesh2->vertexIds()->readable();
+	PrimitiveVariableMap variables;
+	Detail::mergePrimitiveVariables( vector<const Primitive *>( meshes.begin(), meshes.end() ), m_removePrimVarsParameter->getTypedValue(), variables );
+
+	// merge the topology
 
 	IntVectorDataPtr verticesPerFaceData = new IntVectorData;
 	vector<int> &verticesPerFace = verticesPerFaceData->writable();
-	verticesPerFace.resize( verticesPerFace1.size() + verticesPerFace2.size() );
-	vector<int>::iterator it = copy( verticesPerFace1.begin(), verticesPerFace1.end(), verticesPerFace.begin() );
-	copy( verticesPerFace2.begin(), verticesPerFace2.end(), it );
+	verticesPerFace.resize( faceOffsets.back() );
 
 	IntVectorDataPtr vertexIdsData = new IntVectorData;
 	vector<int> &vertexIds = vertexIdsData->writable();
-	vertexIds.resize( vertexIds1.size() + vertexIds2.size() );
-	it = copy( vertexIds1.begin(), vertexIds1.end(), vertexIds.begin() );
-	int vertexIdOffset = mesh->variableSize( PrimitiveVariable::Vertex );
-	transform( vertexIds2.begin(), vertexIds2.end(), it, bind2nd( plus<int>(), vertexIdOffset ) );
+	vertexIds.resize( vertexIdOffsets.back() );
+
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, meshes.size() ),
+		MergeTopology( meshes, faceOffsets, vertexIdOffsets, vertexOffsets, verticesPerFace, vertexIds )
+	);
 
 	mesh->setTopology( verticesPerFaceData, vertexIdsData, mesh->interpolation() );
-	
-	std::set<DataPtr> visitedData;
-	PrimitiveVariableMap::iterator pvIt;
-	for( pvIt=mesh->variables.begin(); pvIt!=mesh->variables.end(); pvIt++ )
-	{
-		if( pvIt->second.interpolation!=PrimitiveVariable::Constant )
-		{
-			AppendPrimVars f( mesh, mesh2, pvIt->first, pvIt->second.interpolation, m_removePrimVarsParameter->getTypedValue(), visitedData );
-			despatchTypedData<AppendPrimVars, TypeTraits::IsVectorTypedData, DespatchTypedDataIgnoreError>( pvIt->second.data, f );
-		}
-	}
-	
-	std::map<ConstDataPtr, DataPtr> visitedData2;
-	PrimitiveVariableMap::const_iterator pvIt2;
-	for ( pvIt2=mesh2->variables.begin(); pvIt2 != mesh2->variables.end(); pvIt2++ )
-	{
-		if ( pvIt2->second.interpolation != PrimitiveVariable::Constant )
-		{
-			PrependPrimVars f( mesh, pvIt2->first, pvIt2->second.interpolation, m_removePrimVarsParameter->getTypedValue(), visitedData2 );
-			despatchTypedData<PrependPrimVars, TypeTraits::IsVectorTypedData, DespatchTypedDataIgnoreError>( pvIt2->second.data, f );
-		}
-	}
+	mesh->variables.swap( variables );
 }
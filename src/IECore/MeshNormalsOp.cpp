@@ -38,6 +38,9 @@
 
 #include "boost/format.hpp"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 using namespace IECore;
 using namespace std;
 
@@ -87,6 +90,82 @@ const StringParameter * MeshNormalsOp::nPrimVarNameParameter() const
 	return parameters()->parameter<StringParameter>( "nPrimVarName" );
 }
 
+namespace
+{
+
+// Calculates the normal of each face from its first three vertices.
+template<typename Vec>
+class FaceNormals
+{
+	public :
+
+		FaceNormals( const vector<Vec> &points, const vector<int> &vertIds, const vector<int> &faceOffsets, vector<Vec> &faceNormals )
+			:	m_points( points ), m_vertIds( vertIds ), m_faceOffsets( faceOffsets ), m_faceNormals( faceNormals )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
+		{
+			for( size_t f=range.begin(); f!=range.end(); ++f )
+			{
+				const int *vertId = &(m_vertIds[m_faceOffsets[f]]);
+				const Vec &p0 = m_points[*vertId];
+				const Vec &p1 = m_points[*(vertId+1)];
+				const Vec &p2 = m_points[*(vertId+2)];
+
+				Vec normal = (p2-p1).cross(p0-p1);
+				normal.normalize();
+				m_faceNormals[f] = normal;
+			}
+		}
+
+	private :
+
+		const vector<Vec> &m_points;
+		const vector<int> &m_vertIds;
+		const vector<int> &m_faceOffsets;
+		vector<Vec> &m_faceNormals;
+
+};
+
+// Gathers the normals of all the faces using each vertex. Because the faces
+// for each vertex are visited in the same order as a serial accumulation would
+// visit them, the result is independent of the number of threads used.
+template<typename Vec>
+class VertexNormals
+{
+	public :
+
+		VertexNormals( const vector<Vec> &faceNormals, const vector<int> &vertexFaceOffsets, const vector<int> &vertexFaces, vector<Vec> &normals )
+			:	m_faceNormals( faceNormals ), m_vertexFaceOffsets( vertexFaceOffsets ), m_vertexFaces( vertexFaces ), m_normals( normals )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
+		{
+			for( size_t v=range.begin(); v!=range.end(); ++v )
+			{
+				Vec normal( 0 );
+				for( int i=m_vertexFaceOffsets[v]; i<m_vertexFaceOffsets[v+1]; ++i )
+				{
+					normal += m_faceNormals[m_vertexFaces[i]];
+				}
+				normal.normalize();
+				m_normals[v] = normal;
+			}
+		}
+
+	private :
+
+		const vector<Vec> &m_faceNormals;
+		const vector<int> &m_vertexFaceOffsets;
+		const vector<int> &m_vertexFaces;
+		vector<Vec> &m_normals;
+
+};
+
+} // namespace
+
 struct MeshNormalsOp::CalculateNormals
 {
 	typedef DataPtr ReturnType;
@@ -105,36 +184,52 @@ struct MeshNormalsOp::CalculateNormals
 		const typename T::ValueType &points = data->readable();
 		const vector<int> &vertsPerFace = m_vertsPerFace->readable();
 		const vector<int> &vertIds = m_vertIds->readable();
+		const size_t numFaces = vertsPerFace.size();
 
 		typename T::Ptr normalsData = new T;
 		normalsData->setInterpretation( GeometricData::Normal );
 		VecContainer &normals = normalsData->writable();
 		normals.resize( points.size(), Vec( 0 ) );
 
-		// for each face, calculate its normal, and accumulate that normal onto
-		// the normal for each of its vertices.
-		const int *vertId = &(vertIds[0]);
-		for( vector<int>::const_iterator it = vertsPerFace.begin(); it!=vertsPerFace.end(); it++ )
+		// find the first face-vertex of each face, and count the
+		// number of face-vertices referencing each vertex.
+		vector<int> faceOffsets( numFaces );
+		vector<int> vertexFaceOffsets( points.size() + 1, 0 );
+		int offset = 0;
+		for( size_t f=0; f<numFaces; ++f )
 		{
-			const Vec &p0 = points[*vertId];
-			const Vec &p1 = points[*(vertId+1)];
-			const Vec &p2 = points[*(vertId+2)];
-
-			Vec normal = (p2-p1).cross(p0-p1);
-			normal.normalize();
-			for( int i=0; i<*it; i++ )
+			faceOffsets[f] = offset;
+			for( int i=0; i<vertsPerFace[f]; ++i )
 			{
-				normals[*vertId] += normal;
-				vertId++;
+				vertexFaceOffsets[vertIds[offset+i]+1]++;
 			}
+			offset += vertsPerFace[f];
+		}
+
+		// calculate the normal for each face
+		VecContainer faceNormals( numFaces );
+		tbb::parallel_for( tbb::blocked_range<size_t>( 0, numFaces ), FaceNormals<Vec>( points, vertIds, faceOffsets, faceNormals ) );
+
+		// build a table of the faces using each vertex, in face order
+		for( size_t v=1; v<vertexFaceOffsets.size(); ++v )
+		{
+			vertexFaceOffsets[v] += vertexFaceOffsets[v-1];
 		}
 
-		// normalize each of the vertex normals
-		for( typename VecContainer::iterator it=normals.begin(); it!=normals.end(); it++ )
+		vector<int> vertexFaces( vertIds.size() );
+		vector<int> insertPositions( vertexFaceOffsets.begin(), vertexFaceOffsets.end() - 1 );
+		for( size_t f=0; f<numFaces; ++f )
 		{
-			it->normalize();
+			const int *vertId = &(vertIds[faceOffsets[f]]);
+			for( int i=0; i<vertsPerFace[f]; ++i )
+			{
+				vertexFaces[insertPositions[vertId[i]]++] = f;
+			}
 		}
 
+		// and accumulate the face normals onto each vertex, normalizing the result
+		tbb::parallel_for( tbb::blocked_range<size_t>( 0, points.size() ), VertexNormals<Vec>( faceNormals, vertexFaceOffsets, vertexFaces, normals ) );
+
 		return normalsData;
 	}
 
@@ -35,7 +35,6 @@
 #include "IECore/MeshPrimitiveBuilder.h"
 #include "IECore/MeshPrimitiveImplicitSurfaceOp.h"
 #include "IECore/MeshPrimitiveImplicitSurfaceFunction.h"
-#include "IECore/CachedImplicitSurfaceFunction.h"
 #include "IECore/MarchingCubes.h"
 #include "IECore/ObjectParameter.h"
 #include "IECore/CompoundParameter.h"
@@ -267,28 +266,17 @@ void MeshPrimitiveImplicitSurfaceOp::modifyTypedPrimitive( MeshPrimitive * typed
 	resolution.y = std::max( 1, resolution.y );
 	resolution.z = std::max( 1, resolution.z );
 
-	/// Calculate a tolerance which is half the size of the smallest grid division
-	double cacheTolerance = ((bound.max.x - bound.min.x) / (double)resolution.x) / 2.0;
-	cacheTolerance = std::min(cacheTolerance, ((bound.max.y - bound.min.y) / (double)resolution.y) / 2.0 );
-	cacheTolerance = std::min(cacheTolerance, ((bound.max.z - bound.min.z) / (double)resolution.z) / 2.0 );
-
 	MeshPrimitiveBuilderPtr builder = new MeshPrimitiveBuilder();
 
-	typedef MarchingCubes< CachedImplicitSurfaceFunction< V3f, float > > Marcher ;
+	/// MarchingCubes evaluates each grid point only once, so there's no need to cache the function values,
+	/// and the mesh evaluator is safe to query from several threads at once.
+	typedef MarchingCubes< MeshPrimitiveImplicitSurfaceFunction > Marcher ;
 
 	MeshPrimitiveImplicitSurfaceFunctionPtr fn = new MeshPrimitiveImplicitSurfaceFunction( typedPrimitive );
 
-	Marcher::Ptr m = new Marcher
-	(
-		new CachedImplicitSurfaceFunction< V3f, float >(
-			fn,
-			cacheTolerance
-		),
-
-		builder
-	);
+	Marcher::Ptr m = new Marcher( fn, builder );
 
-	m->march( Box3f( bound.min, bound.max ), resolution, threshold );
+	m->march( Box3f( bound.min, bound.max ), resolution, threshold, true );
 	MeshPrimitivePtr resultMesh = builder->mesh();
 	typedPrimitive->variables.clear();
 
@@ -37,6 +37,9 @@
 
 #include "boost/format.hpp"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 #include "IECore/DataCastOp.h"
 #include "IECore/Convert.h"
 #include "IECore/MeshTangentsOp.h"
@@ -181,6 +184,172 @@ const StringParameter * MeshTangentsOp::vTangentPrimVarNameParameter() const
 	return m_vTangentPrimVarNameParameter;
 }
 
+namespace
+{
+
+// Calculates the tangent, bitangent and normal of each triangle.
+template<typename Vec>
+class FaceTangents
+{
+	public :
+
+		FaceTangents( const vector<Vec> &points, const vector<int> &vertIds, const vector<float> &u, const vector<float> &v, vector<Vec> &tangents, vector<Vec> &bitangents, vector<Vec> &normals )
+			:	m_points( points ), m_vertIds( vertIds ), m_u( u ), m_v( v ), m_tangents( tangents ), m_bitangents( bitangents ), m_normals( normals )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
+		{
+			for( size_t faceIndex=range.begin(); faceIndex!=range.end(); ++faceIndex )
+			{
+				// indices into the facevarying data for this face
+				size_t fvi0 = faceIndex * 3;
+				size_t fvi1 = fvi0 + 1;
+				size_t fvi2 = fvi1 + 1;
+				assert( fvi2 < m_vertIds.size() );
+				assert( fvi2 < m_u.size() );
+				assert( fvi2 < m_v.size() );
+
+				// positions for each vertex of this face
+				const Vec &p0 = m_points[ m_vertIds[ fvi0 ] ];
+				const Vec &p1 = m_points[ m_vertIds[ fvi1 ] ];
+				const Vec &p2 = m_points[ m_vertIds[ fvi2 ] ];
+
+				// uv coordinates for each vertex of this face
+				const Imath::V2f uv0( m_u[ fvi0 ], m_v[ fvi0 ] );
+				const Imath::V2f uv1( m_u[ fvi1 ], m_v[ fvi1 ] );
+				const Imath::V2f uv2( m_u[ fvi2 ], m_v[ fvi2 ] );
+
+				// compute tangents and normal for this face
+				const Vec e0 = p1 - p0;
+				const Vec e1 = p2 - p0;
+
+				const Imath::V2f e0uv = uv1 - uv0;
+				const Imath::V2f e1uv = uv2 - uv0;
+
+				m_tangents[faceIndex] = ( e0 * -e1uv.y + e1 * e0uv.y ).normalized();
+				m_bitangents[faceIndex] = ( e0 * -e1uv.x + e1 * e0uv.x ).normalized();
+
+				Vec normal = (p2-p1).cross(p0-p1);
+				normal.normalize();
+				m_normals[faceIndex] = normal;
+			}
+		}
+
+	private :
+
+		const vector<Vec> &m_points;
+		const vector<int> &m_vertIds;
+		const vector<float> &m_u;
+		const vector<float> &m_v;
+		vector<Vec> &m_tangents;
+		vector<Vec> &m_bitangents;
+		vector<Vec> &m_normals;
+
+};
+
+// Accumulates the face tangents onto each unique uv, and then normalizes and
+// orthogonalizes the results. The faces are gathered in face order so that the
+// result doesn't depend on the number of threads used.
+template<typename Vec>
+class UVTangents
+{
+	public :
+
+		UVTangents( const vector<Vec> &faceTangents, const vector<Vec> &faceBitangents, const vector<Vec> &faceNormals, const vector<int> &uvFaceOffsets, const vector<int> &uvFaces, bool orthoTangents, vector<Vec> &uTangents, vector<Vec> &vTangents )
+			:	m_faceTangents( faceTangents ), m_faceBitangents( faceBitangents ), m_faceNormals( faceNormals ), m_uvFaceOffsets( uvFaceOffsets ), m_uvFaces( uvFaces ), m_orthoTangents( orthoTangents ), m_uTangents( uTangents ), m_vTangents( vTangents )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
+		{
+			for( size_t i=range.begin(); i!=range.end(); ++i )
+			{
+				Vec uTangent( 0 );
+				Vec vTangent( 0 );
+				Vec normal( 0 );
+				for( int j=m_uvFaceOffsets[i]; j<m_uvFaceOffsets[i+1]; ++j )
+				{
+					const int f = m_uvFaces[j];
+					uTangent += m_faceTangents[f];
+					vTangent += m_faceBitangents[f];
+					normal += m_faceNormals[f];
+				}
+
+				normal.normalize();
+
+				uTangent.normalize();
+				vTangent.normalize();
+
+				// Make uTangent/vTangent orthogonal to normal
+				uTangent -= normal * uTangent.dot( normal );
+				vTangent -= normal * vTangent.dot( normal );
+
+				uTangent.normalize();
+				vTangent.normalize();
+
+				if ( m_orthoTangents )
+				{
+					vTangent -= uTangent * vTangent.dot( uTangent );
+					vTangent.normalize();
+				}
+
+				// make things less sinister
+				if( uTangent.cross( vTangent ).dot( normal ) < 0.0f )
+				{
+					uTangent *= -1.0f;
+				}
+
+				m_uTangents[i] = uTangent;
+				m_vTangents[i] = vTangent;
+			}
+		}
+
+	private :
+
+		const vector<Vec> &m_faceTangents;
+		const vector<Vec> &m_faceBitangents;
+		const vector<Vec> &m_faceNormals;
+		const vector<int> &m_uvFaceOffsets;
+		const vector<int> &m_uvFaces;
+		bool m_orthoTangents;
+		vector<Vec> &m_uTangents;
+		vector<Vec> &m_vTangents;
+
+};
+
+// Shuffles the per-uv tangents back into facevarying data.
+template<typename Vec>
+class FaceVaryingTangents
+{
+	public :
+
+		FaceVaryingTangents( const vector<Vec> &uTangents, const vector<Vec> &vTangents, const vector<int> &uvIds, vector<Vec> &fvUTangents, vector<Vec> &fvVTangents )
+			:	m_uTangents( uTangents ), m_vTangents( vTangents ), m_uvIds( uvIds ), m_fvUTangents( fvUTangents ), m_fvVTangents( fvVTangents )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
+		{
+			for( size_t i=range.begin(); i!=range.end(); ++i )
+			{
+				m_fvUTangents[i] = m_uTangents[m_uvIds[i]];
+				m_fvVTangents[i] = m_vTangents[m_uvIds[i]];
+			}
+		}
+
+	private :
+
+		const vector<Vec> &m_uTangents;
+		const vector<Vec> &m_vTangents;
+		const vector<int> &m_uvIds;
+		vector<Vec> &m_fvUTangents;
+		vector<Vec> &m_fvVTangents;
+
+};
+
+} // namespace
+
 struct MeshTangentsOp::CalculateTangents
 {
 	typedef void ReturnType;
@@ -198,7 +367,8 @@ struct MeshTangentsOp::CalculateTangents
 		typedef typename VecContainer::value_type Vec;
 
 		const VecContainer &points = data->readable();
-		
+		const size_t numFaces = m_vertsPerFace.size();
+
 		// the uvIndices array is indexed as with any other facevarying data. the values in the
 		// array specify the connectivity of the uvs - where two facevertices have the same index
 		// they are known to be sharing a uv. for each one of these unique indices we compute
@@ -206,113 +376,63 @@ struct MeshTangentsOp::CalculateTangents
 		// that reference them. we then take this data and shuffle it back into facevarying
 		// primvars for the mesh.
 		int numUniqueTangents = 1 + *max_element( m_uvIds.begin(), m_uvIds.end() );
-		
-		VecContainer uTangents( numUniqueTangents, Vec( 0 ) );
-		VecContainer vTangents( numUniqueTangents, Vec( 0 ) );
-		VecContainer normals( numUniqueTangents, Vec( 0 ) );
-		
-		for( size_t faceIndex = 0; faceIndex < m_vertsPerFace.size() ; faceIndex++ )
+
+		// compute the tangents and normal for each face
+		VecContainer faceTangents( numFaces );
+		VecContainer faceBitangents( numFaces );
+		VecContainer faceNormals( numFaces );
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, numFaces ),
+			FaceTangents<Vec>( points, m_vertIds, m_u, m_v, faceTangents, faceBitangents, faceNormals )
+		);
+
+		// build a table of the faces referencing each unique uv, in face order
+		vector<int> uvFaceOffsets( numUniqueTangents + 1, 0 );
+		for( vector<int>::const_iterator it = m_uvIds.begin(); it != m_uvIds.end(); ++it )
 		{
-			
-			assert( m_vertsPerFace[faceIndex] == 3 );
-
-			// indices into the facevarying data for this face 
-			size_t fvi0 = faceIndex * 3;
-			size_t fvi1 = fvi0 + 1;
-			size_t fvi2 = fvi1 + 1;
-			assert( fvi2 < m_vertIds.size() );
-			assert( fvi2 < m_u.size() );
-			assert( fvi2 < m_v.size() );
-			
-			// positions for each vertex of this face
-			const Vec &p0 = points[ m_vertIds[ fvi0 ] ];
-			const Vec &p1 = points[ m_vertIds[ fvi1 ] ];
-			const Vec &p2 = points[ m_vertIds[ fvi2 ] ];
-
-			// uv coordinates for each vertex of this face
-			const Imath::V2f uv0( m_u[ fvi0 ], m_v[ fvi0 ] );
-			const Imath::V2f uv1( m_u[ fvi1 ], m_v[ fvi1 ] );
-			const Imath::V2f uv2( m_u[ fvi2 ], m_v[ fvi2 ] );
-
-			// compute tangents and normal for this face
-			const Vec e0 = p1 - p0;
-			const Vec e1 = p2 - p0;
-
-			const Imath::V2f e0uv = uv1 - uv0;
-			const Imath::V2f e1uv = uv2 - uv0;
-
-			Vec tangent   = ( e0 * -e1uv.y + e1 * e0uv.y ).normalized();
-			Vec bitangent = ( e0 * -e1uv.x + e1 * e0uv.x ).normalized();
-
-			Vec normal = (p2-p1).cross(p0-p1);
-			normal.normalize();
-
-			// and accumlate them into the computation so far
-			uTangents[ m_uvIds[fvi0] ] += tangent;
-			uTangents[ m_uvIds[fvi1] ] += tangent;
-			uTangents[ m_uvIds[fvi2] ] += tangent;
-			
-			vTangents[ m_uvIds[fvi0] ] += bitangent;
-			vTangents[ m_uvIds[fvi1] ] += bitangent;
-			vTangents[ m_uvIds[fvi2] ] += bitangent;
-			
-			normals[ m_uvIds[fvi0] ] += normal;
-			normals[ m_uvIds[fvi1] ] += normal;
-			normals[ m_uvIds[fvi2] ] += normal;
-			
+			uvFaceOffsets[*it+1]++;
 		}
-
-		// normalize and orthogonalize everything
-		for( size_t i = 0; i < uTangents.size(); i++ )
+		for( size_t i = 1; i < uvFaceOffsets.size(); i++ )
 		{
-			normals[i].normalize();
-
-			uTangents[i].normalize();
-			vTangents[i].normalize();
+			uvFaceOffsets[i] += uvFaceOffsets[i-1];
+		}
 
-			// Make uTangent/vTangent orthogonal to normal
-			uTangents[i] -= normals[i] * uTangents[i].dot( normals[i] );
-			vTangents[i] -= normals[i] * vTangents[i].dot( normals[i] );
+		vector<int> uvFaces( m_uvIds.size() );
+		vector<int> insertPositions( uvFaceOffsets.begin(), uvFaceOffsets.end() - 1 );
+		for( size_t fvi = 0; fvi < m_uvIds.size(); fvi++ )
+		{
+			uvFaces[insertPositions[m_uvIds[fvi]]++] = fvi / 3;
+		}
 
-			uTangents[i].normalize();
-			vTangents[i].normalize();
+		// accumulate, normalize and orthogonalize everything
+		VecContainer uTangents( numUniqueTangents );
+		VecContainer vTangents( numUniqueTangents );
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, numUniqueTangents ),
+			UVTangents<Vec>( faceTangents, faceBitangents, faceNormals, uvFaceOffsets, uvFaces, m_orthoTangents, uTangents, vTangents )
+		);
 
-			if ( m_orthoTangents )
-			{
-				vTangents[i] -= uTangents[i] * vTangents[i].dot( uTangents[i] );
-				vTangents[i].normalize();
-			}
-		
-			// make things less sinister
-			if( uTangents[i].cross( vTangents[i] ).dot( normals[i] ) < 0.0f )
-			{
-				uTangents[i] *= -1.0f;
-			}
-		}
-		
 		// convert the tangents back to facevarying data and add that to the mesh
 		typename T::Ptr fvUD = new T();
 		typename T::Ptr fvVD = new T();
 		fvUTangentsData = fvUD;
 		fvVTangentsData = fvVD;
-		
+
 		VecContainer &fvUTangents = fvUD->writable();
 		VecContainer &fvVTangents = fvVD->writable();
 		fvUTangents.resize( m_uvIds.size() );
 		fvVTangents.resize( m_uvIds.size() );
-		
-		for( unsigned i=0; i<m_uvIds.size(); i++ )
-		{
-			fvUTangents[i] = uTangents[m_uvIds[i]];
-			fvVTangents[i] = vTangents[m_uvIds[i]];
-		}
 
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, m_uvIds.size() ),
+			FaceVaryingTangents<Vec>( uTangents, vTangents, m_uvIds, fvUTangents, fvVTangents )
+		);
 	}
-	
+
 	// this is the data filled in by operator() above, ready to be added onto the mesh
 	DataPtr fvUTangentsData;
 	DataPtr fvVTangentsData;
-	
+
 	private :
 
 		const vector<int> &m_vertsPerFace;
@@ -321,7 +441,7 @@ struct MeshTangentsOp::CalculateTangents
 		const vector<float> &m_v;
 		const vector<int> &m_uvIds;
 		bool m_orthoTangents;
-		
+
 };
 
 struct MeshTangentsOp::HandleErrors
@@ -35,6 +35,7 @@
 #include "IECore/ModifyOp.h"
 #include "IECore/CompoundObject.h"
 #include "IECore/CompoundParameter.h"
+#include "IECore/SimpleTypedData.h"
 
 using namespace IECore;
 
@@ -98,14 +99,17 @@ const BoolParameter *ModifyOp::enableParameter() const
 
 ObjectPtr ModifyOp::doOperation( const CompoundObject *operands )
 {
-	ObjectPtr object = m_inputParameter->getValue();
-	if( m_copyParameter->getTypedValue() )
+	// We take our arguments from the operands rather than the parameters, so
+	// that operate( operands ) may be used concurrently from several threads.
+	// The const_cast is necessary as we allow modification in place.
+	ObjectPtr object = const_cast<Object *>( operands->member<Object>( m_inputParameter->name(), true ) );
+	if( operands->member<BoolData>( m_copyParameter->name(), true )->readable() )
 	{
 		object = object->copy();
 	}
-	if( m_enableParameter->getTypedValue() )
+	if( operands->member<BoolData>( m_enableParameter->name(), true )->readable() )
 	{
-		modify( object, operands );
+		modify( object.get(), operands );
 	}
 	return object;
 }
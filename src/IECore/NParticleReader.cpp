@@ -40,12 +40,12 @@
 #include "IECore/FileNameParameter.h"
 #include "IECore/CompoundParameter.h"
 #include "IECore/Timer.h"
-
-#include "OpenEXR/ImathRandom.h"
+#include "IECore/ParticleReader.inl"
 
 #include <boost/algorithm/string/predicate.hpp>
 
 #include <algorithm>
+#include <set>
 #include <fstream>
 #include <cassert>
 
@@ -246,45 +246,22 @@ const IntVectorData * NParticleReader::frameTimes()
 	return m_frames;
 }
 
-template<typename T, typename F>
-typename T::Ptr NParticleReader::filterAttr( const F *attr, float percentage )
+DataPtr NParticleReader::readAttribute( const std::string &name )
 {
-	if( percentage < 100.0f )
+	CompoundDataPtr attributes = readAttributes( vector<string>( 1, name ) );
+	if( !attributes )
 	{
-		// percentage filtering (and type conversion if necessary)
-		typename T::Ptr result( new T );
-		const typename F::ValueType &in = attr->readable();
-		typename T::ValueType &out = result->writable();
-		int seed = particlePercentageSeed();
-		float fraction = percentage / 100.0f;
-		Rand48 r;
-		r.init( seed );
-		for( typename F::ValueType::size_type i=0; i<in.size(); i++ )
-		{
-			if( r.nextf() <= fraction )
-			{
-				out.push_back( in[i] );
-			}
-		}
-		return result;
+		return 0;
 	}
-
-	if( T::staticTypeId()!=F::staticTypeId() )
+	CompoundDataMap::const_iterator it = attributes->readable().find( name );
+	if( it == attributes->readable().end() )
 	{
-		// type conversion only
-		typename T::Ptr result( new T );
-		const typename F::ValueType &in = attr->readable();
-		typename T::ValueType &out = result->writable();
-		out.resize( in.size() );
-		copy( in.begin(), in.end(), out.begin() );
-		return result;
+		return 0;
 	}
-
-	// no filtering of any sort needed
-	return typename T::Ptr( (T *)attr );
+	return it->second;
 }
 
-DataPtr NParticleReader::readAttribute( const std::string &name )
+CompoundDataPtr NParticleReader::readAttributes( const std::vector<std::string> &names )
 {
 	if( !open() )
 	{
@@ -296,37 +273,48 @@ DataPtr NParticleReader::readAttribute( const std::string &name )
 	std::map<int, IFFFile::Chunk::ChunkIterator>::const_iterator frameIt = frameToRootChildren.find( frame );
 	if( frameIt == frameToRootChildren.end() )
 	{
-		msg( Msg::Warning, "NParticleReader::readAttribute()", boost::format( "Frame '%d' (index '%d') does not exist in '%s'." ) % frame % frameIndex % m_iffFileName );
+		msg( Msg::Warning, "NParticleReader::readAttributes()", boost::format( "Frame '%d' (index '%d') does not exist in '%s'." ) % frame % frameIndex % m_iffFileName );
 		return 0;
 	}
 	
-	bool foundAttr = false;
+	CompoundDataPtr result = new CompoundData;
+	
+	std::set<std::string> namesToRead( names.begin(), names.end() );
+	std::map<int, std::vector<bool> > masks;
+	
+	// a single pass through the channels in the frame, reading
+	// those which have been requested as we find them.
 	std::string channelName;
-	IFFFile::Chunk::ChunkIterator attrIt;
 	IFFFile::Chunk::ChunkIterator cache = frameIt->second;
-	IFFFile::Chunk::ChunkIterator it = cache->childrenBegin();
-	
-	for ( ; it != cache->childrenEnd(); it++ )
+	for ( IFFFile::Chunk::ChunkIterator it = cache->childrenBegin(); it != cache->childrenEnd() && namesToRead.size(); it++ )
 	{
-		if ( it->type().id() == kCHNM )
+		if ( it->type().id() != kCHNM )
 		{
-			it->read( channelName );
-			
-			if ( name.compare( channelName ) == 0 )
-			{
-				attrIt = it;
-				foundAttr = true;
-				break;
-			}
+			continue;
+		}
+		
+		it->read( channelName );
+		std::set<std::string>::iterator nameIt = namesToRead.find( channelName );
+		if( nameIt == namesToRead.end() )
+		{
+			continue;
+		}
+		namesToRead.erase( nameIt );
+		
+		DataPtr d = readAttribute( channelName, it, cache->childrenEnd(), masks );
+		if( d )
+		{
+			result->writable()[channelName] = d;
 		}
 	}
 	
-	if ( !foundAttr )
-	{
-		return 0;
-	}
-	
-	for ( it++; it < attrIt+2 && it != cache->childrenEnd(); it++ )
+	return result;
+}
+
+DataPtr NParticleReader::readAttribute( const std::string &name, IFFFile::Chunk::ChunkIterator attrIt, IFFFile::Chunk::ChunkIterator end, std::map<int, std::vector<bool> > &masks )
+{
+	IFFFile::Chunk::ChunkIterator it = attrIt;
+	for ( it++; it < attrIt+2 && it != end; it++ )
 	{
 		int id = it->type().id();
 		if ( id != kSIZE && id != kDBLA && id != kDVCA && id != kFVCA )
@@ -340,6 +328,16 @@ DataPtr NParticleReader::readAttribute( const std::string &name )
 	
 	int numParticles = 0;
 	(attrIt+1)->read( numParticles );
+
+	// channels may differ in size, so we keep a mask per size, computing
+	// each one only once for all the channels which share it.
+	std::map<int, std::vector<bool> >::iterator maskIt = masks.find( numParticles );
+	if( maskIt == masks.end() )
+	{
+		maskIt = masks.insert( std::make_pair( numParticles, std::vector<bool>() ) ).first;
+		filterMask( numParticles, 0, maskIt->second );
+	}
+	const std::vector<bool> &mask = maskIt->second;
 	
 	switch( (attrIt+2)->type().id() )
 	{
@@ -352,10 +350,10 @@ DataPtr NParticleReader::readAttribute( const std::string &name )
 				{
 					case Native :
 					case Double :
-						result = filterAttr<DoubleVectorData, DoubleVectorData>( d, particlePercentage() );
+						result = filterAttr<DoubleVectorData, DoubleVectorData>( d, mask );
 						break;
 					case Float :
-						result = filterAttr<FloatVectorData, DoubleVectorData>( d, particlePercentage() );
+						result = filterAttr<FloatVectorData, DoubleVectorData>( d, mask );
 						break;
 				}
 			}
@@ -372,10 +370,10 @@ DataPtr NParticleReader::readAttribute( const std::string &name )
 				{
 					case Native :
 					case Double :
-						result = filterAttr<V3dVectorData, V3dVectorData>( d, particlePercentage() );
+						result = filterAttr<V3dVectorData, V3dVectorData>( d, mask );
 						break;
 					case Float :
-						result = filterAttr<V3fVectorData, V3dVectorData>( d, particlePercentage() );
+						result = filterAttr<V3fVectorData, V3dVectorData>( d, mask );
 						break;
 				}
 			}
@@ -392,10 +390,10 @@ DataPtr NParticleReader::readAttribute( const std::string &name )
 				{
 					case Native :
 					case Double :
-						result = filterAttr<V3dVectorData, V3fVectorData>( d, particlePercentage() );
+						result = filterAttr<V3dVectorData, V3fVectorData>( d, mask );
 						break;
 					case Float :
-						result = filterAttr<V3fVectorData, V3fVectorData>( d, particlePercentage() );
+						result = filterAttr<V3fVectorData, V3fVectorData>( d, mask );
 						break;
 				}
 			}
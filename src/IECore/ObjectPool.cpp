@@ -32,9 +32,17 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
+
+#include "tbb/mutex.h"
+
 #include "boost/lexical_cast.hpp"
+#include "boost/bind.hpp"
+
 #include "IECore/LRUCache.h"
 #include "IECore/ObjectPool.h"
+#include "IECore/DiskObjectCache.h"
+#include "IECore/MessageHandler.h"
 
 using namespace IECore;
 
@@ -45,18 +53,72 @@ using namespace IECore;
 struct ObjectPool::MemberData
 {
 
-	MemberData( size_t maxMemory ) : cache( getter, maxMemory )
+	MemberData( size_t maxMemory ) : cache( getter, boost::bind( &MemberData::removed, this, _1, _2 ), maxMemory )
 	{
 	}
 
 	LRUCache< MurmurHash, ConstObjectPtr > cache;
 
+	DiskObjectCachePtr diskCache;
+
+	// Objects discarded from the cache, waiting to be written to the diskCache.
+	// The removal callback is called while the LRUCache is locked, so we defer
+	// the writing to flushRemoved(), to avoid blocking other threads.
+	typedef std::vector<std::pair<MurmurHash, ConstObjectPtr> > RemovedObjects;
+	RemovedObjects removedObjects;
+	tbb::mutex removedObjectsMutex;
+
 	/// our getter always returns NULL
 	static ConstObjectPtr getter( const MurmurHash &h, size_t &cost )
 	{
 		cost = 0;
 		return NULL;
 	}
+
+	void removed( const MurmurHash &h, const ConstObjectPtr &object )
+	{
+		if( !diskCache || !object )
+		{
+			return;
+		}
+		tbb::mutex::scoped_lock lock( removedObjectsMutex );
+		removedObjects.push_back( RemovedObjects::value_type( h, object ) );
+	}
+
+	void forgetRemoved( const MurmurHash *h = 0 )
+	{
+		tbb::mutex::scoped_lock lock( removedObjectsMutex );
+		if( !h )
+		{
+			removedObjects.clear();
+			return;
+		}
+		for( RemovedObjects::iterator it = removedObjects.begin(); it != removedObjects.end(); )
+		{
+			it = it->first == *h ? removedObjects.erase( it ) : it + 1;
+		}
+	}
+
+	void flushRemoved()
+	{
+		RemovedObjects toWrite;
+		{
+			tbb::mutex::scoped_lock lock( removedObjectsMutex );
+			toWrite.swap( removedObjects );
+		}
+
+		for( RemovedObjects::const_iterator it = toWrite.begin(), eIt = toWrite.end(); it != eIt; ++it )
+		{
+			try
+			{
+				diskCache->store( it->first, it->second.get() );
+			}
+			catch( const std::exception &e )
+			{
+				msg( Msg::Warning, "ObjectPool", e.what() );
+			}
+		}
+	}
 };
 
 //////////////////////////////////////////////////////////////////////////
@@ -74,7 +136,18 @@ ObjectPool::~ObjectPool()
 
 ConstObjectPtr ObjectPool::retrieve( const MurmurHash &hash ) const
 {
-	return m_data->cache.get(hash);
+	ConstObjectPtr result = m_data->cache.get(hash);
+	if( !result && m_data->diskCache )
+	{
+		// fall back to the disk cache, and bring anything we find there back into memory.
+		result = m_data->diskCache->retrieve( hash );
+		if( result )
+		{
+			m_data->cache.set( hash, result, result->memoryUsage() );
+			m_data->flushRemoved();
+		}
+	}
+	return result;
 }
 
 ConstObjectPtr ObjectPool::store( const Object *obj, StoreMode mode )
@@ -92,11 +165,13 @@ ConstObjectPtr ObjectPool::store( const Object *obj, StoreMode mode )
 	{
 		cachedObj = obj->copy();
 		m_data->cache.set( h, cachedObj, obj->memoryUsage() );
+		m_data->flushRemoved();
 		return cachedObj;
 	}
 	else if ( mode == StoreReference )
 	{
 		m_data->cache.set( h, obj, obj->memoryUsage() );
+		m_data->flushRemoved();
 		return obj;
 	}
 	else
@@ -107,22 +182,30 @@ ConstObjectPtr ObjectPool::store( const Object *obj, StoreMode mode )
 
 bool ObjectPool::contains( const MurmurHash &hash ) const
 {
-	return m_data->cache.cached(hash);
+	if( m_data->cache.cached(hash) )
+	{
+		return true;
+	}
+	return m_data->diskCache && m_data->diskCache->contains( hash );
 }
 
 void ObjectPool::clear()
 {
 	m_data->cache.clear();
+	m_data->forgetRemoved();
 }
 
 bool ObjectPool::erase( const MurmurHash &hash )
 {
-	return m_data->cache.erase(hash);
+	bool result = m_data->cache.erase(hash);
+	m_data->forgetRemoved( &hash );
+	return result;
 }
 
 void ObjectPool::setMaxMemoryUsage( size_t maxMemory )
 {
 	m_data->cache.setMaxCost(maxMemory);
+	m_data->flushRemoved();
 }
 
 size_t ObjectPool::getMaxMemoryUsage() const
@@ -135,6 +218,17 @@ size_t ObjectPool::memoryUsage() const
 	return m_data->cache.currentCost();
 }
 
+void ObjectPool::setDiskCache( DiskObjectCachePtr diskCache )
+{
+	m_data->forgetRemoved();
+	m_data->diskCache = diskCache;
+}
+
+DiskObjectCache *ObjectPool::getDiskCache() const
+{
+	return m_data->diskCache.get();
+}
+
 ObjectPoolPtr ObjectPool::defaultObjectPool()
 {
 	static ObjectPoolPtr c = 0;
@@ -143,6 +237,21 @@ ObjectPoolPtr ObjectPool::defaultObjectPool()
 		const char *m = getenv( "IECORE_OBJECTPOOL_MEMORY" );
 		int mi = m ? boost::lexical_cast<int>( m ) : 500;
 		c = new ObjectPool(1024 * 1024 * mi);
+
+		const char *d = getenv( "IECORE_OBJECTPOOL_DISKCACHE_PATH" );
+		if( d && *d )
+		{
+			const char *dm = getenv( "IECORE_OBJECTPOOL_DISKCACHE_SIZE" );
+			size_t dmi = dm ? boost::lexical_cast<size_t>( dm ) : 10000;
+			try
+			{
+				c->setDiskCache( new DiskObjectCache( d, 1024 * 1024 * dmi ) );
+			}
+			catch( const std::exception &e )
+			{
+				msg( Msg::Error, "ObjectPool::defaultObjectPool", e.what() );
+			}
+		}
 	}
 	return c;
 }
@@ -56,13 +56,17 @@ Op::~Op()
 ObjectPtr Op::operate()
 {
 	const CompoundObject *operands = parameters()->getTypedValidatedValue<CompoundObject>();
-	return operate( operands );
+	ObjectPtr result = doOperation( operands );
+	m_resultParameter->setValidatedValue( result );
+	return result;
 }
 
 ObjectPtr Op::operate( const CompoundObject *operands )
 {
+	// we don't store the result in m_resultParameter, so that
+	// this may be called concurrently without locking.
 	ObjectPtr result = doOperation( operands );
-	m_resultParameter->setValidatedValue( result );
+	m_resultParameter->validate( result.get() );
 	return result;
 }
 
@@ -248,30 +248,91 @@ void PDCParticleReader::readElements( T *buffer, std::streampos pos, unsigned lo
 
 DataPtr PDCParticleReader::readAttribute( const std::string &name )
 {
-	if( !open() )
+	CompoundDataPtr attributes = readAttributes( vector<string>( 1, name ) );
+	if( !attributes )
+	{
+		return 0;
+	}
+	CompoundDataMap::const_iterator it = attributes->readable().find( name );
+	if( it == attributes->readable().end() )
 	{
 		return 0;
 	}
+	return it->second;
+}
+
+namespace
+{
+
+struct PositionLess
+{
+	template<typename T>
+	bool operator()( const T &a, const T &b ) const
+	{
+		return a.second->position < b.second->position;
+	}
+};
+
+} // namespace
 
-	map<string, Record>::const_iterator it = m_header.attributes.find( name );
-	if( it==m_header.attributes.end() )
+CompoundDataPtr PDCParticleReader::readAttributes( const std::vector<std::string> &names )
+{
+	if( !open() )
 	{
 		return 0;
 	}
 
+	// find the records we need, and sort them so that we
+	// read through the file in a single forward pass.
+	typedef std::pair<std::string, const Record *> NamedRecord;
+	vector<NamedRecord> records;
+	records.reserve( names.size() );
+	for( vector<string>::const_iterator it = names.begin(); it!=names.end(); it++ )
+	{
+		map<string, Record>::const_iterator rIt = m_header.attributes.find( *it );
+		if( rIt!=m_header.attributes.end() )
+		{
+			records.push_back( NamedRecord( *it, &rIt->second ) );
+		}
+	}
+	sort( records.begin(), records.end(), PositionLess() );
+
+	CompoundDataPtr result = new CompoundData;
+	if( records.empty() )
+	{
+		return result;
+	}
+
+	// compute the filtering once, and reuse it for all attributes
 	const Data *idAttr = idAttribute();
 	if ( !idAttr && particlePercentage() < 100.0f )
 	{
 		msg( Msg::Warning, "PDCParticleReader::filterAttr", format( "Percentage filtering requested but file \"%s\" contains no particle Id attribute." ) % fileName() );
 	}
+	std::vector<bool> mask;
+	filterMask( numParticles(), idAttr, mask );
 
+	for( vector<NamedRecord>::const_iterator it = records.begin(); it!=records.end(); it++ )
+	{
+		DataPtr d = readAttribute( *(it->second), mask );
+		if( d )
+		{
+			result->writable()[it->first] = d;
+		}
+	}
+
+	return result;
+}
+
+DataPtr PDCParticleReader::readAttribute( const Record &record, const std::vector<bool> &mask )
+{
 	DataPtr result = 0;
-	switch( it->second.type )
+	switch( record.type )
 	{
 		case Integer :
 			{
 				IntDataPtr d( new IntData );
-				readElements( &d->writable(), it->second.position, 1 );
+				readElements( &d->writable(), record.position, 1 );
 				result = d;
 			}
 			break;
@@ -279,14 +340,14 @@ DataPtr PDCParticleReader::readAttribute( const std::string &name )
 			{
 				IntVectorDataPtr d( new IntVectorData );
 				d->writable().resize( numParticles() );
-				readElements( &d->writable()[0], it->second.position, numParticles() );
-				result = filterAttr<IntVectorData, IntVectorData>( d, particlePercentage(), idAttr );
+				readElements( &d->writable()[0], record.position, numParticles() );
+				result = filterAttr<IntVectorData, IntVectorData>( d, mask );
 			}
 			break;
 		case Double :
 			{
 				DoubleDataPtr d( new DoubleData );
-				readElements( &d->writable(), it->second.position, 1 );
+				readElements( &d->writable(), record.position, 1 );
 				switch( realType() )
 				{
 					case Native :
@@ -303,15 +364,15 @@ DataPtr PDCParticleReader::readAttribute( const std::string &name )
 			{
 				DoubleVectorDataPtr d( new DoubleVectorData );
 				d->writable().resize( numParticles() );
-				readElements( &d->writable()[0], it->second.position, numParticles() );
+				readElements( &d->writable()[0], record.position, numParticles() );
 				switch( realType() )
 				{
 					case Native :
 					case Double :
-						result = filterAttr<DoubleVectorData, DoubleVectorData>( d, particlePercentage(), idAttr );
+						result = filterAttr<DoubleVectorData, DoubleVectorData>( d, mask );
 						break;
 					case Float :
-						result = filterAttr<FloatVectorData, DoubleVectorData>( d, particlePercentage(), idAttr );
+						result = filterAttr<FloatVectorData, DoubleVectorData>( d, mask );
 						break;
 				}
 			}
@@ -319,7 +380,7 @@ DataPtr PDCParticleReader::readAttribute( const std::string &name )
 		case Vector :
 			{
 				V3dDataPtr d( new V3dData );
-				readElements( (double *)&d->writable(), it->second.position, 3 );
+				readElements( (double *)&d->writable(), record.position, 3 );
 				switch( realType() )
 				{
 					case Native :
@@ -350,21 +411,21 @@ DataPtr PDCParticleReader::readAttribute( const std::string &name )
 				/// this resize problem only occurs with V3d, and not with V3f, or double, or even
 				/// a struct with 3 doubles in, or even a template struct with 3 doubles in.
 				d->writable().resize( numParticles(), V3d( 0 ) );
-				readElements( (double *)&d->writable()[0], it->second.position, numParticles() * 3 );
+				readElements( (double *)&d->writable()[0], record.position, numParticles() * 3 );
 				switch( realType() )
 				{
 					case Native :
 					case Double :
-						result = filterAttr<V3dVectorData, V3dVectorData>( d, particlePercentage(), idAttr );
+						result = filterAttr<V3dVectorData, V3dVectorData>( d, mask );
 						break;
 					case Float :
-						result = filterAttr<V3fVectorData, V3dVectorData>( d, particlePercentage(), idAttr );
+						result = filterAttr<V3fVectorData, V3dVectorData>( d, mask );
 						break;
 				}
 			}
 			break;
 		default :
-			assert( it->second.type < 6 ); // unknown type
+			assert( record.type < 6 ); // unknown type
 
 	}
 	return result;
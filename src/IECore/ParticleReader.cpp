@@ -45,6 +45,9 @@
 #include "IECore/NullObject.h"
 #include "IECore/DespatchTypedData.h"
 #include "IECore/TestTypedData.h"
+#include "IECore/Exception.h"
+
+#include "OpenEXR/ImathRandom.h"
 
 #include <algorithm>
 
@@ -154,10 +157,31 @@ const BoolParameter * ParticleReader::convertPrimVarNamesParameter() const
 	return m_convertPrimVarNamesParameter;
 }
 
+CompoundDataPtr ParticleReader::readAttributes( const std::vector<std::string> &names )
+{
+	CompoundDataPtr result = new CompoundData;
+	for( vector<string>::const_iterator it = names.begin(); it!=names.end(); it++ )
+	{
+		DataPtr d = readAttribute( *it );
+		if( d )
+		{
+			result->writable()[*it] = d;
+		}
+	}
+	return result;
+}
+
 ObjectPtr ParticleReader::doOperation( const CompoundObject * operands )
 {
 	vector<string> attributes;
 	particleAttributes( attributes );
+	
+	ConstCompoundDataPtr attributeData = readAttributes( attributes );
+	if( !attributeData )
+	{
+		throw IOException( ( format( "Failed to load \"%s\"." ) % fileName() ).str() );
+	}
+	
 	PointsPrimitivePtr result = new PointsPrimitive( numParticles() );
 	// because of percentage filtering we don't really know the number of points until we've loaded an attribute.
 	// we start off with numParticles() in case there aren't any varying attributes in the cache at all, but replace it
@@ -165,7 +189,12 @@ ObjectPtr ParticleReader::doOperation( const CompoundObject * operands )
 	bool haveNumPoints = false;
 	for( vector<string>::const_iterator it = attributes.begin(); it!=attributes.end(); it++ )
 	{
-		DataPtr d = readAttribute( *it );
+		CompoundDataMap::const_iterator dIt = attributeData->readable().find( *it );
+		if( dIt == attributeData->readable().end() )
+		{
+			continue;
+		}
+		DataPtr d = dIt->second;
 
 		if ( testTypedData<TypeTraits::IsVectorTypedData>( d ) )
 		{
@@ -235,6 +264,60 @@ ParticleReader::RealType ParticleReader::realType() const
 	return RealType( m_realTypeParameter->getNumericValue() );
 }
 
+bool ParticleReader::filterMask( size_t numParticles, const Data *idAttr, std::vector<bool> &mask ) const
+{
+	mask.clear();
+
+	const float percentage = particlePercentage();
+	if( percentage >= 100.0f )
+	{
+		return false;
+	}
+
+	const int seed = particlePercentageSeed();
+	const float fraction = percentage / 100.0f;
+	Imath::Rand48 r;
+
+	if( idAttr )
+	{
+		// filtering based on id, so it's consistent from frame to frame
+		if( const DoubleVectorData *ids = runTimeCast<const DoubleVectorData>( idAttr ) )
+		{
+			const vector<double> &idValues = ids->readable();
+			mask.resize( numParticles, false );
+			for( size_t i=0, e=std::min( numParticles, idValues.size() ); i<e; i++ )
+			{
+				r.init( seed + (int)idValues[i] );
+				mask[i] = r.nextf() <= fraction;
+			}
+			return true;
+		}
+		else if( const IntVectorData *ids = runTimeCast<const IntVectorData>( idAttr ) )
+		{
+			const vector<int> &idValues = ids->readable();
+			mask.resize( numParticles, false );
+			for( size_t i=0, e=std::min( numParticles, idValues.size() ); i<e; i++ )
+			{
+				r.init( seed + idValues[i] );
+				mask[i] = r.nextf() <= fraction;
+			}
+			return true;
+		}
+
+		msg( Msg::Warning, "ParticleReader::filterMask", boost::format( "Unrecognized id data type in file \"%s\"! Disabling filtering." ) % fileName() );
+		return false;
+	}
+
+	// filtering based only on order
+	mask.resize( numParticles );
+	r.init( seed );
+	for( size_t i=0; i<numParticles; i++ )
+	{
+		mask[i] = r.nextf() <= fraction;
+	}
+	return true;
+}
+
 bool ParticleReader::convertPrimVarNames() const
 {
 	return m_convertPrimVarNamesParameter->getTypedValue();
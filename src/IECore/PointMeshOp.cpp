@@ -46,7 +46,6 @@
 #include "IECore/BoundedKDTree.h"
 #include "IECore/MeshPrimitive.h"
 #include "IECore/MeshPrimitiveBuilder.h"
-#include "IECore/CachedImplicitSurfaceFunction.h"
 #include "IECore/VectorTraits.h"
 #include "IECore/MarchingCubes.h"
 #include "IECore/BlobbyImplicitSurfaceFunction.h"
@@ -200,18 +199,15 @@ ObjectPtr PointMeshOp::doOperation( const CompoundObject * operands )
 	V3i resolution = static_cast<const V3iData *>( resolutionData )->readable();
 	Box3f bound = static_cast<const Box3fData *>( boundData )->readable();
 
-	/// Calculate a tolerance which is half the size of the smallest grid division
-	double cacheTolerance = ((bound.max.x - bound.min.x) / (double)resolution.x) / 2.0;
-	cacheTolerance = std::min(cacheTolerance, ((bound.max.y - bound.min.y) / (double)resolution.y) / 2.0 );
-	cacheTolerance = std::min(cacheTolerance, ((bound.max.z - bound.min.z) / (double)resolution.z) / 2.0 );
-
+	/// MarchingCubes evaluates each grid point only once, so there's no need to cache the function values,
+	/// and the blobby function is safe to evaluate from several threads at once.
 	MeshPrimitiveBuilderPtr builder = new MeshPrimitiveBuilder();
 
 	switch( points->typeId() )
 	{
 		case V3fVectorDataTypeId :
 			{
-				typedef MarchingCubes< CachedImplicitSurfaceFunction< V3f, float > > Marcher ;
+				typedef MarchingCubes< BlobbyImplicitSurfaceFunction< V3f, float > > Marcher ;
 
 				BlobbyImplicitSurfaceFunction< V3f, float >::Ptr fn = new BlobbyImplicitSurfaceFunction< V3f, float >
 				(
@@ -220,22 +216,14 @@ ObjectPtr PointMeshOp::doOperation( const CompoundObject * operands )
 					static_cast<const DoubleVectorData *>( strength )
 				);
 
-				Marcher::Ptr m = new Marcher
-				(
-					new CachedImplicitSurfaceFunction< V3f, float >(
-						fn,
-						cacheTolerance
-					),
-
-					builder
-				);
+				Marcher::Ptr m = new Marcher( fn, builder );
 
-				m->march( bound, resolution, threshold );
+				m->march( bound, resolution, threshold, true );
 			}
 			break;
 		case V3dVectorDataTypeId :
 			{
-				typedef MarchingCubes< CachedImplicitSurfaceFunction< V3d, double > > Marcher ;
+				typedef MarchingCubes< BlobbyImplicitSurfaceFunction< V3d, double > > Marcher ;
 
 				BlobbyImplicitSurfaceFunction< V3d, double >::Ptr fn = new BlobbyImplicitSurfaceFunction< V3d, double >
 				(
@@ -244,17 +232,9 @@ ObjectPtr PointMeshOp::doOperation( const CompoundObject * operands )
 					static_cast<const DoubleVectorData *>( strength )
 				);
 
-				Marcher::Ptr m = new Marcher
-				(
-					new CachedImplicitSurfaceFunction< V3d, double >(
-						fn,
-						cacheTolerance
-					),
-
-					builder
-				);
+				Marcher::Ptr m = new Marcher( fn, builder );
 
-				m->march( Box3d( bound.min, bound.max ), resolution, threshold );
+				m->march( Box3d( bound.min, bound.max ), resolution, threshold, true );
 			}
 			break;
 		default :
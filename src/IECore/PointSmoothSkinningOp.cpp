@@ -35,8 +35,13 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
+
 #include "boost/format.hpp"
 
+#include "tbb/parallel_for.h"
+#include "tbb/blocked_range.h"
+
 #include "IECore/PointsPrimitive.h"
 #include "IECore/ObjectParameter.h"
 #include "IECore/CompoundParameter.h"
@@ -53,6 +58,88 @@ using namespace IECore;
 using namespace Imath;
 using namespace std;
 
+namespace
+{
+
+// Deforms a range of points (and optionally normals) using linear blending of the
+// skinning matrices. When influenceStride is non-zero the influences are laid out
+// with a fixed count per point, otherwise pointIndexOffsets and pointInfluenceCounts
+// are used to locate them.
+struct LinearSkinning
+{
+
+	LinearSkinning(
+		const std::vector<M44f> &skinningMatrices,
+		const int *influenceCounts, const int *indexOffsets,
+		const int *influenceIndices, const float *influenceWeights,
+		int influenceStride, V3f *p, V3f *n
+	)
+		:	m_skinningMatrices( skinningMatrices ), m_influenceCounts( influenceCounts ), m_indexOffsets( indexOffsets ),
+			m_influenceIndices( influenceIndices ), m_influenceWeights( influenceWeights ), m_influenceStride( influenceStride ),
+			m_p( p ), m_n( n )
+	{
+	}
+
+	void operator()( const tbb::blocked_range<size_t> &range ) const
+	{
+		for( size_t i = range.begin(); i != range.end(); ++i )
+		{
+			size_t offset, count;
+			if( m_influenceStride )
+			{
+				offset = i * m_influenceStride;
+				count = m_influenceStride;
+			}
+			else
+			{
+				offset = m_indexOffsets[i];
+				count = m_influenceCounts[i];
+			}
+
+			const int *indices = m_influenceIndices + offset;
+			const float *weights = m_influenceWeights + offset;
+
+			const V3f p = m_p[i];
+			V3f pNew( 0 );
+			if( m_n )
+			{
+				const V3f n = m_n[i];
+				V3f nNew( 0 ), nDeformed;
+				for( size_t j = 0; j < count; ++j )
+				{
+					const M44f &m = m_skinningMatrices[indices[j]];
+					pNew += p * m * weights[j];
+					m.multDirMatrix( n, nDeformed );
+					nNew += nDeformed * weights[j];
+				}
+				m_n[i] = nNew;
+			}
+			else
+			{
+				for( size_t j = 0; j < count; ++j )
+				{
+					pNew += p * m_skinningMatrices[indices[j]] * weights[j];
+				}
+			}
+			m_p[i] = pNew;
+		}
+	}
+
+	private :
+
+		const std::vector<M44f> &m_skinningMatrices;
+		const int *m_influenceCounts;
+		const int *m_indexOffsets;
+		const int *m_influenceIndices;
+		const float *m_influenceWeights;
+		int m_influenceStride;
+		V3f *m_p;
+		V3f *m_n;
+
+};
+
+} // namespace
+
 IE_CORE_DEFINERUNTIMETYPED( PointSmoothSkinningOp );
 
 PointSmoothSkinningOp::PointSmoothSkinningOp() :
@@ -117,6 +204,15 @@ PointSmoothSkinningOp::PointSmoothSkinningOp() :
 	);
 	parameters()->addParameter( m_deformationPoseParameter );
 
+	m_packInfluencesParameter = new BoolParameter(
+		"packInfluences",
+		"Rearranges the influences into a fixed number per point before deforming. This is generally "
+		"faster when all points have a similar number of influences.",
+		false
+	);
+	parameters()->addParameter( m_packInfluencesParameter );
+
+	m_packedInfluenceCount = 0;
 }
 
 PointSmoothSkinningOp::~PointSmoothSkinningOp()
@@ -183,6 +279,16 @@ const IntParameter * PointSmoothSkinningOp::blendParameter() const
 	return m_blendParameter;
 }
 
+BoolParameter * PointSmoothSkinningOp::packInfluencesParameter()
+{
+	return m_packInfluencesParameter;
+}
+
+const BoolParameter * PointSmoothSkinningOp::packInfluencesParameter() const
+{
+	return m_packInfluencesParameter;
+}
+
 
 void PointSmoothSkinningOp::modify( Object *input, const CompoundObject *operands )
 {
@@ -190,6 +296,7 @@ void PointSmoothSkinningOp::modify( Object *input, const CompoundObject *operand
     Primitive *pt = static_cast<Primitive *>( input );
 
     bool deform_n = operands->member<BoolData>( "deformNormals" )->readable();
+	bool pack = operands->member<BoolData>( "packInfluences" )->readable();
 	Blend blend = static_cast<Blend>( m_blendParameter->getNumericValue() );
     string position_var = operands->member<StringData>( "positionVar" )->readable();
     string normal_var = operands->member<StringData>( "normalVar" )->readable();
@@ -239,13 +346,43 @@ void PointSmoothSkinningOp::modify( Object *input, const CompoundObject *operand
 	// check if the smooth skinning data has changed since the last time the op was used;
 	// validating the ssd can be expensive and unnecessary for the case that the ssd is not changing
 	// so we are storing an internal copy of the ssd as a comparison is much faster than a complete validation
-	if ( ssd != m_prevSmoothSkinningData )
+	if ( !m_prevSmoothSkinningData || !ssd->isEqualTo( m_prevSmoothSkinningData.get() ) )
 	{
 		ssd->validate();
 		m_prevSmoothSkinningData = ssd->copy();
+		m_packedInfluenceCount = 0;
+		m_packedInfluenceIndices.clear();
+		m_packedInfluenceWeights.clear();
+	}
+
+	const std::vector<int> &pointInfluenceCounts = ssd->pointInfluenceCounts()->readable();
+	const std::vector<int> &pointIndexOffsets = ssd->pointIndexOffsets()->readable();
+	const std::vector<int> &pointInfluenceIndices = ssd->pointInfluenceIndices()->readable();
+	const std::vector<float> &pointInfluenceWeights = ssd->pointInfluenceWeights()->readable();
+
+	// pack the influences into a fixed count per point, padding with zero weights
+	if ( pack && !m_packedInfluenceCount && p_size )
+	{
+		m_packedInfluenceCount = std::max( 1, *std::max_element( pointInfluenceCounts.begin(), pointInfluenceCounts.end() ) );
+		m_packedInfluenceIndices.resize( p_size * m_packedInfluenceCount, 0 );
+		m_packedInfluenceWeights.resize( p_size * m_packedInfluenceCount, 0.0f );
+		for ( int i = 0; i < p_size; ++i )
+		{
+			std::copy(
+				pointInfluenceIndices.begin() + pointIndexOffsets[i],
+				pointInfluenceIndices.begin() + pointIndexOffsets[i] + pointInfluenceCounts[i],
+				m_packedInfluenceIndices.begin() + i * m_packedInfluenceCount
+			);
+			std::copy(
+				pointInfluenceWeights.begin() + pointIndexOffsets[i],
+				pointInfluenceWeights.begin() + pointIndexOffsets[i] + pointInfluenceCounts[i],
+				m_packedInfluenceWeights.begin() + i * m_packedInfluenceCount
+			);
+		}
 	}
 
 	// test n data
+	V3f *n_data = 0;
     if ( deform_n )
     {
      	// verify the normal data is good
@@ -260,14 +397,15 @@ void PointSmoothSkinningOp::modify( Object *input, const CompoundObject *operand
         	throw Exception("Could not get normal data from primitive!");
         }
 
-     	std::vector<V3f> &n_data =  n->writable();
-        int n_size = n_data.size();
+        int n_size = n->readable().size();
 
     	// todo, deal with the case that the primitive is a mesh and might have facevarying normal data
         if ( p_size != n_size )
         {
         	throw Exception("Position and normal variables must be the same length!");
 		}
+
+		n_data = n_size ? &(n->writable()[0]) : 0;
     }
 
 	// generate skinning matrices
@@ -288,62 +426,39 @@ void PointSmoothSkinningOp::modify( Object *input, const CompoundObject *operand
 	}
 
 
-	// iterate through all the points in the source primitive and deform using the weighted skinning matrices
+	// deform all the points in the source primitive (and their normals) using the weighted skinning matrices
 	if ( blend == Linear )
 	{
-        std::vector<V3f>::iterator p_it = p_data.begin();
-
-		// todo, thread this
-        // deform our P
-        for ( p_it=p_data.begin(); p_it!=p_data.end(); ++p_it )
-        {
-			V3f p_new(0,0,0);
-
-			int p_id = p_it - p_data.begin();
-			int p_influence_count = ssd->pointInfluenceCounts()->readable()[p_id];
-			int p_index_offset = ssd->pointIndexOffsets()->readable()[p_id];
+		if ( !p_size )
+		{
+			return;
+		}
 
-			for (int p_influence_id = p_index_offset; p_influence_id < (p_index_offset+p_influence_count);
-					p_influence_id++)
+		if ( pack && skin_data.size() )
+		{
+			LinearSkinning skinning(
+				skin_data, 0, 0, &m_packedInfluenceIndices[0], &m_packedInfluenceWeights[0],
+				m_packedInfluenceCount, &p_data[0], n_data
+			);
+			tbb::parallel_for( tbb::blocked_range<size_t>( 0, p_size, 1000 ), skinning );
+		}
+		else if ( pointInfluenceIndices.size() )
+		{
+			LinearSkinning skinning(
+				skin_data, &pointInfluenceCounts[0], &pointIndexOffsets[0], &pointInfluenceIndices[0], &pointInfluenceWeights[0],
+				0, &p_data[0], n_data
+			);
+			tbb::parallel_for( tbb::blocked_range<size_t>( 0, p_size, 1000 ), skinning );
+		}
+		else
+		{
+			// no influences at all, so everything collapses to the origin as it always has
+			std::fill( p_data.begin(), p_data.end(), V3f( 0 ) );
+			if ( n_data )
 			{
-				int influence_id = ssd->pointInfluenceIndices()->readable()[p_influence_id];
-				float weight = ssd->pointInfluenceWeights()->readable()[p_influence_id];
-				p_new += (*p_it) * skin_data[influence_id] * weight;
+				std::fill( n_data, n_data + p_size, V3f( 0 ) );
 			}
-
-			(*p_it) = p_new;
-
-        }
-
-        // deform our N
-        if ( deform_n )
-        {
-        	V3fVectorData *n = pt->variableData<V3fVectorData>(normal_var);
-         	std::vector<V3f> &n_data =  n->writable();
-
-        	std::vector<V3f>::iterator n_it = n_data.begin();
-        	V3f n_unw;
-            for ( n_it=n_data.begin(); n_it!=n_data.end(); ++n_it )
-            {
-    			V3f n_new(0,0,0);
-
-    			int n_id = n_it - n_data.begin();
-    			int n_influence_count = ssd->pointInfluenceCounts()->readable()[n_id];
-    			int n_index_offset = ssd->pointIndexOffsets()->readable()[n_id];
-
-    			for (int n_influence_id = n_index_offset; n_influence_id < (n_index_offset+n_influence_count);
-    					n_influence_id++)
-    			{
-    				int influence_id = ssd->pointInfluenceIndices()->readable()[n_influence_id];
-    				float weight = ssd->pointInfluenceWeights()->readable()[n_influence_id];
-
-    				skin_data[influence_id].multDirMatrix((*n_it),n_unw);
-    				n_new += n_unw * weight;
-    			}
-
-    			(*n_it) = n_new;
-            }
-        }
+		}
 	}
 	else
 	{
@@ -0,0 +1,137 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include "IECore/PointsMergeOp.h"
+#include "IECore/CompoundParameter.h"
+#include "IECore/ObjectVector.h"
+#include "IECore/private/PrimitiveMerge.h"
+
+using namespace IECore;
+using namespace std;
+
+IE_CORE_DEFINERUNTIMETYPED( PointsMergeOp );
+
+PointsMergeOp::PointsMergeOp()
+	:	PointsPrimitiveOp( "Merges one PointsPrimitive with another." )
+{
+	m_pointsParameter = new PointsPrimitiveParameter(
+		"points",
+		"The points to be merged with the input.",
+		new PointsPrimitive
+	);
+
+	m_pointsListParameter = new ObjectVectorParameter(
+		"pointsList",
+		"A list of further PointsPrimitives to be merged with the input, after the points parameter. "
+		"Merging many primitives at once is much faster than merging them one at a time, as the "
+		"result is allocated only once.",
+		new ObjectVector
+	);
+
+	m_removePrimVarsParameter = new BoolParameter(
+		"removeNonMatchingPrimVars",
+		"If true, PrimitiveVariables that exist on one PointsPrimitive and not the other will be removed. If false, the PrimitiveVariable data will be expanded using a default value.",
+		false
+	);
+
+	parameters()->addParameter( m_pointsParameter );
+	parameters()->addParameter( m_pointsListParameter );
+	parameters()->addParameter( m_removePrimVarsParameter );
+}
+
+PointsMergeOp::~PointsMergeOp()
+{
+}
+
+PointsPrimitiveParameter * PointsMergeOp::pointsParameter()
+{
+	return m_pointsParameter;
+}
+
+const PointsPrimitiveParameter * PointsMergeOp::pointsParameter() const
+{
+	return m_pointsParameter;
+}
+
+ObjectVectorParameter * PointsMergeOp::pointsListParameter()
+{
+	return m_pointsListParameter;
+}
+
+const ObjectVectorParameter * PointsMergeOp::pointsListParameter() const
+{
+	return m_pointsListParameter;
+}
+
+void PointsMergeOp::modifyTypedPrimitive( PointsPrimitive * points, const CompoundObject * operands )
+{
+	// gather all the points to be merged. empty primitives are skipped so
+	// that they don't affect the primitive variables of the result.
+	vector<const Primitive *> allPoints;
+	allPoints.push_back( points );
+	size_t numPoints = points->getNumPoints();
+
+	const PointsPrimitive *points2 = static_cast<const PointsPrimitive *>( m_pointsParameter->getValue() );
+	if( points2->getNumPoints() )
+	{
+		allPoints.push_back( points2 );
+		numPoints += points2->getNumPoints();
+	}
+
+	const ObjectVector::MemberContainer &pointsList = static_cast<const ObjectVector *>( m_pointsListParameter->getValue() )->members();
+	for( ObjectVector::MemberContainer::const_iterator it = pointsList.begin(); it != pointsList.end(); ++it )
+	{
+		const PointsPrimitive *p = runTimeCast<const PointsPrimitive>( it->get() );
+		if( !p )
+		{
+			throw InvalidArgumentException( "PointsMergeOp : pointsList parameter must contain only PointsPrimitives." );
+		}
+		if( p->getNumPoints() )
+		{
+			allPoints.push_back( p );
+			numPoints += p->getNumPoints();
+		}
+	}
+
+	if( allPoints.size() == 1 )
+	{
+		return;
+	}
+
+	PrimitiveVariableMap variables;
+	Detail::mergePrimitiveVariables( allPoints, m_removePrimVarsParameter->getTypedValue(), variables );
+
+	points->setNumPoints( numPoints );
+	points->variables.swap( variables );
+}
@@ -0,0 +1,278 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include <algorithm>
+
+#include "boost/format.hpp"
+#include "boost/type_traits/is_same.hpp"
+
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
+#include "IECore/private/PrimitiveMerge.h"
+#include "IECore/DespatchTypedData.h"
+#include "IECore/TypeTraits.h"
+
+using namespace IECore;
+using namespace std;
+
+namespace
+{
+
+template<class T>
+struct DefaultValue
+{
+	T operator()() const
+	{
+		return T();
+	}
+};
+
+template<class T>
+struct DefaultValue<Imath::Vec3<T> >
+{
+	Imath::Vec3<T> operator()() const
+	{
+		return Imath::Vec3<T>( 0 );
+	}
+};
+
+template<class T>
+struct DefaultValue<Imath::Vec2<T> >
+{
+	Imath::Vec2<T> operator()() const
+	{
+		return Imath::Vec2<T>( 0 );
+	}
+};
+
+template<class T>
+struct DefaultValue<Imath::Color3<T> >
+{
+	Imath::Color3<T> operator()() const
+	{
+		return Imath::Color3<T>( 0 );
+	}
+};
+
+template<class T>
+struct DefaultValue<Imath::Color4<T> >
+{
+	Imath::Color4<T> operator()() const
+	{
+		return Imath::Color4<T>( 0 );
+	}
+};
+
+template<typename T>
+void copyInterpretation( const T *from, T *to )
+{
+}
+
+template<typename T>
+void copyInterpretation( const GeometricTypedData<T> *from, GeometricTypedData<T> *to )
+{
+	to->setInterpretation( from->getInterpretation() );
+}
+
+// Copies the data from each source primitive into its segment of
+// the merged data, or fills the segment with a default value if the
+// source doesn't have the data.
+template<typename T>
+class FillSegments
+{
+	public :
+
+		typedef typename T::ValueType Container;
+
+		FillSegments( const vector<const T *> &sources, const vector<size_t> &offsets, Container &result )
+			:	m_sources( sources ), m_offsets( offsets ), m_result( result )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &range ) const
+		{
+			const typename Container::value_type defaultValue = DefaultValue<typename Container::value_type>()();
+			for( size_t i=range.begin(); i!=range.end(); ++i )
+			{
+				if( m_sources[i] )
+				{
+					std::copy( m_sources[i]->readable().begin(), m_sources[i]->readable().end(), m_result.begin() + m_offsets[i] );
+				}
+				else
+				{
+					std::fill( m_result.begin() + m_offsets[i], m_result.begin() + m_offsets[i+1], defaultValue );
+				}
+			}
+		}
+
+	private :
+
+		const vector<const T *> &m_sources;
+		const vector<size_t> &m_offsets;
+		Container &m_result;
+
+};
+
+struct MergeData
+{
+	typedef DataPtr ReturnType;
+
+	MergeData( const vector<const Primitive *> &primitives, const string &name, PrimitiveVariable::Interpolation interpolation, bool removeNonMatching )
+		:	m_primitives( primitives ), m_name( name ), m_interpolation( interpolation ), m_removeNonMatching( removeNonMatching )
+	{
+	}
+
+	template<typename T>
+	ReturnType operator()( typename T::Ptr data )
+	{
+		vector<const T *> sources;
+		sources.reserve( m_primitives.size() );
+		vector<size_t> offsets;
+		offsets.reserve( m_primitives.size() + 1 );
+		offsets.push_back( 0 );
+
+		for( vector<const Primitive *>::const_iterator it = m_primitives.begin(); it != m_primitives.end(); ++it )
+		{
+			const size_t size = (*it)->variableSize( m_interpolation );
+			const T *source = (*it)->variableData<T>( m_name, m_interpolation );
+			if( source && source->readable().size() != size )
+			{
+				throw InvalidArgumentException( boost::str( boost::format( "Primitive variable \"%s\" is not valid." ) % m_name ) );
+			}
+			else if( !source && m_removeNonMatching )
+			{
+				return 0;
+			}
+
+			sources.push_back( source );
+			offsets.push_back( offsets.back() + size );
+		}
+
+		typename T::Ptr result = new T;
+		copyInterpretation( data.get(), result.get() );
+		typename T::ValueType &merged = result->writable();
+		merged.resize( offsets.back() );
+
+		// std::vector<bool> packs its elements into shared words, so
+		// it can't be written from several threads at once.
+		const size_t grainSize = boost::is_same<typename T::ValueType::value_type, bool>::value ? m_primitives.size() : 1;
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, m_primitives.size(), grainSize ),
+			FillSegments<T>( sources, offsets, merged )
+		);
+
+		return result;
+	}
+
+	private :
+
+		const vector<const Primitive *> &m_primitives;
+		const string &m_name;
+		PrimitiveVariable::Interpolation m_interpolation;
+		bool m_removeNonMatching;
+
+};
+
+} // namespace
+
+void IECore::Detail::mergePrimitiveVariables( const std::vector<const Primitive *> &primitives, bool removeNonMatchingPrimVars, PrimitiveVariableMap &mergedVariables )
+{
+	mergedVariables.clear();
+	if( primitives.empty() )
+	{
+		return;
+	}
+
+	// find all the variables we need to merge. the type and interpolation
+	// of each is taken from the first primitive which has it, and constant
+	// variables only come from the first primitive.
+	PrimitiveVariableMap variables;
+	for( vector<const Primitive *>::const_iterator it = primitives.begin(); it != primitives.end(); ++it )
+	{
+		for( PrimitiveVariableMap::const_iterator vIt = (*it)->variables.begin(); vIt != (*it)->variables.end(); ++vIt )
+		{
+			if(
+				vIt->second.interpolation == PrimitiveVariable::Constant ||
+				// points only ever have a single uniform value, so it's treated as constant
+				( vIt->second.interpolation == PrimitiveVariable::Uniform && (*it)->isInstanceOf( PointsPrimitiveTypeId ) )
+			)
+			{
+				if( it == primitives.begin() )
+				{
+					mergedVariables.insert( *vIt );
+				}
+				continue;
+			}
+			variables.insert( *vIt );
+		}
+	}
+
+	// and merge them, making sure that any variables sharing data
+	// in the inputs also share data in the output.
+	typedef map<vector<const Data *>, DataPtr> MergedDataMap;
+	MergedDataMap mergedData;
+	for( PrimitiveVariableMap::const_iterator it = variables.begin(); it != variables.end(); ++it )
+	{
+		if( !it->second.data )
+		{
+			continue;
+		}
+
+		vector<const Data *> sourceData;
+		sourceData.reserve( primitives.size() );
+		for( vector<const Primitive *>::const_iterator pIt = primitives.begin(); pIt != primitives.end(); ++pIt )
+		{
+			sourceData.push_back( (*pIt)->variableData<Data>( it->first, it->second.interpolation ) );
+		}
+
+		MergedDataMap::const_iterator mIt = mergedData.find( sourceData );
+		DataPtr data = 0;
+		if( mIt != mergedData.end() )
+		{
+			data = mIt->second;
+		}
+		else
+		{
+			MergeData f( primitives, it->first, it->second.interpolation, removeNonMatchingPrimVars );
+			data = despatchTypedData<MergeData, TypeTraits::IsVectorTypedData, DespatchTypedDataIgnoreError>( it->second.data, f );
+			mergedData[sourceData] = data;
+		}
+
+		if( data )
+		{
+			mergedVariables[it->first] = PrimitiveVariable( it->second.interpolation, data );
+		}
+	}
+}
@@ -71,3 +71,8 @@ bool ReorderedFrameList::isEqualTo( ConstFrameListPtr other ) const
 	ConstReorderedFrameListPtr otherF = assertedStaticCast< const ReorderedFrameList >( other );
 	return m_frameList->isEqualTo( otherF->m_frameList );
 }
+
+void ReorderedFrameList::asRanges( RangeVector &ranges ) const
+{
+	m_frameList->asRanges( ranges );
+}
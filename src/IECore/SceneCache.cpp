@@ -33,7 +33,9 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include"boost/tuple/tuple.hpp"
+#include "boost/scoped_ptr.hpp"
 #include "tbb/concurrent_hash_map.h"
+#include "tbb/mutex.h"
 
 #include "OpenEXR/ImathBoxAlgo.h"
 
@@ -75,6 +77,11 @@ static InternedString attributesEntry("attributes");
 static InternedString childrenEntry("children");
 static InternedString sampleTimesEntry("sampleTimes");
 static InternedString tagsEntry("tags");
+static InternedString tagIndexEntry("tagIndex");
+static InternedString localTagsEntry("local");
+static InternedString childTagsEntry("fromChildren");
+static InternedString locationParentsEntry("parents");
+static InternedString locationNamesEntry("names");
 
 const SceneInterface::Name &SceneCache::animatedObjectTopologyAttribute = InternedString( "sceneInterface:animatedObjectTopology" );
 const SceneInterface::Name &SceneCache::animatedObjectPrimVarsAttribute = InternedString( "sceneInterface:animatedObjectPrimVars" );
@@ -565,6 +572,26 @@ class SceneCache::ReaderImplementation : public SceneCache::Implementation
 			}
 
 			ConstObjectPtr object1 = readObjectAtSample( sample1 );
+
+			// if the topology is constant, we only need to load and interpolate the
+			// animated primitive variables - the rest can be shared with object1.
+			ConstInternedStringVectorDataPtr animatedPrimVars = animatedObjectPrimVars();
+			if ( animatedPrimVars )
+			{
+				if ( const Primitive *primitive1 = runTimeCast< const Primitive >( object1.get() ) )
+				{
+					if ( animatedPrimVars->readable().empty() )
+					{
+						return object1;
+					}
+
+					PrimitivePtr primitive = primitive1->copy();
+					PrimitiveVariableMap variables2 = readObjectPrimitiveVariablesAtSample( m_indexedIO, animatedPrimVars->readable(), sample2 );
+					interpolatePrimitiveVariables( primitive->variables, variables2, x );
+					return primitive;
+				}
+			}
+
 			ConstObjectPtr object2 = readObjectAtSample( sample2 );
 			ObjectPtr object = linearObjectInterpolation( object1, object2, x );
 			if ( !object )
@@ -596,6 +623,29 @@ class SceneCache::ReaderImplementation : public SceneCache::Implementation
 
 			IndexedIOPtr objectIO = m_indexedIO->subdirectory( objectEntry );
 			PrimitiveVariableMap map1 = Primitive::loadPrimitiveVariables( objectIO, sampleEntry(sample1), primVarNames );
+
+			// avoid loading the second sample for primitive variables known to be static
+			ConstInternedStringVectorDataPtr animatedPrimVars = animatedObjectPrimVars();
+			if ( animatedPrimVars )
+			{
+				const std::vector<InternedString> &animated = animatedPrimVars->readable();
+				std::vector<InternedString> animatedNames;
+				for ( std::vector<InternedString>::const_iterator it = primVarNames.begin(); it != primVarNames.end(); ++it )
+				{
+					if ( std::find( animated.begin(), animated.end(), *it ) != animated.end() )
+					{
+						animatedNames.push_back( *it );
+					}
+				}
+				if ( animatedNames.empty() )
+				{
+					return map1;
+				}
+				PrimitiveVariableMap map2 = Primitive::loadPrimitiveVariables( objectIO, sampleEntry(sample2), animatedNames );
+				interpolatePrimitiveVariables( map1, map2, x );
+				return map1;
+			}
+
 			PrimitiveVariableMap map2 = Primitive::loadPrimitiveVariables( objectIO, sampleEntry(sample2), primVarNames );
 
 			for ( PrimitiveVariableMap::iterator it1 = map1.begin(); it1 != map1.end(); it1++ )
@@ -610,6 +660,83 @@ class SceneCache::ReaderImplementation : public SceneCache::Implementation
 			return map1;
 		}
 
+		/// Returns the names of the animated primitive variables, or 0 if the object
+		/// topology is animated (or unknown), meaning that the whole object may change.
+		ConstInternedStringVectorDataPtr animatedObjectPrimVars() const
+		{
+			if ( !hasAttribute( animatedObjectPrimVarsAttribute ) )
+			{
+				return 0;
+			}
+			return runTimeCast< const InternedStringVectorData >( readAttributeAtSample( animatedObjectPrimVarsAttribute, 0 ) );
+		}
+
+		/// Interpolates the variables in map1 towards the matching ones in map2. Variables
+		/// which can't be interpolated keep their values from map1.
+		static void interpolatePrimitiveVariables( PrimitiveVariableMap &map1, const PrimitiveVariableMap &map2, double x )
+		{
+			for ( PrimitiveVariableMap::const_iterator it2 = map2.begin(); it2 != map2.end(); it2++ )
+			{
+				PrimitiveVariableMap::iterator it1 = map1.find( it2->first );
+				if (
+					it1 == map1.end() ||
+					it1->second.interpolation != it2->second.interpolation ||
+					it1->second.data->typeId() != it2->second.data->typeId()
+				)
+				{
+					continue;
+				}
+				ObjectPtr data = linearObjectInterpolation( it1->second.data, it2->second.data, x );
+				if ( data )
+				{
+					it1->second.data = staticPointerCast< Data >( data );
+				}
+			}
+		}
+
+		/// Fills paths with the locations at or below this one which are listed in the
+		/// tag index for the tag. Returns false if the file has no tag index.
+		/// \param fromChildren Whether to list the locations where the tag was written
+		/// explicitly as coming from the children, rather than as a local tag.
+		bool indexedPathsWithTag( const Name &tag, bool fromChildren, std::vector<Path> &paths ) const
+		{
+			const SharedData::TagIndex *tagIndex = m_sharedData->tagIndex( this );
+			if ( !tagIndex )
+			{
+				return false;
+			}
+
+			paths.clear();
+			ConstIndexedIOPtr tagsIO = tagIndex->io->subdirectory( fromChildren ? childTagsEntry : localTagsEntry, IndexedIO::NullIfMissing );
+			if ( !tagsIO || !tagsIO->hasEntry( tag ) )
+			{
+				return true;
+			}
+
+			std::vector<int> locations( tagsIO->entry( tag ).arrayLength() );
+			if ( locations.empty() )
+			{
+				return true;
+			}
+			int *locationsPtr = &locations[0];
+			tagsIO->read( tag, locationsPtr, locations.size() );
+
+			Path prefix;
+			path( prefix );
+
+			// the locations are stored sorted by path, which the filtering preserves
+			Path p;
+			for ( std::vector<int>::const_iterator it = locations.begin(); it != locations.end(); ++it )
+			{
+				tagIndex->path( *it, p );
+				if ( p.size() >= prefix.size() && std::equal( prefix.begin(), prefix.end(), p.begin() ) )
+				{
+					paths.push_back( p );
+				}
+			}
+			return true;
+		}
+
 		ReaderImplementationPtr child( const Name &name, MissingBehaviour missingBehaviour )
 		{
 			IndexedIOPtr children = m_indexedIO->subdirectory( childrenEntry, (IndexedIO::MissingBehaviour)missingBehaviour );
@@ -672,7 +799,8 @@ class SceneCache::ReaderImplementation : public SceneCache::Implementation
 				SharedData() : 
 					objectCache( new SimpleCache( doReadObjectAtSample, simpleHash,  10000 )  ), 
 					attributeCache( new AttributeCache( doReadAttributeAtSample, attributeHash, 1000) ), 
-					transformCache( new SimpleCache(  doReadTransformAtSample, simpleHash, 1000) )
+					transformCache( new SimpleCache(  doReadTransformAtSample, simpleHash, 1000) ),
+					tagIndexLoaded( false )
 				{
 				}
 
@@ -732,6 +860,59 @@ class SceneCache::ReaderImplementation : public SceneCache::Implementation
 					return attributeCache->get( AttributeCacheKey(reader,name,sample) );
 				}
 
+				/// The locations listed in the tag index of the file.
+				struct TagIndex
+				{
+					ConstIndexedIOPtr io;
+					std::vector<int> parents;
+					SceneCache::NameList names;
+
+					void path( int location, SceneCache::Path &p ) const
+					{
+						p.clear();
+						while ( location > 0 )
+						{
+							if ( (size_t)location >= parents.size() )
+							{
+								throw Exception( "Corrupted file! Invalid location in tag index." );
+							}
+							p.push_back( names[location] );
+							location = parents[location];
+						}
+						std::reverse( p.begin(), p.end() );
+					}
+				};
+
+				/// Returns the tag index, loading it on first use, or 0 if the file
+				/// was written without one.
+				const TagIndex *tagIndex( const ReaderImplementation *reader )
+				{
+					tbb::mutex::scoped_lock lock( tagIndexMutex );
+					if ( !tagIndexLoaded )
+					{
+						tagIndexLoaded = true;
+						ConstIndexedIOPtr io = reader->fileRoot()->subdirectory( tagIndexEntry, IndexedIO::NullIfMissing );
+						if ( io )
+						{
+							TagIndex *index = new TagIndex;
+							index->io = io;
+							index->parents.resize( io->entry( locationParentsEntry ).arrayLength() );
+							index->names.resize( io->entry( locationNamesEntry ).arrayLength() );
+							if ( index->parents.empty() || index->parents.size() != index->names.size() )
+							{
+								delete index;
+								throw Exception( "Corrupted file! Invalid tag index." );
+							}
+							int *parents = &index->parents[0];
+							io->read( locationParentsEntry, parents, index->parents.size() );
+							InternedString *names = &index->names[0];
+							io->read( locationNamesEntry, names, index->names.size() );
+							tagIndexData.reset( index );
+						}
+					}
+					return tagIndexData.get();
+				}
+
 				// \todo Consider adding "ReaderImplementation *rootScene" to optimize the scene() calls.
 				SampleTimesMap sampleTimesMap;
 				SimpleCache::Ptr objectCache;
@@ -740,6 +921,10 @@ class SceneCache::ReaderImplementation : public SceneCache::Implementation
 
 			private :
 
+				tbb::mutex tagIndexMutex;
+				bool tagIndexLoaded;
+				boost::scoped_ptr< TagIndex > tagIndexData;
+
 			// utility function that copies all the values from the rhs dictionary to the lhs.
 			template< typename T >
 			static void mergeMaps ( T& lhs, const T& rhs) 
@@ -778,12 +963,17 @@ class SceneCache::ReaderImplementation : public SceneCache::Implementation
 		mutable const SampleTimes *m_objectSampleTimes;
 
 		IndexedIOPtr globalSampleTimes() const
+		{
+			return fileRoot()->subdirectory( sampleTimesEntry );
+		}
+
+		IndexedIOPtr fileRoot() const
 		{
 			if ( m_parent )
 			{
-				return m_parent->globalSampleTimes();
+				return m_parent->fileRoot();
 			}
-			return m_indexedIO->parentDirectory()->subdirectory( sampleTimesEntry );
+			return m_indexedIO->parentDirectory();
 		}
 
 		const SampleTimes *restoreSampleTimes( const IndexedIO::EntryID &childName, bool throwExceptions = false, const IndexedIO::EntryID *attribName = 0 ) const
@@ -953,11 +1143,13 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 			{
 				// use same map from the root
 				m_sampleTimesMap = m_parent->m_sampleTimesMap;
+				m_tagIndex = m_parent->m_tagIndex;
 			}
 			else
 			{
 				// only the root instance allocate the map.
 				m_sampleTimesMap = new SampleTimesMap;
+				m_tagIndex = new TagIndex;
 			}
 		}
 
@@ -1119,6 +1311,13 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 			}
 		}
 
+		/// Records tags written with writeTags( tags, true ) from outside the
+		/// file, so they can be listed separately in the tag index.
+		void recordTagsFromChildren( const NameList &tags )
+		{
+			m_tagsFromChildren.insert( tags.begin(), tags.end() );
+		}
+
 		void writeObject( const Object *object, double time )
 		{
 			writable();
@@ -1254,6 +1453,18 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 			return result;
 		}
 
+		void finish()
+		{
+			writable();
+
+			if ( !m_parent )
+			{
+				throw Exception( "Call to finish at the root scene is not allowed!" );
+			}
+
+			flush();
+		}
+
 		static WriterImplementation *writer( Implementation *impl, bool throwException = true )
 		{
 			WriterImplementation *writer = dynamic_cast< WriterImplementation* >( impl );
@@ -1470,8 +1681,8 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 			}
 		}
 
-		// Called from the destructor of the root location. 
-		// It triggers flush recursivelly on all the child locations.
+		// Called from the destructor of the root location, and from finish().
+		// It triggers flush recursivelly on all the child locations, skipping those already flushed.
 		// It also sets m_sampleTimesMap to NULL which prevents further modification on this and all child scene interface objects through their call to writable().
 		// Responsible for writing missing data such as all the sample 
 		// times from object,transform,attributes and bounds. And also computes the 
@@ -1479,6 +1690,12 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 		//
 		void flush()
 		{
+			if ( !m_sampleTimesMap )
+			{
+				// already flushed by finish()
+				return;
+			}
+
 			/// first call flush recursively on children...
 			for ( std::map< SceneCache::Name, WriterImplementationPtr >::const_iterator cit = m_children.begin(); cit != m_children.end(); cit++ )
 			{
@@ -1707,6 +1924,12 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 				}
 			}
 
+			// record where our tags are, so the root can write the tag index
+			if ( m_indexedIO->hasEntry( tagsEntry ) )
+			{
+				addToTagIndex();
+			}
+
 			if ( m_parent )
 			{
 				IndexedIOPtr tagsIO = m_indexedIO->subdirectory( tagsEntry, IndexedIO::NullIfMissing );
@@ -1718,6 +1941,19 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 					readTags( tags, true );
 					m_parent->writeTags( tags, true );
 				}
+
+				// nothing else will be written to this location, so we commit it to a
+				// subindex. this frees the index nodes for the whole subtree as we go,
+				// rather than leaving them all to be written in the main index when
+				// the file is closed.
+				m_indexedIO->commit();
+
+				// our parent only needs our bounds and transforms from now on.
+				AttributeSamplesMap().swap( m_attributeSampleTimes );
+				SampleTimes().swap( m_objectSampleTimes );
+				BoxSamples().swap( m_objectSamples );
+				AnimatedPrimVarMap().swap( m_animatedObjectPrimVars );
+				TagSet().swap( m_tagsFromChildren );
 			}
 
 			// deallocate children since we now computed everything from them anyways...
@@ -1726,6 +1962,8 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 			if ( !m_parent && m_sampleTimesMap )
 			{
 				// we are at the root...
+				m_tagIndex->write( m_indexedIO->parentDirectory()->subdirectory( tagIndexEntry, IndexedIO::CreateIfMissing ) );
+				delete m_tagIndex;
 				// deallocate samples map stored in the root object.
 				delete m_sampleTimesMap;
 				// and make sure the cache does not contain this file, forcing it to reload it.
@@ -1735,6 +1973,29 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 				}
 			}
 			m_sampleTimesMap = 0;
+			m_tagIndex = 0;
+		}
+
+		void addToTagIndex()
+		{
+			NameList localTags;
+			readTags( localTags, false );
+			if ( localTags.empty() && m_tagsFromChildren.empty() )
+			{
+				return;
+			}
+
+			SceneCache::Path p;
+			path( p );
+			const int location = m_tagIndex->location( p );
+			for ( NameList::const_iterator it = localTags.begin(); it != localTags.end(); ++it )
+			{
+				m_tagIndex->localTags[*it].push_back( location );
+			}
+			for ( TagSet::const_iterator it = m_tagsFromChildren.begin(); it != m_tagsFromChildren.end(); ++it )
+			{
+				m_tagIndex->childTags[*it].push_back( location );
+			}
 		}
 
 		/// This functions transforms the bounding boxes with the animated transforms and also scales the bounding boxes in a way that it
@@ -1869,7 +2130,130 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 		typedef std::map< SampleTimes, uint64_t > SampleTimesMap;
 		typedef std::map< SceneCache::Name, SampleTimes > AttributeSamplesMap;
 
+		/// Accumulates the tagged locations as they are flushed, so that the root
+		/// can write the tag index. The tagged locations and their ancestors are
+		/// added to a tree as we go, each stored as the index of its parent and its
+		/// name, so locations which share ancestors also share their storage.
+		struct TagIndex
+		{
+			typedef std::map< SceneCache::Name, std::vector<int> > TagLocations;
+			TagLocations localTags;
+			TagLocations childTags;
+
+			TagIndex()
+				:	parents( 1, -1 ), names( 1, SceneInterface::rootName )
+			{
+			}
+
+			/// Returns the index of the location with the given path, adding it and
+			/// its ancestors to the tree if necessary.
+			int location( const SceneCache::Path &p )
+			{
+				int result = 0;
+				for ( SceneCache::Path::const_iterator it = p.begin(); it != p.end(); ++it )
+				{
+					std::pair< LocationMap::iterator, bool > inserted = locations.insert( LocationMap::value_type( LocationMap::key_type( result, *it ), parents.size() ) );
+					if ( inserted.second )
+					{
+						parents.push_back( result );
+						names.push_back( *it );
+					}
+					result = inserted.first->second;
+				}
+				return result;
+			}
+
+			void write( IndexedIOPtr io )
+			{
+				std::vector<int> order;
+				pathOrder( order );
+
+				writeTagLocations( localTags, order, io->subdirectory( localTagsEntry, IndexedIO::CreateIfMissing ) );
+				writeTagLocations( childTags, order, io->subdirectory( childTagsEntry, IndexedIO::CreateIfMissing ) );
+
+				io->write( locationParentsEntry, &parents[0], parents.size() );
+				io->write( locationNamesEntry, &names[0], names.size() );
+			}
+
+			private :
+
+				typedef std::map< std::pair< int, SceneCache::Name >, int > LocationMap;
+
+				LocationMap locations;
+				std::vector<int> parents;
+				NameList names;
+
+				struct NameOrder
+				{
+					NameOrder( const NameList &names )
+						:	m_names( names )
+					{
+					}
+
+					bool operator()( int a, int b ) const
+					{
+						return SceneInterface::nameLess( m_names[a], m_names[b] );
+					}
+
+					const NameList &m_names;
+				};
+
+				struct PathOrder
+				{
+					PathOrder( const std::vector<int> &order )
+						:	m_order( order )
+					{
+					}
+
+					bool operator()( int a, int b ) const
+					{
+						return m_order[a] < m_order[b];
+					}
+
+					const std::vector<int> &m_order;
+				};
+
+				/// Fills order with the position of each location when sorted by path,
+				/// which is the order of a depth first traversal visiting children by name.
+				void pathOrder( std::vector<int> &order ) const
+				{
+					std::vector< std::vector<int> > children( parents.size() );
+					for ( size_t i = 1; i < parents.size(); ++i )
+					{
+						children[ parents[i] ].push_back( i );
+					}
+
+					order.resize( parents.size() );
+					int position = 0;
+					std::vector<int> toVisit( 1, 0 );
+					while ( !toVisit.empty() )
+					{
+						const int location = toVisit.back();
+						toVisit.pop_back();
+						order[location] = position++;
+
+						std::vector<int> &c = children[location];
+						std::sort( c.begin(), c.end(), NameOrder( names ) );
+						toVisit.insert( toVisit.end(), c.rbegin(), c.rend() );
+					}
+				}
+
+				static void writeTagLocations( TagLocations &tagLocations, const std::vector<int> &order, IndexedIOPtr io )
+				{
+					for ( TagLocations::iterator it = tagLocations.begin(); it != tagLocations.end(); ++it )
+					{
+						std::vector<int> &l = it->second;
+						std::sort( l.begin(), l.end(), PathOrder( order ) );
+						io->write( it->first, &l[0], l.size() );
+					}
+				}
+		};
+
+		typedef std::set< SceneCache::Name > TagSet;
+
 		SampleTimesMap *m_sampleTimesMap;
+		TagIndex *m_tagIndex;
+		TagSet m_tagsFromChildren;
 		SampleTimes m_boundSampleTimes;		// implicit or explicit bound sample times
 		SampleTimes m_transformSampleTimes;
 		AttributeSamplesMap m_attributeSampleTimes;
@@ -2145,10 +2529,30 @@ void SceneCache::writeTags( const NameList &tags )
 	writer->writeTags( tags );
 }
 
+void SceneCache::pathsWithTag( const Name &name, std::vector<Path> &paths ) const
+{
+	ReaderImplementation *reader = ReaderImplementation::reader( m_implementation.get() );
+	if ( !reader->indexedPathsWithTag( name, false, paths ) )
+	{
+		// the file was written without a tag index
+		SceneInterface::pathsWithTag( name, paths );
+	}
+}
+
+bool SceneCache::pathsWithTagFromChildren( const Name &name, std::vector<Path> &paths ) const
+{
+	ReaderImplementation *reader = ReaderImplementation::reader( m_implementation.get() );
+	return reader->indexedPathsWithTag( name, true, paths );
+}
+
 void SceneCache::writeTags( const NameList &tags, bool fromChildren )
 {
 	WriterImplementation *writer = WriterImplementation::writer( m_implementation.get() );
 	writer->writeTags( tags, fromChildren );
+	if ( fromChildren )
+	{
+		writer->recordTagsFromChildren( tags );
+	}
 }
 
 bool SceneCache::hasObject() const
@@ -2249,6 +2653,12 @@ SceneInterfacePtr SceneCache::createChild( const Name &name )
 	return duplicate( impl );
 }
 
+void SceneCache::finish()
+{
+	WriterImplementation *writer = WriterImplementation::writer( m_implementation.get() );
+	writer->finish();
+}
+
 SceneInterfacePtr SceneCache::scene( const Path &path, MissingBehaviour missingBehaviour )
 {
 	ReaderImplementation *reader = ReaderImplementation::reader( m_implementation.get() );
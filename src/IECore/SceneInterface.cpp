@@ -32,12 +32,75 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <fnmatch.h>
+
+#include <algorithm>
+#include <iterator>
+
 #include "boost/filesystem/convenience.hpp"
 #include "boost/tokenizer.hpp"
 #include "IECore/SceneInterface.h"
+#include "IECore/Exception.h"
 
 using namespace IECore;
 
+namespace
+{
+
+void sortPaths( std::vector<SceneInterface::Path> &paths )
+{
+	std::sort( paths.begin(), paths.end(), SceneInterface::pathLess );
+	paths.erase( std::unique( paths.begin(), paths.end() ), paths.end() );
+}
+
+void pathsWithTagWalk( const SceneInterface *scene, const SceneInterface::Name &name, SceneInterface::Path &path, std::vector<SceneInterface::Path> &paths )
+{
+	if ( !scene->hasTag( name, true ) )
+	{
+		return;
+	}
+
+	if ( scene->hasTag( name, false ) )
+	{
+		paths.push_back( path );
+	}
+
+	SceneInterface::NameList childNames;
+	scene->childNames( childNames );
+	for ( SceneInterface::NameList::const_iterator it = childNames.begin(); it != childNames.end(); ++it )
+	{
+		ConstSceneInterfacePtr child = scene->child( *it );
+		path.push_back( *it );
+		pathsWithTagWalk( child.get(), name, path, paths );
+		path.pop_back();
+	}
+}
+
+// Adds the paths for all the tags matching the pattern to result, which must be sorted.
+void pathsMatchingPattern( const SceneInterface *scene, const std::string &pattern, const SceneInterface::NameList &allTags, std::vector<SceneInterface::Path> &result )
+{
+	std::vector<SceneInterface::Path> paths;
+	if ( pattern.find_first_of( "*?[" ) == std::string::npos )
+	{
+		scene->pathsWithTag( pattern, paths );
+		result.insert( result.end(), paths.begin(), paths.end() );
+	}
+	else
+	{
+		for ( SceneInterface::NameList::const_iterator it = allTags.begin(); it != allTags.end(); ++it )
+		{
+			if ( fnmatch( pattern.c_str(), it->c_str(), 0 ) == 0 )
+			{
+				scene->pathsWithTag( *it, paths );
+				result.insert( result.end(), paths.begin(), paths.end() );
+			}
+		}
+	}
+	sortPaths( result );
+}
+
+} // namespace
+
 IE_CORE_DEFINERUNTIMETYPEDDESCRIPTION( SceneInterface )
 
 const SceneInterface::Name &SceneInterface::rootName = IndexedIO::rootName;
@@ -118,6 +181,82 @@ SceneInterface::~SceneInterface()
 {
 }
 
+void SceneInterface::pathsWithTag( const Name &name, std::vector<Path> &paths ) const
+{
+	paths.clear();
+	Path p;
+	path( p );
+	pathsWithTagWalk( this, name, p, paths );
+	sortPaths( paths );
+}
+
+void SceneInterface::matchingPaths( const std::string &tagExpression, std::vector<Path> &paths ) const
+{
+	NameList allTags;
+	readTags( allTags, true );
+
+	std::vector<Path> included, required, excluded;
+	bool haveIncluded = false, haveRequired = false;
+
+	typedef boost::tokenizer<boost::char_separator<char> > Tokenizer;
+	Tokenizer tokens( tagExpression, boost::char_separator<char>( " \t\n" ) );
+	for ( Tokenizer::iterator t = tokens.begin(); t != tokens.end(); ++t )
+	{
+		char op = (*t)[0];
+		std::string pattern = *t;
+		if ( op == '&' || op == '!' )
+		{
+			pattern = pattern.substr( 1 );
+		}
+		if ( pattern.empty() )
+		{
+			throw InvalidArgumentException( "Invalid tag expression \"" + tagExpression + "\"" );
+		}
+
+		if ( op == '!' )
+		{
+			pathsMatchingPattern( this, pattern, allTags, excluded );
+		}
+		else if ( op == '&' )
+		{
+			std::vector<Path> termPaths;
+			pathsMatchingPattern( this, pattern, allTags, termPaths );
+			if ( haveRequired )
+			{
+				std::vector<Path> intersection;
+				std::set_intersection( required.begin(), required.end(), termPaths.begin(), termPaths.end(), std::back_inserter( intersection ), pathLess );
+				required.swap( intersection );
+			}
+			else
+			{
+				required.swap( termPaths );
+				haveRequired = true;
+			}
+		}
+		else
+		{
+			pathsMatchingPattern( this, pattern, allTags, included );
+			haveIncluded = true;
+		}
+	}
+
+	if ( !haveIncluded )
+	{
+		// consider all the tagged locations
+		pathsMatchingPattern( this, "*", allTags, included );
+	}
+
+	if ( haveRequired )
+	{
+		std::vector<Path> intersection;
+		std::set_intersection( included.begin(), included.end(), required.begin(), required.end(), std::back_inserter( intersection ), pathLess );
+		included.swap( intersection );
+	}
+
+	paths.clear();
+	std::set_difference( included.begin(), included.end(), excluded.begin(), excluded.end(), std::back_inserter( paths ), pathLess );
+}
+
 void SceneInterface::pathToString( const SceneInterface::Path &p, std::string &path )
 {
 	if ( !p.size() )
@@ -155,4 +294,14 @@ void SceneInterface::stringToPath( const std::string &path, SceneInterface::Path
 	}
 }
 
+bool SceneInterface::nameLess( const Name &a, const Name &b )
+{
+	return a.value() < b.value();
+}
+
+bool SceneInterface::pathLess( const Path &a, const Path &b )
+{
+	return std::lexicographical_compare( a.begin(), a.end(), b.begin(), b.end(), nameLess );
+}
+
 
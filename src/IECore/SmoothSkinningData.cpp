@@ -203,11 +203,17 @@ void SmoothSkinningData::validateIds() const
 {
 	int cpii = m_pointInfluenceIndices->readable().size();
 	int cin = m_influenceNames->readable().size();
-	// check for invalid ids in m_pointIndexOffset
+	// check for invalid ids in m_pointIndexOffset. points without influences
+	// don't index anything, so their offsets are left to validateOffsets().
+	const std::vector<int> &pointInfluenceCounts = m_pointInfluenceCounts->readable();
 	for( std::vector<int>::const_iterator it = m_pointIndexOffsets->readable().begin();
 		 it!=m_pointIndexOffsets->readable().end(); ++it )
 	{
 		int o = (*it);
+		if ( !pointInfluenceCounts[it - m_pointIndexOffsets->readable().begin()] )
+		{
+			continue;
+		}
 		if ( ( o < 0 ) or ( o > (cpii-1) ) )
 		{
 			int id = it - m_pointIndexOffsets->readable().begin();
@@ -321,7 +327,7 @@ bool SmoothSkinningData::isEqualTo(  const IECore::Object *other ) const
 		return false;
 	}
 
-	if(	!m_influencePose->isEqualTo( tOther->m_influencePose ) )
+	if(	!m_pointIndexOffsets->isEqualTo( tOther->m_pointIndexOffsets ) )
 	{
 		return false;
 	}
@@ -48,6 +48,10 @@
 #include "boost/iostreams/stream.hpp"
 #include "boost/iostreams/filter/gzip.hpp"
 
+#include "tbb/mutex.h"
+#include "tbb/spin_rw_mutex.h"
+#include "tbb/atomic.h"
+
 #include "IECore/ByteOrder.h"
 #include "IECore/MemoryStream.h"
 #include "IECore/MessageHandler.h"
@@ -68,6 +72,15 @@ static const Imf::Int64 g_versionedMagicNumber = 0xB00B1E50;
 ///            Removed the linkCount field on the data nodes.
 static const Imf::Int64 g_currentVersion = 5;
 
+/// The limit on the memory used by the subindexes loaded from each file
+/// opened in Read mode. Zero means unlimited. It may be changed while other
+/// threads are reading files, hence the atomic, which is zero-initialised.
+static tbb::atomic<size_t> g_subIndexMemoryLimit;
+
+/// An estimate of the memory used by each entry of a std::map, in
+/// addition to the value itself.
+static const size_t g_mapEntryOverhead = 4 * sizeof( void * );
+
 /// FileFormat ::= Data Index IndexOffset Version MagicNumber
 /// Data ::= DataEntry*
 /// Index ::= zip(StringCache NodeTree FreePages)
@@ -246,6 +259,16 @@ class StreamIndexedIO::StringCache
 			return m_stringToIdMap.size();
 		}
 
+		/// Returns an estimate of the memory used by the cache, excluding
+		/// the strings themselves, which are owned by InternedString.
+		size_t memoryUsage() const
+		{
+			return
+				m_stringToIdMap.size() * ( sizeof( StringToIdMap::value_type ) + g_mapEntryOverhead ) +
+				m_idToStringMap.capacity() * sizeof( IdToStringMap::value_type ) +
+				m_ioBufferLen;
+		}
+
 	protected:
 
 		template < typename F >
@@ -304,6 +327,16 @@ class BaseNode : public RefCounted
 
 IE_CORE_DECLAREPTR( BaseNode );
 
+static bool childNameLess( const BaseNodePtr &a, const BaseNodePtr &b )
+{
+	return a->m_name < b->m_name;
+}
+
+static bool childNameLessThanName( const BaseNodePtr &a, const IndexedIO::EntryID &name )
+{
+	return a->m_name < name;
+}
+
 /// Class that represents a Data node
 class DataNode : public BaseNode
 {
@@ -357,6 +390,11 @@ class StreamIndexedIO::Node : public BaseNode
 		typedef std::map< IndexedIO::EntryID, BaseNodePtr> ChildMap;
 		ChildMap m_children;
 
+		/// A more compact alternative to m_children, sorted by name. It is used
+		/// instead of m_children for the read-only nodes of files opened in Read mode.
+		typedef std::vector< BaseNodePtr > ChildVector;
+		ChildVector m_sortedChildren;
+
 	public:
 
 		/// Construct a new Node in the given index with the given numeric id
@@ -384,6 +422,10 @@ class StreamIndexedIO::Node : public BaseNode
 
 		void removeChild( const IndexedIO::EntryID &childName, bool throwException = true );
 
+		/// Appends all children to the result, regardless of how they are stored.
+		/// Does not load the children from a subindex.
+		void allChildren( std::vector< BaseNode * > &result ) const;
+
 		IndexedIO::EntryType entryType() const
 		{
 			return IndexedIO::Directory;
@@ -395,6 +437,10 @@ class StreamIndexedIO::Node : public BaseNode
 
 		/// registers a child node in this node
 		void registerChild( BaseNode* c );
+		/// Takes ownership of the children, storing them in m_sortedChildren.
+		void adoptChildren( ChildVector &children );
+		/// Returns the named child without any locking, or NULL if not existent.
+		BaseNode* findChild( const IndexedIO::EntryID &name ) const;
 };
 
 /// A tree to represent nodes in a filesystem, along with their locations in a file.
@@ -437,10 +483,66 @@ class StreamIndexedIO::Index : public RefCounted
 		/// read the subindex that contains the children of the given node
 		void readNodeFromSubIndex( Node *n );
 
+		/// Guards access to the children of a node. For files opened in Read mode,
+		/// it first loads the children from the subindex if necessary, and then
+		/// prevents them from being evicted until the lock is destroyed.
+		class ChildrenLock;
+
+		/// Returns an estimate of the memory used by the index, in bytes.
+		size_t memoryUsage() const;
+
+		/// Appends the name and memoryUsage() of every open index to usage.
+		static void openIndicesMemoryUsage( StreamIndexedIO::MemoryUsageVector &usage );
+
 	protected:
 
 		NodePtr m_root;
 
+		/// True for files opened in Read mode, in which case the nodes are
+		/// stored compactly and subindexes may be evicted.
+		bool m_readOnly;
+
+		typedef tbb::spin_rw_mutex EvictionMutex;
+		/// Held for reading while accessing the children of a node, and for
+		/// writing while loading or evicting subindexes.
+		mutable EvictionMutex m_evictionMutex;
+
+		/// An estimate of the memory used by the nodes read from the main index.
+		size_t m_mainIndexMemory;
+		/// An estimate of the memory used by the currently loaded subindexes.
+		size_t m_subIndexMemory;
+
+		/// The subindexes currently loaded from files in Read mode, oldest first.
+		struct LoadedSubIndex
+		{
+			LoadedSubIndex( Node *node, size_t memory ) : m_node( node ), m_memory( memory ) {}
+			Node *m_node;
+			size_t m_memory;
+		};
+		typedef std::list< LoadedSubIndex > LoadedSubIndexList;
+		LoadedSubIndexList m_loadedSubIndexes;
+		typedef std::map< const Node *, LoadedSubIndexList::iterator > LoadedSubIndexMap;
+		LoadedSubIndexMap m_loadedSubIndexMap;
+
+		/// Returns an estimate of the memory used by the children of the
+		/// node, excluding any with subindexes of their own.
+		static size_t childrenMemory( const Node *n );
+		/// Returns true if no IndexedIO refers to the node or anything
+		/// loaded beneath it, so that its children may be released.
+		bool evictable( const Node *n ) const;
+		/// Releases the children of a loaded subindex node, so that they will
+		/// be loaded again when next needed. Must be called with m_evictionMutex
+		/// held for writing.
+		void evict( Node *n );
+		void forgetLoadedSubIndex( const Node *n );
+		/// Evicts the oldest evictable subindexes until the memory used is
+		/// below the limit, or there is nothing else to evict.
+		void enforceSubIndexMemoryLimit( const Node *exclude );
+
+		typedef std::set< Index * > IndexSet;
+		static IndexSet &openIndices();
+		static tbb::mutex &openIndicesMutex();
+
 		Imf::Int64 m_version;
 
 		bool m_hasChanged;
@@ -506,7 +608,43 @@ class StreamIndexedIO::Index : public RefCounted
 		template < typename F >
 		BaseNode *readNode( F &f );
 
-		void recursiveSetSubIndex( Node *n );
+		/// Marks the node and all its descendants as committed to a subindex,
+		/// and releases their children. Descendants may outlive this if an
+		/// IndexedIO still refers to them, but their children will not.
+		void releaseCommittedNode( Node *n );
+
+};
+
+class StreamIndexedIO::Index::ChildrenLock : boost::noncopyable
+{
+
+	public :
+
+		ChildrenLock( const Node *node )
+		{
+			Index *index = node->m_idx;
+			if ( !index->m_readOnly )
+			{
+				return;
+			}
+
+			while ( true )
+			{
+				m_lock.acquire( index->m_evictionMutex, /* write = */ false );
+				if ( node->m_subindex != Node::SavedSubIndex )
+				{
+					return;
+				}
+				// the children aren't loaded (or were evicted) - load
+				// them and try again.
+				m_lock.release();
+				index->readNodeFromSubIndex( const_cast< Node * >( node ) );
+			}
+		}
+
+	private :
+
+		EvictionMutex::scoped_lock m_lock;
 
 };
 
@@ -545,13 +683,50 @@ void StreamIndexedIO::Node::registerChild( BaseNode* c )
 	m_children.insert( std::map< IndexedIO::EntryID, BaseNodePtr >::value_type( c->m_name, c) );
 }
 
-bool StreamIndexedIO::Node::hasChild( const IndexedIO::EntryID &name ) const
+void StreamIndexedIO::Node::adoptChildren( ChildVector &children )
 {
-	return m_children.find( name ) != m_children.end();
+	for ( ChildVector::const_iterator it = children.begin(); it != children.end(); ++it )
+	{
+		if ( (*it)->entryType() == IndexedIO::Directory )
+		{
+			Node *childNode = static_cast< Node *>( it->get() );
+			if (childNode->m_parent)
+			{
+				throw IOException("StreamIndexedIO: Node already has parent!");
+			}
+
+			childNode->m_parent = this;
+		}
+	}
+
+	std::sort( children.begin(), children.end(), childNameLess );
+	m_sortedChildren.swap( children );
 }
 
-BaseNode* StreamIndexedIO::Node::child( const IndexedIO::EntryID &name ) const
+void StreamIndexedIO::Node::allChildren( std::vector< BaseNode * > &result ) const
+{
+	for ( ChildVector::const_iterator it = m_sortedChildren.begin(); it != m_sortedChildren.end(); ++it )
+	{
+		result.push_back( it->get() );
+	}
+	for ( ChildMap::const_iterator it = m_children.begin(); it != m_children.end(); ++it )
+	{
+		result.push_back( it->second.get() );
+	}
+}
+
+BaseNode* StreamIndexedIO::Node::findChild( const IndexedIO::EntryID &name ) const
 {
+	if ( m_sortedChildren.size() )
+	{
+		ChildVector::const_iterator it = std::lower_bound( m_sortedChildren.begin(), m_sortedChildren.end(), name, childNameLessThanName );
+		if ( it != m_sortedChildren.end() && (*it)->m_name == name )
+		{
+			return it->get();
+		}
+		return 0;
+	}
+
 	ChildMap::const_iterator cit = m_children.find( name );
 	if (cit == m_children.end())
 	{
@@ -560,6 +735,18 @@ BaseNode* StreamIndexedIO::Node::child( const IndexedIO::EntryID &name ) const
 	return cit->second.get();
 }
 
+bool StreamIndexedIO::Node::hasChild( const IndexedIO::EntryID &name ) const
+{
+	Index::ChildrenLock lock( this );
+	return findChild( name );
+}
+
+BaseNode* StreamIndexedIO::Node::child( const IndexedIO::EntryID &name ) const
+{
+	Index::ChildrenLock lock( this );
+	return findChild( name );
+}
+
 StreamIndexedIO::Node* StreamIndexedIO::Node::child( const IndexedIO::EntryID &name, bool loadChildren ) const
 {
 	Node *n = 0;
@@ -570,6 +757,8 @@ StreamIndexedIO::Node* StreamIndexedIO::Node::child( const IndexedIO::EntryID &n
 		{
 			n = static_cast< Node *>( p );
 			
+			// the lock taken by child() must have been released by now, as
+			// loading the subindex needs exclusive access.
 			if ( loadChildren && n->m_subindex )
 			{
 				m_idx->readNodeFromSubIndex( n );
@@ -665,8 +854,14 @@ const IndexedIO::EntryID &StreamIndexedIO::Node::name() const
 
 void StreamIndexedIO::Node::childNames( IndexedIO::EntryIDList &names ) const
 {
+	Index::ChildrenLock lock( this );
+
 	names.clear();
-	names.reserve( m_children.size() );
+	names.reserve( m_children.size() + m_sortedChildren.size() );
+	for ( ChildVector::const_iterator it = m_sortedChildren.begin(); it != m_sortedChildren.end(); it++ )
+	{
+		names.push_back( (*it)->m_name );
+	}
 	for ( ChildMap::const_iterator cit = m_children.begin(); cit != m_children.end(); cit++ )
 	{
 		names.push_back( cit->first );
@@ -675,11 +870,21 @@ void StreamIndexedIO::Node::childNames( IndexedIO::EntryIDList &names ) const
 
 void StreamIndexedIO::Node::childNames( IndexedIO::EntryIDList &names, IndexedIO::EntryType type ) const
 {
+	Index::ChildrenLock lock( this );
+
 	names.clear();
-	names.reserve( m_children.size() );
+	names.reserve( m_children.size() + m_sortedChildren.size() );
 	
 	bool typeIsDirectory = ( type == IndexedIO::Directory );
 
+	for ( ChildVector::const_iterator it = m_sortedChildren.begin(); it != m_sortedChildren.end(); it++ )
+	{
+		bool childIsDirectory = ( (*it)->entryType() == IndexedIO::Directory );
+		if ( typeIsDirectory == childIsDirectory )
+		{
+			names.push_back( (*it)->m_name );
+		}
+	}
 	for ( ChildMap::const_iterator cit = m_children.begin(); cit != m_children.end(); cit++ )
 	{
 		bool childIsDirectory = ( cit->second->entryType() == IndexedIO::Directory );
@@ -721,13 +926,23 @@ void StreamIndexedIO::Node::removeChild( const IndexedIO::EntryID &childName, bo
 //
 ///////////////////////////////////////////////
 
-StreamIndexedIO::Index::Index( StreamIndexedIO::StreamFilePtr stream ) : m_root(0), m_version(g_currentVersion), m_hasChanged(false), m_offset(0), m_next(0), m_stream(stream)
+StreamIndexedIO::Index::Index( StreamIndexedIO::StreamFilePtr stream )
+	:	m_root(0), m_readOnly( stream->openMode() & IndexedIO::Read ), m_mainIndexMemory(0), m_subIndexMemory(0),
+		m_version(g_currentVersion), m_hasChanged(false), m_offset(0), m_next(0), m_stream(stream)
 {
 	m_stringCache.add(IndexedIO::rootName);
+
+	tbb::mutex::scoped_lock lock( openIndicesMutex() );
+	openIndices().insert( this );
 }
 
 StreamIndexedIO::Index::~Index()
 {
+	{
+		tbb::mutex::scoped_lock lock( openIndicesMutex() );
+		openIndices().erase( this );
+	}
+
 	flush();
 
 	assert( m_freePagesOffset.size() == m_freePagesSize.size() );
@@ -802,6 +1017,8 @@ void StreamIndexedIO::Index::openStream()
 		{
 			read( f );
 		}
+
+		m_mainIndexMemory = sizeof( Node ) + childrenMemory( m_root.get() );
 	}
 	else
 	{
@@ -1020,10 +1237,23 @@ BaseNode *StreamIndexedIO::Index::readNode( F &f )
 			unsigned int nodeCount = 0;
 			readLittleEndian( f, nodeCount );
 
-			for ( unsigned int c = 0; c < nodeCount; c++ )
+			if ( m_readOnly )
+			{
+				Node::ChildVector children;
+				children.reserve( nodeCount );
+				for ( unsigned int c = 0; c < nodeCount; c++ )
+				{
+					children.push_back( readNode( f ) );
+				}
+				n->adoptChildren( children );
+			}
+			else
 			{
-				BaseNode *child = readNode( f );
-				n->registerChild( child );
+				for ( unsigned int c = 0; c < nodeCount; c++ )
+				{
+					BaseNode *child = readNode( f );
+					n->registerChild( child );
+				}
 			}
 		}
 		return n;
@@ -1493,22 +1723,23 @@ void StreamIndexedIO::Index::deallocateWalk( BaseNode* n )
 
 }
 
-void StreamIndexedIO::Index::recursiveSetSubIndex( Node *n )
+void StreamIndexedIO::Index::releaseCommittedNode( Node *n )
 {
 	n->m_subindex = Node::SavedSubIndex;
 
 	for (Node::ChildMap::const_iterator it = n->m_children.begin(); it != n->m_children.end(); ++it)
 	{
-		Node *childNode = static_cast<Node*>(it->second.get());
-
-		if ( childNode->entryType() != IndexedIO::Directory )
+		if ( it->second->entryType() != IndexedIO::Directory )
 			continue;
 
-		if (childNode && childNode->m_subindex == StreamIndexedIO::Node::NoSubIndex )
+		Node *childNode = static_cast<Node*>(it->second.get());
+		if ( childNode->m_subindex == StreamIndexedIO::Node::NoSubIndex )
 		{
-			recursiveSetSubIndex( childNode );
+			releaseCommittedNode( childNode );
 		}
 	}
+
+	n->m_children.clear();
 }
 
 void StreamIndexedIO::Index::commitNodeToSubIndex( Node *n )
@@ -1556,11 +1787,9 @@ void StreamIndexedIO::Index::commitNodeToSubIndex( Node *n )
 
 		n->m_offset = writeUniqueData( data, subindexSize, true );
 
-		// set all child nodes as committed to a subindex (this also makes them read-only)
-		recursiveSetSubIndex( n );
-
-		// remove all children from this node ( freeing some memory if there's no external references)
-		n->m_children.clear();
+		// set all child nodes as committed to a subindex (this also makes them read-only),
+		// and drop them from memory. the subindex is all we need to write the main index.
+		releaseCommittedNode( n );
 	}
 }
 
@@ -1596,15 +1825,201 @@ void StreamIndexedIO::Index::readNodeFromSubIndex( Node *n )
 	unsigned int nodeCount = 0;
 
 	readLittleEndian( decompressingStream, nodeCount );
-	
+
+	if ( !m_readOnly )
+	{
+		for ( unsigned int i = 0; i < nodeCount; i++ )
+		{
+			BaseNode *child = readNode( decompressingStream );
+			n->registerChild( child );
+		}
+
+		/// mark the node as loaded from subindex
+		n->m_subindex = Node::LoadedSubIndex;
+		m_subIndexMemory += childrenMemory( n );
+		return;
+	}
+
+	Node::ChildVector children;
+	children.reserve( nodeCount );
 	for ( unsigned int i = 0; i < nodeCount; i++ )
 	{
-		BaseNode *child = readNode( decompressingStream );
-		n->registerChild( child );
+		children.push_back( readNode( decompressingStream ) );
 	}
 
-	/// mark the node as loaded from subindex
+	/// publish the children, and make room for them by evicting older subindexes if necessary
+	EvictionMutex::scoped_lock evictionLock( m_evictionMutex, /* write = */ true );
+
+	n->adoptChildren( children );
 	n->m_subindex = Node::LoadedSubIndex;
+
+	size_t memory = childrenMemory( n );
+	m_loadedSubIndexes.push_back( LoadedSubIndex( n, memory ) );
+	m_loadedSubIndexMap[n] = --m_loadedSubIndexes.end();
+	m_subIndexMemory += memory;
+
+	enforceSubIndexMemoryLimit( n );
+}
+
+size_t StreamIndexedIO::Index::childrenMemory( const Node *n )
+{
+	size_t result =
+		n->m_sortedChildren.capacity() * sizeof( BaseNodePtr ) +
+		n->m_children.size() * ( sizeof( Node::ChildMap::value_type ) + g_mapEntryOverhead );
+
+	std::vector< BaseNode * > children;
+	n->allChildren( children );
+	for ( std::vector< BaseNode * >::const_iterator it = children.begin(); it != children.end(); ++it )
+	{
+		if ( (*it)->entryType() == IndexedIO::Directory )
+		{
+			const Node *childNode = static_cast< const Node * >( *it );
+			result += sizeof( Node );
+			// children loaded from their own subindex are accounted for separately
+			if ( childNode->m_subindex == Node::NoSubIndex )
+			{
+				result += childrenMemory( childNode );
+			}
+		}
+		else
+		{
+			result += sizeof( DataNode );
+		}
+	}
+
+	return result;
+}
+
+bool StreamIndexedIO::Index::evictable( const Node *n ) const
+{
+	// the only reference should be from the parent (or from m_root)
+	if ( n->refCount() != 1 )
+	{
+		return false;
+	}
+
+	for ( Node::ChildVector::const_iterator it = n->m_sortedChildren.begin(); it != n->m_sortedChildren.end(); ++it )
+	{
+		const BaseNode *child = it->get();
+		if ( child->entryType() == IndexedIO::Directory )
+		{
+			const Node *childNode = static_cast< const Node * >( child );
+			if ( childNode->m_subindex != Node::SavedSubIndex && !evictable( childNode ) )
+			{
+				return false;
+			}
+		}
+		else if ( child->refCount() != 1 )
+		{
+			return false;
+		}
+	}
+
+	return true;
+}
+
+void StreamIndexedIO::Index::evict( Node *n )
+{
+	// forget about any subindexes loaded beneath this one, as they
+	// are about to be released too.
+	for ( Node::ChildVector::const_iterator it = n->m_sortedChildren.begin(); it != n->m_sortedChildren.end(); ++it )
+	{
+		if ( (*it)->entryType() == IndexedIO::Directory )
+		{
+			Node *childNode = static_cast< Node * >( it->get() );
+			if ( childNode->m_subindex != Node::SavedSubIndex )
+			{
+				evict( childNode );
+			}
+		}
+	}
+
+	if ( n->m_subindex == Node::LoadedSubIndex )
+	{
+		forgetLoadedSubIndex( n );
+		Node::ChildVector().swap( n->m_sortedChildren );
+		n->m_subindex = Node::SavedSubIndex;
+	}
+}
+
+void StreamIndexedIO::Index::forgetLoadedSubIndex( const Node *n )
+{
+	LoadedSubIndexMap::iterator it = m_loadedSubIndexMap.find( n );
+	if ( it == m_loadedSubIndexMap.end() )
+	{
+		return;
+	}
+
+	m_subIndexMemory -= it->second->m_memory;
+	m_loadedSubIndexes.erase( it->second );
+	m_loadedSubIndexMap.erase( it );
+}
+
+void StreamIndexedIO::Index::enforceSubIndexMemoryLimit( const Node *exclude )
+{
+	const size_t limit = g_subIndexMemoryLimit;
+	if ( !limit )
+	{
+		return;
+	}
+
+	LoadedSubIndexList::iterator it = m_loadedSubIndexes.begin();
+	while ( m_subIndexMemory > limit && it != m_loadedSubIndexes.end() )
+	{
+		if ( it->m_node == exclude || !evictable( it->m_node ) )
+		{
+			++it;
+			continue;
+		}
+
+		// evicting removes the entry for the node, along with the entries for
+		// any subindexes loaded beneath it. these were necessarily loaded later,
+		// so the preceding entry remains valid and we can continue from there.
+		bool first = ( it == m_loadedSubIndexes.begin() );
+		LoadedSubIndexList::iterator previous = it;
+		if ( !first )
+		{
+			--previous;
+		}
+
+		evict( it->m_node );
+
+		if ( first )
+		{
+			it = m_loadedSubIndexes.begin();
+		}
+		else
+		{
+			it = ++previous;
+		}
+	}
+}
+
+size_t StreamIndexedIO::Index::memoryUsage() const
+{
+	StreamFile::MutexLock lock( m_stream->mutex() );
+	return m_stringCache.memoryUsage() + m_mainIndexMemory + m_subIndexMemory;
+}
+
+StreamIndexedIO::Index::IndexSet &StreamIndexedIO::Index::openIndices()
+{
+	static IndexSet s;
+	return s;
+}
+
+tbb::mutex &StreamIndexedIO::Index::openIndicesMutex()
+{
+	static tbb::mutex m;
+	return m;
+}
+
+void StreamIndexedIO::Index::openIndicesMemoryUsage( StreamIndexedIO::MemoryUsageVector &usage )
+{
+	tbb::mutex::scoped_lock lock( openIndicesMutex() );
+	for ( IndexSet::const_iterator it = openIndices().begin(); it != openIndices().end(); ++it )
+	{
+		usage.push_back( StreamIndexedIO::MemoryUsageVector::value_type( (*it)->m_stream->name(), (*it)->memoryUsage() ) );
+	}
 }
 
 ///////////////////////////////////////////////
@@ -1636,6 +2051,11 @@ StreamIndexedIO::StreamFile::~StreamFile()
 	}
 }
 
+std::string StreamIndexedIO::StreamFile::name() const
+{
+	return "";
+}
+
 IndexedIO::OpenMode StreamIndexedIO::StreamFile::openMode() const
 {
 	return m_openmode;
@@ -1778,19 +2198,10 @@ StreamIndexedIO::~StreamIndexedIO()
 	{
 		// remove our reference to the index, it's destructor triggers the 
 		// flush to disk.
+		// Note that in read-only mode, the memory used by committed directories
+		// is reclaimed by the Index itself, according to the limit set with
+		// setSubIndexMemoryLimit().
 		m_node->m_idx->removeRef();
-
-		// \todo Free some memory for committed directories in read-only mode:
-		/// Should we deallocate the tree when the StreamIndexedIO for the root dies?
-		/// m_node = 0;
-		/// Lock read mutex
-		/// if ( m_node->refCount() == 1 )
-		///    only parent pointing to it...
-		///    if ( m_node->n_subindex && m_node->n_offset )
-		//         // check if all the children has refCount == 1
-		//         if ( childrenRefCount is one )
-		//             m_node->children.clear()
-		//             m_node->m_subindex = Node::SavedSubIndex
 	}
 }
 
@@ -2000,6 +2411,28 @@ IndexedIO::Entry StreamIndexedIO::entry(const IndexedIO::EntryID &name) const
 	return IndexedIO::Entry( node->m_name, IndexedIO::Directory, IndexedIO::Invalid, 0 );
 }
 
+size_t StreamIndexedIO::indexMemoryUsage() const
+{
+	assert( m_node );
+	return m_node->m_idx->memoryUsage();
+}
+
+void StreamIndexedIO::openFilesIndexMemoryUsage( MemoryUsageVector &usage )
+{
+	usage.clear();
+	Index::openIndicesMemoryUsage( usage );
+}
+
+void StreamIndexedIO::setSubIndexMemoryLimit( size_t bytes )
+{
+	g_subIndexMemoryLimit = bytes;
+}
+
+size_t StreamIndexedIO::getSubIndexMemoryLimit()
+{
+	return g_subIndexMemoryLimit;
+}
+
 IndexedIOPtr StreamIndexedIO::parentDirectory()
 {
 	assert( m_node );
@@ -2024,7 +2457,8 @@ ConstIndexedIOPtr StreamIndexedIO::parentDirectory() const
 
 IndexedIOPtr StreamIndexedIO::directory( const IndexedIO::EntryIDList &path, IndexedIO::MissingBehaviour missingBehaviour )
 {
-	// from the root go to the path
+	// from the root go to the path. we hold references to the nodes
+	// as we go, so their children can't be evicted from beneath us.
 	Node* root = m_node;
 	Node* parentNode = root->m_parent;
 	while (parentNode)
@@ -2032,12 +2466,12 @@ IndexedIOPtr StreamIndexedIO::directory( const IndexedIO::EntryIDList &path, Ind
 		root = parentNode;
 		parentNode = root->m_parent;
 	}
-	Node* node = root;
+	NodePtr node = root;
 	for ( IndexedIO::EntryIDList::const_iterator pIt = path.begin(); pIt != path.end(); pIt++ )
 	{
 		const IndexedIO::EntryID &name = *pIt;
 
-		Node* childNode = node->child( name, true );
+		NodePtr childNode = node->child( name, true );
 		if ( !childNode )
 		{
 			if ( missingBehaviour == IndexedIO::CreateIfMissing )
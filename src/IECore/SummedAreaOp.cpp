@@ -32,6 +32,9 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include "tbb/parallel_for.h"
+#include "tbb/blocked_range.h"
+
 #include "IECore/SummedAreaOp.h"
 #include "IECore/DespatchTypedData.h"
 #include "IECore/TypeTraits.h"
@@ -51,6 +54,80 @@ SummedAreaOp::~SummedAreaOp()
 {
 }
 
+namespace
+{
+
+// Replaces each pixel in a range of rows with the sum of the pixels to its left, inclusive.
+template<typename V>
+class SumRows
+{
+
+	public :
+
+		SumRows( V *buffer, size_t width )
+			:	m_buffer( buffer ), m_width( width )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &rows ) const
+		{
+			for( size_t y=rows.begin(); y!=rows.end(); y++ )
+			{
+				V *p = m_buffer + y * m_width;
+				V *pEnd = p + m_width;
+				V rowSum = 0;
+				for( ; p!=pEnd; p++ )
+				{
+					rowSum += *p;
+					*p = rowSum;
+				}
+			}
+		}
+
+	private :
+
+		V *m_buffer;
+		size_t m_width;
+
+};
+
+// Accumulates the row sums down a range of columns. The rows are visited in order
+// within each column, but the columns are independent of one another.
+template<typename V>
+class SumColumns
+{
+
+	public :
+
+		SumColumns( V *buffer, size_t width, size_t height )
+			:	m_buffer( buffer ), m_width( width ), m_height( height )
+		{
+		}
+
+		void operator()( const tbb::blocked_range<size_t> &columns ) const
+		{
+			for( size_t y=1; y<m_height; y++ )
+			{
+				V *p = m_buffer + y * m_width + columns.begin();
+				V *pEnd = m_buffer + y * m_width + columns.end();
+				const V *upper = p - m_width;
+				for( ; p!=pEnd; p++, upper++ )
+				{
+					*p += *upper;
+				}
+			}
+		}
+
+	private :
+
+		V *m_buffer;
+		size_t m_width;
+		size_t m_height;
+
+};
+
+} // namespace
+
 struct SummedAreaOp::SumArea
 {
 	typedef void ReturnType;
@@ -65,30 +142,20 @@ struct SummedAreaOp::SumArea
 	{
 		typedef typename T::ValueType Container;
 		typedef typename Container::value_type V;
-		typedef typename Container::iterator It;
 
 		Container &buffer = data->writable();
-
-		// deal with first row alone, as it doesn't have values above it
-		unsigned pixelIndex=0;
-		V rowSum = 0;
-		for( int x=m_dataWindow.min.x; x<=m_dataWindow.max.x; x++, pixelIndex++ )
+		if( buffer.empty() )
 		{
-			rowSum += buffer[pixelIndex];
-			buffer[pixelIndex] = rowSum;
-		}
-		// now do the other rows
-		unsigned upperPixelIndex = 0;
-		pixelIndex = m_dataWindow.size().x + 1;
-		for( int y=m_dataWindow.min.y + 1; y<=m_dataWindow.max.y; y++ )
-		{
-			rowSum = 0;
-			for( int x=m_dataWindow.min.x; x<=m_dataWindow.max.x; x++ )
-			{
-				rowSum += buffer[pixelIndex];
-				buffer[pixelIndex++] = rowSum + buffer[upperPixelIndex++];
-			}
+			return;
 		}
+
+		// the table is computed in two passes - first each row is summed independently,
+		// and then the row sums are accumulated down each column. both passes are parallel,
+		// and they perform exactly the same additions as summing the rows one at a time.
+		const size_t width = m_dataWindow.size().x + 1;
+		const size_t height = m_dataWindow.size().y + 1;
+		tbb::parallel_for( tbb::blocked_range<size_t>( 0, height ), SumRows<V>( &(buffer[0]), width ) );
+		tbb::parallel_for( tbb::blocked_range<size_t>( 0, width, 256 ), SumColumns<V>( &(buffer[0]), width, height ) );
 	}
 
 	private :
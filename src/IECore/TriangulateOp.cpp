@@ -359,8 +359,8 @@ void TriangulateOp::modifyTypedPrimitive( MeshPrimitive * mesh, const CompoundOb
 		return;
 	}
 
-	const float tolerance = toleranceParameter()->getNumericValue();
-	bool throwExceptions = static_cast<const BoolData *>(throwExceptionsParameter()->getValue())->readable();
+	const float tolerance = operands->member<FloatData>( "tolerance", true )->readable();
+	bool throwExceptions = operands->member<BoolData>( "throwExceptions", true )->readable();
 
 	PrimitiveVariableMap::const_iterator pvIt = mesh->variables.find("P");
 	if (pvIt != mesh->variables.end())
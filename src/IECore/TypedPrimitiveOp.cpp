@@ -80,4 +80,5 @@ namespace IECore
 IE_CORE_DEFINETYPEDPRIMITIVEOPSPECIALISATION( MeshPrimitive, MeshPrimitiveOp );
 IE_CORE_DEFINETYPEDPRIMITIVEOPSPECIALISATION( ImagePrimitive, ImagePrimitiveOp );
 IE_CORE_DEFINETYPEDPRIMITIVEOPSPECIALISATION( CurvesPrimitive, CurvesPrimitiveOp );
+IE_CORE_DEFINETYPEDPRIMITIVEOPSPECIALISATION( PointsPrimitive, PointsPrimitiveOp );
 }
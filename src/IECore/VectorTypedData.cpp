@@ -33,6 +33,11 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include <cassert>
+#include <cstdlib>
+
+#include "boost/lexical_cast.hpp"
+
+#include "tbb/atomic.h"
 
 #include "IECore/VectorTypedData.h"
 #include "IECore/TypedData.inl"
@@ -458,3 +463,33 @@ template class TypedData<vector<string> >;
 template class TypedData<vector<InternedString> >;
 
 } // namespace IECore
+
+//////////////////////////////////////////////////////////////////////////
+// Parallel hashing
+//////////////////////////////////////////////////////////////////////////
+
+static tbb::atomic<size_t> initialParallelHashThreshold()
+{
+	const char *e = getenv( "IECORE_PARALLELHASH_THRESHOLD" );
+	tbb::atomic<size_t> result;
+	result = e ? boost::lexical_cast<size_t>( e ) * 1024 * 1024 : 0;
+	return result;
+}
+
+// a function-local static, so that it is initialised on first use rather
+// than depending on the order of static initialisation across translation units.
+static tbb::atomic<size_t> &parallelHashThreshold()
+{
+	static tbb::atomic<size_t> g_parallelHashThreshold = initialParallelHashThreshold();
+	return g_parallelHashThreshold;
+}
+
+void IECore::setParallelHashThreshold( size_t bytes )
+{
+	parallelHashThreshold() = bytes;
+}
+
+size_t IECore::getParallelHashThreshold()
+{
+	return parallelHashThreshold();
+}
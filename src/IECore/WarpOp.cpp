@@ -32,8 +32,15 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
+#include <cmath>
+#include <limits>
+
+#include "tbb/blocked_range.h"
+#include "tbb/blocked_range2d.h"
+#include "tbb/parallel_for.h"
+
 #include "IECore/WarpOp.h"
-#include "IECore/Interpolator.h"
 #include "IECore/DespatchTypedData.h"
 #include "IECore/TypeTraits.h"
 #include "IECore/CompoundParameter.h"
@@ -50,6 +57,8 @@ WarpOp::WarpOp( const std::string &description )
 	IntParameter::PresetsContainer filterPresets;
 	filterPresets.push_back( IntParameter::Preset( "None", WarpOp::None ) );
 	filterPresets.push_back( IntParameter::Preset( "Bilinear", WarpOp::Bilinear ) );
+	filterPresets.push_back( IntParameter::Preset( "Bicubic", WarpOp::Bicubic ) );
+	filterPresets.push_back( IntParameter::Preset( "Lanczos", WarpOp::Lanczos ) );
 	m_filterParameter = new IntParameter(
 		"filter",
 		"Defines the filter to be used on the warped coordinates.",
@@ -78,54 +87,166 @@ const IntParameter * WarpOp::filterParameter() const
 	return m_filterParameter;
 }
 
-struct WarpOp::Warp
+namespace
 {
-	typedef void ReturnType;
 
-	Warp( WarpOp * warp, WarpOp::FilterType filter, const Imath::Box2i &warpedDataWindow, const Imath::Box2i &originalDataWindow )
-		:	m_warpOp( warp ), m_filter( filter ), m_outputDataWindow( warpedDataWindow ), m_inputDataWindow( originalDataWindow )
+// Computes the weights of a separable filter for a sample position, returning
+// the index of the first input pixel they apply to. Pixels lie on integer
+// coordinates.
+inline int filterWeights( WarpOp::FilterType filter, float p, double *weights, int &numWeights )
+{
+	const float f = floorf( p );
+	const double t = p - f;
+	switch( filter )
 	{
+		case WarpOp::Bilinear :
+			weights[0] = 1.0 - t;
+			weights[1] = t;
+			numWeights = 2;
+			return int( f );
+		case WarpOp::Bicubic :
+			weights[0] = 0.5 * ( ( -t + 2.0 ) * t - 1.0 ) * t;
+			weights[1] = 0.5 * ( ( 3.0 * t - 5.0 ) * t * t + 2.0 );
+			weights[2] = 0.5 * ( ( -3.0 * t + 4.0 ) * t + 1.0 ) * t;
+			weights[3] = 0.5 * ( t - 1.0 ) * t * t;
+			numWeights = 4;
+			return int( f ) - 1;
+		case WarpOp::Lanczos :
+		{
+			double sum = 0.0;
+			for( int i = 0; i < 6; ++i )
+			{
+				const double x = M_PI * ( i - 2 - t );
+				weights[i] = fabs( x ) < 1e-6 ? 1.0 : 3.0 * sin( x ) * sin( x / 3.0 ) / ( x * x );
+				sum += weights[i];
+			}
+			for( int i = 0; i < 6; ++i )
+			{
+				weights[i] /= sum;
+			}
+			numWeights = 6;
+			return int( f ) - 2;
+		}
+		default :
+			weights[0] = 1.0;
+			numWeights = 1;
+			return int( p );
 	}
+}
 
-	inline void computePixelCoordinates( float x, float y, int &x1, int &y1, int &x2, int &y2, float &ratioX, float &ratioY )
+template<typename V>
+inline V filteredValue( double v )
+{
+	// the cubic filters can overshoot the range of integer types
+	if( std::numeric_limits<V>::is_integer )
 	{
-		Imath::V2f inPos = m_warpOp->warp( Imath::V2f( x, y ) );
-		x1 = int(inPos.x);
-		y1 = int(inPos.y);
-		if ( x1 > inPos.x )
+		v = std::max( v, (double)std::numeric_limits<V>::min() );
+		v = std::min( v, (double)std::numeric_limits<V>::max() );
+	}
+	return (V)v;
+}
+
+template<typename V>
+class Resample
+{
+
+	public :
+
+		Resample( WarpOp::FilterType filter, const std::vector<V2f> &coordinates, const std::vector<V> &input, const Box2i &inputDataWindow, std::vector<V> &output, int outputWidth )
+			:	m_filter( filter ), m_coordinates( coordinates ), m_input( input ), m_inputOrigin( inputDataWindow.min ),
+				m_inputWidth( inputDataWindow.size().x + 1 ), m_inputHeight( inputDataWindow.size().y + 1 ),
+				m_output( output ), m_outputWidth( outputWidth )
 		{
-			ratioX = x1 - inPos.x;
-			x2 = x1;
-			x1--;
 		}
-		else
+
+		void operator()( const tbb::blocked_range2d<int> &range ) const
 		{
-			x2 = x1 + 1;
-			ratioX = inPos.x - x1;
+			double weightsX[6], weightsY[6];
+			int numWeightsX, numWeightsY;
+			for( int y = range.rows().begin(); y != range.rows().end(); ++y )
+			{
+				size_t pixelIndex = y * m_outputWidth + range.cols().begin();
+				for( int x = range.cols().begin(); x != range.cols().end(); ++x, ++pixelIndex )
+				{
+					const V2f &p = m_coordinates[pixelIndex];
+					if( m_filter == WarpOp::None )
+					{
+						m_output[pixelIndex] = clampXY( int( p.x ) - m_inputOrigin.x, int( p.y ) - m_inputOrigin.y );
+						continue;
+					}
+
+					const int x0 = filterWeights( m_filter, p.x, weightsX, numWeightsX ) - m_inputOrigin.x;
+					const int y0 = filterWeights( m_filter, p.y, weightsY, numWeightsY ) - m_inputOrigin.y;
+					double result = 0.0;
+					for( int j = 0; j < numWeightsY; ++j )
+					{
+						double row = 0.0;
+						for( int i = 0; i < numWeightsX; ++i )
+						{
+							row += weightsX[i] * (double)clampXY( x0 + i, y0 + j );
+						}
+						result += weightsY[j] * row;
+					}
+					m_output[pixelIndex] = filteredValue<V>( result );
+				}
+			}
 		}
-		if ( y1 > inPos.y )
+
+	private :
+
+		inline const V &clampXY( int x, int y ) const
 		{
-			ratioY = y1 - inPos.y;
-			y2 = y1;
-			y1--;
+			x = ( x < 0 ? 0 : ( x >= m_inputWidth ? m_inputWidth - 1 : x ));
+			y = ( y < 0 ? 0 : ( y >= m_inputHeight ? m_inputHeight - 1 : y ));
+			return m_input[ x + y * m_inputWidth ];
 		}
-		else
+
+		WarpOp::FilterType m_filter;
+		const std::vector<V2f> &m_coordinates;
+		const std::vector<V> &m_input;
+		V2i m_inputOrigin;
+		int m_inputWidth;
+		int m_inputHeight;
+		std::vector<V> &m_output;
+		int m_outputWidth;
+
+};
+
+} // namespace
+
+struct WarpOp::WarpCoordinates
+{
+	WarpCoordinates( const WarpOp *warpOp, const Imath::Box2i &warpedDataWindow, std::vector<V2f> &coordinates )
+		:	m_warpOp( warpOp ), m_outputDataWindow( warpedDataWindow ), m_coordinates( coordinates )
+	{
+	}
+
+	void operator()( const tbb::blocked_range<int> &range ) const
+	{
+		const int outputWidth = m_outputDataWindow.size().x + 1;
+		for( int y = range.begin(); y != range.end(); ++y )
 		{
-			y2 = y1 + 1;
-			ratioY = inPos.y - y1;
+			size_t pixelIndex = y * outputWidth;
+			for( int x = m_outputDataWindow.min.x; x <= m_outputDataWindow.max.x; ++x, ++pixelIndex )
+			{
+				m_coordinates[pixelIndex] = m_warpOp->warp( Imath::V2f( x, y + m_outputDataWindow.min.y ) );
+			}
 		}
-		x1 -= m_inputDataWindow.min.x;
-		y1 -= m_inputDataWindow.min.y;
-		x2 -= m_inputDataWindow.min.x;
-		y2 -= m_inputDataWindow.min.y;
 	}
 
-	template<typename V>
-	inline V clampXY( const std::vector<V> &buffer, int x, int y, int width, int height ) const
+	private :
+		const WarpOp *m_warpOp;
+		Imath::Box2i m_outputDataWindow;
+		std::vector<V2f> &m_coordinates;
+};
+
+struct WarpOp::Warp
+{
+	typedef void ReturnType;
+
+	Warp( WarpOp::FilterType filter, const std::vector<V2f> &coordinates, const Imath::Box2i &warpedDataWindow, const Imath::Box2i &originalDataWindow )
+		:	m_filter( filter ), m_coordinates( coordinates ), m_outputDataWindow( warpedDataWindow ), m_inputDataWindow( originalDataWindow )
 	{
-		x = ( x < 0 ? 0 : ( x >= width ? width - 1 : x ));
-		y = ( y < 0 ? 0 : ( y >= height ? height - 1 : y ));
-		return buffer[ x + y * width ];
 	}
 
 	template<typename T>
@@ -133,58 +254,29 @@ struct WarpOp::Warp
 	{
 		typedef typename T::ValueType Container;
 		typedef typename Container::value_type V;
-		typedef typename Container::iterator It;
-		typename T::Ptr inData = data->copy();
-		const Container &inBuffer = inData->readable();
-		unsigned int outputWidth = m_outputDataWindow.size().x + 1;
-		unsigned int inputWidth = m_inputDataWindow.size().x + 1;
-		unsigned int inputHeight = m_inputDataWindow.size().y + 1;
-		Container &outBuffer = data->writable();
-		outBuffer.resize( outputWidth * (m_outputDataWindow.size().y + 1) );
-		int x1, x2, y1, y2;
-		float ratioX, ratioY;
-		unsigned pixelIndex=0;
-		double r1, r2, r;
 
-		switch( m_filter )
+		if( m_filter < WarpOp::None || m_filter >= WarpOp::TypeCount )
 		{
-		case WarpOp::None:
-			for( int y=m_outputDataWindow.min.y; y<=m_outputDataWindow.max.y; y++ )
-			{
-				for( int x=m_outputDataWindow.min.x; x<=m_outputDataWindow.max.x; x++, pixelIndex++ )
-				{
-					Imath::V2f inPos = m_warpOp->warp( Imath::V2f( x, y ) );
-					x1 = int(inPos.x) - m_inputDataWindow.min.x;
-					y1 = int(inPos.y) - m_inputDataWindow.min.y;
-					outBuffer[pixelIndex] = clampXY<V>( inBuffer, x1, y1, inputWidth, inputHeight);
-				}
-			}
-			break;
-
-		case WarpOp::Bilinear:
-			for( int y=m_outputDataWindow.min.y; y<=m_outputDataWindow.max.y; y++ )
-			{
-				for( int x=m_outputDataWindow.min.x; x<=m_outputDataWindow.max.x; x++, pixelIndex++ )
-				{
-					computePixelCoordinates( x, y, x1, y1, x2, y2, ratioX, ratioY );
-					LinearInterpolator<double>()( (double)clampXY<V>( inBuffer, x1, y1, inputWidth, inputHeight ),
-												  (double)clampXY<V>( inBuffer, x2, y1, inputWidth, inputHeight ), ratioX, r1 );
-					LinearInterpolator<double>()( (double)clampXY<V>( inBuffer, x1, y2, inputWidth, inputHeight ),
-												  (double)clampXY<V>( inBuffer, x2, y2, inputWidth, inputHeight ), ratioX, r2 );
-					LinearInterpolator<double>()( r1, r2, ratioY, r );
-					outBuffer[pixelIndex] = (V)r;
-				}
-			}
-			break;
-
-		default:
 			throw Exception("Invalid filter type!");
 		}
+
+		const int outputWidth = m_outputDataWindow.size().x + 1;
+		const int outputHeight = m_outputDataWindow.size().y + 1;
+
+		Container inBuffer;
+		inBuffer.swap( data->writable() );
+		Container &outBuffer = data->writable();
+		outBuffer.resize( outputWidth * outputHeight );
+
+		tbb::parallel_for(
+			tbb::blocked_range2d<int>( 0, outputHeight, 0, outputWidth ),
+			Resample<V>( m_filter, m_coordinates, inBuffer, m_inputDataWindow, outBuffer, outputWidth )
+		);
 	}
 
 	private :
-		WarpOp * m_warpOp;
 		WarpOp::FilterType m_filter;
+		const std::vector<V2f> &m_coordinates;
 		Imath::Box2i m_outputDataWindow;
 		Imath::Box2i m_inputDataWindow;
 };
@@ -195,8 +287,13 @@ void WarpOp::modifyTypedPrimitive( ImagePrimitive * image, const CompoundObject
 
 	begin( operands );
 	Imath::Box2i newDataWindow = warpedDataWindow( originalDataWindow );
+
+	// the coordinates are shared by all channels, so we compute them up front
+	std::vector<V2f> coordinates( ( newDataWindow.size().x + 1 ) * ( newDataWindow.size().y + 1 ) );
+	tbb::parallel_for( tbb::blocked_range<int>( 0, newDataWindow.size().y + 1 ), WarpCoordinates( this, newDataWindow, coordinates ) );
+
 	std::string error;
-	Warp w( this, (FilterType)m_filterParameter->getNumericValue(), newDataWindow, originalDataWindow );
+	Warp w( (FilterType)m_filterParameter->getNumericValue(), coordinates, newDataWindow, originalDataWindow );
 	for( PrimitiveVariableMap::iterator it = image->variables.begin(); it != image->variables.end(); it++ )
 	{
 		if( it->second.interpolation!=PrimitiveVariable::Vertex &&
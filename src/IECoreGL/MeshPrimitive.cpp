@@ -34,11 +34,16 @@
 
 #include <cassert>
 
+#include "boost/format.hpp"
+
 #include "IECore/DespatchTypedData.h"
+#include "IECore/MessageHandler.h"
 
 #include "IECoreGL/MeshPrimitive.h"
 #include "IECoreGL/GL.h"
 #include "IECoreGL/State.h"
+#include "IECoreGL/Buffer.h"
+#include "IECoreGL/CachedConverter.h"
 
 #include "OpenEXR/ImathMath.h"
 
@@ -57,20 +62,33 @@ struct MeshPrimitive::MemberData : public IECore::RefCounted
 	{
 	}
 
+	MemberData( IECore::ConstUIntVectorDataPtr indices, IECore::ConstIntVectorDataPtr vertexSources, IECore::ConstIntVectorDataPtr faceVaryingSources )
+		:	vertexIndices( indices ), vertexSources( vertexSources ), faceVaryingSources( faceVaryingSources )
+	{
+	}
+
+	// Only used for non-indexed meshes.
 	IECore::ConstIntVectorDataPtr vertIds;
+
+	// Only used for indexed meshes.
+	IECore::ConstUIntVectorDataPtr vertexIndices;
+	IECore::ConstIntVectorDataPtr vertexSources;
+	IECore::ConstIntVectorDataPtr faceVaryingSources;
+	ConstBufferPtr vertexIndicesBuffer;
+
 	Imath::Box3f bound;
 
-	/// \todo This could be removed and the ToGLMeshConverter could use FaceVaryingPromotionOp
-	/// to convert everything to FaceVarying before being added.
-	class ToFaceVaryingConverter
+	/// Gathers data into a new container, such that element i of the
+	/// output is element indices[i] of the input.
+	class Gatherer
 	{
 		public:
 
 		typedef IECore::DataPtr ReturnType;
 
-		ToFaceVaryingConverter( IECore::ConstIntVectorDataPtr vertIds ) : m_vertIds( vertIds )
+		Gatherer( IECore::ConstIntVectorDataPtr indices ) : m_indices( indices )
 		{
-			assert( m_vertIds );
+			assert( m_indices );
 		}
 
 		template<typename T>
@@ -78,22 +96,31 @@ struct MeshPrimitive::MemberData : public IECore::RefCounted
 		{
 			assert( inData );
 
+			const std::vector<int> &indices = m_indices->readable();
+			const typename T::ValueType &in = inData->readable();
+
 			const typename T::Ptr outData = new T();
-			outData->writable().resize( m_vertIds->readable().size() );
+			outData->writable().resize( indices.size() );
 
 			typename T::ValueType::iterator outIt = outData->writable().begin();
 
-			for ( typename T::ValueType::size_type i = 0; i <  m_vertIds->readable().size(); i++ )
+			for ( typename T::ValueType::size_type i = 0; i < indices.size(); i++ )
 			{
-				*outIt++ = inData->readable()[ m_vertIds->readable()[ i ] ];
+				*outIt++ = in[ indices[ i ] ];
 			}
 
 			return outData;
 		}
 
-		IECore::ConstIntVectorDataPtr m_vertIds;
+		IECore::ConstIntVectorDataPtr m_indices;
 	};
 
+	IECore::DataPtr gather( const IECore::Data *data, IECore::ConstIntVectorDataPtr indices )
+	{
+		Gatherer gatherer( indices );
+		return IECore::despatchTypedData< Gatherer, IECore::TypeTraits::IsVectorTypedData >( const_cast<IECore::Data *>( data ), gatherer );
+	}
+
 };
 
 //////////////////////////////////////////////////////////////////////////
@@ -107,6 +134,11 @@ MeshPrimitive::MeshPrimitive( IECore::ConstIntVectorDataPtr vertIds )
 {
 }
 
+MeshPrimitive::MeshPrimitive( IECore::ConstUIntVectorDataPtr vertexIndices, IECore::ConstIntVectorDataPtr vertexSources, IECore::ConstIntVectorDataPtr faceVaryingSources )
+	:	m_memberData( new MemberData( vertexIndices, vertexSources, faceVaryingSources ) )
+{
+}
+
 MeshPrimitive::~MeshPrimitive()
 {
 }
@@ -116,6 +148,11 @@ IECore::ConstIntVectorDataPtr MeshPrimitive::vertexIds() const
 	return m_memberData->vertIds;
 }
 
+IECore::ConstUIntVectorDataPtr MeshPrimitive::vertexIndices() const
+{
+	return m_memberData->vertexIndices;
+}
+
 void MeshPrimitive::addPrimitiveVariable( const std::string &name, const IECore::PrimitiveVariable &primVar )
 {
 	if ( primVar.interpolation==IECore::PrimitiveVariable::Vertex || primVar.interpolation==IECore::PrimitiveVariable::Varying )
@@ -135,14 +172,35 @@ void MeshPrimitive::addPrimitiveVariable( const std::string &name, const IECore:
 			}
 		}
 
-		MemberData::ToFaceVaryingConverter primVarConverter( m_memberData->vertIds );
-		// convert to facevarying
-		IECore::DataPtr newData = IECore::despatchTypedData< MemberData::ToFaceVaryingConverter, IECore::TypeTraits::IsVectorTypedData >( primVar.data, primVarConverter );
-		addVertexAttribute( name, newData );
+		if( m_memberData->vertIds )
+		{
+			// convert to facevarying
+			addVertexAttribute( name, m_memberData->gather( primVar.data.get(), m_memberData->vertIds ) );
+		}
+		else if( m_memberData->vertexSources )
+		{
+			addVertexAttribute( name, m_memberData->gather( primVar.data.get(), m_memberData->vertexSources ) );
+		}
+		else
+		{
+			// the indices refer directly to the vertices, so we can use the data as is.
+			addVertexAttribute( name, primVar.data );
+		}
 	}
 	else if ( primVar.interpolation==IECore::PrimitiveVariable::FaceVarying )
 	{
-		addVertexAttribute( name, primVar.data );
+		if( m_memberData->vertIds )
+		{
+			addVertexAttribute( name, primVar.data );
+		}
+		else if( m_memberData->faceVaryingSources )
+		{
+			addVertexAttribute( name, m_memberData->gather( primVar.data.get(), m_memberData->faceVaryingSources ) );
+		}
+		else
+		{
+			IECore::msg( IECore::Msg::Warning, "IECoreGL::MeshPrimitive::addPrimitiveVariable", boost::format( "Ignoring FaceVarying primitive variable \"%s\" as no face-varying sources were provided." ) % name );
+		}
 	}
 	else if ( primVar.interpolation==IECore::PrimitiveVariable::Constant )
 	{
@@ -152,8 +210,23 @@ void MeshPrimitive::addPrimitiveVariable( const std::string &name, const IECore:
 
 void MeshPrimitive::renderInstances( size_t numInstances ) const
 {
-	unsigned vertexCount = m_memberData->vertIds->readable().size();
-	glDrawArraysInstancedARB( GL_TRIANGLES, 0, vertexCount, numInstances );
+	if( m_memberData->vertIds )
+	{
+		unsigned vertexCount = m_memberData->vertIds->readable().size();
+		glDrawArraysInstancedARB( GL_TRIANGLES, 0, vertexCount, numInstances );
+		return;
+	}
+
+	if( !m_memberData->vertexIndicesBuffer )
+	{
+		// we don't build the actual buffer until now, because in the constructor we're not guaranteed
+		// a valid GL context.
+		CachedConverterPtr cachedConverter = CachedConverter::defaultCachedConverter();
+		m_memberData->vertexIndicesBuffer = IECore::runTimeCast<const Buffer>( cachedConverter->convert( m_memberData->vertexIndices ) );
+	}
+
+	Buffer::ScopedBinding indexBinding( *m_memberData->vertexIndicesBuffer, GL_ELEMENT_ARRAY_BUFFER );
+	glDrawElementsInstancedARB( GL_TRIANGLES, m_memberData->vertexIndices->readable().size(), GL_UNSIGNED_INT, 0, numInstances );
 }
 
 Imath::Box3f MeshPrimitive::bound() const
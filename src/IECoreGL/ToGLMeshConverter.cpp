@@ -35,18 +35,242 @@
 #include <cassert>
 
 #include "boost/format.hpp"
+#include "boost/lexical_cast.hpp"
 
 #include "IECoreGL/ToGLMeshConverter.h"
 #include "IECoreGL/MeshPrimitive.h"
 
 #include "IECore/MeshPrimitive.h"
-#include "IECore/TriangulateOp.h"
 #include "IECore/MeshNormalsOp.h"
 #include "IECore/DespatchTypedData.h"
 #include "IECore/MessageHandler.h"
+#include "IECore/LRUCache.h"
+#include "IECore/MurmurHash.h"
 
 using namespace IECoreGL;
 
+//////////////////////////////////////////////////////////////////////////
+// Topology caching
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// Describes how to draw a mesh as indexed triangles. Face-vertices are welded
+// into a single GL vertex when they share a vertex and have identical values for
+// all FaceVarying primitive variables. This depends only on the topology and the
+// FaceVarying data, so can be reused across the frames of an animated mesh,
+// where typically only Vertex primitive variables change.
+struct MeshTopology : public IECore::RefCounted
+{
+
+	// Three indices per triangle.
+	IECore::UIntVectorDataPtr vertexIndices;
+	// The source vertex for each GL vertex, or 0 if the
+	// GL vertices are the mesh vertices.
+	IECore::IntVectorDataPtr vertexSources;
+	// The source face-vertex for each GL vertex, or 0 if
+	// there are no FaceVarying primitive variables.
+	IECore::IntVectorDataPtr faceVaryingSources;
+
+	size_t memoryUsage() const
+	{
+		size_t result = vertexIndices->readable().size() * sizeof( unsigned int );
+		if( vertexSources )
+		{
+			result += vertexSources->readable().size() * sizeof( int );
+		}
+		if( faceVaryingSources )
+		{
+			result += faceVaryingSources->readable().size() * sizeof( int );
+		}
+		return result;
+	}
+
+};
+
+IE_CORE_DECLAREPTR( MeshTopology );
+
+// Refines a labelling of face-vertices, so that face-vertices share
+// a label only if they shared one before and they also have the same
+// value for the primitive variable being despatched. The new labels
+// are numbered in order of first appearance.
+class WeldRefiner
+{
+
+	public :
+
+		typedef void ReturnType;
+
+		WeldRefiner( std::vector<int> &labels, size_t &numLabels )
+			:	m_labels( labels ), m_numLabels( numLabels )
+		{
+		}
+
+		template<typename T>
+		void operator()( typename T::Ptr data )
+		{
+			const typename T::ValueType &values = data->readable();
+			assert( values.size() == m_labels.size() );
+
+			// new labels derived from each old label are stored as a linked list,
+			// along with the first face-vertex to have been given each new label.
+			std::vector<int> heads( m_numLabels, -1 );
+			std::vector<int> nexts;
+			std::vector<int> representatives;
+
+			for( size_t i = 0, e = m_labels.size(); i < e; ++i )
+			{
+				int &label = m_labels[i];
+				int newLabel = heads[label];
+				while( newLabel != -1 && !( values[representatives[newLabel]] == values[i] ) )
+				{
+					newLabel = nexts[newLabel];
+				}
+
+				if( newLabel == -1 )
+				{
+					newLabel = representatives.size();
+					representatives.push_back( i );
+					nexts.push_back( heads[label] );
+					heads[label] = newLabel;
+				}
+
+				label = newLabel;
+			}
+
+			m_numLabels = representatives.size();
+		}
+
+	private :
+
+		std::vector<int> &m_labels;
+		size_t &m_numLabels;
+
+};
+
+typedef std::vector<IECore::PrimitiveVariableMap::const_iterator> PrimitiveVariableIterators;
+
+MeshTopologyPtr computeTopology( const IECore::MeshPrimitive *mesh, const PrimitiveVariableIterators &faceVaryingVariables )
+{
+	const std::vector<int> &verticesPerFace = mesh->verticesPerFace()->readable();
+	const std::vector<int> &vertexIds = mesh->vertexIds()->readable();
+
+	// label each face-vertex with the GL vertex it will use. we start with
+	// the mesh vertices, and split them as necessary to accommodate
+	// discontinuities in the FaceVarying data.
+
+	std::vector<int> labels( vertexIds );
+	size_t numLabels = mesh->variableSize( IECore::PrimitiveVariable::Vertex );
+
+	WeldRefiner refiner( labels, numLabels );
+	for( PrimitiveVariableIterators::const_iterator it = faceVaryingVariables.begin(); it != faceVaryingVariables.end(); ++it )
+	{
+		IECore::despatchTypedData<WeldRefiner, IECore::TypeTraits::IsVectorTypedData>( const_cast<IECore::Data *>( (*it)->second.data.get() ), refiner );
+	}
+
+	MeshTopologyPtr result = new MeshTopology;
+	if( faceVaryingVariables.size() )
+	{
+		result->vertexSources = new IECore::IntVectorData;
+		result->faceVaryingSources = new IECore::IntVectorData;
+		std::vector<int> &vertexSources = result->vertexSources->writable();
+		std::vector<int> &faceVaryingSources = result->faceVaryingSources->writable();
+		vertexSources.resize( numLabels, -1 );
+		faceVaryingSources.resize( numLabels, -1 );
+		for( size_t i = 0, e = labels.size(); i < e; ++i )
+		{
+			if( faceVaryingSources[labels[i]] == -1 )
+			{
+				faceVaryingSources[labels[i]] = i;
+				vertexSources[labels[i]] = vertexIds[i];
+			}
+		}
+	}
+
+	// triangulate with a simple fan, exactly as the TriangulateOp does.
+
+	result->vertexIndices = new IECore::UIntVectorData;
+	std::vector<unsigned int> &vertexIndices = result->vertexIndices->writable();
+	if( vertexIds.size() > verticesPerFace.size() * 2 )
+	{
+		vertexIndices.reserve( ( vertexIds.size() - verticesPerFace.size() * 2 ) * 3 );
+	}
+
+	int faceVertexIdStart = 0;
+	for( std::vector<int>::const_iterator it = verticesPerFace.begin(), eIt = verticesPerFace.end(); it != eIt; ++it )
+	{
+		const int numFaceVerts = *it;
+		for( int i = 1; i < numFaceVerts - 1; ++i )
+		{
+			vertexIndices.push_back( labels[faceVertexIdStart] );
+			vertexIndices.push_back( labels[faceVertexIdStart + i] );
+			vertexIndices.push_back( labels[faceVertexIdStart + i + 1] );
+		}
+		faceVertexIdStart += numFaceVerts;
+	}
+
+	return result;
+}
+
+// As in the CachedConverter, the key carries the mesh and its
+// FaceVarying variables so that the getter can compute the topology,
+// but these are never accessed outside of the getter.
+struct TopologyCacheKey
+{
+
+	TopologyCacheKey( const IECore::MeshPrimitive *m, const PrimitiveVariableIterators &v )
+		:	mesh( m ), faceVaryingVariables( &v )
+	{
+		mesh->topologyHash( hash );
+		for( PrimitiveVariableIterators::const_iterator it = v.begin(); it != v.end(); ++it )
+		{
+			hash.append( (*it)->first );
+			(*it)->second.data->hash( hash );
+		}
+	}
+
+	bool operator < ( const TopologyCacheKey &other ) const
+	{
+		return hash < other.hash;
+	}
+
+	mutable const IECore::MeshPrimitive *mesh;
+	mutable const PrimitiveVariableIterators *faceVaryingVariables;
+	IECore::MurmurHash hash;
+
+};
+
+MeshTopologyPtr topologyGetter( const TopologyCacheKey &key, size_t &cost )
+{
+	MeshTopologyPtr result = computeTopology( key.mesh, *key.faceVaryingVariables );
+	cost = result->memoryUsage();
+	key.mesh = 0;
+	key.faceVaryingVariables = 0;
+	return result;
+}
+
+typedef IECore::LRUCache<TopologyCacheKey, MeshTopologyPtr> TopologyCache;
+
+size_t topologyCacheMemoryLimit()
+{
+	const char *m = getenv( "IECOREGL_MESHTOPOLOGYCACHE_MEMORY" );
+	int mi = m ? boost::lexical_cast<int>( m ) : 100;
+	return 1024 * 1024 * mi;
+}
+
+TopologyCache &topologyCache()
+{
+	static TopologyCache c( topologyGetter, topologyCacheMemoryLimit() );
+	return c;
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// ToGLMeshConverter
+//////////////////////////////////////////////////////////////////////////
+
 IE_CORE_DEFINERUNTIMETYPED( ToGLMeshConverter );
 
 ToGLConverter::ConverterDescription<ToGLMeshConverter> ToGLMeshConverter::g_description;
@@ -63,7 +287,7 @@ ToGLMeshConverter::~ToGLMeshConverter()
 
 IECore::RunTimeTypedPtr ToGLMeshConverter::doConversion( IECore::ConstObjectPtr src, IECore::ConstCompoundObjectPtr operands ) const
 {
-	IECore::MeshPrimitivePtr mesh = IECore::staticPointerCast<IECore::MeshPrimitive>( src->copy() ); // safe because the parameter validated it for us
+	IECore::ConstMeshPrimitivePtr mesh = IECore::staticPointerCast<const IECore::MeshPrimitive>( src ); // safe because the parameter validated it for us
 
 	if( mesh->interpolation() != "linear" )
 	{
@@ -72,19 +296,14 @@ IECore::RunTimeTypedPtr ToGLMeshConverter::doConversion( IECore::ConstObjectPtr
 		// if interpolation is linear and no normals are provided then we assume the faceted look is intentional.
 		if( mesh->variables.find( "N" )==mesh->variables.end() )
 		{
+			IECore::MeshPrimitivePtr meshCopy = mesh->copy();
 			IECore::MeshNormalsOpPtr normalOp = new IECore::MeshNormalsOp();
-			normalOp->inputParameter()->setValue( mesh );
+			normalOp->inputParameter()->setValue( meshCopy );
 			normalOp->copyParameter()->setTypedValue( false );
 			normalOp->operate();
+			mesh = meshCopy;
 		}
 	}
-		
-	IECore::TriangulateOpPtr op = new IECore::TriangulateOp();
-	op->inputParameter()->setValue( mesh );
-	op->throwExceptionsParameter()->setTypedValue( false ); // it's better to see something than nothing
-
-	mesh = IECore::runTimeCast< IECore::MeshPrimitive > ( op->operate() );
-	assert( mesh );
 
 	IECore::ConstV3fVectorDataPtr p = 0;
 	IECore::PrimitiveVariableMap::const_iterator pIt = mesh->variables.find( "P" );
@@ -100,18 +319,39 @@ IECore::RunTimeTypedPtr ToGLMeshConverter::doConversion( IECore::ConstObjectPtr
 		throw IECore::Exception( "Must specify primitive variable \"P\", of type V3fVectorData and interpolation type Vertex." );
 	}
 
-	MeshPrimitivePtr glMesh = new MeshPrimitive( mesh->vertexIds() );
+	// Find the primitive variables we can convert. The FaceVarying ones determine
+	// how the vertices are welded, and therefore form part of the topology.
 
-	for ( IECore::PrimitiveVariableMap::iterator pIt = mesh->variables.begin(); pIt != mesh->variables.end(); ++pIt )
+	PrimitiveVariableIterators variables;
+	PrimitiveVariableIterators faceVaryingVariables;
+	for( IECore::PrimitiveVariableMap::const_iterator it = mesh->variables.begin(); it != mesh->variables.end(); ++it )
 	{
-		if ( pIt->second.data )
+		if( !it->second.data )
 		{
-			glMesh->addPrimitiveVariable( pIt->first, pIt->second );
+			IECore::msg( IECore::Msg::Warning, "ToGLMeshConverter", boost::format( "No data given for primvar \"%s\"" ) % it->first );
+			continue;
 		}
-		else
+
+		if( it->second.interpolation == IECore::PrimitiveVariable::FaceVarying )
 		{
-			IECore::msg( IECore::Msg::Warning, "ToGLMeshConverter", boost::format( "No data given for primvar \"%s\"" ) % pIt->first );
+			if( !mesh->isPrimitiveVariableValid( it->second ) )
+			{
+				IECore::msg( IECore::Msg::Warning, "ToGLMeshConverter", boost::format( "Ignoring invalid primvar \"%s\"" ) % it->first );
+				continue;
+			}
+			faceVaryingVariables.push_back( it );
 		}
+
+		variables.push_back( it );
+	}
+
+	MeshTopologyPtr topology = topologyCache().get( TopologyCacheKey( mesh.get(), faceVaryingVariables ) );
+
+	MeshPrimitivePtr glMesh = new MeshPrimitive( topology->vertexIndices, topology->vertexSources, topology->faceVaryingSources );
+
+	for( PrimitiveVariableIterators::const_iterator it = variables.begin(); it != variables.end(); ++it )
+	{
+		glMesh->addPrimitiveVariable( (*it)->first, (*it)->second );
 	}
 
 	IECore::PrimitiveVariableMap::const_iterator sIt = mesh->variables.find( "s" );
@@ -63,6 +63,16 @@ static ObjectPtr read( CachedReader &r, const std::string &f )
 	}
 }
 
+static void prefetch( CachedReader &r, object files )
+{
+	std::vector<std::string> f;
+	for( long i = 0, n = len( files ); i < n; ++i )
+	{
+		f.push_back( extract<std::string>( files[i] ) );
+	}
+	r.prefetch( f );
+}
+
 static ObjectPoolPtr objectPool( CachedReader &r )
 {
 	return r.objectPool();
@@ -72,12 +82,14 @@ void bindCachedReader()
 {
 	RefCountedClass<CachedReader, RefCounted>( "CachedReader" )
 		.def( init<const SearchPath &, optional<ObjectPoolPtr> >() )
-		.def( init<const SearchPath &, ConstModifyOpPtr, optional<ObjectPoolPtr> >() )
+		.def( init<const SearchPath &, ConstModifyOpPtr, optional<ObjectPoolPtr, bool> >() )
 		.def( "read", &read )
+		.def( "prefetch", &prefetch )
 		.def( "clear", (void (CachedReader::*)( const std::string &) )&CachedReader::clear )
 		.def( "clear", (void (CachedReader::*)( void ) )&CachedReader::clear )
 		.def( "insert", &CachedReader::insert )
 		.def( "cached", &CachedReader::cached )
+		.add_property( "validation", &CachedReader::getValidation, &CachedReader::setValidation )
 		.add_property( "searchPath", make_function( &CachedReader::getSearchPath, return_value_policy<copy_const_reference>() ), &CachedReader::setSearchPath )
 		.def( "defaultCachedReader", &CachedReader::defaultCachedReader ).staticmethod( "defaultCachedReader" )
 		.def( "objectPool", &objectPool )
@@ -33,12 +33,14 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include "boost/python.hpp"
+#include "boost/python/suite/indexing/container_utils.hpp"
 
 #include "IECore/CurvesPrimitiveEvaluator.h"
 #include "IECore/CurvesPrimitive.h"
 #include "IECorePython/CurvesPrimitiveEvaluatorBinding.h"
 #include "IECorePython/RunTimeTypedBinding.h"
 #include "IECorePython/RefCountedBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
 
 using namespace IECore;
 using namespace boost::python;
@@ -53,6 +55,26 @@ static bool pointAtV( const CurvesPrimitiveEvaluator &e, unsigned curveIndex, fl
 	return e.pointAtV( curveIndex, v, r );
 }
 
+static CompoundDataPtr closestPoints( const CurvesPrimitiveEvaluator &e, const V3fVectorData *points, const object &primVarNames )
+{
+	std::vector<std::string> pvn;
+	container_utils::extend_container( pvn, primVarNames );
+
+	ScopedGILRelease gilRelease;
+
+	return e.closestPoints( points, pvn );
+}
+
+static CompoundDataPtr pointsAtV( const CurvesPrimitiveEvaluator &e, const IntVectorData *curveIndices, const FloatVectorData *v, const object &primVarNames )
+{
+	std::vector<std::string> pvn;
+	container_utils::extend_container( pvn, primVarNames );
+
+	ScopedGILRelease gilRelease;
+
+	return e.pointsAtV( curveIndices, v, pvn );
+}
+
 static IntVectorDataPtr verticesPerCurve( const CurvesPrimitiveEvaluator &e )
 {
 	return new IntVectorData( e.verticesPerCurve() );
@@ -80,6 +102,19 @@ void bindCurvesPrimitiveEvaluator()
 				arg( "vEnd" ) = 1.0f
 			)
 		)
+		.def( "closestPoints", &closestPoints,
+			(
+				arg( "points" ),
+				arg( "primVarNames" ) = list()
+			)
+		)
+		.def( "pointsAtV", &pointsAtV,
+			(
+				arg( "curveIndices" ),
+				arg( "v" ),
+				arg( "primVarNames" ) = list()
+			)
+		)
 		.def( "verticesPerCurve", &verticesPerCurve )
 		.def( "vertexDataOffsets", &vertexDataOffsets )
 		.def( "varyingDataOffsets", &varyingDataOffsets )
@@ -45,8 +45,16 @@ namespace IECorePython
 
 void bindEnvMapSHProjectorOp()
 {
-	RunTimeTypedClass<EnvMapSHProjector>()
+	scope s = RunTimeTypedClass<EnvMapSHProjector>()
 		.def( init<>() )
+		.def( "setProjectorCacheMemoryLimit", &EnvMapSHProjector::setProjectorCacheMemoryLimit ).staticmethod( "setProjectorCacheMemoryLimit" )
+		.def( "getProjectorCacheMemoryLimit", &EnvMapSHProjector::getProjectorCacheMemoryLimit ).staticmethod( "getProjectorCacheMemoryLimit" )
+		.def( "clearProjectorCache", &EnvMapSHProjector::clearProjectorCache ).staticmethod( "clearProjectorCache" )
+	;
+
+	enum_< EnvMapSHProjector::Sampling >( "Sampling" )
+		.value( "Random", EnvMapSHProjector::Random )
+		.value( "Texels", EnvMapSHProjector::Texels )
 	;
 }
 
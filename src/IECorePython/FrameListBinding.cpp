@@ -85,6 +85,39 @@ struct FrameListHelper
 
 		return result;
 	}
+
+	static list asRanges( FrameListPtr l )
+	{
+		FrameList::RangeVector ranges;
+		l->asRanges( ranges );
+
+		list result;
+
+		for ( FrameList::RangeVector::const_iterator it = ranges.begin(); it != ranges.end(); ++it )
+		{
+			result.append( make_tuple( it->start, it->end, it->step ) );
+		}
+
+		return result;
+	}
+
+	static FrameListPtr fromRanges( object ranges )
+	{
+		FrameList::RangeVector r;
+
+		int numRanges = extract<int>( ranges.attr( "__len__" )() );
+		for ( int i = 0; i < numRanges; ++i )
+		{
+			object range = ranges[i];
+			if ( len( range ) != 3 )
+			{
+				throw InvalidArgumentException( "FrameList.fromRanges : Expected ranges of the form ( start, end, step )." );
+			}
+			r.push_back( FrameList::Range( extract<FrameList::Frame>( range[0] ), extract<FrameList::Frame>( range[1] ), extract<FrameList::Frame>( range[2] ) ) );
+		}
+
+		return FrameList::fromRanges( r );
+	}
 };
 
 void bindFrameList()
@@ -94,6 +127,18 @@ void bindFrameList()
 		.def( "isEqualTo", &FrameList::isEqualTo )
 		.def( "copy", &FrameList::copy )
 		.def( "asClumpedList", &FrameListHelper::asClumpedList )
+		.def( "asRanges", &FrameListHelper::asRanges )
+		.def( "fromRanges", &FrameListHelper::fromRanges ).staticmethod( "fromRanges" )
+		.def( "size", &FrameList::size )
+		.def( "minFrame", &FrameList::minFrame )
+		.def( "maxFrame", &FrameList::maxFrame )
+		.def( "isContiguous", &FrameList::isContiguous )
+		.def( "contains", &FrameList::contains )
+		.def( "__contains__", &FrameList::contains )
+		.def( "intersects", &FrameList::intersects )
+		.def( "intersection", &FrameList::setIntersection )
+		.def( "union", &FrameList::setUnion )
+		.def( "difference", &FrameList::setDifference )
 		.def( "parse", &FrameList::parse ).staticmethod( "parse" )
 		.def( "__str__", &FrameList::asString )
 		.def( self == self )
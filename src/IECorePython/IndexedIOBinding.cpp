@@ -405,9 +405,27 @@ void bindIndexedIOBase()
 
 }
 
+static list openFilesIndexMemoryUsage()
+{
+	StreamIndexedIO::MemoryUsageVector usage;
+	StreamIndexedIO::openFilesIndexMemoryUsage( usage );
+
+	list result;
+	for( StreamIndexedIO::MemoryUsageVector::const_iterator it = usage.begin(); it != usage.end(); ++it )
+	{
+		result.append( make_tuple( it->first, it->second ) );
+	}
+	return result;
+}
+
 void bindStreamIndexedIO()
 {
-	IECorePython::RunTimeTypedClass<StreamIndexedIO>();
+	IECorePython::RunTimeTypedClass<StreamIndexedIO>()
+		.def( "indexMemoryUsage", &StreamIndexedIO::indexMemoryUsage )
+		.def( "openFilesIndexMemoryUsage", &openFilesIndexMemoryUsage ).staticmethod( "openFilesIndexMemoryUsage" )
+		.def( "setSubIndexMemoryLimit", &StreamIndexedIO::setSubIndexMemoryLimit ).staticmethod( "setSubIndexMemoryLimit" )
+		.def( "getSubIndexMemoryLimit", &StreamIndexedIO::getSubIndexMemoryLimit ).staticmethod( "getSubIndexMemoryLimit" )
+	;
 }
 
 void bindFileIndexedIO()
@@ -47,6 +47,9 @@ void bindLensDistortOp()
 {
 	IECorePython::RunTimeTypedClass<IECore::LensDistortOp>()
 		.def( init<>() )
+		.def( "setDistortionMapCacheMemoryLimit", &IECore::LensDistortOp::setDistortionMapCacheMemoryLimit ).staticmethod( "setDistortionMapCacheMemoryLimit" )
+		.def( "getDistortionMapCacheMemoryLimit", &IECore::LensDistortOp::getDistortionMapCacheMemoryLimit ).staticmethod( "getDistortionMapCacheMemoryLimit" )
+		.def( "clearDistortionMapCache", &IECore::LensDistortOp::clearDistortionMapCache ).staticmethod( "clearDistortionMapCache" )
 	;
 }
 
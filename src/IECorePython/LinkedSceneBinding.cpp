@@ -64,6 +64,7 @@ void bindLinkedScene()
 		.def( "__init__", make_constructor( &constructor ), "Opens a linked scene file for read or write." )
 		.def( "__init__", make_constructor( &constructor2 ), "Creates a linked scene to expand links in the given scene file." )
 		.def( "writeLink", &LinkedScene::writeLink )
+		.def( "finish", &LinkedScene::finish )
 		.def( "linkAttributeData", linkAttributeData )
 		.def( "linkAttributeData", retimedLinkAttributeData ).staticmethod( "linkAttributeData" )
 		.def_readonly("linkAttribute", &LinkedScene::linkAttribute )
@@ -49,6 +49,9 @@ void bindMedianCutSampler()
 
 	scope s = RunTimeTypedClass<MedianCutSampler>()
 		.def( init<>() )
+		.def( "setSummedAreaTableCacheMemoryLimit", &MedianCutSampler::setSummedAreaTableCacheMemoryLimit ).staticmethod( "setSummedAreaTableCacheMemoryLimit" )
+		.def( "getSummedAreaTableCacheMemoryLimit", &MedianCutSampler::getSummedAreaTableCacheMemoryLimit ).staticmethod( "getSummedAreaTableCacheMemoryLimit" )
+		.def( "clearSummedAreaTableCache", &MedianCutSampler::clearSummedAreaTableCache ).staticmethod( "clearSummedAreaTableCache" )
 	;
 
 	enum_<MedianCutSampler::Projection>( "Projection" )
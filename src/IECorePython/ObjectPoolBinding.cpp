@@ -37,6 +37,7 @@
 #include "boost/python.hpp"
 
 #include "IECore/ObjectPool.h"
+#include "IECore/DiskObjectCache.h"
 
 #include "IECorePython/ObjectPoolBinding.h"
 #include "IECorePython/RefCountedBinding.h"
@@ -69,6 +70,11 @@ ObjectPtr retrieve( const ObjectPool &pool, MurmurHash key, bool _copy )
 	return const_cast< Object * >(o.get());
 }
 
+static DiskObjectCachePtr getDiskCache( const ObjectPool &pool )
+{
+	return pool.getDiskCache();
+}
+
 void bindObjectPool()
 {
 	RefCountedClass<ObjectPool, RefCounted> objectPoolClass( "ObjectPool" );
@@ -94,6 +100,8 @@ void bindObjectPool()
 		.def( "memoryUsage", &ObjectPool::memoryUsage )
 		.def( "getMaxMemoryUsage", &ObjectPool::getMaxMemoryUsage)
 		.def( "setMaxMemoryUsage", &ObjectPool::setMaxMemoryUsage )
+		.def( "setDiskCache", &ObjectPool::setDiskCache )
+		.def( "getDiskCache", &getDiskCache )
 		.def( "defaultObjectPool", &ObjectPool::defaultObjectPool ).staticmethod( "defaultObjectPool" )
 	;
 }
@@ -36,6 +36,7 @@
 
 #include "IECore/ParticleReader.h"
 #include "IECore/VectorTypedData.h"
+#include "IECore/CompoundData.h"
 #include "IECorePython/RunTimeTypedBinding.h"
 
 using std::string;
@@ -53,12 +54,18 @@ static StringVectorDataPtr attributeNames( ParticleReader &that )
 	return result;
 }
 
+static CompoundDataPtr readAttributes( ParticleReader &that, const StringVectorData *names )
+{
+	return that.readAttributes( names->readable() );
+}
+
 void bindParticleReader()
 {
 	RunTimeTypedClass<ParticleReader>()
 		.def( "numParticles", &ParticleReader::numParticles )
 		.def( "attributeNames", &attributeNames )
 		.def( "readAttribute", &ParticleReader::readAttribute )
+		.def( "readAttributes", &readAttributes )
 	;
 }
 
@@ -60,6 +60,7 @@ void bindSceneCache()
 	RunTimeTypedClass<SceneCache>()
 		.def( "__init__", make_constructor( &constructor ), "Opens a scene file for read or write." )
 		.def( "__init__", make_constructor( &constructor2 ), "Opens a scene from a previously opened file handle." )
+		.def( "finish", &SceneCache::finish )
 	;
 }
 
@@ -175,6 +175,30 @@ void writeTags( SceneInterface &m, list tagList )
 	m.writeTags(v);	
 }
 
+static list pathsToList( std::vector<SceneInterface::Path> &paths )
+{
+	list result;
+	for ( std::vector<SceneInterface::Path>::iterator it = paths.begin(); it != paths.end(); it++ )
+	{
+		result.append( arrayToList( *it ) );
+	}
+	return result;
+}
+
+static list pathsWithTag( const SceneInterface &m, const SceneInterface::Name &name )
+{
+	std::vector<SceneInterface::Path> paths;
+	m.pathsWithTag( name, paths );
+	return pathsToList( paths );
+}
+
+static list matchingPaths( const SceneInterface &m, const std::string &tagExpression )
+{
+	std::vector<SceneInterface::Path> paths;
+	m.matchingPaths( tagExpression, paths );
+	return pathsToList( paths );
+}
+
 DataPtr readTransform( SceneInterface &m, double time )
 {
 	ConstDataPtr t = m.readTransform(time);
@@ -244,6 +268,8 @@ void bindSceneInterface()
 		.def( "hasTag", &SceneInterface::hasTag, ( arg( "name" ), arg( "includeChildren" ) = true ) )
 		.def( "readTags", readTags, ( arg( "includeChildren" ) = true ) )
 		.def( "writeTags", writeTags )
+		.def( "pathsWithTag", pathsWithTag )
+		.def( "matchingPaths", matchingPaths )
 		.def( "readObject", &readObject )
 		.def( "readObjectPrimitiveVariables", &readObjectPrimitiveVariables )
 		.def( "writeObject", &SceneInterface::writeObject )
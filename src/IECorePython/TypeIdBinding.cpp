@@ -438,6 +438,8 @@ void bindTypeId()
 		.value( "LensModel", LensModelTypeId )
 		.value( "StandardRadialLensModel", StandardRadialLensModelTypeId )
 		.value( "LensDistortOp", LensDistortOpTypeId )
+		.value( "PointsPrimitiveOp", PointsPrimitiveOpTypeId )
+		.value( "PointsMergeOp", PointsMergeOpTypeId )
 	;
 }
 
@@ -81,6 +81,7 @@ void bindTypedPrimitiveOp()
 	bindTypedPrimitiveOp< MeshPrimitive >();
 	bindTypedPrimitiveOp< ImagePrimitive >();
 	bindTypedPrimitiveOp< CurvesPrimitive >();
+	bindTypedPrimitiveOp< PointsPrimitive >();
 }
 
 } // namespace IECorePython
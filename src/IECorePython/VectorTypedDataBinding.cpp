@@ -182,6 +182,9 @@ void bindAllVectorTypedData()
 	bindImathColorVectorTypedData();
 	bindImathBoxVectorTypedData();
 	bindImathQuatVectorTypedData();
+
+	def( "setParallelHashThreshold", &IECore::setParallelHashThreshold );
+	def( "getParallelHashThreshold", &IECore::getParallelHashThreshold );
 }
 
 
@@ -320,7 +320,9 @@
 #include "IECorePython/LensModelBinding.h"
 #include "IECorePython/StandardRadialLensModelBinding.h"
 #include "IECorePython/LensDistortOpBinding.h"
+#include "IECorePython/PointsMergeOpBinding.h"
 #include "IECorePython/ObjectPoolBinding.h"
+#include "IECorePython/DiskObjectCacheBinding.h"
 #include "IECore/IECore.h"
 
 using namespace IECorePython;
@@ -643,7 +645,9 @@ BOOST_PYTHON_MODULE(_IECore)
 	bindLensModel();
 	bindStandardRadialLensModel();
 	bindLensDistortOp();
+	bindPointsMergeOp();
 	bindObjectPool();
+	bindDiskObjectCache();
 
 	def( "majorVersion", &IECore::majorVersion );
 	def( "minorVersion", &IECore::minorVersion );
@@ -160,6 +160,8 @@ from SummedAreaOpTest import *
 from GradeTest import *
 from MedianCutSamplerTest import *
 from EnvMapSamplerTest import *
+from EnvMapSHProjectorTest import EnvMapSHProjectorTest
+from HdrMergeOpTest import HdrMergeOpTest
 from RandomTest import *
 from MeshVertexReorderOpTest import *
 from SplineTest import *
@@ -206,6 +208,7 @@ from NParticleReader import *
 from IFFHairReader import *
 from FaceAreaOpTest import FaceAreaOpTest
 from CurvesMergeOpTest import CurvesMergeOpTest
+from PointsMergeOpTest import PointsMergeOpTest
 from CurvesPrimitiveEvaluatorTest import CurvesPrimitiveEvaluatorTest
 from SubstitutedDictTest import SubstitutedDictTest
 from PointDistributionTest import PointDistributionTest
@@ -269,6 +272,8 @@ from LinkedSceneTest import LinkedSceneTest
 from StandardRadialLensModelTest import StandardRadialLensModelTest
 from LensDistortOpTest import LensDistortOpTest
 from ObjectPoolTest import ObjectPoolTest
+from DiskObjectCacheTest import DiskObjectCacheTest
+from LazyModuleTest import LazyModuleTest
 
 if IECore.withASIO() :
 	from DisplayDriverTest import *
@@ -106,6 +106,23 @@ class TestBGEOReader( unittest.TestCase ) :
 		self.assert_( len( a ) < 15 )
 		self.assert_( len( a ) > 7 )
 
+	def testReadAttributes( self ) :
+
+		r = IECore.Reader.create( "test/IECore/data/bgeoFiles/particleTest.0006.bgeo" )
+		names = [ "P", "life", "id", "doesntExist" ]
+
+		for percentage in ( 100, 50 ) :
+
+			r.parameters()["percentage"].setValue( IECore.FloatData( percentage ) )
+
+			a = r.readAttributes( IECore.StringVectorData( names ) )
+			self.assertEqual( sorted( a.keys() ), sorted( names[:-1] ) )
+			for n in names[:-1] :
+				self.assertEqual( a[n], r.readAttribute( n ) )
+
+			p = r.read()
+			self.assertEqual( p.numPoints, len( a["P"] ) )
+
 	def testConversion( self ) :
 		
 		r = IECore.Reader.create( "test/IECore/data/bgeoFiles/particleTest.0006.bgeo" )
@@ -34,6 +34,7 @@
 
 import unittest
 import threading
+import time
 
 from IECore import *
 import os
@@ -262,5 +263,84 @@ class CachedReaderTest( unittest.TestCase ) :
 		t2.join()
 		t3.join()
 		
+	def testPrefetch( self ) :
+
+		files = [
+			"test/IECore/data/cobFiles/compoundData.cob",
+			"test/IECore/data/pdcFiles/particleShape1.250.pdc",
+			"test/IECore/data/cobFiles/polySphereQuads.cob",
+			"iDontExist",
+		]
+
+		r = CachedReader( SearchPath( "./", ":" ), ObjectPool(100 * 1024 * 1024) )
+		r.prefetch( files )
+
+		# wait for the background loading to complete
+		t = time.time()
+		while time.time() - t < 10 :
+			if False not in [ r.cached( f ) for f in files[:-1] ] :
+				break
+			time.sleep( 0.01 )
+
+		for f in files[:-1] :
+			self.failUnless( r.cached( f ) )
+			self.assertEqual( r.read( f ), Reader.create( f ).read() )
+
+		self.failIf( r.cached( "iDontExist" ) )
+		self.assertRaises( RuntimeError, r.read, "iDontExist" )
+
+	def testValidation( self ) :
+
+		r = CachedReader( SearchPath( "./test/IECore", ":" ), ObjectPool(100 * 1024 * 1024) )
+		self.assertEqual( r.validation, False )
+
+		ObjectWriter( IntData( 1 ), "test/IECore/cachedReaderValidation.cob" ).write()
+		self.assertEqual( r.read( "cachedReaderValidation.cob" ), IntData( 1 ) )
+
+		# without validation we don't notice that the file changed
+		ObjectWriter( IntVectorData( [ 1, 2 ] ), "test/IECore/cachedReaderValidation.cob" ).write()
+		os.utime( "test/IECore/cachedReaderValidation.cob", ( time.time() + 10, time.time() + 10 ) )
+		self.assertEqual( r.read( "cachedReaderValidation.cob" ), IntData( 1 ) )
+
+		# but with it we do
+		r.validation = True
+		self.assertEqual( r.validation, True )
+		self.assertEqual( r.read( "cachedReaderValidation.cob" ), IntVectorData( [ 1, 2 ] ) )
+		self.failUnless( r.cached( "cachedReaderValidation.cob" ) )
+
+		# failures are forgotten when the file changes too
+		os.remove( "test/IECore/cachedReaderValidation.cob" )
+		self.failIf( r.cached( "cachedReaderValidation.cob" ) )
+		self.assertRaises( RuntimeError, r.read, "cachedReaderValidation.cob" )
+		ObjectWriter( IntData( 2 ), "test/IECore/cachedReaderValidation.cob" ).write()
+		self.assertEqual( r.read( "cachedReaderValidation.cob" ), IntData( 2 ) )
+
+	def testConcurrentPostProcessing( self ) :
+
+		files = [
+			"test/IECore/data/cobFiles/polySphereQuads.cob",
+			"test/IECore/data/cobFiles/pSphereShape1.cob",
+		]
+
+		def func( r, files ) :
+			for i in range( 0, 100 ) :
+				m = r.read( files[ i % len( files ) ] )
+				for v in m.verticesPerFace :
+					self.assertEqual( v, 3 )
+				r.clear()
+
+		r = CachedReader( SearchPath( "./", ":" ), TriangulateOp(), ObjectPool(100 * 1024 * 1024), True )
+
+		threads = [ threading.Thread( target=func, args = [ r, files ] ) for i in range( 0, 4 ) ]
+		for t in threads :
+			t.start()
+		for t in threads :
+			t.join()
+
+	def tearDown( self ) :
+
+		if os.path.exists( "test/IECore/cachedReaderValidation.cob" ) :
+			os.remove( "test/IECore/cachedReaderValidation.cob" )
+
 if __name__ == "__main__":
     unittest.main()
@@ -32,6 +32,10 @@
 #
 ##########################################################################
 
+import os
+import cPickle
+import time
+import shutil
 import unittest
 import IECore
 
@@ -110,6 +114,98 @@ class TestClassLoader( unittest.TestCase ) :
 		s = l.searchPath()
 		s.setPaths( "a:b:c", ":" )
 		self.assertEqual( l.searchPath(), IECore.SearchPath( "test/IECore/ops", ":" ) )
-		
+
+	def testIndex( self ) :
+
+		l = IECore.ClassLoader( IECore.SearchPath( "test/IECore/ops", ":" ) )
+		li = IECore.ClassLoader( IECore.SearchPath( "test/IECore/ops", ":" ), self.__indexDirectory )
+
+		self.assertEqual( li.classNames(), l.classNames() )
+		self.assertEqual( len( os.listdir( self.__indexDirectory ) ), 1 )
+
+		# a new loader should get the same results from the index
+		li = IECore.ClassLoader( IECore.SearchPath( "test/IECore/ops", ":" ), self.__indexDirectory )
+		self.assertEqual( li.classNames(), l.classNames() )
+		self.assertEqual( li.versions( "maths/multiply" ), [ 1, 2 ] )
+		self.assertEqual( len( li.load( "maths/multiply", 1 )().parameters() ), 2 )
+
+		# and single lookups should work without finding all classes first
+		li = IECore.ClassLoader( IECore.SearchPath( "test/IECore/ops", ":" ), self.__indexDirectory )
+		self.assertEqual( li.getDefaultVersion( "path.With.Dot/multiply" ), 1 )
+		self.assertRaises( RuntimeError, li.getDefaultVersion, "thisOpDoesntExist" )
+
+	def testIndexFromAnotherDirectory( self ) :
+
+		IECore.ClassLoader( IECore.SearchPath( "test/IECore/ops", ":" ), self.__indexDirectory ).classNames()
+
+		# the index must only refer to absolute paths, as it is
+		# shared by loaders with different working directories.
+		indexFiles = os.listdir( self.__indexDirectory )
+		self.assertEqual( len( indexFiles ), 1 )
+		with open( os.path.join( self.__indexDirectory, indexFiles[0] ), "rb" ) as f :
+			index = cPickle.load( f )
+		for directory in index["mtimes"].keys() :
+			self.failUnless( os.path.isabs( directory ) )
+		for versions in index["classes"].values() :
+			for fileName in versions.values() :
+				self.failUnless( os.path.isabs( fileName ) )
+
+		indexDirectory = os.path.abspath( self.__indexDirectory )
+		opsDirectory = os.path.abspath( "test/IECore/ops" )
+		cwd = os.getcwd()
+		os.chdir( "test" )
+		try :
+			l = IECore.ClassLoader( IECore.SearchPath( opsDirectory, ":" ), indexDirectory )
+			self.assertEqual( l.versions( "maths/multiply" ), [ 1, 2 ] )
+			self.assertEqual( len( l.load( "maths/multiply", 1 )().parameters() ), 2 )
+		finally :
+			os.chdir( cwd )
+
+		self.assertEqual( os.listdir( self.__indexDirectory ), indexFiles )
+
+	def testIndexInvalidation( self ) :
+
+		def writeClass( name, version ) :
+
+			directory = os.path.join( self.__opsDirectory, name )
+			if not os.path.isdir( directory ) :
+				os.makedirs( directory )
+			shutil.copy( "test/IECore/ops/maths/multiply/multiply-1.py", os.path.join( directory, "multiply-%d.py" % version ) )
+			# make sure the modification times change, regardless of
+			# the resolution of the filesystem timestamps.
+			t = time.time() + 10 * version
+			while directory != os.path.dirname( self.__opsDirectory ) :
+				os.utime( directory, ( t, t ) )
+				directory = os.path.dirname( directory )
+
+		writeClass( "multiply", 1 )
+
+		searchPath = IECore.SearchPath( self.__opsDirectory, ":" )
+		self.assertEqual( IECore.ClassLoader( searchPath, self.__indexDirectory ).classNames(), [ "multiply" ] )
+
+		writeClass( "multiply", 2 )
+		l = IECore.ClassLoader( searchPath, self.__indexDirectory )
+		self.assertEqual( l.classNames(), [ "multiply" ] )
+		self.assertEqual( l.versions( "multiply" ), [ 1, 2 ] )
+
+		writeClass( "maths/multiply", 3 )
+		l = IECore.ClassLoader( searchPath, self.__indexDirectory )
+		self.assertEqual( l.classNames(), [ "maths/multiply", "multiply" ] )
+		self.assertEqual( l.versions( "maths/multiply" ), [ 3 ] )
+		self.assertEqual( l.load( "maths/multiply" ).version, 3 )
+
+	__indexDirectory = "test/IECore/classLoaderIndex"
+	__opsDirectory = "test/IECore/classLoaderOps"
+
+	def setUp( self ) :
+
+		self.tearDown()
+
+	def tearDown( self ) :
+
+		for d in ( self.__indexDirectory, self.__opsDirectory ) :
+			if os.path.isdir( d ) :
+				shutil.rmtree( d )
+
 if __name__ == "__main__":
         unittest.main()
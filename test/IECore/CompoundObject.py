@@ -222,6 +222,30 @@ class testCompoundObject( unittest.TestCase ) :
 			else :
 				self.assertEqual( h, o.hash() )
 			h = o.hash()
+
+	def testHashAfterInPlaceModification( self ) :
+
+		o = IECore.CompoundObject( {
+			"a" : IECore.IntVectorData( [ 1, 2 ] ),
+			"b" : IECore.CompoundObject( { "c" : IECore.IntData( 1 ) } ),
+		} )
+
+		# modifying members in place must be reflected in the hash
+		h = o.hash()
+		self.assertEqual( h, o.hash() )
+
+		a = o["a"]
+		a.append( 3 )
+		self.assertNotEqual( o.hash(), h )
+
+		h = o.hash()
+		c = o["b"]["c"]
+		c.value = 2
+		self.assertNotEqual( o.hash(), h )
+
+		h = o.hash()
+		o["b"]["d"] = IECore.IntData( 3 )
+		self.assertNotEqual( o.hash(), h )
 	
 if __name__ == "__main__":
         unittest.main()
@@ -57,5 +57,39 @@ class CurvesMergeOpTest( unittest.TestCase ) :
 		pMerged.extend( p2 )
 		self.assertEqual( merged["P"].data, pMerged )
 
+	def testCurvesList( self ) :
+
+		allCurves = []
+		for i in range( 0, 10 ) :
+			p = IECore.V3fVectorData( [ IECore.V3f( i, j, 0 ) for j in range( 0, 4 * ( i + 1 ) ) ], IECore.GeometricData.Interpretation.Point )
+			c = IECore.CurvesPrimitive( IECore.IntVectorData( [ 4 ] * ( i + 1 ) ), IECore.CubicBasisf.catmullRom(), False, p )
+			c["width"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Uniform, IECore.FloatVectorData( [ i ] * ( i + 1 ) ) )
+			allCurves.append( c )
+
+		merged = IECore.CurvesMergeOp()( input=allCurves[0], curvesList=IECore.ObjectVector( allCurves[1:] ) )
+		self.failUnless( merged.arePrimitiveVariablesValid() )
+		self.assertEqual( merged.numCurves(), sum( [ c.numCurves() for c in allCurves ] ) )
+
+		expected = allCurves[0]
+		for c in allCurves[1:] :
+			expected = IECore.CurvesMergeOp()( input=expected, curves=c )
+
+		self.assertEqual( merged, expected )
+
+	def testMismatchedPrimVarsArePadded( self ) :
+
+		v = IECore.V3f
+		c1 = IECore.CurvesPrimitive( IECore.IntVectorData( [ 4 ] ), IECore.CubicBasisf.linear(), False, IECore.V3fVectorData( [ v( 0 ), v( 1 ), v( 2 ), v( 3 ) ] ) )
+		c2 = IECore.CurvesPrimitive( IECore.IntVectorData( [ 4 ] ), IECore.CubicBasisf.linear(), False, IECore.V3fVectorData( [ v( 4 ), v( 5 ), v( 6 ), v( 7 ) ] ) )
+		c2["Cs"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Vertex, IECore.Color3fVectorData( [ IECore.Color3f( 1 ) ] * 4 ) )
+
+		merged = IECore.CurvesMergeOp()( input=c1, curves=c2 )
+		self.failUnless( merged.arePrimitiveVariablesValid() )
+		self.assertEqual( merged["Cs"].data, IECore.Color3fVectorData( [ IECore.Color3f( 0 ) ] * 4 + [ IECore.Color3f( 1 ) ] * 4 ) )
+
+		merged = IECore.CurvesMergeOp()( input=c1, curves=c2, removeNonMatchingPrimVars=True )
+		self.failUnless( merged.arePrimitiveVariablesValid() )
+		self.failIf( "Cs" in merged )
+
 if __name__ == "__main__":
     unittest.main()
@@ -1221,6 +1221,100 @@ class CurvesPrimitiveEvaluatorTest( unittest.TestCase ) :
 						self.failUnless( abs( (p2 - p).length() ) < 0.05 )
 						self.assertEqual( c2, c )
 
+	def __randomCurves( self, basis, rand ) :
+
+		p = IECore.V3fVectorData()
+		vertsPerCurve = IECore.IntVectorData()
+
+		numCurves = int( rand.nextf( 1, 10 ) )
+		for c in range( 0, numCurves ) :
+
+			numSegments = int( rand.nextf( 1, 10 ) )
+			numVerts = 4 + basis.step * ( numSegments - 1 )
+
+			vertsPerCurve.append( numVerts )
+
+			for i in range( 0, numVerts ) :
+
+				p.append( rand.nextV3f() + IECore.V3f( c * 2 ) )
+
+		curves = IECore.CurvesPrimitive( vertsPerCurve, basis, False, p )
+		curves["width"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Vertex, IECore.FloatVectorData( [ rand.nextf() for i in range( 0, len( p ) ) ] ) )
+		curves["id"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Uniform, IECore.IntVectorData( range( 0, numCurves ) ) )
+		curves["Cs"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Constant, IECore.Color3fData( IECore.Color3f( 1, 0.5, 0.25 ) ) )
+
+		return curves
+
+	def testClosestPoints( self ) :
+
+		rand = IECore.Rand32()
+
+		for basis in ( IECore.CubicBasisf.linear(), IECore.CubicBasisf.bezier(), IECore.CubicBasisf.bSpline(), IECore.CubicBasisf.catmullRom() ) :
+
+			curves = self.__randomCurves( basis, rand )
+
+			points = IECore.V3fVectorData()
+			for i in range( 0, 1000 ) :
+				points.append( rand.nextV3f() * curves.bound().size() + curves.bound().min )
+
+			e = IECore.CurvesPrimitiveEvaluator( curves )
+			batch = e.closestPoints( points, [ "P", "width", "id", "Cs" ] )
+
+			self.assertEqual( set( batch.keys() ), set( [ "curveIndex", "v", "P", "width", "id", "Cs" ] ) )
+			for k in batch.keys() :
+				self.assertEqual( len( batch[k] ), len( points ) )
+
+			result = e.createResult()
+			for i in range( 0, len( points ) ) :
+
+				self.failUnless( e.closestPoint( points[i], result ) )
+				self.assertEqual( batch["curveIndex"][i], result.curveIndex() )
+				self.assertEqual( batch["v"][i], result.uv()[1] )
+				self.assertEqual( batch["P"][i], result.point() )
+				self.assertEqual( batch["width"][i], result.floatPrimVar( curves["width"] ) )
+				self.assertEqual( batch["id"][i], result.curveIndex() )
+				self.assertEqual( batch["Cs"][i], IECore.Color3f( 1, 0.5, 0.25 ) )
+
+		self.assertRaises( RuntimeError, e.closestPoints, points, [ "iDontExist" ] )
+
+	def testPointsAtV( self ) :
+
+		rand = IECore.Rand32()
+		curves = self.__randomCurves( IECore.CubicBasisf.bSpline(), rand )
+		numCurves = curves.numCurves()
+
+		curveIndices = IECore.IntVectorData()
+		v = IECore.FloatVectorData()
+		for i in range( 0, 1000 ) :
+			curveIndices.append( int( rand.nextf( 0, numCurves ) ) )
+			v.append( rand.nextf() )
+
+		# some invalid queries
+		for c, vv in ( ( -1, 0.5 ), ( numCurves, 0.5 ), ( 0, -0.1 ), ( 0, 1.1 ) ) :
+			curveIndices.append( c )
+			v.append( vv )
+
+		e = IECore.CurvesPrimitiveEvaluator( curves )
+		batch = e.pointsAtV( curveIndices, v, primVarNames = [ "P", "width" ] )
+
+		self.assertEqual( set( batch.keys() ), set( [ "curveIndex", "v", "status", "P", "width" ] ) )
+
+		result = e.createResult()
+		for i in range( 0, len( curveIndices ) ) :
+
+			if i >= 1000 :
+				self.failIf( batch["status"][i] )
+				continue
+
+			self.failUnless( batch["status"][i] )
+			self.failUnless( e.pointAtV( curveIndices[i], v[i], result ) )
+			self.assertEqual( batch["curveIndex"][i], curveIndices[i] )
+			self.assertEqual( batch["v"][i], v[i] )
+			self.assertEqual( batch["P"][i], result.point() )
+			self.assertEqual( batch["width"][i], result.floatPrimVar( curves["width"] ) )
+
+		self.assertRaises( RuntimeError, e.pointsAtV, curveIndices, IECore.FloatVectorData( [ 0.5 ] ) )
+
 	def testTopologyMethods( self ) :
 	
 		c = IECore.CurvesPrimitive( IECore.IntVectorData( [ 6, 6 ] ), IECore.CubicBasisf.linear(), False, IECore.V3fVectorData( [ IECore.V3f( 0 ) ] * 12 ) )
@@ -0,0 +1,175 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+import os
+import shutil
+import unittest
+
+import IECore
+
+class DiskObjectCacheTest( unittest.TestCase ) :
+
+	__directory = "test/IECore/diskObjectCache"
+
+	def testStoreAndRetrieve( self ) :
+
+		c = IECore.DiskObjectCache( self.__directory, 100 * 1024 * 1024 )
+		self.assertEqual( c.directory(), self.__directory )
+		self.assertEqual( c.getMaxDiskUsage(), 100 * 1024 * 1024 )
+		self.assertEqual( c.diskUsage(), 0 )
+
+		o = IECore.IntVectorData( range( 0, 1000 ) )
+		self.failIf( c.contains( o.hash() ) )
+		self.assertEqual( c.retrieve( o.hash() ), None )
+		self.assertEqual( c.misses(), 1 )
+
+		c.store( o.hash(), o )
+		self.failUnless( c.contains( o.hash() ) )
+		self.failUnless( c.diskUsage() > 0 )
+
+		self.assertEqual( c.retrieve( o.hash() ), o )
+		self.assertEqual( c.hits(), 1 )
+		self.assertEqual( c.misses(), 1 )
+
+		c.resetStatistics()
+		self.assertEqual( c.hits(), 0 )
+		self.assertEqual( c.misses(), 0 )
+
+		self.failUnless( c.erase( o.hash() ) )
+		self.failIf( c.erase( o.hash() ) )
+		self.failIf( c.contains( o.hash() ) )
+		self.assertEqual( c.diskUsage(), 0 )
+
+	def testSharing( self ) :
+
+		# two caches on the same directory behave as two
+		# processes would.
+		c1 = IECore.DiskObjectCache( self.__directory, 100 * 1024 * 1024 )
+		c2 = IECore.DiskObjectCache( self.__directory, 100 * 1024 * 1024 )
+
+		o = IECore.StringData( "shareMe" )
+		c1.store( o.hash(), o )
+		self.assertEqual( c2.retrieve( o.hash() ), o )
+
+		# and a new cache picks up the existing contents
+		c3 = IECore.DiskObjectCache( self.__directory, 100 * 1024 * 1024 )
+		self.assertEqual( c3.diskUsage(), c1.diskUsage() )
+
+		c3.clear()
+		self.failIf( c1.contains( o.hash() ) )
+		self.assertEqual( c3.diskUsage(), 0 )
+
+	def testEviction( self ) :
+
+		objects = [ IECore.IntVectorData( [ i ] * 10000 ) for i in range( 0, 10 ) ]
+
+		c = IECore.DiskObjectCache( self.__directory, 100 * 1024 * 1024 )
+		c.store( objects[0].hash(), objects[0] )
+		size = c.diskUsage()
+
+		c.setMaxDiskUsage( size * 5 )
+		for o in objects[1:] :
+			c.store( o.hash(), o )
+			self.failUnless( c.diskUsage() <= size * 5 )
+
+		self.failUnless( False in [ c.contains( o.hash() ) for o in objects ] )
+
+	def testScanSkipsBadEntries( self ) :
+
+		c = IECore.DiskObjectCache( self.__directory, 100 * 1024 * 1024 )
+		objects = [ IECore.IntVectorData( [ i ] * 1000 ) for i in range( 0, 3 ) ]
+		for o in objects :
+			c.store( o.hash(), o )
+		size = c.diskUsage()
+
+		# an unreadable directory, a dangling link and a directory
+		# masquerading as an object must all be ignored, without
+		# stopping the remaining objects from being counted.
+		unreadable = os.path.join( self.__directory, "unreadable" )
+		os.makedirs( os.path.join( unreadable, "child" ) )
+		os.chmod( unreadable, 0 )
+		os.symlink( "doesNotExist", os.path.join( self.__directory, "dangling.fio" ) )
+		os.makedirs( os.path.join( self.__directory, "notHex", "directory.fio" ) )
+
+		try :
+			c2 = IECore.DiskObjectCache( self.__directory, 100 * 1024 * 1024 )
+			self.assertEqual( c2.diskUsage(), size )
+			c2.clear()
+			for o in objects :
+				self.failIf( c.contains( o.hash() ) )
+		finally :
+			os.chmod( unreadable, 0755 )
+
+	def testObjectPool( self ) :
+
+		o1 = IECore.IntVectorData( [ 1 ] * 10000 )
+		o2 = IECore.IntVectorData( [ 2 ] * 10000 )
+
+		p = IECore.ObjectPool( o1.memoryUsage() + o1.memoryUsage() / 2 )
+		self.assertEqual( p.getDiskCache(), None )
+
+		c = IECore.DiskObjectCache( self.__directory, 100 * 1024 * 1024 )
+		p.setDiskCache( c )
+		self.failUnless( p.getDiskCache().isSame( c ) )
+
+		# storing o2 pushes o1 out of memory and onto disk
+		p.store( o1, IECore.ObjectPool.StoreReference )
+		p.store( o2, IECore.ObjectPool.StoreReference )
+		self.assertEqual( p.memoryUsage(), o2.memoryUsage() )
+		self.failUnless( c.contains( o1.hash() ) )
+		self.failIf( c.contains( o2.hash() ) )
+		self.failUnless( p.contains( o1.hash() ) )
+
+		# retrieving it brings it back into memory
+		self.assertEqual( p.retrieve( o1.hash() ), o1 )
+		self.assertEqual( c.hits(), 1 )
+		self.assertEqual( p.memoryUsage(), o1.memoryUsage() )
+		self.failUnless( c.contains( o2.hash() ) )
+
+		# explicit removal doesn't write to disk
+		p.clear()
+		c.clear()
+		p.store( o1, IECore.ObjectPool.StoreReference )
+		p.erase( o1.hash() )
+		p.clear()
+		self.failIf( c.contains( o1.hash() ) )
+
+	def tearDown( self ) :
+
+		if os.path.exists( self.__directory ) :
+			shutil.rmtree( self.__directory )
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,113 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+import unittest
+import math
+
+import IECore
+
+class EnvMapSHProjectorTest( unittest.TestCase ) :
+
+	def __constantEnvMap( self, colour, width = 64, height = 32 ) :
+
+		window = IECore.Box2i( IECore.V2i( 0 ), IECore.V2i( width - 1, height - 1 ) )
+		image = IECore.ImagePrimitive( window, window )
+		for i, c in enumerate( [ "R", "G", "B" ] ) :
+			image[c] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Vertex, IECore.FloatVectorData( [ colour[i] ] * ( width * height ) ) )
+
+		return image
+
+	def __assertConstantProjection( self, coefficients, colour, tolerance ) :
+
+		# the projection of a constant function is entirely in the first
+		# coefficient, which is the constant multiplied by sqrt( 4 * pi ).
+		expected = colour * math.sqrt( 4 * math.pi )
+		for i in range( 0, 3 ) :
+			self.assertAlmostEqual( coefficients[0][i], expected[i], delta = tolerance )
+
+		for c in coefficients[1:] :
+			for i in range( 0, 3 ) :
+				self.assertAlmostEqual( c[i], 0, delta = tolerance )
+
+	def testSampling( self ) :
+
+		colour = IECore.Color3f( 0.25, 0.5, 1 )
+		image = self.__constantEnvMap( colour )
+
+		for sampling in ( IECore.EnvMapSHProjector.Sampling.Random, IECore.EnvMapSHProjector.Sampling.Texels ) :
+
+			result = IECore.EnvMapSHProjector()( input = image, bands = 3, sampling = sampling, applyFilter = False )
+			self.failUnless( isinstance( result, IECore.Color3fVectorData ) )
+			self.assertEqual( len( result ), 9 )
+			self.__assertConstantProjection( result, colour, 0.02 )
+
+	def testCachedProjectorsReused( self ) :
+
+		IECore.EnvMapSHProjector.clearProjectorCache()
+
+		op = IECore.EnvMapSHProjector()
+		for sampling in ( IECore.EnvMapSHProjector.Sampling.Random, IECore.EnvMapSHProjector.Sampling.Texels ) :
+
+			r1 = op( input = self.__constantEnvMap( IECore.Color3f( 1 ) ), sampling = sampling )
+			r2 = op( input = self.__constantEnvMap( IECore.Color3f( 2 ) ), sampling = sampling )
+
+			for c1, c2 in zip( r1, r2 ) :
+				for i in range( 0, 3 ) :
+					self.assertAlmostEqual( c1[i] * 2, c2[i], 4 )
+
+	def testProgressive( self ) :
+
+		colour = IECore.Color3f( 1, 0.5, 0.25 )
+		image = self.__constantEnvMap( colour )
+
+		for sampling in ( IECore.EnvMapSHProjector.Sampling.Random, IECore.EnvMapSHProjector.Sampling.Texels ) :
+
+			result = IECore.EnvMapSHProjector()( input = image, bands = 3, sampling = sampling, tolerance = 0.01, applyFilter = False )
+			self.assertEqual( len( result ), 9 )
+			self.__assertConstantProjection( result, colour, 0.1 )
+
+	def testCacheMemoryLimit( self ) :
+
+		l = IECore.EnvMapSHProjector.getProjectorCacheMemoryLimit()
+		try :
+			IECore.EnvMapSHProjector.setProjectorCacheMemoryLimit( 1024 )
+			self.assertEqual( IECore.EnvMapSHProjector.getProjectorCacheMemoryLimit(), 1024 )
+			result = IECore.EnvMapSHProjector()( input = self.__constantEnvMap( IECore.Color3f( 1 ) ), sampling = IECore.EnvMapSHProjector.Sampling.Texels, applyFilter = False )
+			self.__assertConstantProjection( result, IECore.Color3f( 1 ), 0.02 )
+		finally :
+			IECore.EnvMapSHProjector.setProjectorCacheMemoryLimit( l )
+
+if __name__ == "__main__":
+	unittest.main()
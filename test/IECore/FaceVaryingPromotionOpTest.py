@@ -141,6 +141,22 @@ class FaceVaryingPromotionOpTest( unittest.TestCase ) :
 		self.assertEqual( p2["Varying"].data, self.__outputValues["Varying"] )
 		self.assertEqual( p2["Vertex"].data, self.__inputValues["Vertex"] )
 		self.assertEqual( p2["FaceVarying"].data, self.__outputValues["FaceVarying"] )
-		
+
+	def testLargeMesh( self ) :
+
+		p = IECore.MeshPrimitive.createPlane( IECore.Box2f( IECore.V2f( -1 ), IECore.V2f( 1 ) ), IECore.V2i( 200 ) )
+		numFaces = p.variableSize( IECore.PrimitiveVariable.Interpolation.Uniform )
+		p["Uniform"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Uniform, IECore.IntVectorData( range( 0, numFaces ) ) )
+		p["UniformBool"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Uniform, IECore.BoolVectorData( [ bool( i % 3 ) for i in range( 0, numFaces ) ] ) )
+
+		p2 = IECore.FaceVaryingPromotionOp()( input=p )
+		self.failUnless( p2.arePrimitiveVariablesValid() )
+
+		vertexIds = p.vertexIds
+		for i in range( 0, vertexIds.size() ) :
+			self.assertEqual( p2["P"].data[i], p["P"].data[vertexIds[i]] )
+			self.assertEqual( p2["Uniform"].data[i], i / 4 )
+			self.assertEqual( p2["UniformBool"].data[i], bool( ( i / 4 ) % 3 ) )
+
 if __name__ == "__main__":
     unittest.main()
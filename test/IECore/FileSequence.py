@@ -469,6 +469,56 @@ class testMv( unittest.TestCase ) :
 		self.assertEqual( len( l ), 1 )
 		self.assertEqual( l[0], FileSequence( "s.####.tif", FrameRange( 50, 150 ) ) )
 
+	def testDryRun( self ) :
+
+		self.tearDown()
+		os.system( "mkdir -p test/sequences/mvTest" )
+		s = FileSequence( "test/sequences/mvTest/s.####.tif", FrameRange( 0, 100 ) )
+		for f in s.fileNames() :
+			os.system( "touch '" + f + "'" )
+
+		s2 = FileSequence( "test/sequences/mvTest/s.####.tif", FrameRange( 50, 150 ) )
+		plan = mv( s, s2, dryRun = True )
+		self.assertEqual( len( plan ), 202 )
+		self.assertEqual( [ p[0] for p in plan[:101] ], s.fileNames() )
+		self.assertEqual( [ p[1] for p in plan[101:] ], s2.fileNames() )
+
+		l = ls( "test/sequences/mvTest" )
+		self.assertEqual( len( l ), 1 )
+		self.assertEqual( l[0], FileSequence( "s.####.tif", FrameRange( 0, 100 ) ) )
+
+	def testProgress( self ) :
+
+		self.tearDown()
+		os.system( "mkdir -p test/sequences/mvTest" )
+		s = FileSequence( "test/sequences/mvTest/s.####.tif", FrameRange( 0, 100 ) )
+		for f in s.fileNames() :
+			os.system( "touch '" + f + "'" )
+
+		progress = []
+		def callback( numCompleted, numTotal ) :
+			progress.append( ( numCompleted, numTotal ) )
+
+		s2 = FileSequence( "test/sequences/mvTest/s.####.tif", FrameRange( 50, 150 ) )
+		mv( s, s2, numThreads = 4, progressCallback = callback )
+		self.assertEqual( progress, [ ( i, 202 ) for i in range( 1, 203 ) ] )
+
+		l = ls( "test/sequences/mvTest" )
+		self.assertEqual( len( l ), 1 )
+		self.assertEqual( l[0], FileSequence( "s.####.tif", FrameRange( 50, 150 ) ) )
+
+	def testErrors( self ) :
+
+		self.tearDown()
+		os.system( "mkdir -p test/sequences/mvTest" )
+		s = FileSequence( "test/sequences/mvTest/s.####.tif", FrameRange( 0, 100 ) )
+		for f in s.fileNames() :
+			if f != s.fileNameForFrame( 50 ) :
+				os.system( "touch '" + f + "'" )
+
+		s2 = FileSequence( "test/sequences/mvTest/t.####.tif", FrameRange( 0, 100 ) )
+		self.assertRaises( IOError, mv, s, s2, numThreads = 4 )
+
 	def tearDown( self ) :
 
 		if os.path.exists( "test/sequences" ) :
@@ -499,6 +549,33 @@ class testCp( unittest.TestCase ) :
 		l = ls( "test/sequences/cpTest" )
 		self.assertEqual( len( l ), 1 )
 		self.assertEqual( l[0], FileSequence( "t.####.tif", FrameRange( 50, 150 ) ) )
+
+	def testContents( self ) :
+
+		self.tearDown()
+		os.system( "mkdir -p test/sequences/cpTest" )
+
+		s = FileSequence( "test/sequences/cpTest/s.####.tif", FrameRange( 0, 20 ) )
+		for i, f in enumerate( s.fileNames() ) :
+			open( f, "wb" ).write( str( i ) * ( i * 10000 ) )
+		os.chmod( s.fileNameForFrame( 10 ), 0700 )
+
+		s2 = FileSequence( "test/sequences/cpTest/t.####.tif", FrameRange( 0, 20 ) )
+		self.assertEqual( cp( s, s2, dryRun = True ), s.mapTo( s2, True ) )
+		self.assertEqual( len( ls( "test/sequences/cpTest" ) ), 1 )
+
+		progress = []
+		cp( s, s2, progressCallback = lambda numCompleted, numTotal : progress.append( numCompleted ) )
+		self.assertEqual( progress, range( 1, 22 ) )
+
+		for src, dst in s.mapTo( s2, True ) :
+			self.assertEqual( open( src, "rb" ).read(), open( dst, "rb" ).read() )
+			self.assertEqual( os.stat( src ).st_mode, os.stat( dst ).st_mode )
+
+		self.assertEqual( rm( s2, dryRun = True ), s2.fileNames() )
+		self.assertEqual( len( ls( "test/sequences/cpTest" ) ), 2 )
+		rm( s2, numThreads = 4 )
+		self.assertEqual( len( ls( "test/sequences/cpTest" ) ), 1 )
 	
 	def tearDown( self ) :
 
@@ -529,6 +606,27 @@ class testBigNumbers( unittest.TestCase ) :
 
 		self.assertEqual( s2.frameList.asList(), range( startFrame + offset, startFrame + offset + 5 ) )
 
+	def testRenumberDryRun( self ) :
+
+		s = FileSequence( "test/IECore/sequences/renumberTest/s.#.tif", FrameRange( 1, 10 ) )
+		os.system( "mkdir -p test/IECore/sequences/renumberTest" )
+
+		for f in s.fileNames() :
+			os.system( "touch '" + f + "'" )
+		os.system( "touch test/IECore/sequences/renumberTest/s.20.tif" )
+
+		m = CapturingMessageHandler()
+		with m :
+			SequenceRenumberOp()( src="test/IECore/sequences/renumberTest/s.#.tif", offset=10, dryRun=True )
+
+		warnings = [ x for x in m.messages if x.level == Msg.Level.Warning ]
+		self.assertEqual( len( warnings ), 1 )
+		self.failUnless( "s.20.tif" in warnings[0].message )
+
+		s2 = ls( "test/IECore/sequences/renumberTest" )
+		self.assertEqual( len( s2 ), 1 )
+		self.assertEqual( s2[0].frameList.asList(), range( 1, 11 ) + [ 20 ] )
+
 	def tearDown( self ) :
 
 		if os.path.exists( "test/IECore/sequences" ) :
@@ -56,6 +56,92 @@ class TestFrameList( unittest.TestCase ) :
 		self.assertEqual( frameListFromList( [ 5, 4, 3, 2, 1 ] ), f ) # Known error with IECore::frameListFromList
 	
 	## \todo: there should probably be a lot more tests in here...
+
+	def testRanges( self ) :
+
+		f = FrameList.parse( "1-10x3" )
+		self.assertEqual( f.asRanges(), [ ( 1, 10, 3 ) ] )
+
+		f = FrameList.parse( "1-11x3" )
+		self.assertEqual( f.asRanges(), [ ( 1, 10, 3 ) ] )
+
+		f = FrameList.parse( "1-5, 3-10, 20" )
+		self.assertEqual( f.asRanges(), [ ( 1, 10, 1 ), ( 20, 20, 1 ) ] )
+
+		f = FrameList.parse( "1-100x2!1-100x4" )
+		self.assertEqual( f.asRanges(), [ ( 3, 99, 4 ) ] )
+
+		f = FrameList.parse( "1-10r" )
+		self.assertEqual( f.asRanges(), [ ( 1, 10, 1 ) ] )
+
+		self.assertEqual( FrameList.parse( "" ).asRanges(), [] )
+
+		f = FrameList.parse( "1-3, 2, 2, 3, 10, 10" )
+		self.assertEqual( f.asRanges(), [ ( 1, 3, 1 ), ( 10, 10, 1 ) ] )
+		self.assertEqual( f.size(), 4 )
+
+	def testQueries( self ) :
+
+		f = FrameList.parse( "1-10, 20-30x2" )
+		self.assertEqual( f.size(), 16 )
+		self.assertEqual( f.minFrame(), 1 )
+		self.assertEqual( f.maxFrame(), 30 )
+		self.failIf( f.isContiguous() )
+		self.failUnless( 5 in f )
+		self.failUnless( f.contains( 22 ) )
+		self.failIf( 21 in f )
+		self.failIf( 11 in f )
+
+		f = FrameList.parse( "1-5, 6-10" )
+		self.failUnless( f.isContiguous() )
+
+		f = FrameList.parse( "" )
+		self.assertEqual( f.size(), 0 )
+		self.failIf( f.isContiguous() )
+		self.assertRaises( RuntimeError, f.minFrame )
+		self.assertRaises( RuntimeError, f.maxFrame )
+
+		f = FrameRange( 1, 1000000000 )
+		self.assertEqual( f.size(), 1000000000 )
+		self.assertEqual( f.maxFrame(), 1000000000 )
+		self.failUnless( f.isContiguous() )
+
+	def testSetOperations( self ) :
+
+		frameLists = [
+			"",
+			"1",
+			"1-10",
+			"1-100x3",
+			"5-50x7",
+			"1-20, 40-60x2",
+			"1-100x2!1-100x6",
+			"1-10r",
+			"-10-10x4",
+		]
+
+		for s1 in frameLists :
+			f1 = FrameList.parse( s1 )
+			for s2 in frameLists :
+				f2 = FrameList.parse( s2 )
+
+				a = set( f1.asList() )
+				b = set( f2.asList() )
+
+				self.assertEqual( set( f1.intersection( f2 ).asList() ), a & b )
+				self.assertEqual( set( f1.union( f2 ).asList() ), a | b )
+				self.assertEqual( set( f1.difference( f2 ).asList() ), a - b )
+				self.assertEqual( f1.intersects( f2 ), len( a & b ) > 0 )
+
+	def testFromRanges( self ) :
+
+		self.failUnless( isinstance( FrameList.fromRanges( [] ), EmptyFrameList ) )
+		self.assertEqual( FrameList.fromRanges( [ ( 1, 10, 2 ) ] ), FrameRange( 1, 10, 2 ) )
+
+		f = FrameList.fromRanges( [ ( 1, 10, 1 ), ( 20, 30, 5 ) ] )
+		self.failUnless( isinstance( f, CompoundFrameList ) )
+		self.assertEqual( f.asList(), range( 1, 11 ) + [ 20, 25, 30 ] )
+
 	
 if __name__ == "__main__":
         unittest.main()
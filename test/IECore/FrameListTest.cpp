@@ -0,0 +1,134 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include "FrameListTest.h"
+
+#include "IECore/FrameList.h"
+
+using namespace boost;
+using namespace boost::unit_test;
+
+namespace IECore
+{
+
+// A FrameList which doesn't reimplement asRanges(), so we can test the
+// default implementation.
+class ExplicitFrameList : public FrameList
+{
+
+	public :
+
+		ExplicitFrameList( const std::vector<Frame> &frames )
+			:	m_frames( frames )
+		{
+		}
+
+		virtual void asList( std::vector<Frame> &frames ) const
+		{
+			frames = m_frames;
+		}
+
+		virtual std::string asString() const
+		{
+			return "";
+		}
+
+		virtual FrameListPtr copy() const
+		{
+			return new ExplicitFrameList( m_frames );
+		}
+
+	private :
+
+		std::vector<Frame> m_frames;
+
+};
+
+struct FrameListTest
+{
+
+	void testRepeatedFrames()
+	{
+		std::vector<FrameList::Frame> frames;
+		frames.push_back( 5 );
+		frames.push_back( 1 );
+		frames.push_back( 3 );
+		frames.push_back( 3 );
+		frames.push_back( 1 );
+		frames.push_back( 10 );
+		frames.push_back( 10 );
+
+		FrameListPtr f = new ExplicitFrameList( frames );
+
+		FrameList::RangeVector ranges;
+		f->asRanges( ranges );
+
+		BOOST_CHECK_EQUAL( ranges.size(), 2u );
+		BOOST_CHECK( ranges[0] == FrameList::Range( 1, 5, 2 ) );
+		BOOST_CHECK( ranges[1] == FrameList::Range( 10, 10, 1 ) );
+		BOOST_CHECK_EQUAL( f->size(), 4u );
+	}
+
+	void testSingleRepeatedFrame()
+	{
+		std::vector<FrameList::Frame> frames( 3, 7 );
+		FrameListPtr f = new ExplicitFrameList( frames );
+
+		FrameList::RangeVector ranges;
+		f->asRanges( ranges );
+
+		BOOST_CHECK_EQUAL( ranges.size(), 1u );
+		BOOST_CHECK( ranges[0] == FrameList::Range( 7, 7, 1 ) );
+		BOOST_CHECK_EQUAL( f->size(), 1u );
+	}
+
+};
+
+struct FrameListTestSuite : public boost::unit_test::test_suite
+{
+
+	FrameListTestSuite() : boost::unit_test::test_suite( "FrameListTestSuite" )
+	{
+		boost::shared_ptr<FrameListTest> instance( new FrameListTest() );
+		add( BOOST_CLASS_TEST_CASE( &FrameListTest::testRepeatedFrames, instance ) );
+		add( BOOST_CLASS_TEST_CASE( &FrameListTest::testSingleRepeatedFrame, instance ) );
+	}
+};
+
+void addFrameListTest( boost::unit_test::test_suite *test )
+{
+	test->add( new FrameListTestSuite() );
+}
+
+} // namespace IECore
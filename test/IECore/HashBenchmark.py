@@ -0,0 +1,90 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+## Timings for hashing large objects, comparing serial and parallel hashing
+# of vector data, and the hashing of compound objects with many members. This isn't
+# part of the main test suite as the objects take a while to build - run it
+# directly with :
+#
+#	python test/IECore/HashBenchmark.py
+
+import unittest
+import math
+
+import IECore
+
+class HashBenchmark( unittest.TestCase ) :
+
+	sizes = [ 1000000, 10000000, 100000000 ]
+
+	def __time( self, name, size, f ) :
+
+		t = IECore.Timer()
+		f()
+		print "%s : %d : %.4fs" % ( name, size, t.stop() )
+
+	def testVectorData( self ) :
+
+		oldThreshold = IECore.getParallelHashThreshold()
+		try :
+			for size in self.sizes :
+				for threshold in ( 0, 1024 * 1024 ) :
+					IECore.setParallelHashThreshold( threshold )
+					# a fresh copy each time, so we don't just hit the cached hash
+					d = IECore.V3fVectorData( size )
+					name = "V3fVectorData (%s)" % ( "parallel" if threshold else "serial" )
+					self.__time( name, size, d.hash )
+		finally :
+			IECore.setParallelHashThreshold( oldThreshold )
+
+	def testMesh( self ) :
+
+		for size in self.sizes[:-1] :
+			divisions = int( math.sqrt( size / 2 ) )
+			m = IECore.MeshPrimitive.createSphere( 1, divisions = IECore.V2i( divisions, divisions * 2 ) )
+			self.__time( "MeshPrimitive (first)", size, m.hash )
+			self.__time( "MeshPrimitive (repeated)", size, m.hash )
+
+	def testCompoundObject( self ) :
+
+		for size in ( 1000, 10000, 100000 ) :
+			c = IECore.CompoundObject()
+			for i in range( 0, size ) :
+				c["member%d" % i] = IECore.IntVectorData( [ i ] * 10 )
+			self.__time( "CompoundObject (first)", size, c.hash )
+			self.__time( "CompoundObject (repeated)", size, c.hash )
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,170 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+import os
+import unittest
+from IECore import *
+
+class HdrMergeOpTest( unittest.TestCase ) :
+
+	__fileNames = [ "test/IECore/data/exrFiles/hdrMergeBracket%d.exr" % i for i in range( 0, 3 ) ]
+
+	def __bracket( self, exposure, dataWindow = Box2i( V2i( 0 ), V2i( 63, 36 ) ) ) :
+
+		image = ImagePrimitive( dataWindow, dataWindow )
+		width = dataWindow.size().x + 1
+		height = dataWindow.size().y + 1
+		scale = 2 ** exposure
+		for channel, offset in ( ( "R", 0.0 ), ( "G", 0.1 ), ( "B", 0.2 ) ) :
+			values = FloatVectorData()
+			for y in range( 0, height ) :
+				for x in range( 0, width ) :
+					values.append( min( 1.0, scale * ( offset + 2.0 * x / width + float( y ) / height ) ) )
+			image[channel] = PrimitiveVariable( PrimitiveVariable.Interpolation.Vertex, values )
+
+		return image
+
+	def __writeBrackets( self, dataWindows = None ) :
+
+		for i, fileName in enumerate( self.__fileNames ) :
+			if dataWindows :
+				image = self.__bracket( i - 2, dataWindows[i] )
+			else :
+				image = self.__bracket( i - 2 )
+			Writer.create( image, fileName ).write()
+
+	def testDefaults( self ) :
+
+		op = HdrMergeOp()
+		self.assertEqual( op["fileNames"].getValue(), StringVectorData() )
+		self.assertEqual( op["bandHeight"].getNumericValue(), 64 )
+
+	def testGroup( self ) :
+
+		group = Group()
+		for i in range( 0, 3 ) :
+			group.addChild( self.__bracket( i - 2 ) )
+
+		result = HdrMergeOp()( inputGroup = group, exposureStep = 2 )
+
+		self.assertEqual( result.dataWindow, group.children()[0].dataWindow )
+		self.assertEqual( result.displayWindow, group.children()[0].displayWindow )
+
+		def smoothstep( v0, v1, v ) :
+			x = ( v - v0 ) / ( v1 - v0 )
+			x = max( 0.0, min( 1.0, x ) )
+			return ( 3 - 2 * x ) * x * x
+
+		for i in range( 0, 64 * 37, 97 ) :
+			r = g = b = a = 0.0
+			for j, image in enumerate( group.children() ) :
+				inR = image["R"].data[i]
+				inG = image["G"].data[i]
+				inB = image["B"].data[i]
+				intensity = ( inR + inG + inB ) / 3.0
+				weight = smoothstep( 0.0, 0.05, intensity )
+				if j :
+					weight *= 1.0 - smoothstep( 0.9, 1.0, intensity )
+				m = weight * 2 ** ( 2 - 2 * j )
+				r += inR * m
+				g += inG * m
+				b += inB * m
+				a += weight
+			if a > 0 :
+				r /= a
+				g /= a
+				b /= a
+			self.assertAlmostEqual( result["R"].data[i], r, delta = 1e-4 * max( 1.0, r ) )
+			self.assertAlmostEqual( result["G"].data[i], g, delta = 1e-4 * max( 1.0, g ) )
+			self.assertAlmostEqual( result["B"].data[i], b, delta = 1e-4 * max( 1.0, b ) )
+			self.assertAlmostEqual( result["A"].data[i], a, delta = 1e-4 )
+
+	def testFilesMatchGroup( self ) :
+
+		self.__writeBrackets()
+
+		group = Group()
+		for fileName in self.__fileNames :
+			group.addChild( Reader.create( fileName ).read() )
+
+		expected = HdrMergeOp()( inputGroup = group, exposureStep = 2 )
+
+		for bandHeight in ( 1, 5, 37, 100 ) :
+
+			result = HdrMergeOp()(
+				fileNames = StringVectorData( self.__fileNames ),
+				bandHeight = bandHeight,
+				exposureStep = 2
+			)
+
+			self.assertEqual( result.dataWindow, expected.dataWindow )
+			self.assertEqual( result.displayWindow, expected.displayWindow )
+			for c in ( "R", "G", "B", "A" ) :
+				self.assertEqual( result[c].data, expected[c].data )
+
+	def testFilesWithOffsetDataWindow( self ) :
+
+		dataWindow = Box2i( V2i( 10, 20 ), V2i( 40, 50 ) )
+		self.__writeBrackets( [ dataWindow ] * 3 )
+
+		group = Group()
+		for fileName in self.__fileNames :
+			group.addChild( Reader.create( fileName ).read() )
+
+		expected = HdrMergeOp()( inputGroup = group )
+		result = HdrMergeOp()( fileNames = StringVectorData( self.__fileNames ), bandHeight = 4 )
+
+		self.assertEqual( result.dataWindow, dataWindow )
+		for c in ( "R", "G", "B", "A" ) :
+			self.assertEqual( result[c].data, expected[c].data )
+
+	def testMismatchedResolution( self ) :
+
+		self.__writeBrackets( [ Box2i( V2i( 0 ), V2i( 63, 36 ) ), Box2i( V2i( 0 ), V2i( 36, 63 ) ), Box2i( V2i( 0 ), V2i( 63, 36 ) ) ] )
+		self.assertRaises( RuntimeError, HdrMergeOp(), fileNames = StringVectorData( self.__fileNames ) )
+
+		group = Group()
+		group.addChild( self.__bracket( 0 ) )
+		group.addChild( self.__bracket( 1, Box2i( V2i( 0 ), V2i( 36, 63 ) ) ) )
+		self.assertRaises( RuntimeError, HdrMergeOp(), inputGroup = group )
+
+	def tearDown( self ) :
+
+		for fileName in self.__fileNames :
+			if os.path.isfile( fileName ) :
+				os.remove( fileName )
+
+if __name__ == "__main__":
+	unittest.main()
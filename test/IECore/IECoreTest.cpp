@@ -78,6 +78,7 @@
 #include "CompoundDataTest.h"
 #include "CompoundObjectTest.h"
 #include "ComputationCacheTest.h"
+#include "FrameListTest.h"
 
 using namespace boost::unit_test;
 using boost::test_tools::output_test_stream;
@@ -123,6 +124,7 @@ test_suite* init_unit_test_suite( int argc, char* argv[] )
 		addCompoundDataTest(test);
 		addCompoundObjectTest(test);
 		addComputationCacheTest(test);
+		addFrameListTest(test);
 	}
 	catch (std::exception &ex)
 	{
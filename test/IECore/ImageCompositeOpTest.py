@@ -100,6 +100,68 @@ class ImageCompositeOpTest( unittest.TestCase ) :
 
 		self.__test( ImageCompositeOp.Operation.Multiply, "test/IECore/data/expectedResults/imageCompositeOpMultiply.exr" )
 
+	def testSharedChannelData( self ) :
+
+		# channels which share data must each get their own result
+
+		w = Box2i( V2i( 0, 0 ), V2i( 9, 9 ) )
+
+		imageA = ImagePrimitive( w, w )
+		imageA["R"] = PrimitiveVariable( PrimitiveVariable.Interpolation.Vertex, FloatVectorData( [ 0.25 ] * 100 ) )
+		imageA["G"] = PrimitiveVariable( PrimitiveVariable.Interpolation.Vertex, FloatVectorData( [ 0.5 ] * 100 ) )
+		imageA["A"] = PrimitiveVariable( PrimitiveVariable.Interpolation.Vertex, FloatVectorData( [ 0.5 ] * 100 ) )
+
+		imageB = ImagePrimitive( w, w )
+		d = FloatVectorData( [ 1.0 ] * 100 )
+		imageB["R"] = PrimitiveVariable( PrimitiveVariable.Interpolation.Vertex, d )
+		imageB["G"] = PrimitiveVariable( PrimitiveVariable.Interpolation.Vertex, d )
+		imageB["A"] = PrimitiveVariable( PrimitiveVariable.Interpolation.Vertex, d )
+
+		result = ImageCompositeOp()(
+			input = imageB,
+			imageA = imageA,
+			channels = StringVectorData( [ "R", "G", "A" ] ),
+			operation = ImageCompositeOp.Operation.Over
+		)
+
+		self.assert_( result.arePrimitiveVariablesValid() )
+		self.assertEqual( result["R"].data, FloatVectorData( [ 0.75 ] * 100 ) )
+		self.assertEqual( result["G"].data, FloatVectorData( [ 1.0 ] * 100 ) )
+		self.assertEqual( result["A"].data, FloatVectorData( [ 1.0 ] * 100 ) )
+
+		# and the input image should be untouched
+		self.assertEqual( imageB["R"].data, FloatVectorData( [ 1.0 ] * 100 ) )
+
+	def testChannelSharingDataWithAlpha( self ) :
+
+		# compositing a channel which shares its data with an alpha
+		# channel which isn't composited mustn't modify the alpha.
+
+		w = Box2i( V2i( 0, 0 ), V2i( 9, 9 ) )
+
+		imageA = ImagePrimitive( w, w )
+		imageA["R"] = PrimitiveVariable( PrimitiveVariable.Interpolation.Vertex, FloatVectorData( [ 0.25 ] * 100 ) )
+		imageA["G"] = PrimitiveVariable( PrimitiveVariable.Interpolation.Vertex, FloatVectorData( [ 0.5 ] * 100 ) )
+		imageA["A"] = PrimitiveVariable( PrimitiveVariable.Interpolation.Vertex, FloatVectorData( [ 0.5 ] * 100 ) )
+
+		imageB = ImagePrimitive( w, w )
+		d = FloatVectorData( [ 1.0 ] * 100 )
+		imageB["R"] = PrimitiveVariable( PrimitiveVariable.Interpolation.Vertex, d )
+		imageB["G"] = PrimitiveVariable( PrimitiveVariable.Interpolation.Vertex, FloatVectorData( [ 0.5 ] * 100 ) )
+		imageB["A"] = PrimitiveVariable( PrimitiveVariable.Interpolation.Vertex, d )
+
+		result = ImageCompositeOp()(
+			input = imageB,
+			imageA = imageA,
+			channels = StringVectorData( [ "R", "G" ] ),
+			operation = ImageCompositeOp.Operation.Over
+		)
+
+		self.assert_( result.arePrimitiveVariablesValid() )
+		self.assertEqual( result["R"].data, FloatVectorData( [ 0.75 ] * 100 ) )
+		self.assertEqual( result["G"].data, FloatVectorData( [ 0.75 ] * 100 ) )
+		self.assertEqual( result["A"].data, FloatVectorData( [ 1.0 ] * 100 ) )
+
 
 if __name__ == "__main__":
     unittest.main()
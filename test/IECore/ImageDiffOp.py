@@ -134,6 +134,43 @@ class TestImageDiffOp(unittest.TestCase):
 
 		self.failIf( res.value )
 
+	def testDataWindows( self ) :
+
+		# pixels outside the data window should be treated as zero,
+		# without requiring the data windows to match.
+
+		op = ImageDiffOp()
+
+		displayWindow = Box2i( V2i( 0, 0 ), V2i( 9, 9 ) )
+		dataWindow = Box2i( V2i( 2, 3 ), V2i( 5, 7 ) )
+
+		imageA = ImagePrimitive( displayWindow, displayWindow )
+		imageB = ImagePrimitive( dataWindow, displayWindow )
+
+		r = FloatVectorData( [ 0.0 ] * 100 )
+		for y in range( dataWindow.min.y, dataWindow.max.y + 1 ) :
+			for x in range( dataWindow.min.x, dataWindow.max.x + 1 ) :
+				r[y*10+x] = 1.0
+		imageA["R"] = PrimitiveVariable( PrimitiveVariable.Interpolation.Vertex, r )
+		imageB["R"] = PrimitiveVariable( PrimitiveVariable.Interpolation.Vertex, FloatVectorData( [ 1.0 ] * 20 ) )
+
+		self.failIf( op( imageA = imageA, imageB = imageB, maxError = 0 ).value )
+		self.failIf( op( imageA = imageB, imageB = imageA, maxError = 0 ).value )
+
+		r[0] = 1.0
+		self.failUnless( op( imageA = imageA, imageB = imageB, maxError = 0 ).value )
+		self.failUnless( op( imageA = imageB, imageB = imageA, maxError = 0 ).value )
+
+	def testEarlyOut( self ) :
+
+		op = ImageDiffOp()
+
+		imageA = Reader.create( "test/IECore/data/tiff/uvMap.512x256.16bit.tif" ).read()
+		imageB = Reader.create( "test/IECore/data/tiff/uvMapUpsideDown.512x256.16bit.tif" ).read()
+
+		for earlyOut in ( True, False ) :
+			self.failUnless( op( imageA = imageA, imageB = imageB, earlyOut = earlyOut ).value )
+			self.failIf( op( imageA = imageA, imageB = imageA.copy(), earlyOut = earlyOut ).value )
 
 if __name__ == "__main__":
 	unittest.main()
@@ -0,0 +1,79 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+## Timings for "import IECore", measuring the wall time taken by a fresh
+# interpreter and the number of modules it loads. This isn't part of the main
+# test suite as it launches many processes - run it directly with :
+#
+#	python test/IECore/ImportBenchmark.py
+
+import sys
+import unittest
+import subprocess
+
+import IECore
+
+class ImportBenchmark( unittest.TestCase ) :
+
+	iterations = 20
+
+	def __time( self, name, command ) :
+
+		command = "import sys, time; t = time.time(); %s; print time.time() - t, len( sys.modules )" % command
+
+		times = []
+		for i in range( 0, self.iterations ) :
+			p = subprocess.Popen( [ sys.executable, "-c", command ], stdout=subprocess.PIPE )
+			output, nothing = p.communicate()
+			t, numModules = output.split()
+			times.append( float( t ) )
+
+		times.sort()
+		print "%s : %d : %.3fs (min %.3fs) : %s modules" % ( name, self.iterations, times[len(times)/2], times[0], numModules )
+
+	def testImport( self ) :
+
+		self.__time( "import IECore", "import IECore" )
+
+	def testImportAndLoadAll( self ) :
+
+		self.__time( "import IECore + lazy attributes", "import IECore; [ getattr( IECore, n ) for n in IECore.pendingAttributes() ]" )
+
+	def testStarImport( self ) :
+
+		self.__time( "from IECore import *", "from IECore import *" )
+
+if __name__ == "__main__":
+	unittest.main()
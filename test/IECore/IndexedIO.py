@@ -573,6 +573,50 @@ class TestFileIndexedIO(unittest.TestCase):
 		self.failIf(fv is gv)
 		self.assertEqual(fv, gv)
 
+	def testIndexMemoryUsage(self):
+		"""Test FileIndexedIO index memory usage and limits"""
+
+		f = FileIndexedIO("./test/FileIndexedIO.fio", [], IndexedIO.OpenMode.Write)
+		for i in range( 0, 200 ) :
+			# saving an object commits it to a subindex
+			IntVectorData( range( i, i + 10 ) ).save( f, "obj%d" % i )
+		del f
+
+		def readAll( f ) :
+			for i in range( 0, 200 ) :
+				self.assertEqual( Object.load( f, "obj%d" % i ), IntVectorData( range( i, i + 10 ) ) )
+
+		self.assertEqual( StreamIndexedIO.getSubIndexMemoryLimit(), 0 )
+
+		f = FileIndexedIO("./test/FileIndexedIO.fio", [], IndexedIO.OpenMode.Read)
+		initialUsage = f.indexMemoryUsage()
+		self.failUnless( initialUsage > 0 )
+		self.failUnless( ( "./test/FileIndexedIO.fio", initialUsage ) in StreamIndexedIO.openFilesIndexMemoryUsage() )
+
+		readAll( f )
+		unlimitedUsage = f.indexMemoryUsage()
+		self.failUnless( unlimitedUsage > initialUsage )
+		del f
+
+		self.failIf( "./test/FileIndexedIO.fio" in [ u[0] for u in StreamIndexedIO.openFilesIndexMemoryUsage() ] )
+
+		StreamIndexedIO.setSubIndexMemoryLimit( 1 )
+		self.assertEqual( StreamIndexedIO.getSubIndexMemoryLimit(), 1 )
+
+		f = FileIndexedIO("./test/FileIndexedIO.fio", [], IndexedIO.OpenMode.Read)
+		readAll( f )
+		limitedUsage = f.indexMemoryUsage()
+		self.failUnless( limitedUsage < unlimitedUsage )
+
+		# evicted subindexes are loaded again when needed
+		readAll( f )
+
+		# subindexes still referenced by an IndexedIO are never evicted
+		o = f.subdirectory( "obj0" )
+		readAll( f )
+		self.assertEqual( o.entryIds(), f.subdirectory( "obj0" ).entryIds() )
+		self.failUnless( len( o.entryIds() ) > 0 )
+
 	def setUp( self ):
 
 		if os.path.isfile("./test/FileIndexedIO.fio") :
@@ -580,6 +624,8 @@ class TestFileIndexedIO(unittest.TestCase):
 
 	def tearDown(self):
 
+		StreamIndexedIO.setSubIndexMemoryLimit( 0 )
+
 		# cleanup
 		if os.path.isfile("./test/FileIndexedIO.fio") :
 			os.remove("./test/FileIndexedIO.fio")
@@ -0,0 +1,99 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+import sys
+import unittest
+import subprocess
+
+import IECore
+
+class LazyModuleTest( unittest.TestCase ) :
+
+	def __run( self, command ) :
+
+		p = subprocess.Popen( [ sys.executable, "-c", command ], stdout=subprocess.PIPE )
+		output, nothing = p.communicate()
+		self.assertEqual( p.returncode, 0 )
+		return output.strip()
+
+	def testImportIsLazy( self ) :
+
+		self.assertEqual(
+			self.__run( "import sys; import IECore; print 'IECore.SequenceLsOp' in sys.modules" ),
+			"False"
+		)
+
+		self.assertEqual(
+			self.__run( "import sys; import IECore; IECore.SequenceLsOp; print 'IECore.SequenceLsOp' in sys.modules" ),
+			"True"
+		)
+
+	def testLazyAttributes( self ) :
+
+		self.failUnless( isinstance( IECore, IECore.LazyModule ) )
+
+		self.failUnless( isinstance( IECore.SequenceLsOp(), IECore.Op ) )
+		self.failUnless( issubclass( IECore.CheckImagesOp, IECore.FileSequenceAnalyzerOp ) )
+		self.failUnless( issubclass( IECore.ImageSequenceCompositeOp, IECore.SequenceMergeOp ) )
+		self.assertEqual( IECore.SequenceLsOp.staticTypeName(), "SequenceLsOp" )
+		self.failIf( "SequenceLsOp" in IECore.pendingAttributes() )
+
+		from IECore import SequenceCpOp
+		self.failUnless( SequenceCpOp is IECore.SequenceCpOp )
+
+		self.failUnless( "SequenceMvOp" in dir( IECore ) )
+		self.failUnless( "loadConfig" in dir( IECore ) )
+		self.failUnless( callable( IECore.loadConfig ) )
+
+		self.assertRaises( AttributeError, getattr, IECore, "ThisDoesNotExist" )
+
+	def testDependenciesDontHideAttributes( self ) :
+
+		# loading SequenceConvertOp imports SequenceCpOp as a side effect,
+		# which mustn't leave the module in place of the class.
+		self.assertEqual(
+			self.__run( "import IECore; IECore.SequenceConvertOp; print IECore.SequenceCpOp.__name__, IECore.pendingAttributes().count( 'SequenceCpOp' )" ),
+			"SequenceCpOp 0"
+		)
+
+	def testStarImport( self ) :
+
+		self.assertEqual(
+			self.__run( "from IECore import *; print SequenceRenumberOp.staticTypeName(), FileSequence.staticTypeName()" ),
+			"SequenceRenumberOp FileSequence"
+		)
+
+if __name__ == "__main__":
+	unittest.main()
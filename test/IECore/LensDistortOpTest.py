@@ -66,4 +66,69 @@ class LensDistortOpTest(unittest.TestCase):
 		img2 = r.read()		
 
 		self.assertEqual( img.displayWindow, img2.displayWindow )
+
+	def __lensModel( self ) :
+
+		o = CompoundObject()
+		o["lensModel"] = StringData( "StandardRadialLensModel" )
+		o["distortion"] = DoubleData( 0.2 )
+		o["anamorphicSqueeze"] = DoubleData( 1. )
+		o["curvatureX"] = DoubleData( 0.2 )
+		o["curvatureY"] = DoubleData( 0.5 )
+		o["quarticDistortion"] = DoubleData( .1 )
+
+		return o
+
+	def testCachedDistortionMaps( self ) :
+
+		img = EXRImageReader( "test/IECore/data/exrFiles/uvMapWithDataWindow.100x100.exr" ).read()
+		o = self.__lensModel()
+
+		LensDistortOp.clearDistortionMapCache()
+		out1 = LensDistortOp()( input = img, mode = LensModel.Undistort, lensModel = o )
+		# the second operation reuses the map computed by the first
+		out2 = LensDistortOp()( input = img, mode = LensModel.Undistort, lensModel = o )
+		self.assertEqual( out1, out2 )
+
+		LensDistortOp.clearDistortionMapCache()
+		out3 = LensDistortOp()( input = img, mode = LensModel.Undistort, lensModel = o )
+		self.assertEqual( out1, out3 )
+
+		# different parameters must not pick up the cached map
+		o["distortion"] = DoubleData( 0.1 )
+		out4 = LensDistortOp()( input = img, mode = LensModel.Undistort, lensModel = o )
+		self.assertNotEqual( out1, out4 )
+
+		out5 = LensDistortOp()( input = img, mode = LensModel.Distort, lensModel = self.__lensModel() )
+		self.assertNotEqual( out1, out5 )
+
+	def testDistortionMapCacheMemoryLimit( self ) :
+
+		limit = LensDistortOp.getDistortionMapCacheMemoryLimit()
+		try :
+			LensDistortOp.setDistortionMapCacheMemoryLimit( 0 )
+			self.assertEqual( LensDistortOp.getDistortionMapCacheMemoryLimit(), 0 )
+			# the maps are still computed when they can't be cached
+			img = EXRImageReader( "test/IECore/data/exrFiles/uvMapWithDataWindow.100x100.exr" ).read()
+			out = LensDistortOp()( input = img, mode = LensModel.Undistort, lensModel = self.__lensModel() )
+			self.failUnless( out.arePrimitiveVariablesValid() )
+		finally :
+			LensDistortOp.setDistortionMapCacheMemoryLimit( limit )
+
+	def testFilters( self ) :
+
+		img = EXRImageReader( "test/IECore/data/exrFiles/uvMapWithDataWindow.100x100.exr" ).read()
+		o = self.__lensModel()
+
+		results = {}
+		for f in ( "None", "Bilinear", "Bicubic", "Lanczos" ) :
+			op = LensDistortOp()
+			op["filter"].setValue( f )
+			results[f] = op( input = img, mode = LensModel.Undistort, lensModel = o )
+			self.failUnless( results[f].arePrimitiveVariablesValid() )
+			self.assertEqual( results[f].dataWindow, results["None"].dataWindow )
+
+		# the filters should agree closely on a smooth input such as a uv map
+		for f in ( "Bicubic", "Lanczos" ) :
+			self.failIf( ImageDiffOp()( imageA = results["Bilinear"], imageB = results[f], maxError = 0.01 ).value )
 		
@@ -214,6 +214,43 @@ class LinkedSceneTest( unittest.TestCase ) :
 		t5.writeLink( A )
 		del l2, t1, t2, t3, t4, t5
 
+	def testFinish( self ):
+
+		m = IECore.SceneCache( "test/IECore/data/sccFiles/animatedSpheres.scc", IECore.IndexedIO.OpenMode.Read )
+
+		def write( fileName, finish ) :
+
+			l = IECore.LinkedScene( fileName, IECore.IndexedIO.OpenMode.Write )
+			for i in range( 0, 2 ) :
+				b = l.createChild( "branch%d" % i )
+				b.writeTransform( IECore.M44dData( IECore.M44d.createTranslated( IECore.V3d( i, 0, 0 ) ) ), 0.0 )
+				c = b.createChild( "instance" )
+				c.writeLink( m )
+				if finish :
+					c.finish()
+					b.finish()
+					self.assertRaises( RuntimeError, b.createChild, "new" )
+
+			self.assertRaises( RuntimeError, l.finish )
+
+		write( "/tmp/test.lscc", False )
+		write( "/tmp/test2.lscc", True )
+
+		expected = IECore.LinkedScene( "/tmp/test.lscc", IECore.IndexedIO.OpenMode.Read )
+		l = IECore.LinkedScene( "/tmp/test2.lscc", IECore.IndexedIO.OpenMode.Read )
+		self.assertEqual( sorted( l.childNames() ), [ "branch0", "branch1" ] )
+		for i in range( 0, 2 ) :
+			b = l.child( "branch%d" % i )
+			eb = expected.child( "branch%d" % i )
+			self.assertEqual( b.numBoundSamples(), eb.numBoundSamples() )
+			for s in range( 0, b.numBoundSamples() ) :
+				self.assertEqual( b.boundSampleTime( s ), eb.boundSampleTime( s ) )
+				self.failUnless( LinkedSceneTest.compareBBox( b.readBoundAtSample( s ), eb.readBoundAtSample( s ) ) )
+			self.assertEqual( b.child( "instance" ).childNames(), eb.child( "instance" ).childNames() )
+
+		r = IECore.LinkedScene( "/tmp/test.lscc", IECore.IndexedIO.OpenMode.Read )
+		self.assertRaises( RuntimeError, r.child( "branch0" ).finish )
+
 	def testWriteLinkAnimatedTransform( self ):
 
 		messageHandler = IECore.CapturingMessageHandler()
@@ -579,6 +616,17 @@ class LinkedSceneTest( unittest.TestCase ) :
 		self.assertFalse( ca.hasTag("testB") )
 		self.assertEqual( set(C.readTags(includeChildren=False)), testSet(["C"]) )
 		self.assertEqual( set(D.readTags()), testSet(["D", "testA"]) )
+
+		self.assertEqual( l2.pathsWithTag( "testA" ), [ [ "A", "a" ], [ "B" ], [ "C", "c", "a" ], [ "D" ] ] )
+		self.assertEqual( l2.pathsWithTag( "tags" ), [ [ "A" ], [ "C", "c" ] ] )
+		self.assertEqual( l2.pathsWithTag( "linkedA" ), [ [ "A" ] ] )
+		self.assertEqual( l2.pathsWithTag( "D" ), [ [ "D" ] ] )
+		self.assertEqual( C.pathsWithTag( "testA" ), [ [ "C", "c", "a" ] ] )
+		self.assertEqual( c.pathsWithTag( "testB" ), [ [ "C", "c", "b" ] ] )
+		self.assertEqual( ca.pathsWithTag( "testA" ), [ [ "C", "c", "a" ] ] )
+		self.assertEqual( ca.pathsWithTag( "testB" ), [] )
+		self.assertEqual( l2.matchingPaths( "test*" ), [ [ "A", "a" ], [ "A", "b" ], [ "B" ], [ "C", "c", "a" ], [ "C", "c", "b" ], [ "D" ] ] )
+		self.assertEqual( l2.matchingPaths( "testA !D" ), [ [ "A", "a" ], [ "B" ], [ "C", "c", "a" ] ] )
 	
 	def testMissingLinkedScene( self ) :
 		
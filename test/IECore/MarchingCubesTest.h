@@ -121,6 +121,42 @@ struct MarchingCubesTest
 		delete fn;
 	}
 
+	void testThreaded()
+	{
+		typedef MarchingCubes<SphereIsoSurfaceFn, MeshPrimitiveBuilder > Cubes;
+		typedef IntrusivePtr<Cubes> CubesPtr;
+
+		float radius = 2.5;
+		Box3f bound( V3f(-5,-5,-5),V3f(5,5,5) );
+		V3i resolution( 80, 90, 100 );
+
+		SphereIsoSurfaceFn::Ptr fn = new SphereIsoSurfaceFn( radius );
+
+		MeshPrimitiveBuilder::Ptr builder = new MeshPrimitiveBuilder();
+		CubesPtr c = new Cubes( fn, builder );
+		c->march( bound, resolution );
+		MeshPrimitivePtr serialResult = builder->mesh();
+
+		builder = new MeshPrimitiveBuilder();
+		c = new Cubes( fn, builder );
+		c->march( bound, resolution, 0.0f, true );
+		MeshPrimitivePtr threadedResult = builder->mesh();
+
+		// the vertices shared between slabs must have been welded
+		BOOST_CHECK_EQUAL( threadedResult->variableSize( PrimitiveVariable::Vertex ), serialResult->variableSize( PrimitiveVariable::Vertex ) );
+		BOOST_CHECK_EQUAL( threadedResult->numFaces(), serialResult->numFaces() );
+		BOOST_CHECK_EQUAL( threadedResult->vertexIds()->readable().size(), serialResult->vertexIds()->readable().size() );
+
+		V3fVectorDataPtr p = runTimeCast<V3fVectorData>( threadedResult->variables["P"].data );
+		BOOST_CHECK( p );
+		for (int i = 0; i < (int)p->readable().size(); i++)
+		{
+			BOOST_CHECK_CLOSE( p->readable()[i].length(), radius, 0.5 );
+		}
+
+		delete fn;
+	}
+
 	void testPerlinNoise()
 	{
 		typedef MarchingCubes<PerlinNoiseV3ff, MeshPrimitiveBuilder > Cubes;
@@ -159,6 +195,7 @@ struct MarchingCubesTestSuite : public boost::unit_test::test_suite
 		static boost::shared_ptr<MarchingCubesTest> instance(new MarchingCubesTest());
 
 		add( BOOST_CLASS_TEST_CASE( &MarchingCubesTest::testSphere, instance ) );
+		add( BOOST_CLASS_TEST_CASE( &MarchingCubesTest::testThreaded, instance ) );
 		add( BOOST_CLASS_TEST_CASE( &MarchingCubesTest::testPerlinNoise, instance ) );
 	}
 
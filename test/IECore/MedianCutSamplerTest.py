@@ -69,6 +69,56 @@ class MedianCutSamplerTest( unittest.TestCase ) :
 
 		self.assertEqual( areaSum, luminanceImage.variableSize( IECore.PrimitiveVariable.Interpolation.Vertex ) )
 
+	def testCache( self ) :
+
+		image = IECore.Reader.create( "test/IECore/data/exrFiles/carPark.exr" ).read()
+		for n in ["R", "G", "B"] :
+			p = image[n]
+			p.data = IECore.DataCastOp()( object=image[n].data, targetType=IECore.FloatVectorData.staticTypeId() )
+			image[n] = p
+
+		luminanceImage = IECore.LuminanceOp()( input=image )
+
+		IECore.MedianCutSampler.clearSummedAreaTableCache()
+		uncached = [ IECore.MedianCutSampler()( image=luminanceImage, subdivisionDepth=d ) for d in range( 0, 6 ) ]
+		cached = [ IECore.MedianCutSampler()( image=luminanceImage, subdivisionDepth=d ) for d in range( 0, 6 ) ]
+
+		for d in range( 0, 6 ) :
+			self.assertEqual( len( uncached[d]["areas"] ), 2 ** d )
+			self.assertEqual( uncached[d], cached[d] )
+
+		# the sampler must not modify its input
+		self.assertEqual( luminanceImage, IECore.LuminanceOp()( input=image ) )
+
+		# modifying the image must invalidate the cached table
+		y = luminanceImage["Y"].data.copy()
+		y[0] = 1000000
+		luminanceImage["Y"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Vertex, y )
+		modified = IECore.MedianCutSampler()( image=luminanceImage, subdivisionDepth=5 )
+		self.assertNotEqual( modified, cached[5] )
+
+		l = IECore.MedianCutSampler.getSummedAreaTableCacheMemoryLimit()
+		try :
+			IECore.MedianCutSampler.setSummedAreaTableCacheMemoryLimit( 0 )
+			self.assertEqual( IECore.MedianCutSampler.getSummedAreaTableCacheMemoryLimit(), 0 )
+			self.assertEqual( IECore.MedianCutSampler()( image=luminanceImage, subdivisionDepth=5 ), modified )
+		finally :
+			IECore.MedianCutSampler.setSummedAreaTableCacheMemoryLimit( l )
+
+	def testChannelName( self ) :
+
+		b = IECore.Box2i( IECore.V2i( 0 ), IECore.V2i( 15, 7 ) )
+		image = IECore.ImagePrimitive( b, b )
+		values = IECore.FloatVectorData( [ 1 ] * 128 )
+		values[127] = 1000
+		image["L"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Vertex, values )
+
+		s = IECore.MedianCutSampler()( image=image, channelName="L", subdivisionDepth=2, projection=IECore.MedianCutSampler.Projection.Rectilinear )
+
+		# nearly all the energy is in the last pixel, so the cuts should crowd towards it
+		self.assertEqual( len( s["areas"] ), 4 )
+		self.assertEqual( s["areas"][3], IECore.Box2i( IECore.V2i( 15, 7 ), IECore.V2i( 15, 7 ) ) )
+		self.assertRaises( RuntimeError, IECore.MedianCutSampler(), image=image, channelName="Y" )
 
 if __name__ == "__main__":
 	unittest.main()
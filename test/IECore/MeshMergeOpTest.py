@@ -152,5 +152,38 @@ class MeshMergeOpTest( unittest.TestCase ) :
 		self.failUnless( "Pref" in merged )
 		self.verifyMerge( p1, p2, merged )
 
+	def testMeshList( self ) :
+
+		meshes = []
+		for i in range( 0, 10 ) :
+			m = MeshPrimitive.createPlane( Box2f( V2f( i ), V2f( i + 1 ) ), V2i( i + 1 ) )
+			if i % 2 :
+				MeshNormalsOp()( input=m, copyInput=False )
+			meshes.append( m )
+
+		merged = MeshMergeOp()( input=meshes[0], meshList=ObjectVector( meshes[1:] ) )
+		self.failUnless( merged.arePrimitiveVariablesValid() )
+
+		# should be identical to merging one at a time
+		expected = meshes[0]
+		for m in meshes[1:] :
+			expected = MeshMergeOp()( input=expected, mesh=m )
+
+		self.assertEqual( merged, expected )
+
+		# the mesh parameter comes before the list
+		merged = MeshMergeOp()( input=meshes[0], mesh=meshes[1], meshList=ObjectVector( meshes[2:] ) )
+		self.assertEqual( merged, expected )
+
+		merged = MeshMergeOp()( input=meshes[0], meshList=ObjectVector( meshes[1:] ), removeNonMatchingPrimVars=True )
+		self.failUnless( merged.arePrimitiveVariablesValid() )
+		self.failUnless( "N" not in merged )
+		self.failUnless( "P" in merged )
+
+	def testMeshListTypeChecking( self ) :
+
+		p = MeshPrimitive.createPlane( Box2f( V2f( -1 ), V2f( 0 ) ) )
+		self.assertRaises( RuntimeError, MeshMergeOp(), input=p, meshList=ObjectVector( [ PointsPrimitive( 10 ) ] ) )
+
 if __name__ == "__main__":
     unittest.main()
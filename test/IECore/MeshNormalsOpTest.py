@@ -92,5 +92,22 @@ class MeshNormalsOpTest( unittest.TestCase ) :
 			self.assert_( normals[i].dot( p ) > 0.99 )
 			self.assert_( normals[i].dot( p ) < 1.01 )
 
+	def testLargeMesh( self ) :
+
+		# big enough that the work is split across several threads
+		p = MeshPrimitive.createSphere( 1, divisions = V2i( 300, 600 ) )
+		del p["N"]
+
+		n = MeshNormalsOp()( input=p )["N"].data
+		self.assertEqual( n.size(), p["P"].data.size() )
+
+		points = p["P"].data
+		for i in range( 0, n.size(), 97 ) :
+			self.assert_( n[i].dot( points[i].normalized() ) > 0.99 )
+
+		# results must not depend on how the work was divided up
+		for i in range( 0, 5 ) :
+			self.assertEqual( MeshNormalsOp()( input=p )["N"].data, n )
+
 if __name__ == "__main__":
     unittest.main()
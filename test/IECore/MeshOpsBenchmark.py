@@ -0,0 +1,87 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+## Timings for the mesh processing ops over synthetic meshes of increasing
+# size. This isn't part of the main test suite as the larger meshes take a
+# long time to build - run it directly with :
+#
+#	python test/IECore/MeshOpsBenchmark.py
+
+import unittest
+import math
+
+import IECore
+
+class MeshOpsBenchmark( unittest.TestCase ) :
+
+	faceCounts = [ 10000, 100000, 1000000, 10000000 ]
+
+	def __mesh( self, numFaces ) :
+
+		divisions = int( math.sqrt( numFaces / 2 ) )
+		return IECore.MeshPrimitive.createSphere( 1, divisions = IECore.V2i( divisions, divisions * 2 ) )
+
+	def __time( self, name, numFaces, f ) :
+
+		t = IECore.Timer()
+		f()
+		print "%s : %d faces : %.3fs" % ( name, numFaces, t.stop() )
+
+	def testMeshNormalsOp( self ) :
+
+		for numFaces in self.faceCounts :
+			m = self.__mesh( numFaces )
+			self.__time( "MeshNormalsOp", numFaces, IECore.curry( IECore.MeshNormalsOp(), input=m, copyInput=False ) )
+
+	def testMeshTangentsOp( self ) :
+
+		for numFaces in self.faceCounts :
+			divisions = int( math.sqrt( numFaces / 2 ) )
+			m = IECore.MeshPrimitive.createPlane( IECore.Box2f( IECore.V2f( -1 ), IECore.V2f( 1 ) ), IECore.V2i( divisions ) )
+			IECore.TriangulateOp()( input=m, copyInput=False )
+			self.__time(
+				"MeshTangentsOp", numFaces,
+				IECore.curry( IECore.MeshTangentsOp(), input=m, copyInput=False, uPrimVarName="s", vPrimVarName="t", uvIndicesPrimVarName="" )
+			)
+
+	def testFaceVaryingPromotionOp( self ) :
+
+		for numFaces in self.faceCounts :
+			m = self.__mesh( numFaces )
+			m["Cs"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Uniform, IECore.Color3fVectorData( m.variableSize( IECore.PrimitiveVariable.Interpolation.Uniform ) ) )
+			self.__time( "FaceVaryingPromotionOp", numFaces, IECore.curry( IECore.FaceVaryingPromotionOp(), input=m, copyInput=False ) )
+
+if __name__ == "__main__":
+	unittest.main()
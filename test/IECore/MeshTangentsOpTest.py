@@ -128,6 +128,29 @@ class MeshTangentsOpTest( unittest.TestCase ) :
 			self.failUnless( v.equalWithAbsError( IECore.V3f( 0, 0, 1 ), 0.000001 ) )
 		for v in mesh["tTangent"].data[3:] :
 			self.failUnless( v.equalWithAbsError( IECore.V3f( 0, 0, -1 ), 0.000001 ) )		
-		
+
+	def testLargeMesh( self ) :
+
+		mesh = IECore.MeshPrimitive.createPlane( IECore.Box2f( IECore.V2f( -1 ), IECore.V2f( 1 ) ), IECore.V2i( 300 ) )
+		IECore.TriangulateOp()( input=mesh, copyInput=False )
+
+		op = IECore.MeshTangentsOp()
+		result = op(
+			input = mesh,
+			uPrimVarName = "s",
+			vPrimVarName = "t",
+			uvIndicesPrimVarName = "",
+		)
+
+		self.assert_( result.arePrimitiveVariablesValid() )
+		for v in result["uTangent"].data :
+			self.failUnless( v.equalWithAbsError( IECore.V3f( 1, 0, 0 ), 0.0001 ) )
+
+		# results must not depend on how the work was divided up
+		for i in range( 0, 5 ) :
+			result2 = op( input = mesh, uPrimVarName = "s", vPrimVarName = "t", uvIndicesPrimVarName = "" )
+			self.assertEqual( result2["uTangent"].data, result["uTangent"].data )
+			self.assertEqual( result2["vTangent"].data, result["vTangent"].data )
+
 if __name__ == "__main__":
     unittest.main()
@@ -205,6 +205,21 @@ class TestNParticleReader( unittest.TestCase ) :
 		for attr in convertedAttributes :
 			self.assertEqual( p.numPoints, p[attr].data.size() )
 
+	def testReadAttributes( self ) :
+
+		r = IECore.Reader.create( "test/IECore/data/iffFiles/nParticleMultipleFrames.mc" )
+		r.parameters()['frameIndex'].setValue( 5 )
+		names = [ "testParticleShape_birthTime", "testParticleShape_position", "doesntExist" ]
+
+		for percentage in ( 100, 50 ) :
+
+			r.parameters()["percentage"].setValue( IECore.FloatData( percentage ) )
+
+			a = r.readAttributes( IECore.StringVectorData( names ) )
+			self.assertEqual( sorted( a.keys() ), sorted( names[:-1] ) )
+			for n in names[:-1] :
+				self.assertEqual( a[n], r.readAttribute( n ) )
+
 	def testConversion( self ) :
 
 		r = IECore.Reader.create( "test/IECore/data/iffFiles/nParticleMultipleFrames.mc"  )
@@ -147,6 +147,10 @@ class TestPythonOp( unittest.TestCase ) :
 		self.assertEqual( op( CompoundObject( { "name": StringData("jim") } ) ), StringData( "jim" ) )
 		# make sure the last call did not affect the contents of the Op's parameters.
 		self.assertEqual( op.parameters()['name'].getTypedValue(), "john" )
+		# nor the result parameter, which is only updated by calls without arguments.
+		self.assertEqual( op.resultParameter().getValue(), StringData( "" ) )
+		op()
+		self.assertEqual( op.resultParameter().getValue(), StringData( "john" ) )
 
 if __name__ == "__main__":
 	unittest.main()
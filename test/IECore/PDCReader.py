@@ -212,6 +212,23 @@ class TestPDCReader( unittest.TestCase ) :
 		self.assert_( len( a ) > 8 )
 
 
+	def testReadAttributes( self ) :
+
+		r = IECore.Reader.create( "test/IECore/data/pdcFiles/particleShape1.250.pdc" )
+		names = [ "position", "velocity", "particleId", "age", "doesntExist" ]
+
+		for percentage in ( 100, 50 ) :
+
+			r.parameters()["percentage"].setValue( IECore.FloatData( percentage ) )
+
+			a = r.readAttributes( IECore.StringVectorData( names ) )
+			self.failUnless( isinstance( a, IECore.CompoundData ) )
+			self.assertEqual( sorted( a.keys() ), sorted( names[:-1] ) )
+			for n in names[:-1] :
+				self.assertEqual( a[n], r.readAttribute( n ) )
+
+		self.assertEqual( len( r.readAttributes( IECore.StringVectorData() ) ), 0 )
+
 	def testConversion( self ) :
 
 		r = IECore.Reader.create( "test/IECore/data/pdcFiles/particleShape1.250.pdc" )
@@ -0,0 +1,95 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+## Timings for reading particle caches with many attributes, comparing a
+# single readAttributes() pass with one readAttribute() call per attribute.
+# This isn't part of the main test suite as the caches take a while to
+# write - run it directly with :
+#
+#	python test/IECore/ParticleReaderBenchmark.py
+
+import unittest
+import os
+
+import IECore
+
+class ParticleReaderBenchmark( unittest.TestCase ) :
+
+	sizes = [ 100000, 1000000 ]
+	numAttributes = 10
+	fileName = "test/particleReaderBenchmark.pdc"
+
+	def __time( self, name, size, f ) :
+
+		t = IECore.Timer()
+		f()
+		print "%s : %d : %.3fs" % ( name, size, t.stop() )
+
+	def __writeCache( self, size ) :
+
+		p = IECore.PointsPrimitive( size )
+		p["position"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Vertex, IECore.V3dVectorData( [ IECore.V3d( i ) for i in range( 0, size ) ] ) )
+		p["particleId"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Vertex, IECore.DoubleVectorData( range( 0, size ) ) )
+		for i in range( 0, self.numAttributes ) :
+			p["attr%d" % i] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Vertex, IECore.DoubleVectorData( [ i ] * size ) )
+		IECore.Writer.create( p, self.fileName ).write()
+
+	def testPDC( self ) :
+
+		for size in self.sizes :
+
+			self.__writeCache( size )
+
+			for percentage in ( 100, 10 ) :
+
+				r = IECore.Reader.create( self.fileName )
+				r["percentage"].setTypedValue( percentage )
+				names = r.attributeNames()
+
+				def individually() :
+					for n in names :
+						r.readAttribute( n )
+
+				self.__time( "readAttribute (%d%%)" % percentage, size, individually )
+				self.__time( "readAttributes (%d%%)" % percentage, size, IECore.curry( r.readAttributes, names ) )
+				self.__time( "read (%d%%)" % percentage, size, r.read )
+
+	def tearDown( self ) :
+
+		if os.path.isfile( self.fileName ) :
+			os.remove( self.fileName )
+
+if __name__ == "__main__":
+	unittest.main()
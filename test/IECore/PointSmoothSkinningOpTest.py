@@ -171,6 +171,19 @@ class PointSmoothSkinningOpTest( unittest.TestCase ) :
 		self.assertRaises( RuntimeError, o, input=pts, copyInput=True,
 						smoothSkinningData = ssd,deformationPose = self.myDP())
 
+	def testBadOffsetsAfterGoodSSD( self ) :
+		# the op skips validation for unchanged skinning data, so it must
+		# notice data which differs from the last run only in its offsets
+		pts = self.myPP()
+		o = PointSmoothSkinningOp()
+		o( input=pts, copyInput=True, smoothSkinningData = self.mySSD(), deformationPose = self.myDP() )
+
+		ssd = self.mySSD()
+		a = ssd.pointIndexOffsets()
+		a[7] = 666
+		self.assertRaises( RuntimeError, o, input=pts, copyInput=True,
+						smoothSkinningData = ssd, deformationPose = self.myDP() )
+
 	def testBadDeformationPose( self ) :
 		pts = self.myPP()
 		o = PointSmoothSkinningOp()
@@ -215,6 +228,46 @@ class PointSmoothSkinningOpTest( unittest.TestCase ) :
 		o(input=pts, positionVar="bob", copyInput=False, deformationPose = self.myDP(), smoothSkinningData = self.mySSD( ))
 		self.assertNotEqual(pts["bob"].data , self.myP())
 
+	def testPackedInfluences( self ) :
+		# check that packing the influences doesn't change the result, even when points have differing influence counts
+		ssd = SmoothSkinningData(
+			StringVectorData( [ 'joint1', 'joint2', 'joint3' ] ),
+			M44fVectorData( [M44f().translate(V3f(0,2,0)), M44f(), M44f().translate(V3f(0,-2,0))] ),
+			IntVectorData( [0, 1, 3, 5, 7, 8, 10, 12] ),
+			IntVectorData( [1, 2, 2, 2, 1, 2, 2, 3] ),
+			IntVectorData( [0, 0, 1, 1, 2, 1, 2, 1, 1, 2, 0, 1, 0, 1, 2] ),
+			FloatVectorData( [1, 1, 0, 0.5, 0.5, 0.5, 0.5, 1, 0.5, 0.5, 1, 0, 0.25, 0.5, 0.25] ),
+		)
+		ssd.validate()
+
+		o = PointSmoothSkinningOp()
+		for s in ( ssd, self.mySSD() ) :
+
+			unpacked = o( input = self.myPP(), deformationPose = self.myDP(), smoothSkinningData = s, deformNormals = True, packInfluences = False )
+			packed = o( input = self.myPP(), deformationPose = self.myDP(), smoothSkinningData = s, deformNormals = True, packInfluences = True )
+
+			self.assertNotEqual( unpacked["P"].data, self.myP() )
+			self.assertEqual( packed["P"].data, unpacked["P"].data )
+			self.assertEqual( packed["N"].data, unpacked["N"].data )
+
+	def testPackedInfluencesWithNoInfluences( self ) :
+		# check that packing doesn't try to use influences that don't exist
+		ssd = SmoothSkinningData(
+			StringVectorData(),
+			M44fVectorData(),
+			IntVectorData( [ 0 ] * 8 ),
+			IntVectorData( [ 0 ] * 8 ),
+			IntVectorData(),
+			FloatVectorData(),
+		)
+		ssd.validate()
+
+		o = PointSmoothSkinningOp()
+		for pack in ( False, True ) :
+			result = o( input = self.myPP(), deformationPose = M44fVectorData(), smoothSkinningData = ssd, deformNormals = True, packInfluences = pack )
+			self.assertEqual( result["P"].data, V3fVectorData( [ V3f( 0 ) ] * 8 ) )
+			self.assertEqual( result["N"].data, V3fVectorData( [ V3f( 0 ) ] * 8 ) )
+
 if __name__ == "__main__":
 	unittest.main()
 
@@ -0,0 +1,80 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+import unittest
+import IECore
+
+class PointsMergeOpTest( unittest.TestCase ) :
+
+	def test( self ) :
+
+		p1 = IECore.PointsPrimitive( IECore.V3fVectorData( [ IECore.V3f( i ) for i in range( 0, 10 ) ] ) )
+		p2 = IECore.PointsPrimitive( IECore.V3fVectorData( [ IECore.V3f( i ) for i in range( 10, 15 ) ] ) )
+		p2["r"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Vertex, IECore.FloatVectorData( [ 2 ] * 5 ) )
+
+		merged = IECore.PointsMergeOp()( input=p1, points=p2 )
+		self.failUnless( merged.arePrimitiveVariablesValid() )
+		self.assertEqual( merged.getNumPoints(), 15 )
+		self.assertEqual( merged["P"].data, IECore.V3fVectorData( [ IECore.V3f( i ) for i in range( 0, 15 ) ] ) )
+		self.assertEqual( merged["r"].data, IECore.FloatVectorData( [ 0 ] * 10 + [ 2 ] * 5 ) )
+
+		merged = IECore.PointsMergeOp()( input=p1, points=p2, removeNonMatchingPrimVars=True )
+		self.failUnless( merged.arePrimitiveVariablesValid() )
+		self.failIf( "r" in merged )
+
+	def testPointsList( self ) :
+
+		points = [ IECore.PointsPrimitive( IECore.V3fVectorData( [ IECore.V3f( i ) ] * ( i + 1 ) ) ) for i in range( 0, 20 ) ]
+		for p in points :
+			p["width"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Constant, IECore.FloatData( 1 ) )
+
+		merged = IECore.PointsMergeOp()( input=points[0], pointsList=IECore.ObjectVector( points[1:] ) )
+		self.failUnless( merged.arePrimitiveVariablesValid() )
+		self.assertEqual( merged.getNumPoints(), sum( [ p.getNumPoints() for p in points ] ) )
+		self.assertEqual( merged["width"], points[0]["width"] )
+
+		expected = points[0]
+		for p in points[1:] :
+			expected = IECore.PointsMergeOp()( input=expected, points=p )
+
+		self.assertEqual( merged, expected )
+
+	def testPointsListTypeChecking( self ) :
+
+		p = IECore.PointsPrimitive( 10 )
+		self.assertRaises( RuntimeError, IECore.PointsMergeOp(), input=p, pointsList=IECore.ObjectVector( [ IECore.IntData( 10 ) ] ) )
+
+if __name__ == "__main__":
+	unittest.main()
@@ -540,6 +540,38 @@ class SceneCacheTest( unittest.TestCase ) :
 		self.assertEqual( d.readAttribute( "sceneInterface:animatedObjectTopology", 0 ), IECore.BoolData( True ) )
 		self.assertFalse( d.hasAttribute( "sceneInterface:animatedObjectPrimVars" ) )
 
+	def testInterpolatedObjectWithAnimatedPrimVars( self ) :
+
+		box = IECore.MeshPrimitive.createBox( IECore.Box3f( IECore.V3f( 0 ), IECore.V3f( 1 ) ) )
+		box["Cs"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Uniform, IECore.Color3fVectorData( [ IECore.Color3f( 1, 0, 0 ) ] * box.variableSize( IECore.PrimitiveVariable.Interpolation.Uniform ) ) )
+		box["width"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Constant, IECore.FloatData( 1 ) )
+		box2 = box.copy()
+		box2["Cs"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Uniform, IECore.Color3fVectorData( [ IECore.Color3f( 0, 1, 0 ) ] * box.variableSize( IECore.PrimitiveVariable.Interpolation.Uniform ) ) )
+
+		s = IECore.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write )
+		b = s.createChild( "b" )
+		b.writeObject( box, 0 )
+		b.writeObject( box2, 1 )
+		c = s.createChild( "c" )
+		c.writeObject( box, 0 )
+		c.writeObject( box, 1 )
+
+		del s, b, c
+
+		s = IECore.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+		b = s.child( "b" )
+		c = s.child( "c" )
+
+		for t in ( 0.25, 0.5, 0.75 ) :
+
+			expected = IECore.linearObjectInterpolation( box, box2, t )
+			self.assertEqual( b.readObject( t ), expected )
+			self.assertEqual( b.readObjectPrimitiveVariables( [ "Cs", "width" ], t )["Cs"].data, expected["Cs"].data )
+			self.assertEqual( b.readObjectPrimitiveVariables( [ "Cs", "width" ], t )["width"].data, IECore.FloatData( 1 ) )
+
+			# static objects aren't interpolated at all
+			self.assertEqual( c.readObject( t ), box )
+
 	def testObjectPrimitiveVariablesRead( self ) :
 		
 		box = IECore.MeshPrimitive.createBox( IECore.Box3f( IECore.V3f( 0 ), IECore.V3f( 1 ) ) )
@@ -639,6 +671,38 @@ class SceneCacheTest( unittest.TestCase ) :
 		self.assertTrue( B.hasTag( "t3" ) )
 		self.assertTrue( B.hasTag( "ObjectType:SpherePrimitive" ) )
 		self.assertTrue( d.hasTag( "ObjectType:SpherePrimitive" ) )
+
+		self.assertEqual( m.pathsWithTag( "t1" ), [ [ "A" ], [ "A", "a", "aa" ], [ "A", "a", "ab" ] ] )
+		self.assertEqual( A.pathsWithTag( "t1" ), [ [ "A" ], [ "A", "a", "aa" ], [ "A", "a", "ab" ] ] )
+		self.assertEqual( a.pathsWithTag( "t1" ), [ [ "A", "a", "aa" ], [ "A", "a", "ab" ] ] )
+		self.assertEqual( B.pathsWithTag( "t1" ), [] )
+		self.assertEqual( m.pathsWithTag( "t4" ), [ [ "B" ] ] )
+		self.assertEqual( m.pathsWithTag( "t5" ), [] )
+		self.assertEqual( m.pathsWithTag( "ObjectType:SpherePrimitive" ), [ [ "B", "d" ] ] )
+
+		self.assertEqual( m.matchingPaths( "ObjectType:*" ), [ [ "A", "a", "ab" ], [ "B", "d" ] ] )
+		self.assertEqual( m.matchingPaths( "t3 t4" ), [ [ "B" ], [ "B", "c" ] ] )
+		self.assertEqual( m.matchingPaths( "t1 &t2" ), [ [ "A", "a", "ab" ] ] )
+		self.assertEqual( m.matchingPaths( "t1 !t2" ), [ [ "A" ], [ "A", "a", "aa" ] ] )
+		self.assertEqual( m.matchingPaths( "!ObjectType:*" ), [ [ "A" ], [ "A", "a", "aa" ], [ "B" ], [ "B", "c" ] ] )
+		self.assertEqual( B.matchingPaths( "t?" ), [ [ "B" ], [ "B", "c" ] ] )
+		self.assertRaises( RuntimeError, m.matchingPaths, "t1 !" )
+
+	def testPathsWithTagWithoutIndex( self ) :
+
+		# files written before the tag index was introduced are traversed instead
+		m = IECore.SceneCache( "test/IECore/data/sccFiles/animatedSpheres.scc", IECore.IndexedIO.OpenMode.Read )
+
+		def walk( s, tag, result ) :
+			if s.hasTag( tag, includeChildren = False ) :
+				result.append( s.path() )
+			for c in s.childNames() :
+				walk( s.child( c ), tag, result )
+			return result
+
+		expected = walk( m, "ObjectType:SpherePrimitive", [] )
+		self.failUnless( len( expected ) > 0 )
+		self.assertEqual( m.pathsWithTag( "ObjectType:SpherePrimitive" ), sorted( expected ) )
 	
 	def testSampleTimeOrder( self ):
 		
@@ -655,6 +719,94 @@ class SceneCacheTest( unittest.TestCase ) :
 		m = IECore.SceneInterface.create( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
 		self.assertTrue( m.boundSampleTime(0) < m.boundSampleTime(1) )
 
+	def testDeepIdenticalHierarchies( self ) :
+
+		# locations are committed to subindexes as they are
+		# flushed, and must read back intact.
+		m = IECore.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write )
+		for i in range( 0, 3 ) :
+			a = m.createChild( str( i ) )
+			for j in range( 0, 3 ) :
+				b = a.createChild( str( j ) )
+				b.writeAttribute( "w", IECore.BoolData( True ), 0.0 )
+				b.writeTags( [ "leaf" ] )
+				b.writeObject( IECore.SpherePrimitive( 1 ), 0.0 )
+				c = b.createChild( "c" )
+				c.writeTransform( IECore.M44dData( IECore.M44d.createTranslated( IECore.V3d( 1, 0, 0 ) ) ), 0.0 )
+
+		del m, a, b, c
+
+		m = IECore.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+		self.assertEqual( sorted( m.childNames() ), [ "0", "1", "2" ] )
+		for i in range( 0, 3 ) :
+			a = m.child( str( i ) )
+			self.assertEqual( sorted( a.childNames() ), [ "0", "1", "2" ] )
+			self.assertTrue( a.hasTag( "leaf" ) )
+			for j in range( 0, 3 ) :
+				b = a.child( str( j ) )
+				self.assertEqual( b.readAttribute( "w", 0 ), IECore.BoolData( True ) )
+				self.assertEqual( b.readObject( 0 ), IECore.SpherePrimitive( 1 ) )
+				self.assertEqual( b.childNames(), [ "c" ] )
+				self.assertEqual( b.child( "c" ).readTransformAsMatrix( 0 ), IECore.M44d.createTranslated( IECore.V3d( 1, 0, 0 ) ) )
+
+	def testFinish( self ) :
+
+		def write( fileName, finish ) :
+
+			m = IECore.SceneCache( fileName, IECore.IndexedIO.OpenMode.Write )
+			for i in range( 0, 3 ) :
+				a = m.createChild( str( i ) )
+				a.writeTransform( IECore.M44dData( IECore.M44d.createTranslated( IECore.V3d( i, 0, 0 ) ) ), 0.0 )
+				a.writeTransform( IECore.M44dData( IECore.M44d.createTranslated( IECore.V3d( i, 1, 0 ) ) ), 1.0 )
+				for j in range( 0, 3 ) :
+					b = a.createChild( str( j ) )
+					b.writeTags( [ "leaf" ] )
+					b.writeObject( IECore.SpherePrimitive( j + 1 ), 0.0 )
+					if finish :
+						b.finish()
+				if finish :
+					a.finish()
+
+			return m
+
+		write( "/tmp/test.scc", False )
+		m = write( "/tmp/test2.scc", True )
+
+		# finished locations can't be modified, and the locations
+		# below them have been released.
+		a = m.child( "0" )
+		self.assertRaises( RuntimeError, a.writeBound, IECore.Box3d( IECore.V3d( 0 ), IECore.V3d( 1 ) ), 2.0 )
+		self.assertRaises( RuntimeError, a.child, "0" )
+		self.assertRaises( RuntimeError, a.createChild, "new" )
+		self.assertRaises( RuntimeError, a.finish )
+		self.assertRaises( RuntimeError, m.createChild, "0" )
+
+		# and the root can't be finished, but unfinished siblings
+		# can still be written.
+		self.assertRaises( RuntimeError, m.finish )
+		m.createChild( "3" ).writeObject( IECore.SpherePrimitive( 1 ), 0.0 )
+		del m, a
+
+		# the result matches what we'd have got without calling finish()
+		expected = IECore.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+		m = IECore.SceneCache( "/tmp/test2.scc", IECore.IndexedIO.OpenMode.Read )
+		self.assertEqual( sorted( m.childNames() ), [ "0", "1", "2", "3" ] )
+		self.assertEqual( set( m.readTags() ), set( expected.readTags() ) )
+		self.assertEqual( m.pathsWithTag( "leaf" ), expected.pathsWithTag( "leaf" ) )
+		for i in range( 0, 3 ) :
+			a = m.child( str( i ) )
+			ea = expected.child( str( i ) )
+			self.assertEqual( a.numBoundSamples(), ea.numBoundSamples() )
+			for s in range( 0, a.numBoundSamples() ) :
+				self.assertEqual( a.boundSampleTime( s ), ea.boundSampleTime( s ) )
+				self.assertEqual( a.readBoundAtSample( s ), ea.readBoundAtSample( s ) )
+			self.assertEqual( a.readTransformAsMatrix( 1 ), ea.readTransformAsMatrix( 1 ) )
+			self.assertEqual( set( a.readTags() ), set( ea.readTags() ) )
+			for j in range( 0, 3 ) :
+				b = a.child( str( j ) )
+				self.assertEqual( b.readObject( 0 ), IECore.SpherePrimitive( j + 1 ) )
+				self.assertEqual( b.readBound( 0 ), ea.child( str( j ) ).readBound( 0 ) )
+
 
 if __name__ == "__main__":
 	unittest.main()
@@ -0,0 +1,124 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+## Timings and peak memory usage for writing SceneCaches with very large
+# hierarchies, comparing files where every location is left to be completed
+# when the root is closed with files where each location is completed with
+# SceneCache.finish() as soon as it has been written. Each file is written in
+# a separate process so that the peak resident set size reported is for that
+# file alone. This isn't part of the main test suite as the largest files take
+# a while to write - run it directly with :
+#
+#	python test/IECore/SceneCacheWriteBenchmark.py
+
+import unittest
+import subprocess
+import resource
+import math
+import sys
+import os
+
+import IECore
+
+class SceneCacheWriteBenchmark( unittest.TestCase ) :
+
+	sizes = [ 10000, 100000, 1000000 ]
+	fileName = "test/sceneCacheWriteBenchmark.scc"
+
+	@classmethod
+	def write( cls, size, finish ) :
+
+		# a three level hierarchy with roughly size locations in total
+		branching = int( math.ceil( size ** ( 1.0 / 3.0 ) ) )
+		bound = IECore.Box3d( IECore.V3d( -1 ), IECore.V3d( 1 ) )
+
+		t = IECore.Timer()
+
+		root = IECore.SceneCache( cls.fileName, IECore.IndexedIO.OpenMode.Write )
+		numLocations = 0
+		for i in range( 0, branching ) :
+			a = root.createChild( str( i ) )
+			for j in range( 0, branching ) :
+				b = a.createChild( str( j ) )
+				for k in range( 0, branching ) :
+					c = b.createChild( str( k ) )
+					c.writeTransform( IECore.M44dData( IECore.M44d.createTranslated( IECore.V3d( i, j, k ) ) ), 0.0 )
+					c.writeBound( bound, 0.0 )
+					if finish :
+						c.finish()
+					numLocations += 1
+				if finish :
+					b.finish()
+			if finish :
+				a.finish()
+
+		writeTime = t.stop()
+		t = IECore.Timer()
+
+		del a, b, c
+		del root
+
+		closeTime = t.stop()
+		peakRSS = resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss / 1024.0
+
+		mode = "finish" if finish else "close"
+		print "write (%s) : %d : %.3fs" % ( mode, numLocations, writeTime )
+		print "close (%s) : %d : %.3fs" % ( mode, numLocations, closeTime )
+		print "peak RSS (%s) : %d : %.1fMB" % ( mode, numLocations, peakRSS )
+		print "file size (%s) : %d : %.1fMB" % ( mode, numLocations, os.path.getsize( cls.fileName ) / ( 1024.0 * 1024.0 ) )
+
+	def test( self ) :
+
+		for size in self.sizes :
+			for mode in ( "close", "finish" ) :
+
+				subprocess.check_call( [ sys.executable, __file__, "--write", str( size ), mode ] )
+
+				# make sure what we wrote can be read back
+				root = IECore.SceneCache( self.fileName, IECore.IndexedIO.OpenMode.Read )
+				branching = len( root.childNames() )
+				self.assertEqual( len( root.child( "0" ).child( "0" ).childNames() ), branching )
+				self.assertEqual( root.readBound( 0 ), IECore.Box3d( IECore.V3d( -1 ), IECore.V3d( branching ) ) )
+				del root
+
+	def tearDown( self ) :
+
+		if os.path.isfile( self.fileName ) :
+			os.remove( self.fileName )
+
+if __name__ == "__main__":
+	if len( sys.argv ) == 4 and sys.argv[1] == "--write" :
+		SceneCacheWriteBenchmark.write( int( sys.argv[2] ), sys.argv[3] == "finish" )
+	else :
+		unittest.main()
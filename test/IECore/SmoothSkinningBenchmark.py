@@ -0,0 +1,109 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+## Timings for PointSmoothSkinningOp with increasing numbers of points and
+# influences per point. This isn't part of the main test suite as the larger
+# cases take a long time to build - run it directly with :
+#
+#	python test/IECore/SmoothSkinningBenchmark.py
+
+import unittest
+import random
+
+import IECore
+
+class SmoothSkinningBenchmark( unittest.TestCase ) :
+
+	pointCounts = [ 10000, 100000, 1000000 ]
+	influenceCounts = [ 1, 4, 8 ]
+	numJoints = 64
+
+	def __points( self, numPoints ) :
+
+		r = random.Random( 0 )
+		p = IECore.V3fVectorData( [ IECore.V3f( r.random(), r.random(), r.random() ) for i in range( 0, numPoints ) ] )
+		n = IECore.V3fVectorData( [ IECore.V3f( 0, 1, 0 ) ] * numPoints )
+
+		result = IECore.PointsPrimitive( p )
+		result["N"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Vertex, n )
+
+		return result
+
+	def __skinningData( self, numPoints, numInfluences ) :
+
+		r = random.Random( 0 )
+
+		return IECore.SmoothSkinningData(
+			IECore.StringVectorData( [ "joint%d" % i for i in range( 0, self.numJoints ) ] ),
+			IECore.M44fVectorData( [ IECore.M44f.createTranslated( IECore.V3f( 0, -i, 0 ) ) for i in range( 0, self.numJoints ) ] ),
+			IECore.IntVectorData( range( 0, numPoints * numInfluences, numInfluences ) ),
+			IECore.IntVectorData( [ numInfluences ] * numPoints ),
+			IECore.IntVectorData( [ r.randint( 0, self.numJoints - 1 ) for i in range( 0, numPoints * numInfluences ) ] ),
+			IECore.FloatVectorData( [ 1.0 / numInfluences ] * ( numPoints * numInfluences ) ),
+		)
+
+	def __pose( self ) :
+
+		return IECore.M44fVectorData( [
+			IECore.M44f.createRotated( IECore.V3f( 0, 0, i * 0.1 ) ) * IECore.M44f.createTranslated( IECore.V3f( 0, i, 0 ) )
+			for i in range( 0, self.numJoints )
+		] )
+
+	def __time( self, packInfluences ) :
+
+		op = IECore.PointSmoothSkinningOp()
+		pose = self.__pose()
+
+		for numPoints in self.pointCounts :
+			points = self.__points( numPoints )
+			for numInfluences in self.influenceCounts :
+				ssd = self.__skinningData( numPoints, numInfluences )
+				# run once to validate the skinning data and pack the influences,
+				# so that we're just timing the deformation itself
+				op( input = points, deformationPose = pose, smoothSkinningData = ssd, deformNormals = True, packInfluences = packInfluences )
+				t = IECore.Timer()
+				op( input = points, deformationPose = pose, smoothSkinningData = ssd, deformNormals = True, packInfluences = packInfluences )
+				print "PointSmoothSkinningOp (packInfluences=%d) : %d points : %d influences : %.3fs" % ( packInfluences, numPoints, numInfluences, t.stop() )
+
+	def testUnpacked( self ) :
+
+		self.__time( False )
+
+	def testPacked( self ) :
+
+		self.__time( True )
+
+if __name__ == "__main__":
+	unittest.main()
@@ -155,6 +155,43 @@ class TestSmoothSkinningData( unittest.TestCase ) :
         self.assertRaises( Exception, SmoothSkinningData(ok_jn, ok_ip, iv_pio3, ok_pic, ok_pii, ok_piw).validate )
         self.assertRaises( Exception, SmoothSkinningData(ok_jn, ok_ip, ok_pio, iv_pic3, ok_pii, ok_piw).validate )
 
+    def testValidateWithoutInfluences( self ) :
+
+        # points without influences don't index anything, so
+        # their offsets may point past the end of the indices
+        SmoothSkinningData(
+            StringVectorData( [ 'jointA' ] ), M44fVectorData( [ M44f() ] ),
+            IntVectorData( [ 0, 1 ] ), IntVectorData( [ 1, 0 ] ),
+            IntVectorData( [ 0 ] ), FloatVectorData( [ 1 ] )
+        ).validate()
+
+        SmoothSkinningData(
+            StringVectorData(), M44fVectorData(),
+            IntVectorData( [ 0, 0 ] ), IntVectorData( [ 0, 0 ] ),
+            IntVectorData(), FloatVectorData()
+        ).validate()
+
+        # but they must still be consistent with the counts
+        self.assertRaises( Exception, SmoothSkinningData(
+            StringVectorData( [ 'jointA' ] ), M44fVectorData( [ M44f() ] ),
+            IntVectorData( [ 0, 2 ] ), IntVectorData( [ 1, 0 ] ),
+            IntVectorData( [ 0 ] ), FloatVectorData( [ 1 ] )
+        ).validate )
+
+    def testEquality( self ) :
+
+        jn = StringVectorData( [ 'jointA', 'jointB' ] )
+        ip = M44fVectorData( [M44f(),M44f()] )
+        pic = IntVectorData( [2, 2, 1] )
+        pii = IntVectorData( [0, 1, 0, 1, 1] )
+        piw = FloatVectorData( [0.5, 0.5, 0.2, 0.8, 1.0] )
+
+        s = SmoothSkinningData( jn, ip, IntVectorData( [0, 2, 4] ), pic, pii, piw )
+        self.assertEqual( s, SmoothSkinningData( jn, ip, IntVectorData( [0, 2, 4] ), pic, pii, piw ) )
+
+        # data differing only in the offsets must not compare equal
+        self.assertNotEqual( s, SmoothSkinningData( jn, ip, IntVectorData( [0, 2, 666] ), pic, pii, piw ) )
+
 # todo: add reference test data we are happy with
 #    def testRef(self):
 #        load reference data we are sure is cool
@@ -80,6 +80,12 @@ class SphericalHarmonicsProjectorTest
 		// tests 3D functor with euclidean coordinates
 		void testEuclideanProjection3D();
 
+		// tests that indexed projection matches polar projection
+		void testIndexedProjection();
+
+		// tests that progressive projection refines to match polar projection
+		void testProgressiveProjection();
+
 
 		static T euclidean1DFunctor( const Imath::Vec3<T> &pos );
 		static Imath::Vec3<T> euclidean3DFunctor( const Imath::Vec3<T> &pos );
@@ -152,6 +158,8 @@ struct SphericalHarmonicsTestSuite : public boost::unit_test::test_suite
 		add( BOOST_CLASS_TEST_CASE( &(SphericalHarmonicsProjectorTest< T,bands,samples >::testPolarProjection3D), instance ) );
 		add( BOOST_CLASS_TEST_CASE( &(SphericalHarmonicsProjectorTest< T,bands,samples >::testEuclideanProjection1D), instance ) );
 		add( BOOST_CLASS_TEST_CASE( &(SphericalHarmonicsProjectorTest< T,bands,samples >::testEuclideanProjection3D), instance ) );
+		add( BOOST_CLASS_TEST_CASE( &(SphericalHarmonicsProjectorTest< T,bands,samples >::testIndexedProjection), instance ) );
+		add( BOOST_CLASS_TEST_CASE( &(SphericalHarmonicsProjectorTest< T,bands,samples >::testProgressiveProjection), instance ) );
 	}
 
 	template< typename T >
@@ -313,6 +313,41 @@ class SphericalHarmonicsProjectorExt : public SphericalHarmonicsProjector<V>
 };
 
 
+// returns precomputed values for each sample, for use with indexedProjection().
+template< typename T >
+struct IndexedValues
+{
+	IndexedValues( const std::vector<T> &values ) : values( values )
+	{
+	}
+
+	T operator()( unsigned int i ) const
+	{
+		return values[i];
+	}
+
+	const std::vector<T> &values;
+};
+
+// records the number of samples used by each pass of progressiveProjection(),
+// stopping after maxPasses.
+template< typename T >
+struct ProgressRecorder
+{
+	ProgressRecorder( std::vector<unsigned int> &numSamples, unsigned int maxPasses ) : numSamples( numSamples ), maxPasses( maxPasses )
+	{
+	}
+
+	bool operator()( const SphericalHarmonics<T> &sh, unsigned int n )
+	{
+		numSamples.push_back( n );
+		return numSamples.size() < maxPasses;
+	}
+
+	std::vector<unsigned int> &numSamples;
+	unsigned int maxPasses;
+};
+
 template<typename T, int bands, unsigned int samples >
 void SphericalHarmonicsProjectorTest< T, bands, samples >::testPolarProjection1D()
 {
@@ -720,5 +755,70 @@ void SphericalHarmonicsTest< T >::testSHProduct()
 	}
 }
 
-}	// namespace
+template<typename T, int bands, unsigned int samples >
+void SphericalHarmonicsProjectorTest<T, bands, samples>::testIndexedProjection()
+{
+	SphericalHarmonicsProjector<T> projector( samples );
+
+	std::vector<T> values;
+	for ( unsigned int i = 0; i < projector.sphericalCoordinates().size(); i++ )
+	{
+		values.push_back( polar1DFunctor( projector.sphericalCoordinates()[i] ) );
+	}
+
+	SphericalHarmonics<T> polarSH( bands );
+	projector.template polarProjection<>( polar1DFunctor, polarSH );
+
+	SphericalHarmonics<T> indexedSH( bands );
+	projector.indexedProjection( IndexedValues<T>( values ), indexedSH );
+
+	BOOST_CHECK_EQUAL( indexedSH.coefficients().size(), polarSH.coefficients().size() );
+	for ( unsigned int i = 0; i < polarSH.coefficients().size(); i++ )
+	{
+		BOOST_CHECK( Imath::equalWithAbsError( indexedSH.coefficients()[i], polarSH.coefficients()[i], T( 1e-4 ) ) );
+	}
+}
+
+template<typename T, int bands, unsigned int samples >
+void SphericalHarmonicsProjectorTest<T, bands, samples>::testProgressiveProjection()
+{
+	SphericalHarmonicsProjector<T> projector( samples );
+
+	std::vector<T> values;
+	for ( unsigned int i = 0; i < projector.sphericalCoordinates().size(); i++ )
+	{
+		values.push_back( polar1DFunctor( projector.sphericalCoordinates()[i] ) );
+	}
+
+	SphericalHarmonics<T> polarSH( bands );
+	projector.template polarProjection<>( polar1DFunctor, polarSH );
+
+	// all passes, each doubling the number of samples, should end up matching the full projection
+
+	std::vector<unsigned int> numSamples;
+	SphericalHarmonics<T> progressiveSH( bands );
+	projector.progressiveProjection( IndexedValues<T>( values ), progressiveSH, ProgressRecorder<T>( numSamples, 100 ), 4 );
 
+	BOOST_CHECK_EQUAL( numSamples.size(), 4u );
+	BOOST_CHECK_EQUAL( numSamples[0], samples / 8 );
+	BOOST_CHECK_EQUAL( numSamples[1], samples / 4 );
+	BOOST_CHECK_EQUAL( numSamples[2], samples / 2 );
+	BOOST_CHECK_EQUAL( numSamples[3], samples );
+
+	for ( unsigned int i = 0; i < polarSH.coefficients().size(); i++ )
+	{
+		BOOST_CHECK( Imath::equalWithAbsError( progressiveSH.coefficients()[i], polarSH.coefficients()[i], T( 1e-4 ) ) );
+	}
+
+	// stopping after the first pass should give a coarse approximation from
+	// an eighth of the samples.
+
+	numSamples.clear();
+	projector.progressiveProjection( IndexedValues<T>( values ), progressiveSH, ProgressRecorder<T>( numSamples, 1 ), 4 );
+
+	BOOST_CHECK_EQUAL( numSamples.size(), 1u );
+	BOOST_CHECK_EQUAL( numSamples[0], samples / 8 );
+	BOOST_CHECK( Imath::equalWithAbsError( progressiveSH.coefficients()[0], polarSH.coefficients()[0], T( 0.1 ) * Imath::Math<T>::fabs( polarSH.coefficients()[0] ) ) );
+}
+
+}	// namespace
@@ -53,5 +53,28 @@ class SummedAreaOpTest( unittest.TestCase ) :
 		self.assertEqual( yy[2], 4 )
 		self.assertEqual( yy[3], 10 )
 
+	def testLargeImage( self ) :
+
+		b = IECore.Box2i( IECore.V2i( 10, 20 ), IECore.V2i( 1010, 520 ) )
+		width = b.size().x + 1
+		height = b.size().y + 1
+		y = IECore.IntVectorData( [ ( i * 7 ) % 13 for i in range( 0, width * height ) ] )
+		i = IECore.ImagePrimitive( b, b )
+		i["Y"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Vertex, y )
+
+		ii = IECore.SummedAreaOp()( input=i, channels=IECore.StringVectorData( ["Y"] ) )
+		yy = ii["Y"].data
+
+		expected = [ 0 ] * ( width * height )
+		for py in range( 0, height ) :
+			rowSum = 0
+			for px in range( 0, width ) :
+				index = py * width + px
+				rowSum += y[index]
+				expected[index] = rowSum + ( expected[index-width] if py else 0 )
+
+		self.assertEqual( list( yy ), expected )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1259,6 +1259,44 @@ class TestVectorDataHashOptimisation( unittest.TestCase ) :
 		# should be slow this time, as the hash is being recomputed
 		self.failIf( secondTime < 0.8 * firstTime )
 
+	def testParallelHash( self ) :
+
+		oldThreshold = getParallelHashThreshold()
+		try :
+
+			setParallelHashThreshold( 0 )
+			self.assertEqual( getParallelHashThreshold(), 0 )
+			serialHash = IntVectorData( range( 0, 1000000 ) ).hash()
+
+			setParallelHashThreshold( 1024 * 1024 )
+			self.assertEqual( getParallelHashThreshold(), 1024 * 1024 )
+
+			# parallel hashes differ from serial ones, but are repeatable
+			d = IntVectorData( range( 0, 1000000 ) )
+			h = d.hash()
+			self.assertNotEqual( h, serialHash )
+			self.assertEqual( h, IntVectorData( range( 0, 1000000 ) ).hash() )
+
+			# and reflect changes in any of the chunks
+			for i in ( 0, 500000, 999999 ) :
+				d2 = d.copy()
+				d2[i] = -1
+				self.assertNotEqual( d2.hash(), h )
+
+			# hashes cached with one threshold aren't reused with another
+			setParallelHashThreshold( 0 )
+			self.assertEqual( d.hash(), serialHash )
+			setParallelHashThreshold( 1024 * 1024 )
+			self.assertEqual( d.hash(), h )
+
+			# small data is still hashed serially
+			smallHash = IntVectorData( range( 0, 10 ) ).hash()
+			setParallelHashThreshold( 0 )
+			self.assertEqual( IntVectorData( range( 0, 10 ) ).hash(), smallHash )
+
+		finally :
+			setParallelHashThreshold( oldThreshold )
+
 class TestInternedStringVectorData( unittest.TestCase ) :
 
 	def test( self ) :
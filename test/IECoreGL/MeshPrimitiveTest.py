@@ -104,6 +104,87 @@ class MeshPrimitiveTest( unittest.TestCase ) :
 		
 		self.assertEqual( IECore.ImageDiffOp()( imageA = expectedImage, imageB = actualImage, maxError = 0.05 ).value, False )
 
+	def __fanTriangulate( self, mesh ) :
+
+		result = []
+		vertexIds = mesh.vertexIds
+		offset = 0
+		for n in mesh.verticesPerFace :
+			for i in range( 1, n - 1 ) :
+				result.extend( [ vertexIds[offset], vertexIds[offset+i], vertexIds[offset+i+1] ] )
+			offset += n
+
+		return result
+
+	def testIndexedConversion( self ) :
+
+		m = IECore.MeshPrimitive.createPlane( IECore.Box2f( IECore.V2f( 0 ), IECore.V2f( 2 ) ), IECore.V2i( 2 ) )
+		corners = self.__fanTriangulate( m )
+		self.assertEqual( len( corners ), 24 )
+
+		# without FaceVarying data, the indices refer directly to the mesh vertices
+
+		m2 = m.copy()
+		del m2["s"]
+		del m2["t"]
+
+		glMesh = IECoreGL.ToGLMeshConverter( m2 ).convert()
+		self.failUnless( isinstance( glMesh, IECoreGL.MeshPrimitive ) )
+		self.assertEqual( glMesh.vertexIds(), None )
+		self.assertEqual( list( glMesh.vertexIndices() ), corners )
+
+		# continuous FaceVarying data doesn't prevent welding, so there is
+		# still one GL vertex per mesh vertex, numbered in order of first use.
+
+		glMesh = IECoreGL.ToGLMeshConverter( m ).convert()
+		indices = list( glMesh.vertexIndices() )
+		self.assertEqual( len( indices ), len( corners ) )
+		self.assertEqual( max( indices ) + 1, 9 )
+		self.failUnless( max( indices ) + 1 < len( corners ) )
+
+		glToMesh = {}
+		for glIndex, vertexId in zip( indices, corners ) :
+			self.assertEqual( glToMesh.setdefault( glIndex, vertexId ), vertexId )
+		self.assertEqual( sorted( glToMesh.values() ), range( 0, 9 ) )
+
+		# but discontinuities split vertices. here every face has its own
+		# "s" values, so only corners within the same face can be welded.
+
+		m3 = m.copy()
+		m3["s"] = IECore.PrimitiveVariable(
+			IECore.PrimitiveVariable.Interpolation.FaceVarying,
+			IECore.FloatVectorData( [ float( i / 4 ) for i in range( 0, 16 ) ] )
+		)
+
+		glMesh = IECoreGL.ToGLMeshConverter( m3 ).convert()
+		indices = list( glMesh.vertexIndices() )
+		self.assertEqual( len( indices ), len( corners ) )
+		self.assertEqual( max( indices ) + 1, 16 )
+		self.assertEqual( len( set( indices ) ), 16 )
+
+	def testTopologyReuse( self ) :
+
+		m = IECore.Reader.create( "test/IECore/data/cobFiles/pSphereShape1.cob").read()
+		glMesh = IECoreGL.ToGLMeshConverter( m ).convert()
+
+		# changing only "P" reuses the cached topology
+
+		m2 = m.copy()
+		m2["P"] = IECore.PrimitiveVariable( IECore.PrimitiveVariable.Interpolation.Vertex, IECore.V3fVectorData( [ p * 2 for p in m["P"].data ] ) )
+		glMesh2 = IECoreGL.ToGLMeshConverter( m2 ).convert()
+		self.failUnless( glMesh2.vertexIndices().isSame( glMesh.vertexIndices() ) )
+
+		# but changing the topology doesn't
+
+		m3 = IECore.MeshPrimitive.createPlane( IECore.Box2f( IECore.V2f( 0 ), IECore.V2f( 1 ) ) )
+		glMesh3 = IECoreGL.ToGLMeshConverter( m3 ).convert()
+		self.failIf( glMesh3.vertexIndices().isSame( glMesh.vertexIndices() ) )
+
+		# and the original must still render correctly after
+		# its topology has been shared.
+
+		self.testVertexAttributes()
+
 	def setUp( self ) :
 		
 		if not os.path.isdir( "test/IECoreGL/output" ) :
@@ -0,0 +1,107 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+## Timings for ToGLMeshConverter over synthetic meshes of increasing size,
+# comparing the first conversion of a mesh with the conversion of subsequent
+# frames where only "P" has changed, and the topology can be reused. Memory
+# use is reported as the number of GL vertices compared to the number of
+# triangle corners they would otherwise be expanded to, the size of the index
+# buffer, and the growth in the peak resident set size of the process. Conversion
+# doesn't require a GL context, so this can be run without a display :
+#
+#	python test/IECoreGL/ToGLMeshConverterBenchmark.py
+
+import unittest
+import math
+import resource
+
+import IECore
+import IECoreGL
+
+IECoreGL.init( False )
+
+class ToGLMeshConverterBenchmark( unittest.TestCase ) :
+
+	faceCounts = [ 10000, 100000, 1000000 ]
+	numFrames = 5
+
+	def __mesh( self, numFaces ) :
+
+		divisions = int( math.sqrt( numFaces / 2 ) )
+		m = IECore.MeshPrimitive.createSphere( 1, divisions = IECore.V2i( divisions, divisions * 2 ) )
+		IECore.FaceVaryingPromotionOp()( input = m, copyInput = False, primVarNames = IECore.StringVectorData( [ "s", "t" ] ) )
+		return m
+
+	def __frame( self, mesh, frame ) :
+
+		result = mesh.copy()
+		scale = 1 + frame * 0.1
+		result["P"] = IECore.PrimitiveVariable(
+			IECore.PrimitiveVariable.Interpolation.Vertex,
+			IECore.V3fVectorData( [ p * scale for p in mesh["P"].data ] )
+		)
+		return result
+
+	# in kilobytes, as reported by linux
+	def __peakRSS( self ) :
+
+		return resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss
+
+	def testConversion( self ) :
+
+		for numFaces in self.faceCounts :
+
+			mesh = self.__mesh( numFaces )
+			frames = [ self.__frame( mesh, i ) for i in range( 0, self.numFrames ) ]
+
+			rss = self.__peakRSS()
+			t = IECore.Timer()
+			glMesh = IECoreGL.ToGLMeshConverter( frames[0] ).convert()
+			print "first frame : %d faces : %.3fs" % ( numFaces, t.stop() )
+
+			indices = glMesh.vertexIndices()
+			print "vertices : %d faces : %d GL vertices for %d corners : %.1fMB index buffer" % (
+				numFaces, max( indices ) + 1, len( indices ), len( indices ) * 4 / ( 1024.0 * 1024.0 )
+			)
+			del indices
+
+			t = IECore.Timer()
+			for frame in frames[1:] :
+				IECoreGL.ToGLMeshConverter( frame ).convert()
+			print "subsequent frames : %d faces : %.3fs per frame" % ( numFaces, t.stop() / ( self.numFrames - 1 ) )
+			print "peak RSS growth : %d faces : %.1fMB" % ( numFaces, ( self.__peakRSS() - rss ) / 1024.0 )
+
+if __name__ == "__main__":
+	unittest.main()